@@ -146,6 +146,30 @@ class Settings(BaseSettings):
     embedder_host: str = Field(default="localhost", description="Embedder gRPC host")
     embedder_port: int = Field(default=50051, description="Embedder gRPC port")
     embedder_timeout: float = Field(default=30.0, description="Embedder call timeout")
+    embedder_vector_encoding: str = Field(
+        default="float32",
+        description="Embedder vector wire format: repeated | float32 | float16",
+    )
+    embedder_model: str = Field(
+        default="",
+        description="Embedding model for queries (empty = embedder default)",
+    )
+
+    # Retrieval reranking (cross-encoder Rerank RPC on the embedder)
+    rerank_enabled: bool = Field(
+        default=True,
+        description="Rerank over-fetched chunks with the embedder's cross-encoder",
+    )
+    rerank_candidates: int = Field(
+        default=20,
+        description="Chunks fetched per query and reranked before keeping the top results",
+        gt=0,
+    )
+    rerank_budget_ms: float = Field(
+        default=300.0,
+        description="Latency budget for reranking; on timeout the vector order is kept (ms)",
+        gt=0,
+    )
 
     # Langfuse (LLM Observability)
     langfuse_public_key: str | None = Field(
@@ -4,9 +4,10 @@ Chat service for retrieval-augmented generation.
 Orchestrates:
 1. Query embedding via Embedder gRPC
 2. Vector similarity search via Qdrant
-3. Context assembly with retrieved documents
-4. LLM completion with streaming
-5. Message persistence to database
+3. Cross-encoder reranking of over-fetched candidates via Embedder gRPC
+4. Context assembly with retrieved documents
+5. LLM completion with streaming
+6. Message persistence to database
 """
 
 import logging
@@ -65,9 +66,10 @@ class ChatService:
     Orchestrates the full RAG pipeline:
     1. Embed user query
     2. Search Qdrant for relevant chunks
-    3. Build prompt with context
-    4. Stream LLM completion
-    5. Persist message and sources
+    3. Rerank candidates with the cross-encoder (optional)
+    4. Build prompt with context
+    5. Stream LLM completion
+    6. Persist message and sources
 
     Attributes:
         db: Database session.
@@ -82,6 +84,8 @@ class ChatService:
         qdrant: QdrantDB,
         embedder: EmbedderClient,
         llm: LLMClient,
+        rerank_candidates: int = 0,
+        rerank_budget_ms: float = 300.0,
     ) -> None:
         """
         Initialize chat service.
@@ -89,13 +93,19 @@ class ChatService:
         Args:
             db: Async database session.
             qdrant: Qdrant client for vector search.
-            embedder: Embedder client for query embedding.
+            embedder: Embedder client for query embedding and reranking.
             llm: LLM client for generation.
+            rerank_candidates: Chunks to fetch and rerank per query, or 0
+                to keep the vector-score order.
+            rerank_budget_ms: Deadline for the rerank call; on timeout the
+                vector-score order is kept.
         """
         self._db = db
         self._qdrant = qdrant
         self._embedder = embedder
         self._llm = llm
+        self._rerank_candidates = rerank_candidates
+        self._rerank_timeout = rerank_budget_ms / 1000
         self._permissions = PermissionChecker(db)
 
     async def get_session(
@@ -139,6 +149,10 @@ class ChatService:
         """
         Retrieve relevant document chunks for query.
 
+        With reranking enabled, up to ``rerank_candidates`` chunks are
+        fetched and reordered by the cross-encoder before the top ``limit``
+        are kept.
+
         Args:
             query: User's search query.
             user: Authenticated user (for collection access).
@@ -164,6 +178,9 @@ class ChatService:
             logger.error(f"❌ Failed to embed query: {e}")
             raise ServiceUnavailableError("Embedder") from e
 
+        # Over-fetch candidates for the reranker
+        fetch_limit = max(limit, self._rerank_candidates)
+
         # Search each collection
         all_results: list[dict[str, Any]] = []
         for collection in collections:
@@ -171,7 +188,7 @@ class ChatService:
                 results = await self._qdrant.search(
                     collection_name=collection,
                     query_vector=query_vector,
-                    limit=limit,
+                    limit=fetch_limit,
                     score_threshold=min_score,
                 )
                 for r in results:
@@ -185,9 +202,12 @@ class ChatService:
                 )
                 continue
 
-        # Sort by score and take top results
+        # Sort by score, rerank the candidates, and take top results
         all_results.sort(key=lambda x: x.get("score", 0), reverse=True)
-        top_results = all_results[:limit]
+        candidates = all_results[:fetch_limit]
+        if len(candidates) > limit:
+            candidates = await self._rerank(query, candidates)
+        top_results = candidates[:limit]
 
         # Convert to sources
         sources: list[RetrievedSource] = []
@@ -212,6 +232,39 @@ class ChatService:
 
         return sources
 
+    async def _rerank(
+        self,
+        query: str,
+        candidates: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """
+        Reorder search results by cross-encoder relevance.
+
+        Reranked results carry the cross-encoder score. If reranking fails
+        or misses its budget, the results are returned unchanged.
+
+        Args:
+            query: User's search query.
+            candidates: Search results sorted by vector score.
+
+        Returns:
+            Results sorted by relevance.
+        """
+        passages = [r.get("payload", {}).get("text", "") for r in candidates]
+        try:
+            scores = await self._embedder.rerank(
+                query,
+                passages,
+                timeout=self._rerank_timeout,
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Rerank skipped, keeping vector order: {e}")
+            return candidates
+
+        for result, score in zip(candidates, scores):
+            result["score"] = score
+        return sorted(candidates, key=lambda x: x["score"], reverse=True)
+
     async def stream_response(
         self,
         session: ChatSessionORM,
@@ -8,8 +8,16 @@ Used by ChatService for query vectorization during retrieval.
 import logging
 
 import grpc
-
-from echomind_lib.models.internal.embedding_pb2 import EmbedRequest
+import numpy as np
+
+from echomind_lib.helpers.vector_codec import encoding_from_name, is_packed, unpack_matrix
+from echomind_lib.models.internal.embedding_pb2 import (
+    EMBED_PRIORITY_INTERACTIVE,
+    VECTOR_ENCODING_UNSPECIFIED,
+    EmbedRequest,
+    RerankRequest,
+    VectorEncoding,
+)
 from echomind_lib.models.internal.embedding_pb2_grpc import EmbedServiceStub
 
 from api.logic.exceptions import ServiceUnavailableError
@@ -34,6 +42,8 @@ class EmbedderClient:
         host: str,
         port: int,
         timeout: float = 30.0,
+        vector_encoding: VectorEncoding = VECTOR_ENCODING_UNSPECIFIED,
+        model: str = "",
     ) -> None:
         """
         Initialize Embedder client.
@@ -42,20 +52,29 @@ class EmbedderClient:
             host: Embedder service hostname.
             port: Embedder gRPC port.
             timeout: gRPC call timeout in seconds.
+            vector_encoding: VectorEncoding to request. Packed encodings
+                return the query vector as a numpy array.
+            model: Embedding model to request, or empty for the
+                embedder's default model.
         """
         self._host = host
         self._port = port
         self._timeout = timeout
+        self._vector_encoding = vector_encoding
+        self._model = model
         self._channel: grpc.aio.Channel | None = None
         self._stub: EmbedServiceStub | None = None
 
-    async def _ensure_connected(self) -> None:
+    async def _ensure_connected(self) -> EmbedServiceStub:
         """
         Ensure gRPC channel is connected.
 
         Creates channel and stub if not already connected.
+
+        Returns:
+            Stub bound to the channel.
         """
-        if self._channel is None:
+        if self._stub is None:
             target = f"{self._host}:{self._port}"
             self._channel = grpc.aio.insecure_channel(
                 target,
@@ -68,29 +87,48 @@ class EmbedderClient:
             )
             self._stub = EmbedServiceStub(self._channel)
             logger.info(f"🔗 Connected to Embedder at {self._host}:{self._port}")
+        return self._stub
 
-    async def embed_query(self, query: str) -> list[float]:
+    async def embed_query(self, query: str) -> list[float] | np.ndarray:
         """
         Embed a search query.
 
+        Sent with interactive priority so it pre-empts queued bulk
+        ingestion work on the embedder.
+
         Args:
             query: The search query text.
 
         Returns:
-            Embedding vector as list of floats.
+            Embedding vector, as a float32 array for packed encodings
+            (Qdrant accepts numpy query vectors directly).
 
         Raises:
             ServiceUnavailableError: If Embedder service is unavailable.
         """
-        await self._ensure_connected()
+        stub = await self._ensure_connected()
 
         try:
-            request = EmbedRequest(texts=[query])
-            response = await self._stub.Embed(
+            request = EmbedRequest(
+                texts=[query],
+                priority=EMBED_PRIORITY_INTERACTIVE,
+                encoding=self._vector_encoding,
+                model=self._model,
+            )
+            response = await stub.Embed(
                 request,
                 timeout=self._timeout,
             )
 
+            if is_packed(self._vector_encoding) and response.HasField("matrix"):
+                matrix = unpack_matrix(response.matrix)
+                if not len(matrix):
+                    logger.error("❌ Embedder returned empty response")
+                    raise ServiceUnavailableError("Embedder")
+                vector = matrix[0].astype(np.float32, copy=False)
+                logger.debug(f"🎯 Embedded query ({len(vector)} dims)")
+                return vector
+
             if not response.embeddings:
                 logger.error("❌ Embedder returned empty response")
                 raise ServiceUnavailableError("Embedder")
@@ -102,6 +140,52 @@ class EmbedderClient:
         except grpc.aio.AioRpcError as e:
             logger.error(f"❌ Embedder gRPC error: {e.details()}")
             raise ServiceUnavailableError("Embedder") from e
+        except ValueError as e:
+            logger.error(f"❌ Invalid embedder response: {e}")
+            raise ServiceUnavailableError("Embedder") from e
+
+    async def rerank(
+        self,
+        query: str,
+        passages: list[str],
+        timeout: float | None = None,
+    ) -> list[float]:
+        """
+        Score candidate passages against a query with the cross-encoder.
+
+        Args:
+            query: The search query text.
+            passages: Candidate passages to score.
+            timeout: Call deadline in seconds (defaults to the client timeout).
+
+        Returns:
+            Relevance score per passage, in the order of ``passages``.
+
+        Raises:
+            ServiceUnavailableError: If reranking fails, is disabled, or
+                misses the deadline.
+        """
+        if not passages:
+            return []
+
+        stub = await self._ensure_connected()
+
+        try:
+            response = await stub.Rerank(
+                RerankRequest(query=query, passages=passages),
+                timeout=timeout or self._timeout,
+            )
+        except grpc.aio.AioRpcError as e:
+            logger.warning(f"⚠️ Embedder rerank error: {e.code().name} {e.details()}")
+            raise ServiceUnavailableError("Embedder") from e
+
+        scores = list(response.scores)
+        if len(scores) != len(passages):
+            logger.error(
+                f"❌ Embedder returned {len(scores)} rerank scores for {len(passages)} passages"
+            )
+            raise ServiceUnavailableError("Embedder")
+        return scores
 
     async def close(self) -> None:
         """Close gRPC channel."""
@@ -141,6 +225,8 @@ async def init_embedder_client(
     host: str,
     port: int,
     timeout: float = 30.0,
+    vector_encoding: str = "repeated",
+    model: str = "",
 ) -> EmbedderClient:
     """
     Initialize the global Embedder client.
@@ -149,12 +235,23 @@ async def init_embedder_client(
         host: Embedder gRPC host.
         port: Embedder gRPC port.
         timeout: Call timeout in seconds.
+        vector_encoding: Vector wire format (repeated, float32, float16).
+        model: Embedding model to request (empty = embedder default).
 
     Returns:
         Initialized EmbedderClient.
+
+    Raises:
+        ValueError: If vector_encoding is unknown.
     """
     global _embedder_client
-    _embedder_client = EmbedderClient(host=host, port=port, timeout=timeout)
+    _embedder_client = EmbedderClient(
+        host=host,
+        port=port,
+        timeout=timeout,
+        vector_encoding=encoding_from_name(vector_encoding),
+        model=model,
+    )
     return _embedder_client
 
 
@@ -250,6 +250,8 @@ async def _retry_embedder_connection(settings: Settings) -> None:
                 host=settings.embedder_host,
                 port=settings.embedder_port,
                 timeout=settings.embedder_timeout,
+                vector_encoding=settings.embedder_vector_encoding,
+                model=settings.embedder_model,
             )
             logger.info("🔗 Embedder gRPC client reconnected")
             break
@@ -363,6 +365,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             host=settings.embedder_host,
             port=settings.embedder_port,
             timeout=settings.embedder_timeout,
+            vector_encoding=settings.embedder_vector_encoding,
+            model=settings.embedder_model,
         )
         logger.info("🔗 Embedder gRPC client connected")
     except Exception as e:
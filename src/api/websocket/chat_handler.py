@@ -15,6 +15,7 @@ from typing import Any
 from fastapi import WebSocket, WebSocketDisconnect
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.config import get_settings
 from api.logic.chat_service import ChatService, RetrievedSource
 from api.logic.embedder_client import get_embedder_client
 from api.logic.exceptions import NotFoundError, ServiceUnavailableError
@@ -204,11 +205,14 @@ class ChatHandler:
 
         try:
             # Initialize service with dependencies
+            settings = get_settings()
             service = ChatService(
                 db=self._db,
                 qdrant=get_qdrant(),
                 embedder=get_embedder_client(),
                 llm=get_llm_client(),
+                rerank_candidates=settings.rerank_candidates if settings.rerank_enabled else 0,
+                rerank_budget_ms=settings.rerank_budget_ms,
             )
 
             # Validate session and get assistant config
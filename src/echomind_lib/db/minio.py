@@ -234,6 +234,40 @@ class MinIOClient:
             response.close()
             await response.release()
     
+    async def download_to_file(
+        self,
+        bucket_name: str,
+        object_name: str,
+        file_path: str,
+        chunk_size: int = 1024 * 1024,
+    ) -> int:
+        """
+        Stream an object from MinIO into a local file.
+
+        Only one chunk is held in memory at a time, so large objects can
+        be fetched without buffering them whole.
+
+        Args:
+            bucket_name: Source bucket
+            object_name: Object path/name
+            file_path: Destination file (created or truncated)
+            chunk_size: Bytes read from the response per write
+
+        Returns:
+            Number of bytes written
+        """
+        response = await self._client.get_object(bucket_name, object_name)
+        size = 0
+        try:
+            with open(file_path, "wb") as f:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    f.write(chunk)
+                    size += len(chunk)
+            return size
+        finally:
+            response.close()
+            await response.release()
+    
     async def delete_file(self, bucket_name: str, object_name: str) -> None:
         """Delete a file from MinIO."""
         await self._client.remove_object(bucket_name, object_name)
@@ -11,6 +11,7 @@ from typing import Any
 import nats
 from nats.js import JetStreamContext
 from nats.js.api import ConsumerConfig, DeliverPolicy
+from nats.js.errors import NotFoundError
 
 
 class JetStreamSubscriber:
@@ -120,24 +121,54 @@ class JetStreamSubscriber:
         consumer: str,
         subject: str,
         batch_size: int = 10,
+        ack_wait: float = 30,
+        max_deliver: int = 3,
+        max_ack_pending: int | None = None,
+        legacy_consumer: str | None = None,
     ) -> Any:
         """
         Create a pull-based subscription.
         
+        Pull consumers are shared by every process fetching with the same
+        durable name, so no deliver group is needed. An existing durable
+        is updated in place when ack_wait, max_deliver or max_ack_pending
+        changed, since binding to it would otherwise keep the old values.
+        
+        A new durable starts after the ack floor of ``legacy_consumer``,
+        the push consumer it takes over from. The push consumer is left in
+        place so pods still running it keep working during a rolling
+        deploy; delete it once they are gone.
+        
         Args:
             stream: Stream name
             consumer: Durable consumer name
             subject: Subject filter
             batch_size: Messages to fetch per pull
+            ack_wait: Seconds before an unacked message is redelivered
+            max_deliver: Max redelivery attempts
+            max_ack_pending: Max unacked messages across all fetchers
+            legacy_consumer: Push consumer this pull consumer replaces
         
         Returns:
             Pull subscription object
         """
         config = ConsumerConfig(
             durable_name=consumer,
-            deliver_group=consumer,  # Enable queue-based load balancing
-            ack_wait=30,
+            ack_wait=ack_wait,
+            max_deliver=max_deliver,
         )
+        if max_ack_pending is not None:
+            config.max_ack_pending = max_ack_pending
+        
+        try:
+            info = await self.js.consumer_info(stream, consumer)
+        except NotFoundError:
+            start_seq = await self._legacy_start(stream, legacy_consumer) if legacy_consumer else None
+            if start_seq is not None:
+                config.deliver_policy = DeliverPolicy.BY_START_SEQUENCE
+                config.opt_start_seq = start_seq
+        else:
+            await self._update_pull_consumer(stream, info.config, config)
         
         sub = await self.js.pull_subscribe(
             subject,
@@ -148,6 +179,50 @@ class JetStreamSubscriber:
         self._subscriptions.append(sub)
         return sub
     
+    async def _legacy_start(self, stream: str, consumer: str) -> int | None:
+        """
+        Find where a pull consumer taking over from a push consumer starts.
+        
+        Args:
+            stream: Stream name
+            consumer: Durable name of the push consumer
+        
+        Returns:
+            Stream sequence after the push consumer's ack floor, or None
+            if no push consumer exists under that name.
+        """
+        try:
+            info = await self.js.consumer_info(stream, consumer)
+        except NotFoundError:
+            return None
+        
+        if not info.config.deliver_subject:
+            return None
+        return (info.ack_floor.stream_seq if info.ack_floor else 0) + 1
+    
+    async def _update_pull_consumer(
+        self,
+        stream: str,
+        current: ConsumerConfig,
+        wanted: ConsumerConfig,
+    ) -> None:
+        """
+        Apply changed delivery limits to an existing durable consumer.
+        
+        Args:
+            stream: Stream name
+            current: Configuration the server reports
+            wanted: Configuration requested by this process
+        """
+        changes = {
+            field: getattr(wanted, field)
+            for field in ("ack_wait", "max_deliver", "max_ack_pending")
+            if getattr(wanted, field) is not None
+            and getattr(wanted, field) != getattr(current, field)
+        }
+        if changes:
+            await self.js.add_consumer(stream, config=current.evolve(**changes))
+    
     async def fetch_messages(
         self,
         subscription: Any,
@@ -6,11 +6,17 @@ Provides async operations for vector storage and similarity search.
 
 from typing import Any
 
+import numpy as np
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import (
     Distance,
+    ExtendedPointId,
+    Filter,
+    PointIdsList,
     PointStruct,
     SearchParams,
+    SetPayload,
+    SetPayloadOperation,
     VectorParams,
 )
 
@@ -99,10 +105,15 @@ class QdrantDB:
         """Delete a collection."""
         return await self._client.delete_collection(collection_name)
     
+    async def list_collections(self) -> list[str]:
+        """List collection names."""
+        collections = await self._client.get_collections()
+        return [c.name for c in collections.collections]
+    
     async def upsert(
         self,
         collection_name: str,
-        vectors: list[list[float]],
+        vectors: list[list[float]] | np.ndarray,
         payloads: list[dict[str, Any]],
         ids: list[str | int],
     ) -> None:
@@ -111,10 +122,13 @@ class QdrantDB:
         
         Args:
             collection_name: Target collection
-            vectors: List of embedding vectors
+            vectors: List of embedding vectors or a (rows, dim) matrix
             payloads: List of metadata dicts
             ids: List of point IDs
         """
+        if isinstance(vectors, np.ndarray):
+            # PointStruct needs float lists; convert the matrix in one call
+            vectors = vectors.tolist()
         points = [
             PointStruct(id=id_, vector=vector, payload=payload)
             for id_, vector, payload in zip(ids, vectors, payloads)
@@ -124,7 +138,7 @@ class QdrantDB:
     async def search(
         self,
         collection_name: str,
-        query_vector: list[float],
+        query_vector: list[float] | np.ndarray,
         limit: int = 10,
         score_threshold: float | None = None,
         filter_: dict[str, Any] | None = None,
@@ -171,6 +185,105 @@ class QdrantDB:
             points_selector=filter_,
         )
     
+    async def scroll_ids(
+        self,
+        collection_name: str,
+        filter_: dict[str, Any],
+        batch_size: int = 1000,
+    ) -> list[ExtendedPointId]:
+        """
+        List IDs of all points matching a filter.
+        
+        Args:
+            collection_name: Collection to scan
+            filter_: Qdrant filter conditions
+            batch_size: Points per scroll page
+        
+        Returns:
+            Point IDs (payloads and vectors are not fetched)
+        """
+        ids: list[ExtendedPointId] = []
+        offset: Any = None
+        while True:
+            points, offset = await self._client.scroll(
+                collection_name=collection_name,
+                scroll_filter=Filter(**filter_),
+                limit=batch_size,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False,
+            )
+            ids.extend(point.id for point in points)
+            if offset is None:
+                return ids
+    
+    async def scroll_payloads(
+        self,
+        collection_name: str,
+        keys: list[str],
+        filter_: dict[str, Any] | None = None,
+        batch_size: int = 1000,
+    ) -> list[dict[str, Any]]:
+        """
+        Read selected payload keys of all points matching a filter.
+        
+        Args:
+            collection_name: Collection to scan
+            keys: Payload keys to return
+            filter_: Optional Qdrant filter conditions
+            batch_size: Points per scroll page
+        
+        Returns:
+            One payload dict (restricted to keys) per point
+        """
+        payloads: list[dict[str, Any]] = []
+        offset: Any = None
+        while True:
+            points, offset = await self._client.scroll(
+                collection_name=collection_name,
+                scroll_filter=Filter(**filter_) if filter_ else None,
+                limit=batch_size,
+                offset=offset,
+                with_payload=keys,
+                with_vectors=False,
+            )
+            payloads.extend(point.payload or {} for point in points)
+            if offset is None:
+                return payloads
+    
+    async def delete_points(
+        self,
+        collection_name: str,
+        ids: list[ExtendedPointId],
+    ) -> None:
+        """Delete points by ID."""
+        await self._client.delete(
+            collection_name=collection_name,
+            points_selector=PointIdsList(points=ids),
+        )
+    
+    async def set_payloads(
+        self,
+        collection_name: str,
+        payloads: dict[str | int, dict[str, Any]],
+    ) -> None:
+        """
+        Merge per-point payload updates in one request.
+        
+        Args:
+            collection_name: Target collection
+            payloads: Point ID -> payload keys to set
+        """
+        if not payloads:
+            return
+        await self._client.batch_update_points(
+            collection_name=collection_name,
+            update_operations=[
+                SetPayloadOperation(set_payload=SetPayload(payload=payload, points=[id_]))
+                for id_, payload in payloads.items()
+            ],
+        )
+    
     async def get_collection_info(self, collection_name: str) -> dict[str, Any]:
         """Get collection statistics."""
         info = await self._client.get_collection(collection_name)
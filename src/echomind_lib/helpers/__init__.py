@@ -5,4 +5,5 @@ Helper utilities for EchoMind.
 - device_checker: GPU/CPU detection
 - minio_helper: S3/MinIO file operations
 - readiness_probe: Kubernetes health checks
+- vector_codec: Packed embedding matrix encoding
 """
@@ -203,7 +203,8 @@ class HealthServer:
     """
     HTTP health check server for standalone services (gRPC, NATS consumers).
 
-    Provides /healthz and /readyz endpoints for Kubernetes probes.
+    Provides /healthz and /readyz endpoints for Kubernetes probes, plus
+    /metrics in Prometheus text format when prometheus_client is installed.
 
     Usage:
         server = HealthServer(port=8080)
@@ -211,6 +212,8 @@ class HealthServer:
 
     Attributes:
         is_ready: Set to True when service is ready to receive traffic.
+        details: Extra status values (e.g. in-flight work) included in
+            the /healthz and /readyz responses.
     """
 
     def __init__(self, port: int = 8080):
@@ -222,6 +225,7 @@ class HealthServer:
         """
         self._port = port
         self.is_ready = False
+        self.details: dict[str, Any] = {}
         self._server: HTTPServer | None = None
 
     def set_ready(self, ready: bool = True) -> None:
@@ -233,6 +237,16 @@ class HealthServer:
         """
         self.is_ready = ready
 
+    def set_detail(self, key: str, value: Any) -> None:
+        """
+        Set a status value reported by the health endpoints.
+
+        Args:
+            key: Detail name.
+            value: JSON-serializable value.
+        """
+        self.details[key] = value
+
     def start(self) -> None:
         """
         Start the HTTP health server (blocking).
@@ -252,16 +266,33 @@ class HealthServer:
             def do_GET(self) -> None:
                 """Handle GET requests for health endpoints."""
                 if self.path == "/healthz" or self.path == "/":
-                    self._respond(200, {"status": "healthy"})
+                    self._respond(200, {"status": "healthy", **health_server.details})
                 elif self.path == "/readyz":
                     if health_server.is_ready:
-                        self._respond(200, {"status": "ready"})
+                        self._respond(200, {"status": "ready", **health_server.details})
                     else:
-                        self._respond(503, {"status": "not_ready"})
+                        self._respond(503, {"status": "not_ready", **health_server.details})
+                elif self.path == "/metrics":
+                    self._respond_metrics()
                 else:
                     self._respond(404, {"error": "not_found"})
 
-            def _respond(self, status: int, body: dict[str, str]) -> None:
+            def _respond_metrics(self) -> None:
+                """Send Prometheus metrics from the default registry."""
+                try:
+                    from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+                except ImportError:
+                    self._respond(404, {"error": "metrics_unavailable"})
+                    return
+
+                content = generate_latest()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE_LATEST)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def _respond(self, status: int, body: dict[str, Any]) -> None:
                 """Send JSON response."""
                 content = json.dumps(body).encode("utf-8")
                 self.send_response(status)
@@ -0,0 +1,130 @@
+"""
+Packed vector encoding for the embedding protocol.
+
+Converts between numpy matrices and the EmbeddingMatrix message, which
+carries a whole batch of vectors as one row-major little-endian buffer
+instead of one ``repeated float`` per vector.
+
+Usage:
+    from echomind_lib.helpers.vector_codec import pack_matrix, unpack_matrix
+
+    matrix = pack_matrix(vectors, VECTOR_ENCODING_FLOAT16)
+    vectors = unpack_matrix(response.matrix)
+"""
+
+from typing import Any
+
+import numpy as np
+
+from echomind_lib.models.internal.embedding_pb2 import (
+    VECTOR_ENCODING_FLOAT16,
+    VECTOR_ENCODING_FLOAT32,
+    VECTOR_ENCODING_UNSPECIFIED,
+    EmbeddingMatrix,
+    VectorEncoding,
+)
+
+# Setting values accepted by the embedder clients
+VECTOR_ENCODINGS: dict[str, VectorEncoding] = {
+    "repeated": VECTOR_ENCODING_UNSPECIFIED,
+    "float32": VECTOR_ENCODING_FLOAT32,
+    "float16": VECTOR_ENCODING_FLOAT16,
+}
+
+_DTYPES: dict[int, np.dtype] = {
+    VECTOR_ENCODING_FLOAT32: np.dtype("<f4"),
+    VECTOR_ENCODING_FLOAT16: np.dtype("<f2"),
+}
+
+
+def encoding_from_name(name: str) -> VectorEncoding:
+    """
+    Resolve a setting value to a VectorEncoding.
+
+    Args:
+        name: One of "repeated", "float32" or "float16".
+
+    Returns:
+        VectorEncoding enum value.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    try:
+        return VECTOR_ENCODINGS[name.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Invalid vector encoding: {name}. Must be one of {set(VECTOR_ENCODINGS)}"
+        ) from None
+
+
+def is_packed(encoding: int) -> bool:
+    """
+    Check whether an encoding uses the packed EmbeddingMatrix format.
+
+    Args:
+        encoding: VectorEncoding enum value.
+
+    Returns:
+        True for float32/float16, False for repeated floats.
+    """
+    return encoding in _DTYPES
+
+
+def pack_matrix(vectors: Any, encoding: VectorEncoding) -> EmbeddingMatrix:
+    """
+    Pack a batch of vectors into an EmbeddingMatrix.
+
+    Args:
+        vectors: 2-D array-like of shape (rows, dimension).
+        encoding: VECTOR_ENCODING_FLOAT32 or VECTOR_ENCODING_FLOAT16.
+
+    Returns:
+        EmbeddingMatrix holding the vectors as one buffer.
+
+    Raises:
+        ValueError: If the encoding is not a packed encoding.
+    """
+    if encoding not in _DTYPES:
+        raise ValueError(f"Unsupported packed vector encoding: {encoding}")
+
+    array = np.ascontiguousarray(vectors, dtype=_DTYPES[encoding])
+    if array.ndim != 2:
+        array = array.reshape(len(array), -1)
+
+    rows, dimension = array.shape
+    return EmbeddingMatrix(
+        data=array.tobytes(),
+        rows=rows,
+        dimension=dimension,
+        encoding=encoding,
+    )
+
+
+def unpack_matrix(matrix: EmbeddingMatrix) -> np.ndarray:
+    """
+    Decode an EmbeddingMatrix into a read-only numpy view of its buffer.
+
+    No copy is made; float16 callers that need float32 must convert.
+
+    Args:
+        matrix: EmbeddingMatrix from an EmbedResponse.
+
+    Returns:
+        Array of shape (rows, dimension).
+
+    Raises:
+        ValueError: If the encoding is unknown or the buffer size is wrong.
+    """
+    dtype = _DTYPES.get(matrix.encoding)
+    if dtype is None:
+        raise ValueError(f"Unsupported packed vector encoding: {matrix.encoding}")
+
+    expected = matrix.rows * matrix.dimension * dtype.itemsize
+    if len(matrix.data) != expected:
+        raise ValueError(
+            f"Matrix buffer is {len(matrix.data)} bytes, expected {expected} "
+            f"({matrix.rows}x{matrix.dimension})"
+        )
+
+    return np.frombuffer(matrix.data, dtype=dtype).reshape(matrix.rows, matrix.dimension)
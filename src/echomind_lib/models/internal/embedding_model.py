@@ -6,15 +6,31 @@
 @Desc    :   Generated Pydantic models from protobuf definitions
 """
 
+from enum import Enum as _Enum
 from google.protobuf import message as _message, message_factory
 from protobuf_pydantic_gen.ext import model2protobuf, pool, protobuf2model
 from pydantic import BaseModel, ConfigDict, Field as _Field
 from typing import List, Optional, Type
 
 
+class EmbedPriority(_Enum):
+    EMBED_PRIORITY_UNSPECIFIED = 0
+    EMBED_PRIORITY_INTERACTIVE = 1
+    EMBED_PRIORITY_BULK = 2
+
+
+class VectorEncoding(_Enum):
+    VECTOR_ENCODING_UNSPECIFIED = 0
+    VECTOR_ENCODING_FLOAT32 = 1
+    VECTOR_ENCODING_FLOAT16 = 2
+
+
 class EmbedRequest(BaseModel):
     model_config = ConfigDict(protected_namespaces=())
     texts: Optional[List[str]] = _Field(default="")
+    priority: Optional[EmbedPriority] = _Field(default=EmbedPriority(0))
+    encoding: Optional[VectorEncoding] = _Field(default=VectorEncoding(0))
+    model: Optional[str] = _Field(default="")
 
     def to_protobuf(self) -> _message.Message:
         """Convert Pydantic model to protobuf message"""
@@ -45,9 +61,29 @@ class Embedding(BaseModel):
         return protobuf2model(cls, src)
 
 
+class EmbeddingMatrix(BaseModel):
+    model_config = ConfigDict(protected_namespaces=())
+    data: Optional[bytes] = _Field(default=b"")
+    rows: Optional[int] = _Field(default=0)
+    dimension: Optional[int] = _Field(default=0)
+    encoding: Optional[VectorEncoding] = _Field(default=VectorEncoding(0))
+
+    def to_protobuf(self) -> _message.Message:
+        """Convert Pydantic model to protobuf message"""
+        _proto = pool.FindMessageTypeByName("echomind.internal.EmbeddingMatrix")
+        _cls: Type[_message.Message] = message_factory.GetMessageClass(_proto)
+        return model2protobuf(self, _cls())
+
+    @classmethod
+    def from_protobuf(cls, src: _message.Message) -> "EmbeddingMatrix":
+        """Convert protobuf message to Pydantic model"""
+        return protobuf2model(cls, src)
+
+
 class EmbedResponse(BaseModel):
     model_config = ConfigDict(protected_namespaces=())
     embeddings: Optional[List[Embedding]] = _Field(default=None)
+    matrix: Optional[EmbeddingMatrix] = _Field(default=None)
 
     def to_protobuf(self) -> _message.Message:
         """Convert Pydantic model to protobuf message"""
@@ -61,8 +97,82 @@ class EmbedResponse(BaseModel):
         return protobuf2model(cls, src)
 
 
+class EmbedStreamRequest(BaseModel):
+    model_config = ConfigDict(protected_namespaces=())
+    batch_id: Optional[int] = _Field(default=0)
+    texts: Optional[List[str]] = _Field(default=None)
+    priority: Optional[EmbedPriority] = _Field(default=EmbedPriority(0))
+    encoding: Optional[VectorEncoding] = _Field(default=VectorEncoding(0))
+    model: Optional[str] = _Field(default="")
+
+    def to_protobuf(self) -> _message.Message:
+        """Convert Pydantic model to protobuf message"""
+        _proto = pool.FindMessageTypeByName("echomind.internal.EmbedStreamRequest")
+        _cls: Type[_message.Message] = message_factory.GetMessageClass(_proto)
+        return model2protobuf(self, _cls())
+
+    @classmethod
+    def from_protobuf(cls, src: _message.Message) -> "EmbedStreamRequest":
+        """Convert protobuf message to Pydantic model"""
+        return protobuf2model(cls, src)
+
+
+class EmbedStreamResponse(BaseModel):
+    model_config = ConfigDict(protected_namespaces=())
+    batch_id: Optional[int] = _Field(default=0)
+    embeddings: Optional[List[Embedding]] = _Field(default=None)
+    matrix: Optional[EmbeddingMatrix] = _Field(default=None)
+
+    def to_protobuf(self) -> _message.Message:
+        """Convert Pydantic model to protobuf message"""
+        _proto = pool.FindMessageTypeByName("echomind.internal.EmbedStreamResponse")
+        _cls: Type[_message.Message] = message_factory.GetMessageClass(_proto)
+        return model2protobuf(self, _cls())
+
+    @classmethod
+    def from_protobuf(cls, src: _message.Message) -> "EmbedStreamResponse":
+        """Convert protobuf message to Pydantic model"""
+        return protobuf2model(cls, src)
+
+
+class RerankRequest(BaseModel):
+    model_config = ConfigDict(protected_namespaces=())
+    query: Optional[str] = _Field(default="")
+    passages: Optional[List[str]] = _Field(default=None)
+    model: Optional[str] = _Field(default="")
+
+    def to_protobuf(self) -> _message.Message:
+        """Convert Pydantic model to protobuf message"""
+        _proto = pool.FindMessageTypeByName("echomind.internal.RerankRequest")
+        _cls: Type[_message.Message] = message_factory.GetMessageClass(_proto)
+        return model2protobuf(self, _cls())
+
+    @classmethod
+    def from_protobuf(cls, src: _message.Message) -> "RerankRequest":
+        """Convert protobuf message to Pydantic model"""
+        return protobuf2model(cls, src)
+
+
+class RerankResponse(BaseModel):
+    model_config = ConfigDict(protected_namespaces=())
+    scores: Optional[List[float]] = _Field(default=None)
+    model_id: Optional[str] = _Field(default="")
+
+    def to_protobuf(self) -> _message.Message:
+        """Convert Pydantic model to protobuf message"""
+        _proto = pool.FindMessageTypeByName("echomind.internal.RerankResponse")
+        _cls: Type[_message.Message] = message_factory.GetMessageClass(_proto)
+        return model2protobuf(self, _cls())
+
+    @classmethod
+    def from_protobuf(cls, src: _message.Message) -> "RerankResponse":
+        """Convert protobuf message to Pydantic model"""
+        return protobuf2model(cls, src)
+
+
 class DimensionRequest(BaseModel):
     model_config = ConfigDict(protected_namespaces=())
+    model: Optional[str] = _Field(default="")
 
     def to_protobuf(self) -> _message.Message:
         """Convert Pydantic model to protobuf message"""
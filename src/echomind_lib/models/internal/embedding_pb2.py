@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18internal/embedding.proto\x12\x11\x65\x63homind.internal\"\x1d\n\x0c\x45mbedRequest\x12\r\n\x05texts\x18\x01 \x03(\t\".\n\tEmbedding\x12\x0e\n\x06vector\x18\x01 \x03(\x02\x12\x11\n\tdimension\x18\x02 \x01(\x05\"A\n\rEmbedResponse\x12\x30\n\nembeddings\x18\x01 \x03(\x0b\x32\x1c.echomind.internal.Embedding\"\x12\n\x10\x44imensionRequest\"8\n\x11\x44imensionResponse\x12\x11\n\tdimension\x18\x01 \x01(\x05\x12\x10\n\x08model_id\x18\x02 \x01(\t2\xb5\x01\n\x0c\x45mbedService\x12J\n\x05\x45mbed\x12\x1f.echomind.internal.EmbedRequest\x1a .echomind.internal.EmbedResponse\x12Y\n\x0cGetDimension\x12#.echomind.internal.DimensionRequest\x1a$.echomind.internal.DimensionResponseB\x19Z\x17\x65\x63homind/proto/internalb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18internal/embedding.proto\x12\x11\x65\x63homind.internal\"\x95\x01\n\x0c\x45mbedRequest\x12\r\n\x05texts\x18\x01 \x03(\t\x12\x32\n\x08priority\x18\x02 \x01(\x0e\x32 .echomind.internal.EmbedPriority\x12\x33\n\x08\x65ncoding\x18\x03 \x01(\x0e\x32!.echomind.internal.VectorEncoding\x12\r\n\x05model\x18\x04 \x01(\t\".\n\tEmbedding\x12\x0e\n\x06vector\x18\x01 \x03(\x02\x12\x11\n\tdimension\x18\x02 \x01(\x05\"u\n\x0f\x45mbeddingMatrix\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\x12\x0c\n\x04rows\x18\x02 \x01(\x05\x12\x11\n\tdimension\x18\x03 \x01(\x05\x12\x33\n\x08\x65ncoding\x18\x04 \x01(\x0e\x32!.echomind.internal.VectorEncoding\"u\n\rEmbedResponse\x12\x30\n\nembeddings\x18\x01 \x03(\x0b\x32\x1c.echomind.internal.Embedding\x12\x32\n\x06matrix\x18\x02 \x01(\x0b\x32\".echomind.internal.EmbeddingMatrix\"\xad\x01\n\x12\x45mbedStreamRequest\x12\x10\n\x08\x62\x61tch_id\x18\x01 \x01(\x05\x12\r\n\x05texts\x18\x02 \x03(\t\x12\x32\n\x08priority\x18\x03 \x01(\x0e\x32 .echomind.internal.EmbedPriority\x12\x33\n\x08\x65ncoding\x18\x04 \x01(\x0e\x32!.echomind.internal.VectorEncoding\x12\r\n\x05model\x18\x05 \x01(\t\"\x8d\x01\n\x13\x45mbedStreamResponse\x12\x10\n\x08\x62\x61tch_id\x18\x01 \x01(\x05\x12\x30\n\nembeddings\x18\x02 \x03(\x0b\x32\x1c.echomind.internal.Embedding\x12\x32\n\x06matrix\x18\x03 \x01(\x0b\x32\".echomind.internal.EmbeddingMatrix\"?\n\rRerankRequest\x12\r\n\x05query\x18\x01 \x01(\t\x12\x10\n\x08passages\x18\x02 \x03(\t\x12\r\n\x05model\x18\x03 \x01(\t\"2\n\x0eRerankResponse\x12\x0e\n\x06scores\x18\x01 \x03(\x02\x12\x10\n\x08model_id\x18\x02 \x01(\t\"!\n\x10\x44imensionRequest\x12\r\n\x05model\x18\x01 \x01(\t\"8\n\x11\x44imensionResponse\x12\x11\n\tdimension\x18\x01 \x01(\x05\x12\x10\n\x08model_id\x18\x02 \x01(\t*h\n\rEmbedPriority\x12\x1e\n\x1a\x45MBED_PRIORITY_UNSPECIFIED\x10\x00\x12\x1e\n\x1a\x45MBED_PRIORITY_INTERACTIVE\x10\x01\x12\x17\n\x13\x45MBED_PRIORITY_BULK\x10\x02*k\n\x0eVectorEncoding\x12\x1f\n\x1bVECTOR_ENCODING_UNSPECIFIED\x10\x00\x12\x1b\n\x17VECTOR_ENCODING_FLOAT32\x10\x01\x12\x1b\n\x17VECTOR_ENCODING_FLOAT16\x10\x02\x32\xe6\x02\n\x0c\x45mbedService\x12J\n\x05\x45mbed\x12\x1f.echomind.internal.EmbedRequest\x1a .echomind.internal.EmbedResponse\x12`\n\x0b\x45mbedStream\x12%.echomind.internal.EmbedStreamRequest\x1a&.echomind.internal.EmbedStreamResponse(\x01\x30\x01\x12Y\n\x0cGetDimension\x12#.echomind.internal.DimensionRequest\x1a$.echomind.internal.DimensionResponse\x12M\n\x06Rerank\x12 .echomind.internal.RerankRequest\x1a!.echomind.internal.RerankResponseB\x19Z\x17\x65\x63homind/proto/internalb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -32,16 +32,30 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'internal.embedding_pb2', _g
 if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._loaded_options = None
   _globals['DESCRIPTOR']._serialized_options = b'Z\027echomind/proto/internal'
-  _globals['_EMBEDREQUEST']._serialized_start=47
-  _globals['_EMBEDREQUEST']._serialized_end=76
-  _globals['_EMBEDDING']._serialized_start=78
-  _globals['_EMBEDDING']._serialized_end=124
-  _globals['_EMBEDRESPONSE']._serialized_start=126
-  _globals['_EMBEDRESPONSE']._serialized_end=191
-  _globals['_DIMENSIONREQUEST']._serialized_start=193
-  _globals['_DIMENSIONREQUEST']._serialized_end=211
-  _globals['_DIMENSIONRESPONSE']._serialized_start=213
-  _globals['_DIMENSIONRESPONSE']._serialized_end=269
-  _globals['_EMBEDSERVICE']._serialized_start=272
-  _globals['_EMBEDSERVICE']._serialized_end=453
+  _globals['_EMBEDPRIORITY']._serialized_start=1015
+  _globals['_EMBEDPRIORITY']._serialized_end=1119
+  _globals['_VECTORENCODING']._serialized_start=1121
+  _globals['_VECTORENCODING']._serialized_end=1228
+  _globals['_EMBEDREQUEST']._serialized_start=48
+  _globals['_EMBEDREQUEST']._serialized_end=197
+  _globals['_EMBEDDING']._serialized_start=199
+  _globals['_EMBEDDING']._serialized_end=245
+  _globals['_EMBEDDINGMATRIX']._serialized_start=247
+  _globals['_EMBEDDINGMATRIX']._serialized_end=364
+  _globals['_EMBEDRESPONSE']._serialized_start=366
+  _globals['_EMBEDRESPONSE']._serialized_end=483
+  _globals['_EMBEDSTREAMREQUEST']._serialized_start=486
+  _globals['_EMBEDSTREAMREQUEST']._serialized_end=659
+  _globals['_EMBEDSTREAMRESPONSE']._serialized_start=662
+  _globals['_EMBEDSTREAMRESPONSE']._serialized_end=803
+  _globals['_RERANKREQUEST']._serialized_start=805
+  _globals['_RERANKREQUEST']._serialized_end=868
+  _globals['_RERANKRESPONSE']._serialized_start=870
+  _globals['_RERANKRESPONSE']._serialized_end=920
+  _globals['_DIMENSIONREQUEST']._serialized_start=922
+  _globals['_DIMENSIONREQUEST']._serialized_end=955
+  _globals['_DIMENSIONRESPONSE']._serialized_start=957
+  _globals['_DIMENSIONRESPONSE']._serialized_end=1013
+  _globals['_EMBEDSERVICE']._serialized_start=1231
+  _globals['_EMBEDSERVICE']._serialized_end=1589
 # @@protoc_insertion_point(module_scope)
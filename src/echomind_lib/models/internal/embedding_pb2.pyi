@@ -1,15 +1,40 @@
 from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Mapping, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
+class EmbedPriority(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    EMBED_PRIORITY_UNSPECIFIED: _ClassVar[EmbedPriority]
+    EMBED_PRIORITY_INTERACTIVE: _ClassVar[EmbedPriority]
+    EMBED_PRIORITY_BULK: _ClassVar[EmbedPriority]
+
+class VectorEncoding(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    VECTOR_ENCODING_UNSPECIFIED: _ClassVar[VectorEncoding]
+    VECTOR_ENCODING_FLOAT32: _ClassVar[VectorEncoding]
+    VECTOR_ENCODING_FLOAT16: _ClassVar[VectorEncoding]
+EMBED_PRIORITY_UNSPECIFIED: EmbedPriority
+EMBED_PRIORITY_INTERACTIVE: EmbedPriority
+EMBED_PRIORITY_BULK: EmbedPriority
+VECTOR_ENCODING_UNSPECIFIED: VectorEncoding
+VECTOR_ENCODING_FLOAT32: VectorEncoding
+VECTOR_ENCODING_FLOAT16: VectorEncoding
+
 class EmbedRequest(_message.Message):
-    __slots__ = ("texts",)
+    __slots__ = ("texts", "priority", "encoding", "model")
     TEXTS_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    ENCODING_FIELD_NUMBER: _ClassVar[int]
+    MODEL_FIELD_NUMBER: _ClassVar[int]
     texts: _containers.RepeatedScalarFieldContainer[str]
-    def __init__(self, texts: _Optional[_Iterable[str]] = ...) -> None: ...
+    priority: EmbedPriority
+    encoding: VectorEncoding
+    model: str
+    def __init__(self, texts: _Optional[_Iterable[str]] = ..., priority: _Optional[_Union[EmbedPriority, str]] = ..., encoding: _Optional[_Union[VectorEncoding, str]] = ..., model: _Optional[str] = ...) -> None: ...
 
 class Embedding(_message.Message):
     __slots__ = ("vector", "dimension")
@@ -19,15 +44,73 @@ class Embedding(_message.Message):
     dimension: int
     def __init__(self, vector: _Optional[_Iterable[float]] = ..., dimension: _Optional[int] = ...) -> None: ...
 
+class EmbeddingMatrix(_message.Message):
+    __slots__ = ("data", "rows", "dimension", "encoding")
+    DATA_FIELD_NUMBER: _ClassVar[int]
+    ROWS_FIELD_NUMBER: _ClassVar[int]
+    DIMENSION_FIELD_NUMBER: _ClassVar[int]
+    ENCODING_FIELD_NUMBER: _ClassVar[int]
+    data: bytes
+    rows: int
+    dimension: int
+    encoding: VectorEncoding
+    def __init__(self, data: _Optional[bytes] = ..., rows: _Optional[int] = ..., dimension: _Optional[int] = ..., encoding: _Optional[_Union[VectorEncoding, str]] = ...) -> None: ...
+
 class EmbedResponse(_message.Message):
-    __slots__ = ("embeddings",)
+    __slots__ = ("embeddings", "matrix")
+    EMBEDDINGS_FIELD_NUMBER: _ClassVar[int]
+    MATRIX_FIELD_NUMBER: _ClassVar[int]
+    embeddings: _containers.RepeatedCompositeFieldContainer[Embedding]
+    matrix: EmbeddingMatrix
+    def __init__(self, embeddings: _Optional[_Iterable[_Union[Embedding, _Mapping]]] = ..., matrix: _Optional[_Union[EmbeddingMatrix, _Mapping]] = ...) -> None: ...
+
+class EmbedStreamRequest(_message.Message):
+    __slots__ = ("batch_id", "texts", "priority", "encoding", "model")
+    BATCH_ID_FIELD_NUMBER: _ClassVar[int]
+    TEXTS_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    ENCODING_FIELD_NUMBER: _ClassVar[int]
+    MODEL_FIELD_NUMBER: _ClassVar[int]
+    batch_id: int
+    texts: _containers.RepeatedScalarFieldContainer[str]
+    priority: EmbedPriority
+    encoding: VectorEncoding
+    model: str
+    def __init__(self, batch_id: _Optional[int] = ..., texts: _Optional[_Iterable[str]] = ..., priority: _Optional[_Union[EmbedPriority, str]] = ..., encoding: _Optional[_Union[VectorEncoding, str]] = ..., model: _Optional[str] = ...) -> None: ...
+
+class EmbedStreamResponse(_message.Message):
+    __slots__ = ("batch_id", "embeddings", "matrix")
+    BATCH_ID_FIELD_NUMBER: _ClassVar[int]
     EMBEDDINGS_FIELD_NUMBER: _ClassVar[int]
+    MATRIX_FIELD_NUMBER: _ClassVar[int]
+    batch_id: int
     embeddings: _containers.RepeatedCompositeFieldContainer[Embedding]
-    def __init__(self, embeddings: _Optional[_Iterable[_Union[Embedding, _Mapping]]] = ...) -> None: ...
+    matrix: EmbeddingMatrix
+    def __init__(self, batch_id: _Optional[int] = ..., embeddings: _Optional[_Iterable[_Union[Embedding, _Mapping]]] = ..., matrix: _Optional[_Union[EmbeddingMatrix, _Mapping]] = ...) -> None: ...
+
+class RerankRequest(_message.Message):
+    __slots__ = ("query", "passages", "model")
+    QUERY_FIELD_NUMBER: _ClassVar[int]
+    PASSAGES_FIELD_NUMBER: _ClassVar[int]
+    MODEL_FIELD_NUMBER: _ClassVar[int]
+    query: str
+    passages: _containers.RepeatedScalarFieldContainer[str]
+    model: str
+    def __init__(self, query: _Optional[str] = ..., passages: _Optional[_Iterable[str]] = ..., model: _Optional[str] = ...) -> None: ...
+
+class RerankResponse(_message.Message):
+    __slots__ = ("scores", "model_id")
+    SCORES_FIELD_NUMBER: _ClassVar[int]
+    MODEL_ID_FIELD_NUMBER: _ClassVar[int]
+    scores: _containers.RepeatedScalarFieldContainer[float]
+    model_id: str
+    def __init__(self, scores: _Optional[_Iterable[float]] = ..., model_id: _Optional[str] = ...) -> None: ...
 
 class DimensionRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("model",)
+    MODEL_FIELD_NUMBER: _ClassVar[int]
+    model: str
+    def __init__(self, model: _Optional[str] = ...) -> None: ...
 
 class DimensionResponse(_message.Message):
     __slots__ = ("dimension", "model_id")
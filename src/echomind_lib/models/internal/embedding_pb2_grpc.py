@@ -40,11 +40,21 @@ class EmbedServiceStub(object):
                 request_serializer=internal_dot_embedding__pb2.EmbedRequest.SerializeToString,
                 response_deserializer=internal_dot_embedding__pb2.EmbedResponse.FromString,
                 _registered_method=True)
+        self.EmbedStream = channel.stream_stream(
+                '/echomind.internal.EmbedService/EmbedStream',
+                request_serializer=internal_dot_embedding__pb2.EmbedStreamRequest.SerializeToString,
+                response_deserializer=internal_dot_embedding__pb2.EmbedStreamResponse.FromString,
+                _registered_method=True)
         self.GetDimension = channel.unary_unary(
                 '/echomind.internal.EmbedService/GetDimension',
                 request_serializer=internal_dot_embedding__pb2.DimensionRequest.SerializeToString,
                 response_deserializer=internal_dot_embedding__pb2.DimensionResponse.FromString,
                 _registered_method=True)
+        self.Rerank = channel.unary_unary(
+                '/echomind.internal.EmbedService/Rerank',
+                request_serializer=internal_dot_embedding__pb2.RerankRequest.SerializeToString,
+                response_deserializer=internal_dot_embedding__pb2.RerankResponse.FromString,
+                _registered_method=True)
 
 
 class EmbedServiceServicer(object):
@@ -57,12 +67,24 @@ class EmbedServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def EmbedStream(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetDimension(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def Rerank(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_EmbedServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -71,11 +93,21 @@ def add_EmbedServiceServicer_to_server(servicer, server):
                     request_deserializer=internal_dot_embedding__pb2.EmbedRequest.FromString,
                     response_serializer=internal_dot_embedding__pb2.EmbedResponse.SerializeToString,
             ),
+            'EmbedStream': grpc.stream_stream_rpc_method_handler(
+                    servicer.EmbedStream,
+                    request_deserializer=internal_dot_embedding__pb2.EmbedStreamRequest.FromString,
+                    response_serializer=internal_dot_embedding__pb2.EmbedStreamResponse.SerializeToString,
+            ),
             'GetDimension': grpc.unary_unary_rpc_method_handler(
                     servicer.GetDimension,
                     request_deserializer=internal_dot_embedding__pb2.DimensionRequest.FromString,
                     response_serializer=internal_dot_embedding__pb2.DimensionResponse.SerializeToString,
             ),
+            'Rerank': grpc.unary_unary_rpc_method_handler(
+                    servicer.Rerank,
+                    request_deserializer=internal_dot_embedding__pb2.RerankRequest.FromString,
+                    response_serializer=internal_dot_embedding__pb2.RerankResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'echomind.internal.EmbedService', rpc_method_handlers)
@@ -115,6 +147,33 @@ class EmbedService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def EmbedStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/echomind.internal.EmbedService/EmbedStream',
+            internal_dot_embedding__pb2.EmbedStreamRequest.SerializeToString,
+            internal_dot_embedding__pb2.EmbedStreamResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetDimension(request,
             target,
@@ -141,3 +200,30 @@ class EmbedService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def Rerank(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/echomind.internal.EmbedService/Rerank',
+            internal_dot_embedding__pb2.RerankRequest.SerializeToString,
+            internal_dot_embedding__pb2.RerankResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -9,6 +9,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from nats.js.api import ConsumerConfig, DeliverPolicy
+from nats.js.errors import NotFoundError
 
 
 @pytest.fixture
@@ -327,10 +328,11 @@ class TestJetStreamSubscriberPullSubscribe:
 
         Verifies:
         - Calls js.pull_subscribe with correct parameters
-        - Uses deliver_group for queue-based load balancing
+        - Sets no deliver_group, which pull consumers reject
         - Returns subscription object
         - Stores subscription
         """
+        subscriber._js.consumer_info = AsyncMock(side_effect=NotFoundError())
         subscriber._js.pull_subscribe = AsyncMock(return_value=mock_subscription)
 
         sub = await subscriber.pull_subscribe(
@@ -351,13 +353,135 @@ class TestJetStreamSubscriberPullSubscribe:
         # Verify consumer config
         config: ConsumerConfig = call_args.kwargs["config"]
         assert config.durable_name == "test-consumer"
-        assert config.deliver_group == "test-consumer"  # Queue-based load balancing
+        assert config.deliver_group is None  # Fetchers share the durable
         assert config.ack_wait == 30
 
         # Verify subscription returned and stored
         assert sub == mock_subscription
         assert len(subscriber._subscriptions) == 1
 
+    @pytest.mark.asyncio
+    async def test_pull_subscribe_starts_after_legacy_consumer(
+        self,
+        subscriber,
+        mock_subscription: AsyncMock,
+    ) -> None:
+        """
+        Test a new pull durable taking over from a push consumer.
+
+        Verifies:
+        - Starts after the push consumer's ack floor
+        - Leaves the push consumer for pods still using it
+        """
+        legacy = MagicMock()
+        legacy.config.deliver_subject = "_INBOX.legacy"
+        legacy.ack_floor.stream_seq = 41
+        subscriber._js.consumer_info = AsyncMock(side_effect=[NotFoundError(), legacy])
+        subscriber._js.pull_subscribe = AsyncMock(return_value=mock_subscription)
+
+        await subscriber.pull_subscribe(
+            stream="test-stream",
+            consumer="test-consumer-pull",
+            subject="test.subject",
+            legacy_consumer="test-consumer",
+        )
+
+        subscriber._js.consumer_info.assert_called_with("test-stream", "test-consumer")
+        config: ConsumerConfig = subscriber._js.pull_subscribe.call_args.kwargs["config"]
+        assert config.deliver_policy == DeliverPolicy.BY_START_SEQUENCE
+        assert config.opt_start_seq == 42
+        subscriber._js.delete_consumer.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_pull_subscribe_without_legacy_consumer(
+        self,
+        subscriber,
+        mock_subscription: AsyncMock,
+    ) -> None:
+        """
+        Test a new pull durable when the push consumer never existed.
+
+        Verifies:
+        - Keeps the default deliver policy
+        """
+        subscriber._js.consumer_info = AsyncMock(side_effect=NotFoundError())
+        subscriber._js.pull_subscribe = AsyncMock(return_value=mock_subscription)
+
+        await subscriber.pull_subscribe(
+            stream="test-stream",
+            consumer="test-consumer-pull",
+            subject="test.subject",
+            legacy_consumer="test-consumer",
+        )
+
+        config: ConsumerConfig = subscriber._js.pull_subscribe.call_args.kwargs["config"]
+        assert config.deliver_policy == DeliverPolicy.ALL
+        assert config.opt_start_seq is None
+
+    @pytest.mark.asyncio
+    async def test_pull_subscribe_updates_existing_durable(
+        self,
+        subscriber,
+        mock_subscription: AsyncMock,
+    ) -> None:
+        """
+        Test changed limits are applied to an existing pull durable.
+
+        Verifies:
+        - Sends the server's config with the new limits
+        - Keeps settings that were not requested
+        """
+        current = ConsumerConfig(
+            name="test-consumer",
+            durable_name="test-consumer",
+            ack_wait=30,
+            max_deliver=3,
+            opt_start_seq=42,
+            deliver_policy=DeliverPolicy.BY_START_SEQUENCE,
+        )
+        subscriber._js.consumer_info = AsyncMock(return_value=MagicMock(config=current))
+        subscriber._js.pull_subscribe = AsyncMock(return_value=mock_subscription)
+
+        await subscriber.pull_subscribe(
+            stream="test-stream",
+            consumer="test-consumer",
+            subject="test.subject",
+            ack_wait=60,
+            max_deliver=5,
+            max_ack_pending=4,
+        )
+
+        subscriber._js.add_consumer.assert_called_once()
+        call_args = subscriber._js.add_consumer.call_args
+        assert call_args.args[0] == "test-stream"
+        config: ConsumerConfig = call_args.kwargs["config"]
+        assert (config.ack_wait, config.max_deliver, config.max_ack_pending) == (60, 5, 4)
+        assert config.opt_start_seq == 42
+
+    @pytest.mark.asyncio
+    async def test_pull_subscribe_unchanged_durable_not_updated(
+        self,
+        subscriber,
+        mock_subscription: AsyncMock,
+    ) -> None:
+        """
+        Test an existing durable with the same limits is bound as is.
+
+        Verifies:
+        - No consumer update is sent
+        """
+        current = ConsumerConfig(durable_name="test-consumer", ack_wait=30, max_deliver=3)
+        subscriber._js.consumer_info = AsyncMock(return_value=MagicMock(config=current))
+        subscriber._js.pull_subscribe = AsyncMock(return_value=mock_subscription)
+
+        await subscriber.pull_subscribe(
+            stream="test-stream",
+            consumer="test-consumer",
+            subject="test.subject",
+        )
+
+        subscriber._js.add_consumer.assert_not_called()
+
 
 class TestJetStreamSubscriberFetchMessages:
     """Tests for fetching messages from pull subscription."""
@@ -0,0 +1,170 @@
+"""
+Accuracy check for the ONNX Runtime backend.
+
+Encodes a sample corpus with the PyTorch and ONNX (optionally int8)
+backends and compares the vectors, so the ONNX backend can be enabled
+only when it matches closely enough.
+
+Usage:
+    python -m embedder.accuracy_check --model BAAI/bge-small-en-v1.5 \\
+        --quantize avx512_vnni --corpus passages.txt --min-cosine 0.99
+
+Exits with status 1 when the minimum cosine similarity or the nearest
+neighbour agreement is below the thresholds.
+"""
+
+import argparse
+import logging
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+from embedder.logic.onnx_backend import QUANTIZATION_PRESETS, load_onnx_model
+
+logger = logging.getLogger("echomind-embedder.accuracy")
+
+# Mix of short email-style chunks and longer document passages
+SAMPLE_CORPUS = [
+    "Thanks, see you at the standup tomorrow.",
+    "Can you resend the invoice for March? The attachment was missing.",
+    "The quarterly revenue grew 12% year over year, driven mainly by enterprise renewals "
+    "and a lower churn rate in the mid-market segment.",
+    "To reset your password, open Settings, choose Security and follow the link sent to "
+    "your registered email address. The link expires after 30 minutes.",
+    "Kubernetes schedules pods onto nodes based on resource requests, affinity rules and "
+    "taints; a pod stays pending when no node satisfies its constraints.",
+    "The contract may be terminated by either party with ninety days written notice, "
+    "provided that all outstanding invoices have been settled.",
+    "Photosynthesis converts light energy into chemical energy stored in glucose, "
+    "releasing oxygen as a by-product.",
+    "Please find attached the minutes of the board meeting held on 4 June.",
+    "Qdrant stores vectors with payloads and supports filtered approximate nearest "
+    "neighbour search using HNSW graphs.",
+    "Our refund policy allows returns within 30 days of delivery for unused items in "
+    "their original packaging.",
+    "The patient was advised to take the medication twice daily with food and to report "
+    "any dizziness to the clinic.",
+    "Lunch is on me today!",
+]
+
+
+@dataclass
+class AccuracyReport:
+    """Agreement between reference and candidate embeddings."""
+
+    texts: int
+    mean_cosine: float
+    min_cosine: float
+    p01_cosine: float
+    neighbour_agreement: float
+
+
+def compare_embeddings(reference: np.ndarray, candidate: np.ndarray) -> AccuracyReport:
+    """
+    Compare two embedding matrices of the same texts.
+
+    Args:
+        reference: Vectors from the PyTorch backend, one row per text.
+        candidate: Vectors from the backend under test.
+
+    Returns:
+        Row-wise cosine statistics and the fraction of texts whose
+        nearest neighbour in the corpus is the same under both backends.
+    """
+    reference = reference / np.linalg.norm(reference, axis=1, keepdims=True)
+    candidate = candidate / np.linalg.norm(candidate, axis=1, keepdims=True)
+    cosines = np.sum(reference * candidate, axis=1)
+
+    agreement = 1.0
+    if len(reference) > 1:
+        ref_sim = reference @ reference.T
+        cand_sim = candidate @ candidate.T
+        np.fill_diagonal(ref_sim, -np.inf)
+        np.fill_diagonal(cand_sim, -np.inf)
+        agreement = float(np.mean(ref_sim.argmax(axis=1) == cand_sim.argmax(axis=1)))
+
+    return AccuracyReport(
+        texts=len(cosines),
+        mean_cosine=float(cosines.mean()),
+        min_cosine=float(cosines.min()),
+        p01_cosine=float(np.percentile(cosines, 1)),
+        neighbour_agreement=agreement,
+    )
+
+
+def load_corpus(path: str | None) -> list[str]:
+    """
+    Load the texts to compare.
+
+    Args:
+        path: File with one passage per line, or None for the built-in sample.
+
+    Returns:
+        Non-empty passages.
+    """
+    if path is None:
+        return list(SAMPLE_CORPUS)
+    lines = Path(path).read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the accuracy check.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv).
+
+    Returns:
+        Process exit status: 0 if within thresholds, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--model", required=True, help="HuggingFace model name or path")
+    parser.add_argument(
+        "--quantize",
+        default="",
+        choices=["", *sorted(QUANTIZATION_PRESETS)],
+        help="Dynamic int8 quantization preset (default: float ONNX)",
+    )
+    parser.add_argument("--corpus", help="File with one passage per line")
+    parser.add_argument("--cache-dir", default="/tmp/echomind/onnx", help="ONNX export cache")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--min-cosine", type=float, default=0.99)
+    parser.add_argument("--min-agreement", type=float, default=0.95)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    texts = load_corpus(args.corpus)
+    logger.info(f"📚 Comparing {len(texts)} texts with {args.model}")
+
+    reference = SentenceTransformer(args.model, device="cpu").encode(
+        texts, batch_size=args.batch_size, normalize_embeddings=True
+    )
+    candidate = load_onnx_model(
+        args.model,
+        device="cpu",
+        cache_dir=args.cache_dir,
+        quantize=args.quantize,
+    ).encode(texts, batch_size=args.batch_size, normalize_embeddings=True)
+
+    report = compare_embeddings(np.asarray(reference), np.asarray(candidate))
+    logger.info(
+        f"📊 cosine mean={report.mean_cosine:.5f} min={report.min_cosine:.5f} "
+        f"p01={report.p01_cosine:.5f}, nearest-neighbour agreement="
+        f"{report.neighbour_agreement:.1%}"
+    )
+
+    passed = (
+        report.min_cosine >= args.min_cosine
+        and report.neighbour_agreement >= args.min_agreement
+    )
+    logger.info("✅ Within thresholds" if passed else "❌ Below thresholds, keep torch backend")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
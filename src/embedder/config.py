@@ -4,7 +4,7 @@ Configuration for the Embedder Service.
 Uses Pydantic Settings to load environment variables.
 """
 
-from pydantic import Field
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -36,11 +36,109 @@ class EmbedderSettings(BaseSettings):
         1,
         description="Maximum number of models to cache in memory",
     )
+    model_memory_budget_mb: float = Field(
+        0.0,
+        description="Memory budget for cached model weights in MiB (0 = count limit only)",
+        ge=0,
+    )
+    allowed_models: list[str] = Field(
+        default_factory=list,
+        description="Extra models clients may select per request (JSON list)",
+    )
     batch_size: int = Field(
         32,
         description="Batch size for encoding",
     )
 
+    max_batch_tokens: int = Field(
+        8192,
+        description="Padded token budget per forward pass; texts are length-sorted (0 = batch_size)",
+        ge=0,
+    )
+
+    # Dynamic Batching
+    batching_enabled: bool = Field(
+        True,
+        description="Merge concurrent Embed requests into shared forward passes",
+    )
+    batch_max_size: int = Field(
+        32,
+        description="Maximum texts per batched forward pass",
+        gt=0,
+    )
+    batch_max_wait_ms: float = Field(
+        5.0,
+        description="Maximum time a request waits for others to join its batch (ms)",
+        ge=0,
+    )
+
+    # Inference Backend
+    backend: str = Field(
+        "torch",
+        description="Inference backend: torch or onnx (ONNX Runtime, CPU)",
+    )
+    onnx_quantize: str = Field(
+        "",
+        description="ONNX dynamic int8 quantization: avx2, avx512, avx512_vnni, arm64 (empty = float)",
+    )
+    onnx_cache_dir: str = Field(
+        "/tmp/echomind/onnx",
+        description="Directory for exported ONNX models",
+    )
+
+    # Reranking
+    rerank_model: str = Field(
+        "cross-encoder/ms-marco-MiniLM-L-6-v2",
+        description="Cross-encoder for the Rerank RPC (empty = Rerank disabled)",
+    )
+    rerank_batch_size: int = Field(
+        32,
+        description="(query, passage) pairs per reranker forward pass",
+        gt=0,
+    )
+    rerank_max_length: int = Field(
+        256,
+        description="Token limit per (query, passage) pair; longer pairs are truncated",
+        gt=0,
+    )
+    rerank_max_passages: int = Field(
+        200,
+        description="Maximum passages per Rerank request",
+        gt=0,
+    )
+
+    # CPU Inference Workers
+    inference_workers: int = Field(
+        0,
+        description="Worker processes for CPU inference, each with its own model (0 = in-process)",
+        ge=0,
+    )
+    inference_threads_per_worker: int = Field(
+        0,
+        description="PyTorch threads per inference worker (0 = split cores evenly)",
+        ge=0,
+    )
+    inference_pin_cpus: bool = Field(
+        True,
+        description="Pin each inference worker to its own CPU cores (Linux)",
+    )
+
+    # Embedding Cache
+    embedding_cache_mb: float = Field(
+        256.0,
+        description="In-memory embedding cache size in MiB (0 = memory tier off)",
+        ge=0,
+    )
+    embedding_cache_path: str = Field(
+        "",
+        description="SQLite file for the persistent embedding cache tier (empty = off)",
+    )
+    embedding_cache_disk_max_entries: int = Field(
+        1_000_000,
+        description="Maximum vectors kept in the disk cache tier (0 = unbounded)",
+        ge=0,
+    )
+
     # Device
     prefer_gpu: bool = Field(
         True,
@@ -63,6 +161,48 @@ class EmbedderSettings(BaseSettings):
         description="Logging level",
     )
 
+    @field_validator("backend")
+    @classmethod
+    def validate_backend(cls, v: str) -> str:
+        """
+        Validate inference backend.
+
+        Args:
+            v: Backend name.
+
+        Returns:
+            Lower-cased backend name.
+
+        Raises:
+            ValueError: If backend is invalid.
+        """
+        valid_values = {"torch", "onnx"}
+        v_lower = v.lower()
+        if v_lower not in valid_values:
+            raise ValueError(f"Invalid backend: {v}. Must be one of {valid_values}")
+        return v_lower
+
+    @field_validator("onnx_quantize")
+    @classmethod
+    def validate_onnx_quantize(cls, v: str) -> str:
+        """
+        Validate ONNX quantization preset.
+
+        Args:
+            v: Preset name, or empty for no quantization.
+
+        Returns:
+            Lower-cased preset name.
+
+        Raises:
+            ValueError: If preset is invalid.
+        """
+        valid_values = {"", "arm64", "avx2", "avx512", "avx512_vnni"}
+        v_lower = v.lower()
+        if v_lower not in valid_values:
+            raise ValueError(f"Invalid onnx_quantize: {v}. Must be one of {valid_values}")
+        return v_lower
+
     model_config = SettingsConfigDict(
         env_prefix="EMBEDDER_",
         env_file=".env",
@@ -77,4 +217,4 @@ def get_settings() -> EmbedderSettings:
     Returns:
         EmbedderSettings instance.
     """
-    return EmbedderSettings()
+    return EmbedderSettings()  # type: ignore[call-arg]
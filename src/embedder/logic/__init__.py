@@ -1,10 +1,15 @@
 """Business logic for the Embedder Service."""
 
+from embedder.logic.batcher import EmbedBatcher, Priority
 from embedder.logic.encoder import SentenceEncoder
 from embedder.logic.exceptions import EncoderError, ModelNotFoundError
+from embedder.logic.reranker import CrossEncoderReranker
 
 __all__ = [
+    "CrossEncoderReranker",
+    "EmbedBatcher",
     "SentenceEncoder",
     "EncoderError",
     "ModelNotFoundError",
+    "Priority",
 ]
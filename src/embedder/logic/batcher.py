@@ -0,0 +1,358 @@
+"""
+Dynamic micro-batching scheduler for SentenceEncoder.
+
+Concurrent Embed RPCs are queued and merged into a single forward pass,
+bounded by a maximum batch size and a maximum wait window. Vectors are
+split back to each caller in submission order.
+
+Interactive requests (chat queries) have their own queue that is always
+drained before bulk ingestion work and is dispatched without waiting for
+the batching window, so query latency stays flat during backfills.
+
+With an InferenceWorkerPool, one batch is dispatched per idle worker
+process; requests keep accumulating while all workers are busy.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+import numpy as np
+
+from embedder.logic.encoder import SentenceEncoder
+from embedder.logic.exceptions import EncoderError
+from embedder.logic.metrics import (
+    embed_batch_requests,
+    embed_batch_texts,
+    embed_forward_duration,
+    embed_queue_wait,
+)
+from embedder.logic.worker_pool import InferenceWorkerPool
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Scheduling priority. Lower values are dispatched first."""
+
+    INTERACTIVE = 0
+    BULK = 1
+
+
+@dataclass
+class _PendingRequest:
+    """A queued embed request waiting for its batch."""
+
+    texts: list[str]
+    model_name: str
+    encode_type: str
+    priority: Priority = Priority.BULK
+    future: Future = field(default_factory=Future)
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def batch_key(self) -> tuple[str, str]:
+        """Requests can only share a forward pass with the same model and encode type."""
+        return (self.model_name, self.encode_type)
+
+
+class EmbedBatcher:
+    """
+    Merges concurrent encode requests into batched forward passes.
+
+    A single background thread forms batches and owns the forward pass,
+    or hands batches to an inference worker pool (one in flight per worker).
+    Callers block on ``submit`` until their slice of the batch is ready. A
+    forward pass in progress is never interrupted; interactive requests
+    take the next one.
+
+    Usage:
+        batcher = EmbedBatcher(max_batch_size=32, max_wait_ms=5.0)
+        batcher.start()
+
+        vectors = batcher.submit(["Hello world"], model_name="my-model")
+        query = batcher.submit(["search"], model_name="my-model", priority=Priority.INTERACTIVE)
+
+        batcher.stop()
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        pool: InferenceWorkerPool | None = None,
+    ) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            max_batch_size: Maximum texts per forward pass. A single request
+                larger than this is still encoded in one pass.
+            max_wait_ms: Maximum time the oldest queued bulk request waits
+                for more requests to join its batch.
+            pool: Optional worker process pool to run forward passes on.
+                Without it, batches are encoded on the batcher thread.
+        """
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._queues: dict[Priority, deque[_PendingRequest]] = {
+            priority: deque() for priority in Priority
+        }
+        self._queued_texts: dict[Priority, int] = {priority: 0 for priority in Priority}
+        self._cond = threading.Condition()
+        self._pool = pool
+        # One batch in flight per worker; the wait builds the next batch
+        self._slots = threading.Semaphore(pool.num_workers if pool is not None else 1)
+        self._running = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the background batching thread."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(
+            target=self._run,
+            name="embed-batcher",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(
+            f"📦 Batcher started (max_batch_size={self._max_batch_size}, "
+            f"max_wait={self._max_wait * 1000:.1f}ms)"
+        )
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """
+        Stop the batching thread after draining queued requests.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish.
+        """
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        logger.info("📦 Batcher stopped")
+
+    def submit(
+        self,
+        texts: list[str],
+        model_name: str,
+        encode_type: str = "document",
+        priority: Priority = Priority.BULK,
+        timeout: float | None = None,
+    ) -> np.ndarray:
+        """
+        Queue texts for encoding and wait for their vectors.
+
+        Args:
+            texts: Texts to encode.
+            model_name: SentenceTransformer model name.
+            encode_type: Type of encoding - "document" or "query".
+            priority: Scheduling priority for this request.
+            timeout: Optional seconds to wait for the result.
+
+        Returns:
+            Float32 matrix with one row per text, in the order of ``texts``.
+
+        Raises:
+            EncoderError: If the batcher is not running.
+            ModelNotFoundError: If model cannot be loaded.
+            EncodingError: If encoding fails.
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        future = self.enqueue(texts, model_name, encode_type, priority)
+        return future.result(timeout=timeout)
+
+    def enqueue(
+        self,
+        texts: list[str],
+        model_name: str,
+        encode_type: str = "document",
+        priority: Priority = Priority.BULK,
+    ) -> Future:
+        """
+        Queue texts for encoding without waiting.
+
+        Used by streaming callers that keep several batches in flight.
+
+        Args:
+            texts: Texts to encode (must not be empty).
+            model_name: SentenceTransformer model name.
+            encode_type: Type of encoding - "document" or "query".
+            priority: Scheduling priority for this request.
+
+        Returns:
+            Future resolving to the float32 matrix for ``texts``.
+
+        Raises:
+            EncoderError: If the batcher is not running.
+        """
+        request = _PendingRequest(
+            texts=texts,
+            model_name=model_name,
+            encode_type=encode_type,
+            priority=priority,
+        )
+        with self._cond:
+            if not self._running:
+                raise EncoderError("Batcher is not running")
+            self._queues[priority].append(request)
+            self._queued_texts[priority] += len(texts)
+            self._cond.notify_all()
+
+        return request.future
+
+    def _run(self) -> None:
+        """Background loop: collect a batch, run the forward pass, repeat."""
+        while True:
+            self._slots.acquire()
+            with self._cond:
+                while not self._has_pending() and self._running:
+                    self._cond.wait()
+                if not self._has_pending():
+                    self._slots.release()
+                    return
+
+                interactive = self._queues[Priority.INTERACTIVE]
+                bulk = self._queues[Priority.BULK]
+
+                # Hold a bulk batch open until it is full or the oldest
+                # request has waited max_wait. Interactive arrivals and
+                # stop() end the window early.
+                if not interactive:
+                    deadline = bulk[0].enqueued_at + self._max_wait
+                    while (
+                        self._running
+                        and not interactive
+                        and self._queued_texts[Priority.BULK] < self._max_batch_size
+                    ):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+
+                priority = Priority.INTERACTIVE if interactive else Priority.BULK
+                batch = self._take_batch(priority)
+
+            self._execute(batch)
+
+    def _has_pending(self) -> bool:
+        """Check whether any queue has requests. Caller must hold ``_cond``."""
+        return any(self._queues.values())
+
+    def _take_batch(self, priority: Priority) -> list[_PendingRequest]:
+        """
+        Pop the next batch from a priority queue. Caller must hold ``_cond``.
+
+        Takes requests sharing the oldest request's model and encode type,
+        in arrival order, until adding another would exceed max_batch_size.
+        Requests for other models keep their place in the queue.
+
+        Args:
+            priority: Queue to take the batch from.
+
+        Returns:
+            Requests to encode together.
+        """
+        queue = self._queues[priority]
+        key = queue[0].batch_key
+        batch: list[_PendingRequest] = []
+        remaining: deque[_PendingRequest] = deque()
+        total = 0
+
+        for request in queue:
+            fits = total + len(request.texts) <= self._max_batch_size
+            if request.batch_key == key and (not batch or fits):
+                batch.append(request)
+                total += len(request.texts)
+            else:
+                remaining.append(request)
+
+        self._queues[priority] = remaining
+        self._queued_texts[priority] -= total
+        return batch
+
+    def _execute(self, batch: list[_PendingRequest]) -> None:
+        """
+        Encode a batch in one forward pass and resolve each caller's future.
+
+        Releases the batch's slot once the vectors are delivered.
+
+        Args:
+            batch: Requests sharing model and encode type.
+        """
+        texts = [text for request in batch for text in request.texts]
+        started = time.monotonic()
+
+        for request in batch:
+            embed_queue_wait.labels(priority=request.priority.name.lower()).observe(
+                started - request.enqueued_at
+            )
+        embed_batch_texts.observe(len(texts))
+        embed_batch_requests.observe(len(batch))
+
+        if self._pool is not None:
+            try:
+                future = self._pool.submit(
+                    texts=texts,
+                    model_name=batch[0].model_name,
+                    encode_type=batch[0].encode_type,
+                    batch_size=max(self._max_batch_size, len(texts)),
+                )
+            except Exception as e:
+                future = Future()
+                future.set_exception(e)
+            future.add_done_callback(lambda f: self._complete(batch, f, started))
+            return
+
+        future = Future()
+        try:
+            future.set_result(
+                SentenceEncoder.encode_array(
+                    texts=texts,
+                    model_name=batch[0].model_name,
+                    batch_size=max(self._max_batch_size, len(texts)),
+                    encode_type=batch[0].encode_type,
+                )
+            )
+        except Exception as e:
+            future.set_exception(e)
+        self._complete(batch, future, started)
+
+    def _complete(self, batch: list[_PendingRequest], future: Future, started: float) -> None:
+        """
+        Split a finished forward pass back to its callers.
+
+        Args:
+            batch: Requests encoded together.
+            future: Finished future holding the batch matrix or an error.
+            started: Monotonic time the forward pass started.
+        """
+        embed_forward_duration.observe(time.monotonic() - started)
+        try:
+            error = future.exception()
+            if error is not None:
+                for request in batch:
+                    request.future.set_exception(error)
+                return
+
+            vectors = future.result()
+            logger.debug(f"📦 Batched {len(batch)} requests ({len(vectors)} texts)")
+
+            offset = 0
+            for request in batch:
+                count = len(request.texts)
+                request.future.set_result(vectors[offset:offset + count])
+                offset += count
+        finally:
+            self._slots.release()
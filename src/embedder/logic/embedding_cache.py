@@ -0,0 +1,243 @@
+"""
+Content-addressed embedding cache.
+
+Vectors are keyed by (model fingerprint, encode_type, sha256(text)), so
+identical text is encoded once no matter which document or chunking
+session it came from. The fingerprint names the backend and quantization
+as well as the model (see ``SentenceEncoder.fingerprint``), so torch,
+ONNX and int8 vectors never mix, even in the persistent tier. A bounded
+in-memory LRU tier sits in front of an optional SQLite tier that
+survives restarts. Cache hits never reach the forward pass.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from embedder.logic.metrics import embed_cache_bytes, embed_cache_lookups
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[str, str, bytes]
+
+# Keys per SQLite lookup, below the default host parameter limit
+_SQL_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    model TEXT NOT NULL,
+    encode_type TEXT NOT NULL,
+    sha BLOB NOT NULL,
+    vector BLOB NOT NULL,
+    UNIQUE (model, encode_type, sha)
+)
+"""
+
+
+class EmbeddingCache:
+    """
+    Two-tier cache of float32 embedding vectors.
+
+    Thread-safe; shared by all gRPC worker threads.
+
+    Usage:
+        cache = EmbeddingCache(memory_mb=256, disk_path="/data/embeddings.db")
+
+        cached = cache.get_many("my-model#torch", "document", texts)
+        # encode the texts whose entry is None, then:
+        cache.put_many("my-model#torch", "document", missing_texts, vectors)
+    """
+
+    def __init__(
+        self,
+        memory_mb: float = 256.0,
+        disk_path: str | None = None,
+        disk_max_entries: int = 0,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            memory_mb: Budget for the in-memory tier in MiB.
+            disk_path: SQLite database file for the disk tier, or None
+                to keep the cache in memory only.
+            disk_max_entries: Maximum rows in the disk tier, oldest
+                first out (0 = unbounded).
+        """
+        self._memory_budget = int(memory_mb * 1024 * 1024)
+        self._memory: OrderedDict[CacheKey, np.ndarray] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_max_entries = max(0, disk_max_entries)
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self._disk_entries = 0
+
+        if disk_path:
+            Path(disk_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(disk_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(_SCHEMA)
+            self._db.commit()
+            self._disk_entries = self._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            logger.info(f"💾 Embedding disk cache: {disk_path} ({self._disk_entries} entries)")
+
+    @staticmethod
+    def key(model_name: str, encode_type: str, text: str) -> CacheKey:
+        """
+        Build the cache key for a text.
+
+        Args:
+            model_name: Fingerprint of the model that produced the vector.
+            encode_type: "document" or "query".
+            text: Input text.
+
+        Returns:
+            Tuple of model, encode type and the text's SHA-256 digest.
+        """
+        return (model_name, encode_type, hashlib.sha256(text.encode("utf-8")).digest())
+
+    def get_many(
+        self,
+        model_name: str,
+        encode_type: str,
+        texts: list[str],
+    ) -> list[np.ndarray | None]:
+        """
+        Look up cached vectors for texts.
+
+        Disk hits are promoted to the memory tier.
+
+        Args:
+            model_name: Fingerprint of the model the vectors must come from.
+            encode_type: "document" or "query".
+            texts: Texts to look up.
+
+        Returns:
+            One entry per text: the cached vector, or None on a miss.
+        """
+        keys = [self.key(model_name, encode_type, text) for text in texts]
+        results: list[np.ndarray | None] = [None] * len(keys)
+        missing: list[int] = []
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is None:
+                    missing.append(i)
+                else:
+                    self._memory.move_to_end(key)
+                    results[i] = vector
+
+            embed_cache_lookups.labels(tier="memory", result="hit").inc(len(keys) - len(missing))
+            embed_cache_lookups.labels(tier="memory", result="miss").inc(len(missing))
+
+            if self._db is not None and missing:
+                found = self._disk_get(self._db, [keys[i] for i in missing])
+                hits = 0
+                for i in missing:
+                    vector = found.get(keys[i])
+                    if vector is not None:
+                        results[i] = vector
+                        self._remember(keys[i], vector)
+                        hits += 1
+                embed_cache_lookups.labels(tier="disk", result="hit").inc(hits)
+                embed_cache_lookups.labels(tier="disk", result="miss").inc(len(missing) - hits)
+
+        return results
+
+    def put_many(
+        self,
+        model_name: str,
+        encode_type: str,
+        texts: list[str],
+        vectors: np.ndarray,
+    ) -> None:
+        """
+        Store freshly encoded vectors.
+
+        Args:
+            model_name: Fingerprint of the model that produced the vectors.
+            encode_type: "document" or "query".
+            texts: Texts that were encoded.
+            vectors: Matrix with one row per text.
+        """
+        rows = np.asarray(vectors, dtype=np.float32)
+        entries = [
+            # Copy each row so the cache does not pin the whole batch matrix
+            (self.key(model_name, encode_type, text), np.array(row))
+            for text, row in zip(texts, rows)
+        ]
+
+        with self._lock:
+            for key, vector in entries:
+                vector.flags.writeable = False
+                self._remember(key, vector)
+            if self._db is not None:
+                self._disk_put(self._db, entries)
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: CacheKey, vector: np.ndarray) -> None:
+        """Insert into the memory tier and evict LRU entries. Caller must hold ``_lock``."""
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous.nbytes
+        self._memory[key] = vector
+        self._memory_bytes += vector.nbytes
+
+        while self._memory_bytes > self._memory_budget and self._memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+        embed_cache_bytes.set(self._memory_bytes)
+
+    def _disk_get(self, db: sqlite3.Connection, keys: list[CacheKey]) -> dict[CacheKey, np.ndarray]:
+        """Read vectors from SQLite. Caller must hold ``_lock``."""
+        found: dict[CacheKey, np.ndarray] = {}
+        # Keys of one lookup share model and encode type
+        model_name, encode_type, _ = keys[0]
+        for start in range(0, len(keys), _SQL_BATCH):
+            shas = [sha for _, _, sha in keys[start:start + _SQL_BATCH]]
+            rows = db.execute(
+                "SELECT sha, vector FROM embeddings WHERE model = ? AND encode_type = ? "
+                f"AND sha IN ({', '.join('?' * len(shas))})",
+                (model_name, encode_type, *shas),
+            )
+            for sha, vector in rows:
+                found[(model_name, encode_type, sha)] = np.frombuffer(vector, dtype=np.float32)
+        return found
+
+    def _disk_put(self, db: sqlite3.Connection, entries: list[tuple[CacheKey, np.ndarray]]) -> None:
+        """Write vectors to SQLite and prune the oldest rows. Caller must hold ``_lock``."""
+        try:
+            cursor = db.executemany(
+                "INSERT OR IGNORE INTO embeddings (model, encode_type, sha, vector) "
+                "VALUES (?, ?, ?, ?)",
+                [(*key, vector.tobytes()) for key, vector in entries],
+            )
+            self._disk_entries += max(cursor.rowcount, 0)
+
+            overflow = self._disk_entries - self._disk_max_entries
+            if self._disk_max_entries and overflow > 0:
+                db.execute(
+                    "DELETE FROM embeddings WHERE id IN "
+                    "(SELECT id FROM embeddings ORDER BY id LIMIT ?)",
+                    (overflow,),
+                )
+                self._disk_entries -= overflow
+            db.commit()
+        except sqlite3.Error as e:
+            # The disk tier is an optimisation; never fail an embed request on it
+            logger.warning(f"⚠️ Embedding disk cache write failed: {e}")
+            db.rollback()
@@ -3,17 +3,33 @@ SentenceTransformer encoder with model caching.
 
 Provides thread-safe model loading and batch encoding for text embeddings.
 Supports NVIDIA Nemotron embedding models with trust_remote_code.
+
+Several models can be cached at once. The cache is least-recently-used,
+bounded by a model count and an optional memory budget, and models load
+outside the cache lock so encoding with cached models never waits on a
+download.
+
+With a token budget set, texts are sorted by tokenized length and split
+into batches by padded token count rather than a fixed count, so one long
+chunk no longer pads a batch of short ones. Output order is unchanged.
+
+Models load with PyTorch by default, or with ONNX Runtime (optionally int8
+quantized) for CPU-only nodes; see ``onnx_backend``.
 """
 
 import logging
 import threading
+from collections import OrderedDict
+from concurrent.futures import Future
 from typing import ClassVar
 
+import numpy as np
 import torch
 from sentence_transformers import SentenceTransformer
 
 from echomind_lib.helpers.device_checker import get_device
-from embedder.logic.exceptions import EncodingError, ModelNotFoundError
+from embedder.logic.exceptions import EncodingError, ModelLoadingError, ModelNotFoundError
+from embedder.logic.onnx_backend import BACKENDS, load_onnx_model, onnx_model_size
 
 logger = logging.getLogger(__name__)
 
@@ -26,13 +42,43 @@ NVIDIA_EMBED_MODELS = [
 ]
 
 
+def token_buckets(lengths: list[int], max_tokens: int) -> list[list[int]]:
+    """
+    Group texts into batches bounded by padded token count.
+
+    Texts are sorted by length so each batch pads to a similar length.
+    A batch costs ``len(batch) * longest`` tokens; a single text longer
+    than the budget gets a batch of its own.
+
+    Args:
+        lengths: Token count per text.
+        max_tokens: Padded token budget per batch.
+
+    Returns:
+        Batches of indices into ``lengths``, shortest texts first.
+    """
+    order = sorted(range(len(lengths)), key=lengths.__getitem__)
+    batches: list[list[int]] = []
+    batch: list[int] = []
+    for index in order:
+        # Sorted ascending, so the newest text is the longest in the batch
+        if batch and (len(batch) + 1) * lengths[index] > max_tokens:
+            batches.append(batch)
+            batch = []
+        batch.append(index)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
 class SentenceEncoder:
     """
     Thread-safe SentenceTransformer encoder with LRU model caching.
 
     Usage:
-        # Configure cache limit (optional)
+        # Configure cache limits (optional)
         SentenceEncoder.set_cache_limit(2)
+        SentenceEncoder.set_memory_budget(8192)
 
         # Encode texts
         vectors = SentenceEncoder.encode(
@@ -45,8 +91,17 @@ class SentenceEncoder:
     """
 
     _cache_limit: ClassVar[int] = 1
+    _max_batch_tokens: ClassVar[int] = 0
+    _backend: ClassVar[str] = "torch"
+    _onnx_quantize: ClassVar[str] = ""
+    _onnx_cache_dir: ClassVar[str] = "/tmp/echomind/onnx"
+    _memory_budget: ClassVar[int] = 0
     _lock: ClassVar[threading.Lock] = threading.Lock()
-    _model_cache: ClassVar[dict[str, SentenceTransformer]] = {}
+    _model_cache: ClassVar[OrderedDict[str, SentenceTransformer]] = OrderedDict()
+    _model_sizes: ClassVar[dict[str, int]] = {}
+    _loading: ClassVar[dict[str, Future]] = {}
+    _failed: ClassVar[dict[str, ModelNotFoundError]] = {}
+    _pinned: ClassVar[set[str]] = set()
     _device: ClassVar[str | None] = None
 
     @classmethod
@@ -61,6 +116,75 @@ class SentenceEncoder:
             cls._cache_limit = max(1, limit)
             logger.info(f"🔧 Model cache limit set to {cls._cache_limit}")
 
+    @classmethod
+    def set_memory_budget(cls, budget_mb: float) -> None:
+        """
+        Set the memory budget for cached model weights.
+
+        Least recently used models are evicted until the cache fits.
+        A single model larger than the budget is still kept.
+
+        Args:
+            budget_mb: Budget in MiB, or 0 for no budget.
+        """
+        with cls._lock:
+            cls._memory_budget = max(0, int(budget_mb * 1024 * 1024))
+            logger.info(f"🔧 Model memory budget set to {budget_mb:.0f} MiB")
+
+    @classmethod
+    def set_max_batch_tokens(cls, max_tokens: int) -> None:
+        """
+        Set the padded token budget per forward pass.
+
+        Args:
+            max_tokens: Token budget, or 0 to batch by count (batch_size).
+        """
+        with cls._lock:
+            cls._max_batch_tokens = max(0, max_tokens)
+            logger.info(f"🔧 Max batch tokens set to {cls._max_batch_tokens or 'off'}")
+
+    @classmethod
+    def set_backend(
+        cls,
+        backend: str,
+        quantize: str = "",
+        cache_dir: str | None = None,
+    ) -> None:
+        """
+        Set the inference backend for models loaded from now on.
+
+        Args:
+            backend: "torch" or "onnx".
+            quantize: ONNX dynamic int8 preset (avx2, avx512, avx512_vnni,
+                arm64), or empty for the float graph.
+            cache_dir: Directory for exported ONNX models.
+
+        Raises:
+            ValueError: If the backend is unknown.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Invalid backend: {backend}. Must be one of {BACKENDS}")
+        with cls._lock:
+            cls._backend = backend
+            cls._onnx_quantize = quantize
+            if cache_dir:
+                cls._onnx_cache_dir = cache_dir
+            logger.info(
+                f"🔧 Backend set to {backend}"
+                f"{f' (int8 {quantize})' if backend == 'onnx' and quantize else ''}"
+            )
+
+    @classmethod
+    def pin(cls, model_name: str) -> None:
+        """
+        Exclude a model from eviction (used for the default model).
+
+        Args:
+            model_name: Model to keep cached.
+        """
+        with cls._lock:
+            cls._pinned.add(model_name)
+
     @classmethod
     def set_device(cls, device: str | None = None) -> None:
         """
@@ -85,7 +209,8 @@ class SentenceEncoder:
         """
         Get or load a model from cache.
 
-        Thread-safe with LRU eviction when cache is full.
+        Thread-safe with LRU eviction when cache is full. Only callers of
+        the same model wait for a load in progress.
 
         Args:
             model_name: HuggingFace model name or path.
@@ -100,44 +225,227 @@ class SentenceEncoder:
             # Return cached model if available
             if model_name in cls._model_cache:
                 logger.debug(f"🧠 Cache hit for model: {model_name}")
+                cls._model_cache.move_to_end(model_name)
                 return cls._model_cache[model_name]
 
-            # Evict oldest model if cache is full
-            if len(cls._model_cache) >= cls._cache_limit:
-                oldest = next(iter(cls._model_cache))
-                del cls._model_cache[oldest]
-                logger.info(f"🗑️ Evicted model from cache: {oldest}")
-
-            # Load new model
-            try:
-                device = cls._get_device()
-                logger.info(f"📥 Loading model: {model_name} on {device}")
-
-                # Check if this is an NVIDIA model requiring special handling
-                is_nvidia_model = any(
-                    model_name.startswith(prefix) or model_name == prefix
-                    for prefix in NVIDIA_EMBED_MODELS
+            future = cls._loading.get(model_name)
+            owner = future is None
+            if future is None:
+                future = Future()
+                cls._loading[model_name] = future
+
+        if owner:
+            cls._load(model_name, future)
+        return future.result()
+
+    @classmethod
+    def load_async(cls, model_name: str) -> Future:
+        """
+        Start loading a model on a background thread.
+
+        Args:
+            model_name: HuggingFace model name or path.
+
+        Returns:
+            Future resolving to the loaded model, or raising
+            ModelNotFoundError. Already cached models resolve immediately.
+        """
+        with cls._lock:
+            if model_name in cls._model_cache:
+                future: Future = Future()
+                future.set_result(cls._model_cache[model_name])
+                return future
+
+            if model_name in cls._loading:
+                return cls._loading[model_name]
+
+            future = Future()
+            cls._loading[model_name] = future
+
+        threading.Thread(
+            target=cls._load,
+            args=(model_name, future),
+            name=f"model-loader-{model_name}",
+            daemon=True,
+        ).start()
+        return future
+
+    @classmethod
+    def require_loaded(cls, model_name: str) -> None:
+        """
+        Ensure a model is cached without blocking on a load.
+
+        Starts a background load if needed so a later retry finds it.
+
+        Args:
+            model_name: HuggingFace model name or path.
+
+        Raises:
+            ModelLoadingError: If the model is not cached yet.
+            ModelNotFoundError: If the last background load failed.
+        """
+        with cls._lock:
+            if model_name in cls._model_cache:
+                return
+            # Report a failed load once; the next request retries it
+            failure = cls._failed.pop(model_name, None)
+        if failure is not None:
+            raise failure
+
+        future = cls.load_async(model_name)
+        if not future.done():
+            raise ModelLoadingError(model_name)
+        future.result()
+
+    @classmethod
+    def _load(cls, model_name: str, future: Future) -> None:
+        """
+        Load a model outside the cache lock and publish it.
+
+        Args:
+            model_name: HuggingFace model name or path.
+            future: Future registered in ``_loading`` for this model.
+        """
+        try:
+            model = cls._create_model(model_name)
+        except ModelNotFoundError as e:
+            with cls._lock:
+                cls._loading.pop(model_name, None)
+                cls._failed[model_name] = e
+            future.set_exception(e)
+            return
+
+        size = cls._model_size(model_name, model)
+        with cls._lock:
+            cls._model_cache[model_name] = model
+            cls._model_sizes[model_name] = size
+            cls._loading.pop(model_name, None)
+            cls._failed.pop(model_name, None)
+            cls._evict()
+
+        future.set_result(model)
+
+    @classmethod
+    def _create_model(cls, model_name: str) -> SentenceTransformer:
+        """
+        Instantiate a SentenceTransformer model.
+
+        Args:
+            model_name: HuggingFace model name or path.
+
+        Returns:
+            Loaded SentenceTransformer model.
+
+        Raises:
+            ModelNotFoundError: If model cannot be loaded.
+        """
+        try:
+            device = cls._get_device()
+            logger.info(f"📥 Loading model: {model_name} on {device}")
+
+            use_onnx = cls._uses_onnx(model_name)
+            if cls._backend == "onnx" and not use_onnx:
+                logger.warning(f"⚠️ No ONNX export for {model_name}, using torch backend")
+
+            if use_onnx:
+                model = load_onnx_model(
+                    model_name,
+                    device=device,
+                    cache_dir=cls._onnx_cache_dir,
+                    quantize=cls._onnx_quantize,
                 )
+            elif cls._is_nvidia_model(model_name):
+                # NVIDIA models require trust_remote_code and work best with bfloat16
+                logger.info("🚀 Loading NVIDIA model with trust_remote_code=True")
+                model = SentenceTransformer(
+                    model_name,
+                    device=device,
+                    trust_remote_code=True,
+                    model_kwargs={"torch_dtype": torch.bfloat16},
+                )
+            else:
+                # Standard sentence-transformers model
+                model = SentenceTransformer(model_name, device=device)
+
+            logger.info(f"🧠 Model loaded: {model_name} (dim={model.get_sentence_embedding_dimension()})")
+            return model
+        except Exception as e:
+            logger.error(f"❌ Failed to load model {model_name}: {e}")
+            raise ModelNotFoundError(model_name) from e
 
-                if is_nvidia_model:
-                    # NVIDIA models require trust_remote_code and work best with bfloat16
-                    logger.info("🚀 Loading NVIDIA model with trust_remote_code=True")
-                    model = SentenceTransformer(
-                        model_name,
-                        device=device,
-                        trust_remote_code=True,
-                        model_kwargs={"torch_dtype": torch.bfloat16},
-                    )
-                else:
-                    # Standard sentence-transformers model
-                    model = SentenceTransformer(model_name, device=device)
-
-                cls._model_cache[model_name] = model
-                logger.info(f"🧠 Model loaded: {model_name} (dim={model.get_sentence_embedding_dimension()})")
-                return model
-            except Exception as e:
-                logger.error(f"❌ Failed to load model {model_name}: {e}")
-                raise ModelNotFoundError(model_name) from e
+    @classmethod
+    def _evict(cls) -> None:
+        """
+        Evict least recently used models over the count or memory budget.
+
+        The most recently used model and pinned models are never evicted.
+        Caller must hold ``_lock``.
+        """
+        def over_limit() -> bool:
+            if len(cls._model_cache) > cls._cache_limit:
+                return True
+            return bool(cls._memory_budget) and (
+                sum(cls._model_sizes.values()) > cls._memory_budget
+            )
+
+        newest = next(reversed(cls._model_cache))
+        for name in list(cls._model_cache):
+            if not over_limit():
+                break
+            if name == newest or name in cls._pinned:
+                continue
+            del cls._model_cache[name]
+            cls._model_sizes.pop(name, None)
+            logger.info(f"🗑️ Evicted model from cache: {name}")
+
+    @classmethod
+    def _model_size(cls, model_name: str, model: SentenceTransformer) -> int:
+        """
+        Estimate the memory held by a model's weights and buffers.
+
+        ONNX models are measured by their exported graph on disk, since
+        ONNX Runtime sessions have no parameters to sum.
+
+        Args:
+            model_name: HuggingFace model name or path.
+            model: Loaded model.
+
+        Returns:
+            Size in bytes, or 0 if it cannot be determined.
+        """
+        if cls._uses_onnx(model_name):
+            return onnx_model_size(cls._onnx_cache_dir, model_name, cls._onnx_quantize)
+        try:
+            tensors = [*model.parameters(), *model.buffers()]
+            return sum(t.numel() * t.element_size() for t in tensors)
+        except Exception:
+            return 0
+
+    @classmethod
+    def _uses_onnx(cls, model_name: str) -> bool:
+        """Check if a model is loaded with the ONNX backend."""
+        # Remote-code models cannot be exported by sentence-transformers
+        return cls._backend == "onnx" and not cls._is_nvidia_model(model_name)
+
+    @classmethod
+    def fingerprint(cls, model_name: str) -> str:
+        """
+        Identify the vectors a model produces with the current backend.
+
+        The same model gives slightly different vectors on torch, ONNX
+        and int8 ONNX, so caches must not share entries between them.
+
+        Args:
+            model_name: HuggingFace model name or path.
+
+        Returns:
+            Model name with its backend, e.g. ``"BAAI/bge-m3#onnx-int8-avx2"``.
+        """
+        if not cls._uses_onnx(model_name):
+            return f"{model_name}#torch"
+        if cls._onnx_quantize:
+            return f"{model_name}#onnx-int8-{cls._onnx_quantize}"
+        return f"{model_name}#onnx"
 
     @classmethod
     def _is_nvidia_model(cls, model_name: str) -> bool:
@@ -177,39 +485,178 @@ class SentenceEncoder:
         if not texts:
             return []
 
+        return cls.encode_array(
+            texts=texts,
+            model_name=model_name,
+            batch_size=batch_size,
+            normalize=normalize,
+            encode_type=encode_type,
+        ).tolist()
+
+    @classmethod
+    def encode_array(
+        cls,
+        texts: list[str],
+        model_name: str,
+        batch_size: int = 32,
+        normalize: bool = True,
+        encode_type: str = "document",
+    ) -> np.ndarray:
+        """
+        Encode texts to a float32 matrix without converting to Python lists.
+
+        Args:
+            texts: List of texts to encode.
+            model_name: SentenceTransformer model name.
+            batch_size: Batch size for encoding (unused with a token budget).
+            normalize: Normalize vectors to unit length.
+            encode_type: Type of encoding - "document" or "query".
+                         NVIDIA models use different methods for each.
+
+        Returns:
+            Array of shape (len(texts), dimension).
+
+        Raises:
+            ModelNotFoundError: If model cannot be loaded.
+            EncodingError: If encoding fails.
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
         model = cls._get_model(model_name)
 
         try:
-            # Check if this is an NVIDIA model with special encode methods
-            if cls._is_nvidia_model(model_name):
-                # NVIDIA models have encode_query and encode_document methods
-                if encode_type == "query" and hasattr(model, "encode_query"):
-                    logger.debug("🔍 Using encode_query for NVIDIA model")
-                    embeddings = model.encode_query(texts)
-                elif hasattr(model, "encode_document"):
-                    logger.debug("📄 Using encode_document for NVIDIA model")
-                    embeddings = model.encode_document(texts)
-                else:
-                    # Fallback to standard encode
-                    embeddings = model.encode(
-                        texts,
-                        batch_size=batch_size,
-                        normalize_embeddings=normalize,
-                        show_progress_bar=False,
-                    )
+            if cls._max_batch_tokens and len(texts) > 1:
+                return cls._encode_bucketed(model, texts, model_name, normalize, encode_type)
+            return cls._forward(model, texts, model_name, batch_size, normalize, encode_type)
+        except Exception as e:
+            logger.error(f"❌ Encoding failed: {e}")
+            raise EncodingError(str(e), len(texts)) from e
+
+    @classmethod
+    def _encode_bucketed(
+        cls,
+        model: SentenceTransformer,
+        texts: list[str],
+        model_name: str,
+        normalize: bool,
+        encode_type: str,
+    ) -> np.ndarray:
+        """
+        Encode in length-sorted batches bounded by the token budget.
+
+        Args:
+            model: Loaded model.
+            texts: Texts to encode.
+            model_name: Model name (selects the NVIDIA encode methods).
+            normalize: Normalize vectors to unit length.
+            encode_type: Type of encoding - "document" or "query".
+
+        Returns:
+            Array of shape (len(texts), dimension) in the order of ``texts``.
+        """
+        lengths = cls._token_lengths(model, texts)
+        result: np.ndarray | None = None
+
+        for batch in token_buckets(lengths, cls._max_batch_tokens):
+            vectors = cls._forward(
+                model,
+                [texts[i] for i in batch],
+                model_name,
+                len(batch),
+                normalize,
+                encode_type,
+            )
+            if result is None:
+                result = np.empty((len(texts), vectors.shape[1]), dtype=np.float32)
+            result[batch] = vectors
+
+        if result is None:
+            # No texts, so no batches
+            return np.empty((0, 0), dtype=np.float32)
+        logger.debug(f"📏 Encoded {len(texts)} texts in token-budgeted batches")
+        return result
+
+    @staticmethod
+    def _token_lengths(model: SentenceTransformer, texts: list[str]) -> list[int]:
+        """
+        Count tokens per text as the model will see them (truncated).
+
+        Args:
+            model: Loaded model.
+            texts: Texts to measure.
+
+        Returns:
+            Token count per text. Falls back to a characters/4 estimate
+            when the model has no usable tokenizer.
+        """
+        max_length = getattr(model, "max_seq_length", None) or 512
+        try:
+            encoded = model.tokenizer(
+                texts,
+                add_special_tokens=True,
+                truncation=True,
+                max_length=max_length,
+            )
+            return [len(ids) for ids in encoded["input_ids"]]
+        except Exception:
+            return [min(max_length, len(text) // 4 + 2) for text in texts]
+
+    @classmethod
+    def _forward(
+        cls,
+        model: SentenceTransformer,
+        texts: list[str],
+        model_name: str,
+        batch_size: int,
+        normalize: bool,
+        encode_type: str,
+    ) -> np.ndarray:
+        """
+        Run the model over texts.
+
+        Args:
+            model: Loaded model.
+            texts: Texts to encode.
+            model_name: Model name (selects the NVIDIA encode methods).
+            batch_size: Batch size for encoding.
+            normalize: Normalize vectors to unit length.
+            encode_type: Type of encoding - "document" or "query".
+
+        Returns:
+            Float32 array of shape (len(texts), dimension).
+        """
+        # Check if this is an NVIDIA model with special encode methods
+        if cls._is_nvidia_model(model_name):
+            # NVIDIA models have encode_query and encode_document methods
+            if encode_type == "query" and hasattr(model, "encode_query"):
+                logger.debug("🔍 Using encode_query for NVIDIA model")
+                embeddings = model.encode_query(texts)
+            elif hasattr(model, "encode_document"):
+                logger.debug("📄 Using encode_document for NVIDIA model")
+                embeddings = model.encode_document(texts)
             else:
-                # Standard sentence-transformers encoding
+                # Fallback to standard encode
                 embeddings = model.encode(
                     texts,
                     batch_size=batch_size,
                     normalize_embeddings=normalize,
                     show_progress_bar=False,
                 )
+        else:
+            # Standard sentence-transformers encoding
+            embeddings = model.encode(
+                texts,
+                batch_size=batch_size,
+                normalize_embeddings=normalize,
+                show_progress_bar=False,
+            )
 
-            return [emb.tolist() for emb in embeddings]
-        except Exception as e:
-            logger.error(f"❌ Encoding failed: {e}")
-            raise EncodingError(str(e), len(texts)) from e
+        # NVIDIA encode_* may return bfloat16 tensors, which numpy cannot read
+        if isinstance(embeddings, torch.Tensor):
+            embeddings = embeddings.float().cpu().numpy()
+
+        return np.asarray(embeddings, dtype=np.float32)
 
     @classmethod
     def encode_query(
@@ -275,10 +722,19 @@ class SentenceEncoder:
         """Clear all cached models."""
         with cls._lock:
             cls._model_cache.clear()
+            cls._model_sizes.clear()
+            cls._failed.clear()
+            cls._pinned.clear()
             logger.info("🗑️ Model cache cleared")
 
     @classmethod
     def get_cached_models(cls) -> list[str]:
-        """Get list of currently cached model names."""
+        """Get list of currently cached model names, least recently used first."""
         with cls._lock:
             return list(cls._model_cache.keys())
+
+    @classmethod
+    def get_cache_size_mb(cls) -> float:
+        """Get the estimated memory held by cached models in MiB."""
+        with cls._lock:
+            return sum(cls._model_sizes.values()) / (1024 * 1024)
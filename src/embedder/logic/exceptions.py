@@ -20,9 +20,18 @@ class ModelNotFoundError(EncoderError):
         super().__init__(f"Model not found: {model_name}")
 
 
+class ModelLoadingError(EncoderError):
+    """Raised when a requested model is still loading in the background."""
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        super().__init__(f"Model is loading: {model_name}")
+
+
 class EncodingError(EncoderError):
     """Raised when encoding fails."""
 
     def __init__(self, message: str, texts_count: int):
+        self.message = message
         self.texts_count = texts_count
         super().__init__(f"Encoding failed for {texts_count} texts: {message}")
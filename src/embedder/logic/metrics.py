@@ -0,0 +1,42 @@
+"""
+Prometheus metrics for the Embedder Service.
+
+Metric instruments are module-level singletons registered in the default
+registry and exposed on the health server's /metrics endpoint.
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# Effective batch sizes are bounded by batch_max_size (default 32)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+embed_queue_wait = Histogram(
+    "embedder_queue_wait_seconds",
+    "Time an embed request waits in the batching queue before its forward pass",
+    ["priority"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+embed_batch_texts = Histogram(
+    "embedder_batch_texts",
+    "Number of texts encoded per forward pass",
+    buckets=BATCH_SIZE_BUCKETS,
+)
+embed_batch_requests = Histogram(
+    "embedder_batch_requests",
+    "Number of RPC requests merged into one forward pass",
+    buckets=BATCH_SIZE_BUCKETS,
+)
+embed_forward_duration = Histogram(
+    "embedder_forward_duration_seconds",
+    "Duration of a single batched forward pass",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+)
+embed_cache_lookups = Counter(
+    "embedder_cache_lookups",
+    "Embedding cache lookups per text by tier and result",
+    ["tier", "result"],
+)
+embed_cache_bytes = Gauge(
+    "embedder_cache_memory_bytes",
+    "Bytes of vectors held in the in-memory embedding cache tier",
+)
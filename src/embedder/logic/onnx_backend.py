@@ -0,0 +1,135 @@
+"""
+ONNX Runtime backend for SentenceEncoder.
+
+Exports a model to ONNX once, optionally quantizes it dynamically to int8,
+and caches the result on disk so later starts load the graph directly.
+The loaded object is still a SentenceTransformer, so encoding goes through
+the same ``encode`` path as the PyTorch backend.
+
+Requires the optional ``onnx`` dependencies (optimum + onnxruntime).
+"""
+
+import logging
+from pathlib import Path
+
+from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = {"torch", "onnx"}
+
+# Dynamic int8 quantization presets understood by sentence-transformers
+QUANTIZATION_PRESETS = {"arm64", "avx2", "avx512", "avx512_vnni"}
+
+
+def export_dir(cache_dir: str, model_name: str) -> Path:
+    """
+    Directory holding the exported ONNX model for a model name.
+
+    Args:
+        cache_dir: Root of the ONNX export cache.
+        model_name: HuggingFace model name or path.
+
+    Returns:
+        Per-model export directory.
+    """
+    return Path(cache_dir) / model_name.strip("/").replace("/", "__")
+
+
+def onnx_file_name(quantize: str) -> str:
+    """
+    Relative ONNX file name inside an export directory.
+
+    Args:
+        quantize: Quantization preset, or empty for the float graph.
+
+    Returns:
+        Path such as ``onnx/model.onnx`` or ``onnx/model_qint8_avx2.onnx``.
+    """
+    return f"onnx/model_qint8_{quantize}.onnx" if quantize else "onnx/model.onnx"
+
+
+def onnx_model_size(cache_dir: str, model_name: str, quantize: str = "") -> int:
+    """
+    Size of an exported ONNX graph on disk.
+
+    ONNX Runtime sessions expose no parameters to sum, and they hold
+    roughly the weights stored in the graph, so the file size is used as
+    the model's memory estimate.
+
+    Args:
+        cache_dir: Root of the ONNX export cache.
+        model_name: HuggingFace model name or path.
+        quantize: Quantization preset, or empty for the float graph.
+
+    Returns:
+        Size in bytes of the graph and its external data files, or 0 if
+        the model has not been exported.
+    """
+    graph = export_dir(cache_dir, model_name) / onnx_file_name(quantize)
+    if not graph.parent.is_dir():
+        return 0
+    # Graphs over 2 GB keep their weights next to them in model.onnx_data
+    return sum(path.stat().st_size for path in graph.parent.glob(f"{graph.name}*") if path.is_file())
+
+
+def load_onnx_model(
+    model_name: str,
+    device: str,
+    cache_dir: str,
+    quantize: str = "",
+) -> SentenceTransformer:
+    """
+    Load a model with the ONNX Runtime backend, exporting it on first use.
+
+    Args:
+        model_name: HuggingFace model name or path.
+        device: Device string; ONNX Runtime runs on CPU unless the GPU
+            execution provider is installed.
+        cache_dir: Root of the ONNX export cache.
+        quantize: Dynamic int8 quantization preset, or empty for float.
+
+    Returns:
+        SentenceTransformer backed by an ONNX Runtime session.
+
+    Raises:
+        ValueError: If the quantization preset is unknown.
+        ImportError: If optimum / onnxruntime are not installed.
+    """
+    if quantize and quantize not in QUANTIZATION_PRESETS:
+        raise ValueError(
+            f"Invalid ONNX quantization: {quantize}. Must be one of {QUANTIZATION_PRESETS}"
+        )
+
+    target = export_dir(cache_dir, model_name)
+    file_name = onnx_file_name(quantize)
+
+    if (target / file_name).exists():
+        logger.info(f"📦 Loading cached ONNX model: {target / file_name}")
+        return SentenceTransformer(
+            str(target),
+            device=device,
+            backend="onnx",
+            model_kwargs={"file_name": file_name},
+        )
+
+    logger.info(f"🔄 Exporting {model_name} to ONNX ({target})")
+    model = SentenceTransformer(model_name, device=device, backend="onnx")
+    model.save_pretrained(str(target))
+
+    if not quantize:
+        return model
+
+    logger.info(f"🔄 Quantizing {model_name} to int8 ({quantize})")
+    export_dynamic_quantized_onnx_model(
+        model,
+        quantize,
+        str(target),
+        file_suffix=f"qint8_{quantize}",
+    )
+    return SentenceTransformer(
+        str(target),
+        device=device,
+        backend="onnx",
+        model_kwargs={"file_name": file_name},
+    )
@@ -0,0 +1,162 @@
+"""
+Cross-encoder reranker for the Embedder Service.
+
+Scores (query, passage) pairs with a small cross-encoder such as
+``cross-encoder/ms-marco-MiniLM-L-6-v2``. Pairs are sorted by length
+before batching so short passages are not padded to the longest one,
+and passages are truncated to ``max_length`` tokens to bound CPU cost.
+"""
+
+import logging
+import threading
+from typing import ClassVar
+
+import numpy as np
+from sentence_transformers import CrossEncoder
+
+from echomind_lib.helpers.device_checker import get_device
+from embedder.logic.exceptions import EncodingError, ModelNotFoundError
+
+logger = logging.getLogger(__name__)
+
+
+class CrossEncoderReranker:
+    """
+    Thread-safe cross-encoder scorer with per-model caching.
+
+    Usage:
+        CrossEncoderReranker.set_max_length(256)
+
+        scores = CrossEncoderReranker.score(
+            query="how do I reset my password?",
+            passages=["Open Settings > Security ...", "Lunch is on me"],
+            model_name="cross-encoder/ms-marco-MiniLM-L-6-v2",
+        )
+    """
+
+    _max_length: ClassVar[int] = 512
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _model_cache: ClassVar[dict[str, CrossEncoder]] = {}
+    _device: ClassVar[str | None] = None
+
+    @classmethod
+    def set_max_length(cls, max_length: int) -> None:
+        """
+        Set the token limit per (query, passage) pair.
+
+        Args:
+            max_length: Maximum tokens per pair; longer pairs are truncated.
+        """
+        with cls._lock:
+            cls._max_length = max(16, max_length)
+            for model in cls._model_cache.values():
+                model.max_length = cls._max_length
+            logger.info(f"🔧 Rerank max length set to {cls._max_length}")
+
+    @classmethod
+    def set_device(cls, device: str | None = None) -> None:
+        """
+        Set the device for reranker inference.
+
+        Args:
+            device: Device string (cuda:0, mps, cpu) or None for auto-detect.
+        """
+        with cls._lock:
+            cls._device = device or get_device()
+
+    @classmethod
+    def _get_model(cls, model_name: str) -> CrossEncoder:
+        """
+        Get or load a cross-encoder.
+
+        Args:
+            model_name: HuggingFace model name or path.
+
+        Returns:
+            Loaded CrossEncoder.
+
+        Raises:
+            ModelNotFoundError: If model cannot be loaded.
+        """
+        with cls._lock:
+            model = cls._model_cache.get(model_name)
+            if model is not None:
+                return model
+
+            try:
+                device = cls._device or get_device()
+                logger.info(f"📥 Loading reranker: {model_name} on {device}")
+                model = CrossEncoder(model_name, device=device, max_length=cls._max_length)
+            except Exception as e:
+                logger.error(f"❌ Failed to load reranker {model_name}: {e}")
+                raise ModelNotFoundError(model_name) from e
+
+            cls._model_cache[model_name] = model
+            logger.info(f"🧠 Reranker loaded: {model_name}")
+            return model
+
+    @classmethod
+    def load(cls, model_name: str) -> None:
+        """
+        Load a reranker ahead of the first request.
+
+        Args:
+            model_name: HuggingFace model name or path.
+
+        Raises:
+            ModelNotFoundError: If model cannot be loaded.
+        """
+        cls._get_model(model_name)
+
+    @classmethod
+    def score(
+        cls,
+        query: str,
+        passages: list[str],
+        model_name: str,
+        batch_size: int = 32,
+    ) -> np.ndarray:
+        """
+        Score passages against a query.
+
+        Args:
+            query: Search query.
+            passages: Candidate passages.
+            model_name: Cross-encoder model name.
+            batch_size: Pairs per forward pass.
+
+        Returns:
+            Float32 relevance score per passage, in input order. Single-label
+            models return sigmoid scores in [0, 1].
+
+        Raises:
+            ModelNotFoundError: If model cannot be loaded.
+            EncodingError: If scoring fails.
+        """
+        if not passages:
+            return np.empty(0, dtype=np.float32)
+
+        model = cls._get_model(model_name)
+
+        # Similar lengths per batch keep padding (and CPU time) down
+        order = sorted(range(len(passages)), key=lambda i: len(passages[i]))
+        try:
+            sorted_scores = model.predict(
+                [(query, passages[i]) for i in order],
+                batch_size=batch_size,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+            )
+        except Exception as e:
+            logger.error(f"❌ Reranking failed: {e}")
+            raise EncodingError(str(e), len(passages)) from e
+
+        scores = np.empty(len(passages), dtype=np.float32)
+        scores[order] = np.asarray(sorted_scores, dtype=np.float32).reshape(len(passages))
+        return scores
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear all cached rerankers."""
+        with cls._lock:
+            cls._model_cache.clear()
@@ -0,0 +1,431 @@
+"""
+Multi-process CPU inference workers.
+
+On CPU-only nodes a single process cannot use many cores well: PyTorch
+intra-op threads compete with gRPC threads for the GIL and the scheduler.
+The pool starts N spawned worker processes. Each one loads its own copy of
+the model and runs with a fixed thread count, optionally pinned to its own
+set of cores.
+
+Texts are sent to workers over a task queue. Workers write the result
+matrix into a shared memory block and return only the block name, so the
+vectors are never pickled.
+"""
+
+import itertools
+import logging
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from multiprocessing import shared_memory
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+import numpy as np
+
+from embedder.logic.exceptions import EncoderError, EncodingError, ModelNotFoundError
+
+logger = logging.getLogger(__name__)
+
+# Seconds between worker liveness checks
+_POLL_INTERVAL = 1.0
+
+
+@dataclass
+class WorkerConfig:
+    """Encoder settings applied in every worker process."""
+
+    default_model: str
+    threads: int
+    cache_limit: int = 1
+    memory_budget_mb: float = 0.0
+    max_batch_tokens: int = 0
+    backend: str = "torch"
+    onnx_quantize: str = ""
+    onnx_cache_dir: str | None = None
+    cpus: list[int] | None = None
+
+
+def _pin_worker(config: WorkerConfig) -> None:
+    """Restrict a worker to its cores and thread count."""
+    if config.cpus and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, config.cpus)
+
+    import torch
+
+    torch.set_num_threads(config.threads)
+    torch.set_num_interop_threads(1)
+
+
+def _share_result(vectors: np.ndarray) -> tuple[str, tuple[int, ...]]:
+    """
+    Copy a result matrix into a new shared memory block.
+
+    Args:
+        vectors: Float32 matrix to share.
+
+    Returns:
+        Block name and array shape. The parent process unlinks the block.
+    """
+    block = shared_memory.SharedMemory(create=True, size=max(1, vectors.nbytes))
+    try:
+        np.ndarray(vectors.shape, dtype=np.float32, buffer=block.buf)[:] = vectors
+        return block.name, vectors.shape
+    finally:
+        block.close()
+
+
+def _worker_main(
+    index: int,
+    config: WorkerConfig,
+    tasks: mp.Queue,
+    results: mp.Queue,
+) -> None:
+    """
+    Worker process loop: encode tasks until a None task arrives.
+
+    Args:
+        index: Worker number, for logs.
+        config: Encoder settings.
+        tasks: Queue of (task_id, kind, payload) tuples.
+        results: Queue of (task_id, status, value) tuples.
+    """
+    _pin_worker(config)
+
+    from embedder.logic.encoder import SentenceEncoder
+
+    SentenceEncoder.set_device("cpu")
+    SentenceEncoder.set_cache_limit(config.cache_limit)
+    SentenceEncoder.set_memory_budget(config.memory_budget_mb)
+    SentenceEncoder.set_max_batch_tokens(config.max_batch_tokens)
+    SentenceEncoder.set_backend(config.backend, config.onnx_quantize, config.onnx_cache_dir)
+    SentenceEncoder.pin(config.default_model)
+
+    try:
+        SentenceEncoder.get_dimension(config.default_model)
+    except ModelNotFoundError as e:
+        logger.error(f"❌ Worker {index} failed to load {e.model_name}")
+
+    logger.info(f"🧵 Inference worker {index} ready ({config.threads} threads)")
+
+    while True:
+        task = tasks.get()
+        if task is None:
+            return
+
+        task_id, kind, payload = task
+        try:
+            if kind == "dimension":
+                results.put((task_id, "ok", SentenceEncoder.get_dimension(payload)))
+            else:
+                vectors = SentenceEncoder.encode_array(**payload)
+                results.put((task_id, "shm", _share_result(vectors)))
+        except ModelNotFoundError as e:
+            results.put((task_id, "model_not_found", e.model_name))
+        except EncodingError as e:
+            results.put((task_id, "encoding", (e.message, e.texts_count)))
+        except Exception as e:
+            results.put((task_id, "error", str(e)))
+
+
+def _read_result(name: str, shape: tuple[int, ...]) -> np.ndarray:
+    """
+    Copy a result out of shared memory and release the block.
+
+    Args:
+        name: Shared memory block name.
+        shape: Array shape.
+
+    Returns:
+        Float32 matrix owned by this process.
+    """
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        return np.ndarray(shape, dtype=np.float32, buffer=block.buf).copy()
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _to_exception(status: str, value: Any) -> Exception:
+    """Rebuild an encoder exception reported by a worker."""
+    if status == "model_not_found":
+        return ModelNotFoundError(value)
+    if status == "encoding":
+        return EncodingError(*value)
+    return EncoderError(f"Inference worker error: {value}")
+
+
+def default_threads(num_workers: int) -> int:
+    """
+    Split the available cores between workers.
+
+    Args:
+        num_workers: Number of worker processes.
+
+    Returns:
+        Threads per worker (at least 1).
+    """
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    return max(1, (cores or 1) // max(1, num_workers))
+
+
+class InferenceWorkerPool:
+    """
+    Pool of encoder processes fed from one task queue.
+
+    Idle workers pull the next task, so batches spread across workers
+    without explicit scheduling. A worker that dies is restarted and the
+    tasks in flight fail with EncoderError so callers can retry.
+
+    Usage:
+        pool = InferenceWorkerPool(num_workers=4, default_model="my-model")
+        pool.start()
+
+        vectors = pool.submit(["Hello world"], model_name="my-model").result()
+
+        pool.stop()
+    """
+
+    def __init__(
+        self,
+        num_workers: int,
+        default_model: str,
+        threads_per_worker: int = 0,
+        pin_cpus: bool = True,
+        cache_limit: int = 1,
+        memory_budget_mb: float = 0.0,
+        max_batch_tokens: int = 0,
+        backend: str = "torch",
+        onnx_quantize: str = "",
+        onnx_cache_dir: str | None = None,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            num_workers: Number of worker processes.
+            default_model: Model every worker loads at startup.
+            threads_per_worker: PyTorch threads per worker, or 0 to split
+                the available cores evenly.
+            pin_cpus: Pin each worker to its own cores (Linux only).
+            cache_limit: Model cache limit per worker.
+            memory_budget_mb: Model memory budget per worker.
+            max_batch_tokens: Token budget per forward pass.
+            backend: Inference backend, "torch" or "onnx".
+            onnx_quantize: ONNX int8 quantization preset, or empty.
+            onnx_cache_dir: Directory for exported ONNX models.
+        """
+        self.num_workers = max(1, num_workers)
+        self._threads = threads_per_worker or default_threads(self.num_workers)
+        self._pin_cpus = pin_cpus
+        self._config = WorkerConfig(
+            default_model=default_model,
+            threads=self._threads,
+            cache_limit=cache_limit,
+            memory_budget_mb=memory_budget_mb,
+            max_batch_tokens=max_batch_tokens,
+            backend=backend,
+            onnx_quantize=onnx_quantize,
+            onnx_cache_dir=onnx_cache_dir,
+        )
+        self._ctx = mp.get_context("spawn")
+        self._tasks: mp.Queue = self._ctx.Queue()
+        self._results: mp.Queue = self._ctx.Queue()
+        self._processes: list[BaseProcess] = []
+        self._pending: dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._running = False
+        self._collector: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the worker processes and the result collector thread."""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._processes = [self._spawn(index) for index in range(self.num_workers)]
+
+        self._collector = threading.Thread(
+            target=self._collect,
+            name="inference-results",
+            daemon=True,
+        )
+        self._collector.start()
+        logger.info(
+            f"🧵 Inference pool started ({self.num_workers} workers x {self._threads} threads, "
+            f"pinned={self._pin_cpus})"
+        )
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Stop the workers after their current task.
+
+        Args:
+            timeout: Seconds to wait for each worker to exit.
+        """
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            processes = list(self._processes)
+
+        for _ in processes:
+            self._tasks.put(None)
+        for process in processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+
+        self._fail_pending(EncoderError("Inference pool stopped"))
+        if self._collector is not None:
+            self._collector.join(timeout)
+            self._collector = None
+        logger.info("🧵 Inference pool stopped")
+
+    def submit(
+        self,
+        texts: list[str],
+        model_name: str,
+        encode_type: str = "document",
+        batch_size: int = 32,
+    ) -> Future:
+        """
+        Queue texts for encoding on the next idle worker.
+
+        Args:
+            texts: Texts to encode.
+            model_name: SentenceTransformer model name.
+            encode_type: Type of encoding - "document" or "query".
+            batch_size: Batch size for encoding.
+
+        Returns:
+            Future resolving to a float32 matrix with one row per text.
+
+        Raises:
+            EncoderError: If the pool is not running.
+        """
+        return self._send(
+            "encode",
+            {
+                "texts": texts,
+                "model_name": model_name,
+                "encode_type": encode_type,
+                "batch_size": batch_size,
+            },
+        )
+
+    def get_dimension(self, model_name: str, timeout: float | None = None) -> int:
+        """
+        Get a model's embedding dimension from a worker.
+
+        Args:
+            model_name: SentenceTransformer model name.
+            timeout: Optional seconds to wait.
+
+        Returns:
+            Embedding vector dimension.
+
+        Raises:
+            ModelNotFoundError: If the model cannot be loaded.
+        """
+        return self._send("dimension", model_name).result(timeout=timeout)
+
+    def _send(self, kind: str, payload: Any) -> Future:
+        """Register a future and put a task on the queue."""
+        future: Future = Future()
+        with self._lock:
+            if not self._running:
+                raise EncoderError("Inference pool is not running")
+            task_id = next(self._ids)
+            self._pending[task_id] = future
+        self._tasks.put((task_id, kind, payload))
+        return future
+
+    def _spawn(self, index: int) -> BaseProcess:
+        """Start worker ``index``. Caller must hold ``_lock``."""
+        cpus = None
+        if self._pin_cpus and hasattr(os, "sched_getaffinity"):
+            available = sorted(os.sched_getaffinity(0))
+            start = index * self._threads
+            if start + self._threads <= len(available):
+                cpus = available[start:start + self._threads]
+
+        config = replace(self._config, cpus=cpus)
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(index, config, self._tasks, self._results),
+            name=f"inference-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        return process
+
+    def _collect(self) -> None:
+        """Resolve futures from worker results; restart dead workers."""
+        # Liveness is checked on a timer, not only when the queue is idle:
+        # under steady load another worker's results keep arriving and a
+        # crashed worker's futures would otherwise never fail
+        next_check = time.monotonic() + _POLL_INTERVAL
+        while True:
+            try:
+                task_id, status, value = self._results.get(
+                    timeout=max(0.0, next_check - time.monotonic())
+                )
+            except queue.Empty:
+                if not self._running:
+                    return
+            else:
+                self._resolve(task_id, status, value)
+
+            if time.monotonic() >= next_check:
+                self._check_workers()
+                next_check = time.monotonic() + _POLL_INTERVAL
+
+    def _resolve(self, task_id: int, status: str, value: Any) -> None:
+        """Complete the future of one worker result."""
+        with self._lock:
+            future = self._pending.pop(task_id, None)
+        if future is None or future.done():
+            # The task was failed after a worker crash; drop its buffer
+            if status == "shm":
+                _read_result(*value)
+            return
+
+        try:
+            if status == "shm":
+                future.set_result(_read_result(*value))
+            elif status == "ok":
+                future.set_result(value)
+            else:
+                future.set_exception(_to_exception(status, value))
+        except Exception as e:
+            future.set_exception(EncoderError(f"Failed to read worker result: {e}"))
+
+    def _check_workers(self) -> None:
+        """Restart exited workers and fail the tasks that may have been lost."""
+        with self._lock:
+            if not self._running:
+                return
+            dead = [i for i, process in enumerate(self._processes) if not process.is_alive()]
+            for index in dead:
+                code = self._processes[index].exitcode
+                logger.error(f"❌ Inference worker {index} exited ({code}), restarting")
+                self._processes[index] = self._spawn(index)
+
+        if dead:
+            # Tasks are not tracked per worker, so every in-flight task fails
+            self._fail_pending(EncoderError("Inference worker exited"))
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail all in-flight futures."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
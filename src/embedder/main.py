@@ -11,29 +11,51 @@ Environment Variables:
     EMBEDDER_HEALTH_PORT: Health check port (default: 8080)
     EMBEDDER_MODEL_NAME: Default model name
     EMBEDDER_MODEL_CACHE_LIMIT: Max models in cache (default: 1)
+    EMBEDDER_MODEL_MEMORY_BUDGET_MB: Cached model memory budget (default: 0, none)
+    EMBEDDER_ALLOWED_MODELS: JSON list of selectable extra models (default: [])
     EMBEDDER_PREFER_GPU: Use GPU if available (default: true)
+    EMBEDDER_MAX_BATCH_TOKENS: Padded token budget per forward pass (default: 8192, 0 = off)
+    EMBEDDER_BATCHING_ENABLED: Merge concurrent requests (default: true)
+    EMBEDDER_BATCH_MAX_SIZE: Max texts per batched forward pass (default: 32)
+    EMBEDDER_BATCH_MAX_WAIT_MS: Max batching wait window (default: 5.0)
+    EMBEDDER_BACKEND: Inference backend, torch or onnx (default: torch)
+    EMBEDDER_ONNX_QUANTIZE: ONNX int8 preset, e.g. avx512_vnni (default: none)
+    EMBEDDER_RERANK_MODEL: Cross-encoder for the Rerank RPC (empty = disabled)
+    EMBEDDER_INFERENCE_WORKERS: CPU inference worker processes (default: 0, in-process)
+    EMBEDDER_INFERENCE_THREADS_PER_WORKER: Threads per worker (default: 0, cores / workers)
+    EMBEDDER_EMBEDDING_CACHE_MB: In-memory embedding cache size (default: 256, 0 = off)
+    EMBEDDER_EMBEDDING_CACHE_PATH: SQLite file for the disk cache tier (default: off)
     EMBEDDER_LOG_LEVEL: Logging level (default: INFO)
 """
 
+import functools
 import logging
 import os
+import queue
 import sys
 import threading
 import time
 from concurrent import futures
+from concurrent.futures import Future
 from types import ModuleType
 
 import grpc
+import numpy as np
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from echomind_lib.helpers.device_checker import DeviceChecker
 from echomind_lib.helpers.readiness_probe import HealthServer
+from echomind_lib.helpers.vector_codec import is_packed, pack_matrix
 from echomind_lib.models.internal.embedding_pb2 import (
+    EMBED_PRIORITY_INTERACTIVE,
     DimensionResponse,
     EmbedResponse,
+    EmbedStreamResponse,
     Embedding,
+    RerankResponse,
+    VectorEncoding,
 )
 from echomind_lib.models.internal.embedding_pb2_grpc import (
     EmbedServiceServicer,
@@ -41,8 +63,12 @@ from echomind_lib.models.internal.embedding_pb2_grpc import (
 )
 
 from embedder.config import get_settings
+from embedder.logic.batcher import EmbedBatcher, Priority
+from embedder.logic.embedding_cache import EmbeddingCache
 from embedder.logic.encoder import SentenceEncoder
-from embedder.logic.exceptions import EncoderError, ModelNotFoundError
+from embedder.logic.exceptions import EncoderError, ModelLoadingError, ModelNotFoundError
+from embedder.logic.reranker import CrossEncoderReranker
+from embedder.logic.worker_pool import InferenceWorkerPool
 
 # Configure logging
 logging.basicConfig(
@@ -52,6 +78,78 @@ logging.basicConfig(
 logger = logging.getLogger("echomind-embedder")
 
 
+MIN_TEXT_LENGTH = 50
+
+# The servicer always encodes with the document method
+ENCODE_TYPE = "document"
+
+# Sentinel marking the end of a request stream
+_STREAM_END = object()
+
+
+class _InvalidBatchError(Exception):
+    """A stream batch failed validation."""
+
+    def __init__(self, batch_id: int, message: str):
+        self.batch_id = batch_id
+        self.message = message
+        super().__init__(message)
+
+
+def _validate_texts(texts) -> str | None:
+    """
+    Validate texts of an embed request.
+
+    Args:
+        texts: Texts from an EmbedRequest or EmbedStreamRequest.
+
+    Returns:
+        Error message for INVALID_ARGUMENT, or None if all texts are valid.
+    """
+    if not texts:
+        return "texts cannot be empty"
+
+    for idx, text in enumerate(texts):
+        if not text:
+            return f"Text at index {idx} is empty"
+
+        if not text.strip():
+            return f"Text at index {idx} contains only whitespace"
+
+        if len(text.strip()) < MIN_TEXT_LENGTH:
+            return (
+                f"Text at index {idx} is too short "
+                f"({len(text.strip())} chars, minimum {MIN_TEXT_LENGTH})"
+            )
+
+    return None
+
+
+def _vector_fields(vectors, encoding: VectorEncoding) -> dict:
+    """
+    Build the vector fields of an embed response.
+
+    Args:
+        vectors: Encoded vectors, a float32 matrix or a list of rows.
+        encoding: Requested VectorEncoding.
+
+    Returns:
+        ``{"matrix": ...}`` for packed encodings, else ``{"embeddings": ...}``.
+    """
+    if is_packed(encoding):
+        return {"matrix": pack_matrix(vectors, encoding)}
+
+    rows = vectors.tolist() if hasattr(vectors, "tolist") else vectors
+    return {
+        "embeddings": [Embedding(vector=vec, dimension=len(vec)) for vec in rows]
+    }
+
+
+def _to_priority(value: int) -> Priority:
+    """Map a proto EmbedPriority to a batcher priority (unspecified is bulk)."""
+    return Priority.INTERACTIVE if value == EMBED_PRIORITY_INTERACTIVE else Priority.BULK
+
+
 class EmbedServicer(EmbedServiceServicer):
     """
     gRPC servicer for embedding operations.
@@ -59,16 +157,115 @@ class EmbedServicer(EmbedServiceServicer):
     Implements the EmbedService defined in embedding.proto.
     """
 
-    def __init__(self, default_model: str, batch_size: int = 32):
+    def __init__(
+        self,
+        default_model: str,
+        batch_size: int = 32,
+        batcher: EmbedBatcher | None = None,
+        allowed_models: list[str] | None = None,
+        cache: EmbeddingCache | None = None,
+        pool: InferenceWorkerPool | None = None,
+        rerank_model: str = "",
+        rerank_batch_size: int = 32,
+        rerank_max_passages: int = 200,
+    ):
         """
         Initialize the servicer.
 
         Args:
             default_model: Default model name for embeddings.
             batch_size: Default batch size for encoding.
+            batcher: Optional micro-batching scheduler. When set, concurrent
+                requests share forward passes instead of encoding per RPC.
+            allowed_models: Additional models clients may select per request.
+            cache: Optional embedding cache. Cached texts skip the forward pass.
+            pool: Optional inference worker pool. Workers hold the models, so
+                the servicer asks them for dimensions instead of loading locally.
+            rerank_model: Cross-encoder for Rerank, or empty to disable it.
+            rerank_batch_size: Pairs per reranker forward pass.
+            rerank_max_passages: Maximum passages per Rerank request.
         """
         self._default_model = default_model
         self._batch_size = batch_size
+        self._batcher = batcher
+        self._allowed_models = {default_model, *(allowed_models or [])}
+        self._cache = cache
+        self._pool = pool
+        self._rerank_model = rerank_model
+        self._rerank_batch_size = rerank_batch_size
+        self._rerank_max_passages = rerank_max_passages
+
+    def _resolve_model(self, requested: str) -> str:
+        """
+        Resolve the model for a request.
+
+        Non-default models are loaded in the background on first use so a
+        slow download never blocks the gRPC worker.
+
+        Args:
+            requested: Model name from the request, or empty for the default.
+
+        Returns:
+            Model name to encode with.
+
+        Raises:
+            ModelNotFoundError: If the model is not allowed or failed to load.
+            ModelLoadingError: If the model is still loading.
+        """
+        model_name = requested or self._default_model
+        if model_name not in self._allowed_models:
+            raise ModelNotFoundError(model_name)
+        # Worker processes load their own models on first use
+        if model_name != self._default_model and self._pool is None:
+            SentenceEncoder.require_loaded(model_name)
+        return model_name
+
+    def _cache_lookup(self, texts: list[str], model_name: str) -> list[np.ndarray | None]:
+        """
+        Look up cached vectors for texts.
+
+        Args:
+            texts: Texts to embed.
+            model_name: Model the vectors must come from.
+
+        Returns:
+            Cached vector or None per text (all None without a cache).
+        """
+        if self._cache is None:
+            return [None] * len(texts)
+        return self._cache.get_many(SentenceEncoder.fingerprint(model_name), ENCODE_TYPE, texts)
+
+    def _cache_fill(
+        self,
+        texts: list[str],
+        cached: list[np.ndarray | None],
+        vectors,
+        model_name: str,
+    ):
+        """
+        Store newly encoded vectors and merge them with cache hits.
+
+        Args:
+            texts: All texts of the request.
+            cached: Result of ``_cache_lookup`` for ``texts``.
+            vectors: Vectors encoded for the missed texts, in order.
+            model_name: Model that produced the vectors.
+
+        Returns:
+            Vectors for all texts in request order. Without a cache,
+            ``vectors`` is returned unchanged.
+        """
+        if self._cache is None:
+            return vectors
+
+        missing = [i for i, vector in enumerate(cached) if vector is None]
+        if missing:
+            vectors = np.asarray(vectors, dtype=np.float32)
+            self._cache.put_many(
+                SentenceEncoder.fingerprint(model_name), ENCODE_TYPE, [texts[i] for i in missing], vectors
+            )
+        fresh = iter(vectors if missing else ())
+        return np.stack([next(fresh) if vector is None else vector for vector in cached])
 
     def Embed(self, request, context) -> EmbedResponse:
         """
@@ -88,61 +285,154 @@ class EmbedServicer(EmbedServiceServicer):
         texts_count = len(request.texts)
 
         try:
-            # Validate texts list is not empty
-            if not request.texts:
-                context.abort(
-                    grpc.StatusCode.INVALID_ARGUMENT,
-                    "texts cannot be empty",
+            error = _validate_texts(request.texts)
+            if error:
+                return context.abort(grpc.StatusCode.INVALID_ARGUMENT, error)
+
+            model_name = self._resolve_model(request.model)
+            priority = _to_priority(request.priority)
+            logger.info(
+                f"📨 Embed request: {texts_count} texts ({priority.name.lower()}, {model_name})"
+            )
+
+            texts = list(request.texts)
+            cached = self._cache_lookup(texts, model_name)
+            pending = [text for text, vector in zip(texts, cached) if vector is None]
+
+            # Encode texts that missed the cache
+            vectors: np.ndarray | list[list[float]] | None = None
+            if pending and self._batcher is not None:
+                vectors = self._batcher.submit(
+                    texts=pending,
+                    model_name=model_name,
+                    priority=priority,
+                )
+            elif pending:
+                # Packed responses skip the per-vector Python list conversion
+                encode = (
+                    SentenceEncoder.encode_array
+                    if is_packed(request.encoding) or self._cache is not None
+                    else SentenceEncoder.encode
                 )
+                vectors = encode(
+                    texts=pending,
+                    model_name=model_name,
+                    batch_size=self._batch_size,
+                )
+            vectors = self._cache_fill(texts, cached, vectors, model_name)
+
+            logger.info(
+                f"🎯 Embedded {texts_count} texts ({texts_count - len(pending)} cached)"
+            )
+            return EmbedResponse(**_vector_fields(vectors, request.encoding))
 
-            # Validate each text string
-            MIN_TEXT_LENGTH = 50
-            for idx, text in enumerate(request.texts):
-                # Check for empty strings
-                if not text:
-                    context.abort(
-                        grpc.StatusCode.INVALID_ARGUMENT,
-                        f"Text at index {idx} is empty",
-                    )
-
-                # Check for whitespace-only strings
-                if not text.strip():
-                    context.abort(
-                        grpc.StatusCode.INVALID_ARGUMENT,
-                        f"Text at index {idx} contains only whitespace",
-                    )
-
-                # Check minimum length
-                if len(text.strip()) < MIN_TEXT_LENGTH:
-                    context.abort(
-                        grpc.StatusCode.INVALID_ARGUMENT,
-                        f"Text at index {idx} is too short ({len(text.strip())} chars, minimum {MIN_TEXT_LENGTH})",
-                    )
-
-            logger.info(f"📨 Embed request: {texts_count} texts")
-
-            # Encode texts
-            vectors = SentenceEncoder.encode(
-                texts=list(request.texts),
-                model_name=self._default_model,
-                batch_size=self._batch_size,
+        except ModelNotFoundError as e:
+            logger.error(f"❌ Model not found: {e.model_name}")
+            return context.abort(
+                grpc.StatusCode.NOT_FOUND,
+                f"Model not found: {e.model_name}",
+            )
+        except ModelLoadingError as e:
+            logger.info(f"⏳ Model still loading: {e.model_name}")
+            return context.abort(
+                grpc.StatusCode.UNAVAILABLE,
+                f"Model is loading, retry later: {e.model_name}",
             )
+        except EncoderError as e:
+            logger.error(f"❌ Encoding error: {e}")
+            return context.abort(
+                grpc.StatusCode.INTERNAL,
+                str(e),
+            )
+        except grpc.RpcError:
+            raise
+        except Exception as e:
+            logger.exception("❌ Unexpected error")
+            return context.abort(
+                grpc.StatusCode.INTERNAL,
+                f"Internal error: {str(e)}",
+            )
+        finally:
+            elapsed = time.time() - start_time
+            logger.info(f"⏰ Embed request completed in {elapsed:.2f}s")
+
+    def EmbedStream(self, request_iterator, context):
+        """
+        Embed a stream of text batches.
+
+        Each incoming batch is queued as soon as it arrives, so the client
+        can keep several batches in flight over one call. Responses are
+        yielded in completion order and carry the request's batch_id.
+
+        Args:
+            request_iterator: Iterator of EmbedStreamRequest messages.
+            context: gRPC context.
+
+        Yields:
+            EmbedStreamResponse for each completed batch.
 
-            # Build response
-            embeddings = [
-                Embedding(vector=vec, dimension=len(vec))
-                for vec in vectors
-            ]
+        Raises:
+            INVALID_ARGUMENT: If a batch is empty or contains invalid strings.
+        """
+        start_time = time.time()
+        completed: queue.Queue = queue.Queue()
+        batches = 0
+        texts_count = 0
+
+        def mark_done(key: tuple[int, int], future: Future) -> None:
+            """Hand a finished batch to the response loop."""
+            completed.put((key, future))
+
+        def read_requests() -> None:
+            """Queue incoming batches; runs on its own thread."""
+            submitted = 0
+            try:
+                for request in request_iterator:
+                    future = self._submit_stream_batch(request)
+                    key = (request.batch_id, request.encoding)
+                    future.add_done_callback(functools.partial(mark_done, key))
+                    submitted += 1
+            except Exception as e:
+                failed: Future = Future()
+                failed.set_exception(e)
+                completed.put(((None, None), failed))
+            completed.put((_STREAM_END, submitted))
+
+        reader = threading.Thread(target=read_requests, name="embed-stream-reader", daemon=True)
+        reader.start()
 
-            logger.info(f"🎯 Embedded {texts_count} texts")
-            return EmbedResponse(embeddings=embeddings)
+        try:
+            expected: int | None = None
+            while expected is None or batches < expected:
+                key, item = completed.get()
+                if key is _STREAM_END:
+                    expected = item
+                    continue
+
+                vectors = item.result()
+                batch_id, encoding = key
+                batches += 1
+                texts_count += len(vectors)
+                yield EmbedStreamResponse(
+                    batch_id=batch_id,
+                    **_vector_fields(vectors, encoding),
+                )
 
+        except _InvalidBatchError as e:
+            logger.error(f"❌ Invalid stream batch {e.batch_id}: {e.message}")
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, e.message)
         except ModelNotFoundError as e:
             logger.error(f"❌ Model not found: {e.model_name}")
             context.abort(
                 grpc.StatusCode.NOT_FOUND,
                 f"Model not found: {e.model_name}",
             )
+        except ModelLoadingError as e:
+            logger.info(f"⏳ Model still loading: {e.model_name}")
+            context.abort(
+                grpc.StatusCode.UNAVAILABLE,
+                f"Model is loading, retry later: {e.model_name}",
+            )
         except EncoderError as e:
             logger.error(f"❌ Encoding error: {e}")
             context.abort(
@@ -159,38 +449,209 @@ class EmbedServicer(EmbedServiceServicer):
             )
         finally:
             elapsed = time.time() - start_time
-            logger.info(f"⏰ Embed request completed in {elapsed:.2f}s")
+            logger.info(
+                f"⏰ Embed stream completed: {batches} batches, "
+                f"{texts_count} texts in {elapsed:.2f}s"
+            )
+
+    def _submit_stream_batch(self, request) -> Future:
+        """
+        Queue one stream batch for encoding.
+
+        Args:
+            request: EmbedStreamRequest to encode.
+
+        Returns:
+            Future resolving to the batch's vectors. Validation and encoding
+            errors are set on the future rather than raised.
+        """
+        error = _validate_texts(request.texts)
+        if error:
+            future: Future = Future()
+            future.set_exception(_InvalidBatchError(request.batch_id, error))
+            return future
+
+        try:
+            model_name = self._resolve_model(request.model)
+        except EncoderError as e:
+            future = Future()
+            future.set_exception(e)
+            return future
+
+        texts = list(request.texts)
+        cached = self._cache_lookup(texts, model_name)
+        pending = [text for text, vector in zip(texts, cached) if vector is None]
+        if not pending:
+            future = Future()
+            future.set_result(self._cache_fill(texts, cached, None, model_name))
+            return future
+
+        encoded = self._encode_stream_batch(request, pending, model_name)
+        if self._cache is None:
+            return encoded
+
+        future = Future()
+
+        def fill(done: Future) -> None:
+            """Merge the encoded misses with the cache hits."""
+            try:
+                future.set_result(self._cache_fill(texts, cached, done.result(), model_name))
+            except Exception as e:
+                future.set_exception(e)
+
+        encoded.add_done_callback(fill)
+        return future
+
+    def _encode_stream_batch(self, request, texts: list[str], model_name: str) -> Future:
+        """
+        Encode texts of a stream batch on the batcher or inline.
+
+        Args:
+            request: EmbedStreamRequest being encoded.
+            texts: Texts to encode.
+            model_name: Resolved model name.
+
+        Returns:
+            Future resolving to the vectors for ``texts``.
+        """
+        priority = _to_priority(request.priority)
+        if self._batcher is not None:
+            return self._batcher.enqueue(
+                texts=texts,
+                model_name=model_name,
+                priority=priority,
+            )
+
+        encode = (
+            SentenceEncoder.encode_array
+            if is_packed(request.encoding) or self._cache is not None
+            else SentenceEncoder.encode
+        )
+        future: Future = Future()
+        try:
+            future.set_result(
+                encode(
+                    texts=texts,
+                    model_name=model_name,
+                    batch_size=self._batch_size,
+                )
+            )
+        except Exception as e:
+            future.set_exception(e)
+        return future
 
     def GetDimension(self, request, context) -> DimensionResponse:
         """
-        Get the embedding dimension for the current model.
+        Get the embedding dimension for the requested or default model.
 
         Args:
-            request: DimensionRequest (empty).
+            request: DimensionRequest with optional model name.
             context: gRPC context.
 
         Returns:
             DimensionResponse with dimension and model ID.
         """
         try:
-            dimension = SentenceEncoder.get_dimension(self._default_model)
+            model_name = self._resolve_model(request.model)
+            if self._pool is not None:
+                dimension = self._pool.get_dimension(model_name)
+            else:
+                dimension = SentenceEncoder.get_dimension(model_name)
             return DimensionResponse(
                 dimension=dimension,
-                model_id=self._default_model,
+                model_id=model_name,
             )
         except ModelNotFoundError as e:
             logger.error(f"❌ Model not found: {e.model_name}")
-            context.abort(
+            return context.abort(
                 grpc.StatusCode.NOT_FOUND,
                 f"Model not found: {e.model_name}",
             )
+        except ModelLoadingError as e:
+            logger.info(f"⏳ Model still loading: {e.model_name}")
+            return context.abort(
+                grpc.StatusCode.UNAVAILABLE,
+                f"Model is loading, retry later: {e.model_name}",
+            )
         except Exception as e:
             logger.exception("❌ Unexpected error getting dimension")
-            context.abort(
+            return context.abort(
                 grpc.StatusCode.INTERNAL,
                 f"Internal error: {str(e)}",
             )
 
+    def Rerank(self, request, context) -> RerankResponse:
+        """
+        Score candidate passages against a query with the cross-encoder.
+
+        Runs in the gRPC process, next to the embedding batcher, since
+        reranking is a small per-query workload.
+
+        Args:
+            request: RerankRequest with a query and candidate passages.
+            context: gRPC context.
+
+        Returns:
+            RerankResponse with one score per passage, in request order.
+
+        Raises:
+            FAILED_PRECONDITION: If no reranker is configured.
+            INVALID_ARGUMENT: If the query or passages are missing or too many.
+        """
+        start_time = time.time()
+
+        try:
+            model_name = request.model or self._rerank_model
+            if not model_name:
+                return context.abort(grpc.StatusCode.FAILED_PRECONDITION, "Reranking is disabled")
+            if request.model and request.model != self._rerank_model:
+                raise ModelNotFoundError(request.model)
+
+            if not request.query.strip():
+                return context.abort(grpc.StatusCode.INVALID_ARGUMENT, "query cannot be empty")
+            if not request.passages:
+                return context.abort(grpc.StatusCode.INVALID_ARGUMENT, "passages cannot be empty")
+            if len(request.passages) > self._rerank_max_passages:
+                return context.abort(
+                    grpc.StatusCode.INVALID_ARGUMENT,
+                    f"Too many passages ({len(request.passages)}, "
+                    f"maximum {self._rerank_max_passages})",
+                )
+
+            scores = CrossEncoderReranker.score(
+                query=request.query,
+                passages=list(request.passages),
+                model_name=model_name,
+                batch_size=self._rerank_batch_size,
+            )
+            return RerankResponse(scores=scores.tolist(), model_id=model_name)
+
+        except ModelNotFoundError as e:
+            logger.error(f"❌ Reranker not found: {e.model_name}")
+            return context.abort(
+                grpc.StatusCode.NOT_FOUND,
+                f"Model not found: {e.model_name}",
+            )
+        except EncoderError as e:
+            logger.error(f"❌ Rerank error: {e}")
+            return context.abort(
+                grpc.StatusCode.INTERNAL,
+                str(e),
+            )
+        except grpc.RpcError:
+            raise
+        except Exception as e:
+            logger.exception("❌ Unexpected error")
+            return context.abort(
+                grpc.StatusCode.INTERNAL,
+                f"Internal error: {str(e)}",
+            )
+        finally:
+            elapsed = time.time() - start_time
+            logger.info(
+                f"⏰ Rerank of {len(request.passages)} passages completed in {elapsed:.3f}s"
+            )
+
 
 def serve() -> None:
     """
@@ -205,8 +666,34 @@ def serve() -> None:
     logger.info(f"   gRPC port: {settings.grpc_port}")
     logger.info(f"   Health port: {settings.health_port}")
     logger.info(f"   Model: {settings.model_name}")
-    logger.info(f"   Cache limit: {settings.model_cache_limit}")
-    logger.info(f"   Batch size: {settings.batch_size}")
+    logger.info(
+        f"   Cache limit: {settings.model_cache_limit} models, "
+        f"{settings.model_memory_budget_mb:.0f} MiB budget"
+    )
+    if settings.allowed_models:
+        logger.info(f"   Extra models: {', '.join(settings.allowed_models)}")
+    logger.info(
+        f"   Batch size: {settings.batch_size} "
+        f"(token budget: {settings.max_batch_tokens or 'off'})"
+    )
+    logger.info(
+        f"   Backend: {settings.backend}"
+        f"{f' (int8 {settings.onnx_quantize})' if settings.backend == 'onnx' and settings.onnx_quantize else ''}"
+    )
+    logger.info(f"   Reranker: {settings.rerank_model or 'disabled'}")
+    if settings.inference_workers > 0:
+        logger.info(
+            f"   Inference workers: {settings.inference_workers} "
+            f"({settings.inference_threads_per_worker or 'auto'} threads each)"
+        )
+    logger.info(
+        f"   Embedding cache: {settings.embedding_cache_mb:.0f} MiB"
+        f"{f', disk {settings.embedding_cache_path}' if settings.embedding_cache_path else ''}"
+    )
+    logger.info(
+        f"   Dynamic batching: {settings.batching_enabled} "
+        f"(max {settings.batch_max_size} texts, {settings.batch_max_wait_ms}ms)"
+    )
 
     # Check device
     checker = DeviceChecker(prefer_gpu=settings.prefer_gpu)
@@ -215,7 +702,17 @@ def serve() -> None:
 
     # Configure encoder
     SentenceEncoder.set_cache_limit(settings.model_cache_limit)
+    SentenceEncoder.set_memory_budget(settings.model_memory_budget_mb)
+    SentenceEncoder.pin(settings.model_name)
+    SentenceEncoder.set_max_batch_tokens(settings.max_batch_tokens)
+    SentenceEncoder.set_backend(
+        settings.backend,
+        quantize=settings.onnx_quantize,
+        cache_dir=settings.onnx_cache_dir,
+    )
     SentenceEncoder.set_device(checker.get_torch_device())
+    CrossEncoderReranker.set_device(checker.get_torch_device())
+    CrossEncoderReranker.set_max_length(settings.rerank_max_length)
 
     # Start health server (must start before model loading for K8s liveness)
     health_server = HealthServer(port=settings.health_port)
@@ -223,13 +720,31 @@ def serve() -> None:
     health_thread.start()
     logger.info(f"💓 Health server started on port {settings.health_port}")
 
+    # Start CPU inference workers; they hold the models instead of this process
+    pool: InferenceWorkerPool | None = None
+    if settings.inference_workers > 0:
+        pool = InferenceWorkerPool(
+            num_workers=settings.inference_workers,
+            default_model=settings.model_name,
+            threads_per_worker=settings.inference_threads_per_worker,
+            pin_cpus=settings.inference_pin_cpus,
+            cache_limit=settings.model_cache_limit,
+            memory_budget_mb=settings.model_memory_budget_mb,
+            max_batch_tokens=settings.max_batch_tokens,
+            backend=settings.backend,
+            onnx_quantize=settings.onnx_quantize,
+            onnx_cache_dir=settings.onnx_cache_dir,
+        )
+        pool.start()
+    get_dimension = pool.get_dimension if pool is not None else SentenceEncoder.get_dimension
+
     # Pre-load default model with retry
     max_retries = 5
     retry_delay = 30
     logger.info(f"🧠 Pre-loading model: {settings.model_name}")
     for attempt in range(1, max_retries + 1):
         try:
-            dim = SentenceEncoder.get_dimension(settings.model_name)
+            dim = get_dimension(settings.model_name)
             logger.info(f"🧠 Model loaded, dimension: {dim}")
             health_server.set_ready(True)
             break
@@ -246,6 +761,15 @@ def serve() -> None:
                 )
                 sys.exit(1)
 
+    # Reranking is optional; a failed load only disables Rerank
+    rerank_model = settings.rerank_model
+    if rerank_model:
+        try:
+            CrossEncoderReranker.load(rerank_model)
+        except ModelNotFoundError as e:
+            logger.warning(f"⚠️ Reranker unavailable, Rerank disabled: {e}")
+            rerank_model = ""
+
     # Create gRPC server
     server = grpc.server(
         futures.ThreadPoolExecutor(max_workers=settings.grpc_max_workers),
@@ -255,10 +779,37 @@ def serve() -> None:
         ],
     )
 
+    # Start batching scheduler
+    batcher: EmbedBatcher | None = None
+    if settings.batching_enabled or pool is not None:
+        # The batcher is what dispatches work to the inference workers
+        batcher = EmbedBatcher(
+            max_batch_size=settings.batch_max_size,
+            max_wait_ms=settings.batch_max_wait_ms,
+            pool=pool,
+        )
+        batcher.start()
+
+    # Embedding cache
+    cache: EmbeddingCache | None = None
+    if settings.embedding_cache_mb > 0 or settings.embedding_cache_path:
+        cache = EmbeddingCache(
+            memory_mb=settings.embedding_cache_mb,
+            disk_path=settings.embedding_cache_path or None,
+            disk_max_entries=settings.embedding_cache_disk_max_entries,
+        )
+
     # Add servicer
     servicer = EmbedServicer(
         default_model=settings.model_name,
         batch_size=settings.batch_size,
+        batcher=batcher,
+        allowed_models=settings.allowed_models,
+        cache=cache,
+        pool=pool,
+        rerank_model=rerank_model,
+        rerank_batch_size=settings.rerank_batch_size,
+        rerank_max_passages=settings.rerank_max_passages,
     )
     add_EmbedServiceServicer_to_server(servicer, server)
 
@@ -273,7 +824,14 @@ def serve() -> None:
     except KeyboardInterrupt:
         logger.info("🛑 Shutting down...")
         server.stop(grace=5)
+        if batcher is not None:
+            batcher.stop()
+        if pool is not None:
+            pool.stop()
+        if cache is not None:
+            cache.close()
         SentenceEncoder.clear_cache()
+        CrossEncoderReranker.clear_cache()
         logger.info("👋 Goodbye!")
 
 
@@ -0,0 +1,958 @@
+"""
+End-to-end ingestion benchmark for the Ingestor service.
+
+Drives ``IngestorService.process_document`` over a generated corpus of
+PDF, DOCX, HTML and markdown documents without any external service:
+MinIO is a local directory, the database is SQLite, Qdrant runs in local
+in-memory mode and the embedder is an in-process gRPC server returning
+random vectors after a tunable latency. Extraction, chunking, the
+pipeline, the lease and the coalescer run exactly as in production.
+
+Usage:
+    python -m ingestor.benchmark --documents 80 --workers 4 \\
+        --embed-latency 0.02 --output report.json --min-docs-per-sec 5
+
+Reports docs/sec, chunks/sec, peak RSS and per-stage times (from the
+service's Prometheus histograms). Exits with status 1 when a document
+fails or throughput is below ``--min-docs-per-sec``.
+
+Requires ``aiosqlite`` and the tokenizer set by ``INGESTOR_TOKENIZER`` or
+``--tokenizer`` in the local HuggingFace cache (or network access on the
+first run).
+"""
+
+import argparse
+import asyncio
+import hashlib
+import io
+import itertools
+import json
+import logging
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import textwrap
+import time
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import grpc
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+
+from echomind_lib.db.connection import Base, DatabaseManager
+from echomind_lib.db.models import Connector, Document
+from echomind_lib.db.qdrant import QdrantDB
+from echomind_lib.helpers.vector_codec import is_packed, pack_matrix
+from echomind_lib.models.internal.embedding_pb2 import (
+    DimensionResponse,
+    Embedding,
+    EmbedResponse,
+    EmbedStreamResponse,
+    VectorEncoding,
+)
+from echomind_lib.models.internal.embedding_pb2_grpc import (
+    EmbedServiceServicer,
+    add_EmbedServiceServicer_to_server,
+)
+
+from ingestor.config import IngestorSettings
+from ingestor.logic.admission import close_memory_budget, init_memory_budget
+from ingestor.logic.coalescer import close_batch_coalescer, init_batch_coalescer
+from ingestor.logic.cpu_pool import close_cpu_pool, init_cpu_pool
+from ingestor.logic.ingestor_service import IngestorService
+from ingestor.logic.metrics import (
+    chunk_duration,
+    db_update_duration,
+    download_duration,
+    embed_duration,
+    extract_duration,
+    upsert_duration,
+)
+
+logger = logging.getLogger("echomind-ingestor.benchmark")
+
+BUCKET = "benchmark"
+USER_ID = 1
+CONNECTOR_ID = 1
+
+MIME_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "html": "text/html",
+    "md": "text/markdown",
+}
+
+STAGE_HISTOGRAMS = {
+    "download": download_duration,
+    "extract": extract_duration,
+    "chunk": chunk_duration,
+    "embed": embed_duration,
+    "upsert": upsert_duration,
+    "db_update": db_update_duration,
+}
+
+_SYLLABLES = [
+    "an", "ber", "cal", "dor", "en", "fi", "gra", "hol", "in", "ja", "ket", "lo", "man",
+    "nor", "o", "pel", "qui", "ras", "sen", "tor", "u", "vel", "wes", "xi", "yor", "zan",
+]
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class CorpusDocument:
+    """A generated document stored in the local object store."""
+
+    document_id: int
+    kind: str
+    object_name: str
+    mime_type: str
+    size: int
+    signature: str
+
+
+class CorpusGenerator:
+    """
+    Generates reproducible documents from a seeded pseudo-word vocabulary.
+
+    Word frequencies follow a Zipf-like curve, so tokenization behaves
+    closer to natural text than uniformly random words would.
+    """
+
+    def __init__(self, seed: int, paragraphs: int) -> None:
+        """
+        Initialize the generator.
+
+        Args:
+            seed: Random seed; the same seed yields the same corpus.
+            paragraphs: Paragraphs per document.
+        """
+        self._rng = random.Random(seed)
+        self._paragraphs = paragraphs
+        self._words = sorted(
+            {"".join(self._rng.choices(_SYLLABLES, k=self._rng.randint(1, 4))) for _ in range(3000)}
+        )
+        self._rng.shuffle(self._words)
+        self._cum_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(self._words))))
+
+    def _sentence(self) -> str:
+        """Build one sentence."""
+        words = self._rng.choices(self._words, cum_weights=self._cum_weights, k=self._rng.randint(6, 22))
+        return " ".join(words).capitalize() + "."
+
+    def _paragraph(self) -> str:
+        """Build one paragraph."""
+        return " ".join(self._sentence() for _ in range(self._rng.randint(3, 7)))
+
+    def sections(self) -> list[tuple[str, list[str]]]:
+        """
+        Build the content of one document.
+
+        Returns:
+            (heading, paragraphs) pairs.
+        """
+        sections: list[tuple[str, list[str]]] = []
+        remaining = self._paragraphs
+        while remaining > 0:
+            count = min(remaining, self._rng.randint(2, 6))
+            heading = self._sentence().rstrip(".")
+            sections.append((heading, [self._paragraph() for _ in range(count)]))
+            remaining -= count
+        return sections
+
+    def render(self, kind: str, title: str) -> bytes:
+        """
+        Render a document.
+
+        Args:
+            kind: One of ``MIME_TYPES``.
+            title: Document title.
+
+        Returns:
+            File content.
+
+        Raises:
+            ValueError: If the kind is unknown.
+        """
+        sections = self.sections()
+        if kind == "pdf":
+            return build_pdf(title, sections)
+        if kind == "docx":
+            return build_docx(title, sections)
+        if kind == "html":
+            return build_html(title, sections)
+        if kind == "md":
+            return build_markdown(title, sections)
+        raise ValueError(f"Unknown document kind: {kind}")
+
+
+def _pdf_escape(line: str) -> str:
+    """Escape a line for a PDF string literal."""
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def build_pdf(title: str, sections: list[tuple[str, list[str]]], lines_per_page: int = 48) -> bytes:
+    """
+    Build a text PDF with the standard Helvetica font.
+
+    Args:
+        title: Document title.
+        sections: (heading, paragraphs) pairs.
+        lines_per_page: Text lines per US Letter page.
+
+    Returns:
+        PDF file content.
+    """
+    lines = [title, ""]
+    for heading, paragraphs in sections:
+        lines += [heading, ""]
+        for paragraph in paragraphs:
+            lines += textwrap.wrap(paragraph, 90) + [""]
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+
+    # Objects 1-3 are shared; page i has its content at 4 + 2i and itself at 5 + 2i
+    kids = " ".join(f"{5 + 2 * i} 0 R" for i in range(len(pages)))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, page_lines in enumerate(pages):
+        text = ["BT", "/F1 11 Tf", "14 TL", "72 756 Td"]
+        text += [f"({_pdf_escape(line)}) '" for line in page_lines]
+        text.append("ET")
+        stream = "\n".join(text).encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        objects.append(
+            (
+                "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                f"/Resources << /Font << /F1 3 0 R >> >> /Contents {4 + 2 * i} 0 R >>"
+            ).encode()
+        )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def build_docx(title: str, sections: list[tuple[str, list[str]]]) -> bytes:
+    """
+    Build a DOCX with headings and paragraphs.
+
+    Args:
+        title: Document title.
+        sections: (heading, paragraphs) pairs.
+
+    Returns:
+        DOCX file content.
+    """
+    import docx
+
+    document = docx.Document()
+    document.add_heading(title, level=1)
+    for heading, paragraphs in sections:
+        document.add_heading(heading, level=2)
+        for paragraph in paragraphs:
+            document.add_paragraph(paragraph)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def build_html(title: str, sections: list[tuple[str, list[str]]]) -> bytes:
+    """
+    Build an HTML page with headings and paragraphs.
+
+    Args:
+        title: Document title.
+        sections: (heading, paragraphs) pairs.
+
+    Returns:
+        UTF-8 HTML content.
+    """
+    parts = [f"<html><head><title>{title}</title></head><body><h1>{title}</h1>"]
+    for heading, paragraphs in sections:
+        parts.append(f"<h2>{heading}</h2>")
+        parts += [f"<p>{paragraph}</p>" for paragraph in paragraphs]
+    parts.append("</body></html>")
+    return "\n".join(parts).encode("utf-8")
+
+
+def build_markdown(title: str, sections: list[tuple[str, list[str]]]) -> bytes:
+    """
+    Build a markdown document with headings and paragraphs.
+
+    Args:
+        title: Document title.
+        sections: (heading, paragraphs) pairs.
+
+    Returns:
+        UTF-8 markdown content.
+    """
+    parts = [f"# {title}"]
+    for heading, paragraphs in sections:
+        parts.append(f"## {heading}")
+        parts += paragraphs
+    return "\n\n".join(parts).encode("utf-8")
+
+
+# ---------------------------------------------------------------------------
+# Stand-ins for external services
+# ---------------------------------------------------------------------------
+
+
+class LocalObjectStore:
+    """
+    Directory-backed stand-in for ``MinIOClient``.
+
+    Implements the calls the ingestor makes: streaming downloads, and the
+    whole-object reads and writes of the MinIO extraction cache.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory holding one subdirectory per bucket.
+        """
+        self._root = root
+
+    def _path(self, bucket_name: str, object_name: str) -> Path:
+        """Resolve an object to its file."""
+        return self._root / bucket_name / object_name
+
+    def put(self, bucket_name: str, object_name: str, data: bytes) -> None:
+        """
+        Store an object synchronously, for corpus setup.
+
+        Args:
+            bucket_name: Target bucket.
+            object_name: Object path/name.
+            data: Object content.
+        """
+        path = self._path(bucket_name, object_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    async def download_to_file(
+        self,
+        bucket_name: str,
+        object_name: str,
+        file_path: str,
+        chunk_size: int = 1024 * 1024,
+    ) -> int:
+        """
+        Copy an object into a local file.
+
+        Args:
+            bucket_name: Source bucket.
+            object_name: Object path/name.
+            file_path: Destination file.
+            chunk_size: Unused; kept for interface compatibility.
+
+        Returns:
+            Number of bytes written.
+
+        Raises:
+            FileNotFoundError: If the object does not exist.
+        """
+        source = self._path(bucket_name, object_name)
+        if not source.exists():
+            raise FileNotFoundError(f"Object {object_name} not found")
+        await asyncio.to_thread(shutil.copyfile, source, file_path)
+        return source.stat().st_size
+
+    async def download_file(self, bucket_name: str, object_name: str) -> bytes:
+        """
+        Read a whole object.
+
+        Args:
+            bucket_name: Source bucket.
+            object_name: Object path/name.
+
+        Returns:
+            Object content.
+
+        Raises:
+            FileNotFoundError: If the object does not exist.
+        """
+        return await asyncio.to_thread(self._path(bucket_name, object_name).read_bytes)
+
+    async def upload_file(
+        self,
+        bucket_name: str,
+        object_name: str,
+        data: bytes | BinaryIO,
+        content_type: str = "application/octet-stream",
+        metadata: dict[str, str] | None = None,
+    ) -> str:
+        """
+        Write a whole object.
+
+        Args:
+            bucket_name: Target bucket.
+            object_name: Object path/name.
+            data: Object content.
+            content_type: Unused; kept for interface compatibility.
+            metadata: Unused; kept for interface compatibility.
+
+        Returns:
+            The object name.
+        """
+        content = data if isinstance(data, bytes) else data.read()
+        await asyncio.to_thread(self.put, bucket_name, object_name, content)
+        return object_name
+
+
+class LocalQdrant(QdrantDB):
+    """``QdrantDB`` on qdrant-client's local mode (in memory or a URL)."""
+
+    def __init__(self, location: str = ":memory:") -> None:
+        """
+        Initialize the client.
+
+        Args:
+            location: ``:memory:``, or a Qdrant URL to benchmark a real server.
+        """
+        # The parent only builds a host/port client; swap in a local one
+        self._client = AsyncQdrantClient(location=location)
+
+
+class FakeEmbedder(EmbedServiceServicer):
+    """
+    In-process embedder returning random unit vectors.
+
+    Each batch waits ``latency + per_text_latency * len(texts)`` seconds,
+    with at most ``concurrency`` batches running at once, to model the
+    throughput of a GPU embedder.
+
+    Attributes:
+        batches: Batches embedded.
+        texts: Texts embedded.
+    """
+
+    def __init__(self, dimension: int, latency: float, per_text_latency: float, concurrency: int) -> None:
+        """
+        Initialize the fake embedder.
+
+        Args:
+            dimension: Vector dimension.
+            latency: Seconds per batch.
+            per_text_latency: Additional seconds per text in a batch.
+            concurrency: Batches embedded at once.
+        """
+        self._dimension = dimension
+        self._latency = latency
+        self._per_text_latency = per_text_latency
+        self._slots = asyncio.Semaphore(concurrency)
+        self._rng = np.random.default_rng(0)
+        self.batches = 0
+        self.texts = 0
+
+    async def _embed(self, texts: list[str]) -> np.ndarray:
+        """Wait the modelled latency and return unit vectors."""
+        async with self._slots:
+            await asyncio.sleep(self._latency + self._per_text_latency * len(texts))
+        self.batches += 1
+        self.texts += len(texts)
+        vectors = self._rng.standard_normal((len(texts), self._dimension), dtype=np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors
+
+    @staticmethod
+    def _vector_fields(vectors: np.ndarray, encoding: VectorEncoding) -> dict[str, Any]:
+        """Build the vector fields of a response in the requested encoding."""
+        if is_packed(encoding):
+            return {"matrix": pack_matrix(vectors, encoding)}
+        return {"embeddings": [Embedding(vector=row, dimension=len(row)) for row in vectors.tolist()]}
+
+    async def Embed(self, request, context) -> EmbedResponse:
+        """Embed one batch."""
+        vectors = await self._embed(list(request.texts))
+        return EmbedResponse(**self._vector_fields(vectors, request.encoding))
+
+    async def EmbedStream(self, request_iterator, context) -> AsyncIterator[EmbedStreamResponse]:
+        """Embed a stream of batches concurrently, yielding in completion order."""
+        done: asyncio.Queue = asyncio.Queue()
+
+        async def embed(request) -> None:
+            vectors = await self._embed(list(request.texts))
+            fields = self._vector_fields(vectors, request.encoding)
+            await done.put(EmbedStreamResponse(batch_id=request.batch_id, **fields))
+
+        async def read() -> None:
+            try:
+                tasks = [asyncio.create_task(embed(request)) async for request in request_iterator]
+                await asyncio.gather(*tasks)
+            finally:
+                await done.put(None)
+
+        reader = asyncio.create_task(read())
+        try:
+            while (response := await done.get()) is not None:
+                yield response
+            await reader
+        finally:
+            reader.cancel()
+
+    async def GetDimension(self, request, context) -> DimensionResponse:
+        """Report the vector dimension."""
+        return DimensionResponse(dimension=self._dimension, model_id=request.model or "fake-embedder")
+
+
+async def start_fake_embedder(embedder: FakeEmbedder) -> tuple[grpc.aio.Server, int]:
+    """
+    Serve the fake embedder on a free localhost port.
+
+    Args:
+        embedder: Servicer to serve.
+
+    Returns:
+        Started server and its port.
+    """
+    server = grpc.aio.server(
+        options=[
+            ("grpc.max_send_message_length", 100 * 1024 * 1024),
+            ("grpc.max_receive_message_length", 100 * 1024 * 1024),
+        ]
+    )
+    add_EmbedServiceServicer_to_server(embedder, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    return server, port
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw) -> str:
+    """Store JSONB columns as JSON in the SQLite stand-in."""
+    return "JSON"
+
+
+async def create_database(path: Path, documents: list[CorpusDocument], pool_size: int) -> DatabaseManager:
+    """
+    Create a SQLite database holding the connector and document rows.
+
+    Only the tables the ingestor touches are created.
+
+    Args:
+        path: Database file.
+        documents: Corpus documents to register as pending.
+        pool_size: Connection pool size.
+
+    Returns:
+        Database manager for the file.
+    """
+    db = DatabaseManager(f"sqlite+aiosqlite:///{path}", pool_size=pool_size)
+    async with db.engine.begin() as conn:
+        # Lets lease renewals read while another worker writes
+        await conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+        await conn.run_sync(Base.metadata.create_all, tables=[Connector.__table__, Document.__table__])
+
+    async with db.session() as session:
+        session.add(
+            Connector(
+                id=CONNECTOR_ID,
+                name="benchmark",
+                type="file",
+                config={},
+                state={},
+                user_id=USER_ID,
+                scope="user",
+            )
+        )
+        session.add_all(
+            Document(
+                id=doc.document_id,
+                connector_id=CONNECTOR_ID,
+                source_id=doc.object_name,
+                title=doc.object_name,
+                content_type=doc.mime_type,
+                signature=doc.signature,
+                status="pending",
+            )
+            for doc in documents
+        )
+    return db
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class StageTime:
+    """Time spent in one stage, summed over concurrent documents."""
+
+    calls: int
+    seconds: float
+    mean_ms: float
+
+
+@dataclass
+class BenchmarkReport:
+    """Result of a benchmark run."""
+
+    documents: int
+    failed: int
+    chunks: int
+    megabytes: float
+    wall_seconds: float
+    docs_per_sec: float
+    chunks_per_sec: float
+    peak_rss_mb: float
+    peak_child_rss_mb: float
+    embed_batches: int
+    stages: dict[str, StageTime] = field(default_factory=dict)
+    docs_per_sec_by_kind: dict[str, float] = field(default_factory=dict)
+
+
+def stage_totals() -> dict[str, tuple[float, float]]:
+    """
+    Read the stage histograms.
+
+    Returns:
+        ``stage`` or ``stage/label`` to (seconds, calls) so far.
+    """
+    totals: dict[str, list[float]] = {}
+    for stage, histogram in STAGE_HISTOGRAMS.items():
+        for metric in histogram.collect():
+            for sample in metric.samples:
+                suffix = sample.name.rsplit("_", 1)[-1]
+                if suffix not in ("sum", "count"):
+                    continue
+                key = "/".join([stage, *sample.labels.values()])
+                entry = totals.setdefault(key, [0.0, 0.0])
+                entry[0 if suffix == "sum" else 1] += sample.value
+    return {key: (seconds, calls) for key, (seconds, calls) in totals.items()}
+
+
+def stage_times(
+    before: dict[str, tuple[float, float]],
+    after: dict[str, tuple[float, float]],
+) -> dict[str, StageTime]:
+    """
+    Compute stage times between two ``stage_totals`` snapshots.
+
+    Args:
+        before: Snapshot at the start of the run.
+        after: Snapshot at the end of the run.
+
+    Returns:
+        Stage times of the run, for stages that were called.
+    """
+    times = {}
+    for key, (seconds, calls) in sorted(after.items()):
+        seconds -= before.get(key, (0.0, 0.0))[0]
+        calls -= before.get(key, (0.0, 0.0))[1]
+        if calls:
+            times[key] = StageTime(calls=int(calls), seconds=seconds, mean_ms=seconds / calls * 1000)
+    return times
+
+
+def _maxrss_mb(who: int) -> float:
+    """Peak resident set size in MB; ru_maxrss is KB on Linux, bytes on macOS."""
+    peak = resource.getrusage(who).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+# ---------------------------------------------------------------------------
+# Run
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _DocumentResult:
+    """Outcome of one measured document."""
+
+    kind: str
+    seconds: float
+    chunks: int
+    size: int
+    failed: bool
+
+
+async def _process_all(
+    documents: list[CorpusDocument],
+    workers: int,
+    db: DatabaseManager,
+    store: LocalObjectStore,
+    qdrant: QdrantDB,
+    settings: IngestorSettings,
+) -> list[_DocumentResult]:
+    """
+    Process documents with concurrent workers, as ``main.py`` does per message.
+
+    Args:
+        documents: Documents to process.
+        workers: Concurrent documents.
+        db: Database manager.
+        store: Object store stand-in.
+        qdrant: Qdrant client.
+        settings: Service configuration.
+
+    Returns:
+        One result per document.
+    """
+    queue: asyncio.Queue[CorpusDocument] = asyncio.Queue()
+    for doc in documents:
+        queue.put_nowait(doc)
+    chunking_session = str(uuid.uuid4())
+    results: list[_DocumentResult] = []
+
+    async def worker() -> None:
+        while not queue.empty():
+            doc = queue.get_nowait()
+            started = time.perf_counter()
+            chunks, failed = 0, False
+            try:
+                async with db.session() as session:
+                    service = IngestorService(
+                        db_session=session,
+                        minio_client=store,  # type: ignore[arg-type]  # duck-typed stand-in
+                        qdrant_client=qdrant,
+                        settings=settings,
+                        session_factory=db.session,
+                    )
+                    try:
+                        result = await service.process_document(
+                            document_id=doc.document_id,
+                            connector_id=CONNECTOR_ID,
+                            user_id=USER_ID,
+                            minio_path=doc.object_name,
+                            chunking_session=chunking_session,
+                            scope="user",
+                        )
+                        chunks = result["chunk_count"]
+                    finally:
+                        await service.close()
+            except Exception as e:
+                logger.error(f"❌ {doc.object_name} failed: {e}")
+                failed = True
+            results.append(_DocumentResult(doc.kind, time.perf_counter() - started, chunks, doc.size, failed))
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    return results
+
+
+def generate_corpus(
+    store: LocalObjectStore,
+    kinds: list[str],
+    count: int,
+    first_id: int,
+    generator: CorpusGenerator,
+) -> list[CorpusDocument]:
+    """
+    Generate documents into the object store, cycling through the kinds.
+
+    Args:
+        store: Object store stand-in.
+        kinds: Document kinds to generate.
+        count: Number of documents.
+        first_id: Document ID of the first document.
+        generator: Content generator.
+
+    Returns:
+        The generated documents.
+    """
+    documents = []
+    for i in range(count):
+        kind = kinds[i % len(kinds)]
+        document_id = first_id + i
+        object_name = f"{CONNECTOR_ID}/doc-{document_id}.{kind}"
+        data = generator.render(kind, title=f"Benchmark document {document_id}")
+        store.put(BUCKET, object_name, data)
+        documents.append(
+            CorpusDocument(
+                document_id=document_id,
+                kind=kind,
+                object_name=object_name,
+                mime_type=MIME_TYPES[kind],
+                size=len(data),
+                signature=hashlib.sha256(data).hexdigest(),
+            )
+        )
+    return documents
+
+
+async def run_benchmark(args: argparse.Namespace, workdir: Path) -> BenchmarkReport:
+    """
+    Generate the corpus, start the stand-ins and process every document.
+
+    Args:
+        args: Parsed command line arguments.
+        workdir: Scratch directory for the object store, database and downloads.
+
+    Returns:
+        The benchmark report.
+    """
+    embedder = FakeEmbedder(
+        dimension=args.dimension,
+        latency=args.embed_latency,
+        per_text_latency=args.embed_latency_per_text,
+        concurrency=args.embed_concurrency,
+    )
+    server, port = await start_fake_embedder(embedder)
+
+    overrides: dict[str, Any] = {
+        "embedder_host": "127.0.0.1",
+        "embedder_port": port,
+        "worker_count": args.workers,
+        "minio_bucket": BUCKET,
+        "download_dir": str(workdir / "downloads"),
+    }
+    if args.tokenizer:
+        overrides["tokenizer"] = args.tokenizer
+    settings = IngestorSettings(**overrides)
+    (workdir / "downloads").mkdir()
+
+    store = LocalObjectStore(workdir / "objects")
+    generator = CorpusGenerator(seed=args.seed, paragraphs=args.paragraphs)
+    kinds = args.kinds.split(",")
+    warmup = generate_corpus(store, kinds, args.warmup, first_id=1, generator=generator)
+    corpus = generate_corpus(store, kinds, args.documents, first_id=args.warmup + 1, generator=generator)
+    megabytes = sum(doc.size for doc in corpus) / (1024 * 1024)
+    logger.info(f"📚 Generated {len(corpus)} documents ({megabytes:.1f} MB) + {len(warmup)} warmup")
+
+    db = await create_database(workdir / "ingestor.db", warmup + corpus, pool_size=args.workers * 2)
+    qdrant = LocalQdrant(args.qdrant_location)
+
+    try:
+        await init_cpu_pool(settings)
+        init_batch_coalescer(settings)
+        init_memory_budget(settings)
+
+        # Load the tokenizer and extractors outside the measured run
+        await _process_all(warmup, args.workers, db, store, qdrant, settings)
+
+        before = stage_totals()
+        batches_before = embedder.batches
+        started = time.perf_counter()
+        results = await _process_all(corpus, args.workers, db, store, qdrant, settings)
+        wall = time.perf_counter() - started
+        after = stage_totals()
+        batches = embedder.batches - batches_before
+    finally:
+        await close_batch_coalescer()
+        close_memory_budget()
+        close_cpu_pool()
+        await qdrant.close()
+        await db.close()
+        await server.stop(grace=None)
+
+    succeeded = [r for r in results if not r.failed]
+    chunks = sum(r.chunks for r in succeeded)
+    by_kind: dict[str, float] = {}
+    for kind in kinds:
+        seconds = [r.seconds for r in succeeded if r.kind == kind]
+        if seconds:
+            # Per-document latency turned into a rate for one worker
+            by_kind[kind] = len(seconds) / sum(seconds)
+
+    return BenchmarkReport(
+        documents=len(results),
+        failed=len(results) - len(succeeded),
+        chunks=chunks,
+        megabytes=megabytes,
+        wall_seconds=wall,
+        docs_per_sec=len(succeeded) / wall,
+        chunks_per_sec=chunks / wall,
+        peak_rss_mb=_maxrss_mb(resource.RUSAGE_SELF),
+        peak_child_rss_mb=_maxrss_mb(resource.RUSAGE_CHILDREN),
+        embed_batches=batches,
+        stages=stage_times(before, after),
+        docs_per_sec_by_kind=by_kind,
+    )
+
+
+def log_report(report: BenchmarkReport) -> None:
+    """
+    Log a benchmark report.
+
+    Args:
+        report: Report to log.
+    """
+    logger.info(
+        f"📊 {report.documents} documents ({report.failed} failed, {report.megabytes:.1f} MB) "
+        f"in {report.wall_seconds:.2f}s: {report.docs_per_sec:.2f} docs/s, "
+        f"{report.chunks_per_sec:.1f} chunks/s ({report.chunks} chunks, {report.embed_batches} embed batches)"
+    )
+    logger.info(f"🧠 Peak RSS: {report.peak_rss_mb:.0f} MB (worker processes: {report.peak_child_rss_mb:.0f} MB)")
+    for kind, rate in report.docs_per_sec_by_kind.items():
+        logger.info(f"   {kind:<6} {rate:8.2f} docs/s per worker")
+    logger.info(f"   {'stage':<24} {'calls':>7} {'total s':>9} {'mean ms':>9}")
+    for stage, times in report.stages.items():
+        logger.info(f"   {stage:<24} {times.calls:>7} {times.seconds:>9.2f} {times.mean_ms:>9.1f}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the benchmark.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv).
+
+    Returns:
+        Process exit status: 0 if all documents succeeded within the
+        throughput threshold, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--documents", type=int, default=40, help="Measured documents")
+    parser.add_argument("--warmup", type=int, default=4, help="Unmeasured documents processed first")
+    parser.add_argument("--kinds", default="pdf,docx,html,md", help="Comma-separated kinds to cycle through")
+    parser.add_argument("--paragraphs", type=int, default=40, help="Paragraphs per document")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--workers", type=int, default=4, help="Documents processed concurrently")
+    parser.add_argument("--tokenizer", help="HuggingFace tokenizer (default: INGESTOR_TOKENIZER)")
+    parser.add_argument("--dimension", type=int, default=1024, help="Fake embedding dimension")
+    parser.add_argument("--embed-latency", type=float, default=0.02, help="Fake embedder seconds per batch")
+    parser.add_argument("--embed-latency-per-text", type=float, default=0.001, help="Additional seconds per text")
+    parser.add_argument("--embed-concurrency", type=int, default=2, help="Batches the fake embedder runs at once")
+    parser.add_argument("--qdrant-location", default=":memory:", help="Qdrant local mode or a server URL")
+    parser.add_argument("--workdir", help="Scratch directory (default: a temporary directory)")
+    parser.add_argument("--output", help="Write the report as JSON")
+    parser.add_argument("--min-docs-per-sec", type=float, default=0.0)
+    parser.add_argument("--log-level", default="INFO", help="Benchmark log level; service logs stay at WARNING")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logger.setLevel(args.log_level.upper())
+    unknown = set(args.kinds.split(",")) - set(MIME_TYPES)
+    if unknown:
+        parser.error(f"unknown kinds: {', '.join(sorted(unknown))}")
+
+    with tempfile.TemporaryDirectory(prefix="ingestor-benchmark-", dir=args.workdir) as workdir:
+        report = asyncio.run(run_benchmark(args, Path(workdir)))
+
+    log_report(report)
+    if args.output:
+        Path(args.output).write_text(json.dumps(asdict(report), indent=2))
+
+    passed = not report.failed and report.docs_per_sec >= args.min_docs_per_sec
+    if not passed:
+        logger.info("❌ Failed documents or throughput below threshold")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -63,6 +63,36 @@ class IngestorSettings(BaseSettings):
         "ingestor-consumer",
         description="NATS consumer durable name",
     )
+    nats_ack_wait: float = Field(
+        60.0,
+        description="Seconds before an unacknowledged message is redelivered",
+        gt=0,
+    )
+    nats_max_deliver: int = Field(
+        3,
+        description="Max delivery attempts per message",
+        gt=0,
+    )
+    nats_fetch_timeout: float = Field(
+        5.0,
+        description="Seconds a worker waits for a message per pull",
+        gt=0,
+    )
+    worker_count: int = Field(
+        2,
+        description="Documents processed concurrently per pod (one pull worker each)",
+        gt=0,
+    )
+    in_progress_interval: float = Field(
+        15.0,
+        description="Seconds between in-progress heartbeats while a document is processing",
+        gt=0,
+    )
+    lease_ttl: float = Field(
+        120.0,
+        description="Seconds a document's processing claim lasts without renewal; redeliveries are deferred until then",
+        gt=0,
+    )
 
     # MinIO
     minio_endpoint: str = Field(
@@ -85,6 +115,27 @@ class IngestorSettings(BaseSettings):
         "echomind-documents",
         description="MinIO bucket for document storage",
     )
+    download_dir: str = Field(
+        "",
+        description="Directory documents are streamed to before extraction (empty = system temp dir)",
+    )
+    extract_cache: str = Field(
+        "none",
+        description="Cache of extracted, chunked text keyed by file content: none | disk | minio",
+    )
+    extract_cache_dir: str = Field(
+        "/tmp/ingestor-extract-cache",
+        description="Directory for the extraction cache when extract_cache=disk",
+    )
+    extract_cache_max_mb: int = Field(
+        2048,
+        description="Size cap of the disk extraction cache in MB; least recently used entries are pruned (0 = unbounded)",
+        ge=0,
+    )
+    extract_cache_prefix: str = Field(
+        "extract-cache/",
+        description="Object prefix in minio_bucket for the extraction cache when extract_cache=minio",
+    )
 
     # Qdrant
     qdrant_host: str = Field(
@@ -116,6 +167,23 @@ class IngestorSettings(BaseSettings):
         description="gRPC call timeout in seconds",
         gt=0,
     )
+    embedder_stream_enabled: bool = Field(
+        True,
+        description="Send embedding batches over the EmbedStream RPC",
+    )
+    embedder_max_in_flight: int = Field(
+        4,
+        description="Max embedding batches in flight per stream",
+        gt=0,
+    )
+    embedder_vector_encoding: str = Field(
+        "float32",
+        description="Vector wire format: repeated | float32 | float16",
+    )
+    embedder_model: str = Field(
+        "",
+        description="Embedding model to request (empty = embedder default)",
+    )
 
     # nv_ingest_api Settings
     extract_method: str = Field(
@@ -148,6 +216,82 @@ class IngestorSettings(BaseSettings):
                     "Get token at: https://huggingface.co/settings/tokens",
     )
 
+    # CPU execution backend for extraction and chunking
+    cpu_backend: str = Field(
+        "thread",
+        description="Where nv-ingest extraction and tokenization run: thread | process",
+    )
+    cpu_workers: int = Field(
+        2,
+        description="Worker processes when cpu_backend=process",
+        gt=0,
+    )
+    cpu_spool_dir: str = Field(
+        "",
+        description="Directory for handing files to worker processes (empty = /dev/shm if available)",
+    )
+    pdf_split_threshold: int = Field(
+        500,
+        description="PDFs with at least this many pages are extracted in parallel page ranges when cpu_backend=process (0 = disabled)",
+        ge=0,
+    )
+    pdf_split_pages: int = Field(
+        100,
+        description="Pages per range when a PDF is extracted in parallel",
+        gt=0,
+    )
+    pdf_split_concurrency: int = Field(
+        0,
+        description="Page ranges of one PDF extracted at once (0 = cpu_workers)",
+        ge=0,
+    )
+
+    # Streaming pipeline
+    pipeline_chunk_rows: int = Field(
+        16,
+        description="Extracted rows (pages with text_depth=page) chunked per pipeline step",
+        gt=0,
+    )
+    pipeline_embed_batch_size: int = Field(
+        128,
+        description="Chunks per embedding batch in the streaming pipeline",
+        gt=0,
+    )
+    pipeline_upsert_batch_size: int = Field(
+        256,
+        description="Vectors per Qdrant upsert in the streaming pipeline",
+        gt=0,
+    )
+    pipeline_queue_size: int = Field(
+        2,
+        description="Batches buffered between pipeline stages (bounds memory)",
+        gt=0,
+    )
+    coalesce_window: float = Field(
+        0.02,
+        description="Seconds embed/upsert requests wait to share a batch with other documents (0 = disabled)",
+        ge=0,
+    )
+
+    # Memory admission control
+    memory_budget_mb: int = Field(
+        0,
+        description="Estimated MB of documents processed at once per pod (0 = 60% of the container memory limit)",
+        ge=0,
+    )
+    admission_max_wait: float = Field(
+        60.0,
+        description="Seconds a large document waiting for memory can be overtaken by smaller ones",
+        ge=0,
+    )
+
+    # Orphaned session compaction
+    compaction_interval: float = Field(
+        3600.0,
+        description="Seconds between scans for vectors of superseded sessions and deleted documents (0 = disabled)",
+        ge=0,
+    )
+
     # Optional NIMs
     yolox_enabled: bool = Field(
         False,
@@ -230,6 +374,66 @@ class IngestorSettings(BaseSettings):
             raise ValueError(f"Invalid extract method: {v}. Must be one of {valid_methods}")
         return v
 
+    @field_validator("embedder_vector_encoding")
+    @classmethod
+    def validate_embedder_vector_encoding(cls, v: str) -> str:
+        """
+        Validate embedder vector encoding.
+
+        Args:
+            v: Vector encoding name.
+
+        Returns:
+            Lowercased encoding name.
+
+        Raises:
+            ValueError: If encoding is unknown.
+        """
+        valid_values = {"repeated", "float32", "float16"}
+        if v.lower() not in valid_values:
+            raise ValueError(f"Invalid embedder vector encoding: {v}. Must be one of {valid_values}")
+        return v.lower()
+
+    @field_validator("cpu_backend")
+    @classmethod
+    def validate_cpu_backend(cls, v: str) -> str:
+        """
+        Validate CPU execution backend.
+
+        Args:
+            v: Backend name.
+
+        Returns:
+            Lowercased backend name.
+
+        Raises:
+            ValueError: If backend is unknown.
+        """
+        valid_values = {"thread", "process"}
+        if v.lower() not in valid_values:
+            raise ValueError(f"Invalid cpu backend: {v}. Must be one of {valid_values}")
+        return v.lower()
+
+    @field_validator("extract_cache")
+    @classmethod
+    def validate_extract_cache(cls, v: str) -> str:
+        """
+        Validate extraction cache backend.
+
+        Args:
+            v: Backend name.
+
+        Returns:
+            Lowercased backend name.
+
+        Raises:
+            ValueError: If backend is unknown.
+        """
+        valid_values = {"none", "disk", "minio"}
+        if v.lower() not in valid_values:
+            raise ValueError(f"Invalid extract cache: {v}. Must be one of {valid_values}")
+        return v.lower()
+
     @field_validator("text_depth")
     @classmethod
     def validate_text_depth(cls, v: str) -> str:
@@ -279,6 +483,42 @@ class IngestorSettings(BaseSettings):
 
         return self
 
+    @model_validator(mode="after")
+    def validate_in_progress_interval(self) -> "IngestorSettings":
+        """
+        Validate heartbeats are sent more often than the ack deadline.
+
+        Returns:
+            Validated settings instance.
+
+        Raises:
+            ValueError: If in_progress_interval >= nats_ack_wait.
+        """
+        if self.in_progress_interval >= self.nats_ack_wait:
+            raise ValueError(
+                f"in_progress_interval ({self.in_progress_interval}) must be less than "
+                f"nats_ack_wait ({self.nats_ack_wait})"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def validate_lease_ttl(self) -> "IngestorSettings":
+        """
+        Validate document claims are renewed before they expire.
+
+        Returns:
+            Validated settings instance.
+
+        Raises:
+            ValueError: If in_progress_interval >= lease_ttl.
+        """
+        if self.in_progress_interval >= self.lease_ttl:
+            raise ValueError(
+                f"in_progress_interval ({self.in_progress_interval}) must be less than "
+                f"lease_ttl ({self.lease_ttl})"
+            )
+        return self
+
     @model_validator(mode="after")
     def validate_chunk_overlap_less_than_size(self) -> "IngestorSettings":
         """
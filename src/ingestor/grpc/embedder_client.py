@@ -4,14 +4,22 @@ gRPC client for Embedder service.
 Handles text embeddings via async gRPC calls.
 """
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 import grpc
+import numpy as np
 
+from echomind_lib.helpers.vector_codec import is_packed, unpack_matrix
 from echomind_lib.models.internal.embedding_pb2 import (
+    EMBED_PRIORITY_BULK,
+    VECTOR_ENCODING_UNSPECIFIED,
     DimensionRequest,
     EmbedRequest,
+    EmbedStreamRequest,
+    VectorEncoding,
 )
 from echomind_lib.models.internal.embedding_pb2_grpc import EmbedServiceStub
 
@@ -19,6 +27,28 @@ from ingestor.logic.exceptions import EmbeddingError, GrpcError
 
 logger = logging.getLogger("echomind-ingestor.embedder_client")
 
+# Vectors from the embedder: a float32 matrix when packed, else float lists
+Vectors = np.ndarray | list[list[float]]
+
+
+def join_vectors(parts: list[Vectors]) -> Vectors:
+    """
+    Concatenate per-batch vectors in order.
+
+    Args:
+        parts: Vectors of each batch.
+
+    Returns:
+        One float32 matrix if every batch was packed, else a list of rows.
+    """
+    if parts and all(isinstance(part, np.ndarray) for part in parts):
+        return np.concatenate(parts)
+
+    joined: list[list[float]] = []
+    for part in parts:
+        joined.extend(part.tolist() if isinstance(part, np.ndarray) else part)
+    return joined
+
 
 class EmbedderClient:
     """
@@ -40,6 +70,10 @@ class EmbedderClient:
         host: str,
         port: int,
         timeout: float = 30.0,
+        stream_enabled: bool = False,
+        max_in_flight: int = 4,
+        vector_encoding: VectorEncoding = VECTOR_ENCODING_UNSPECIFIED,
+        model: str = "",
     ) -> None:
         """
         Initialize Embedder client.
@@ -48,21 +82,35 @@ class EmbedderClient:
             host: Embedder service hostname.
             port: Embedder gRPC port.
             timeout: gRPC call timeout in seconds.
+            stream_enabled: Send batches over the EmbedStream RPC.
+            max_in_flight: Max batches awaiting vectors on a stream.
+            vector_encoding: VectorEncoding to request. Packed encodings
+                return vectors as a float32 numpy matrix.
+            model: Embedding model to request, or empty for the
+                embedder's default model.
         """
         self._host = host
         self._port = port
         self._timeout = timeout
+        self._stream_enabled = stream_enabled
+        self._max_in_flight = max(1, max_in_flight)
+        self._vector_encoding = vector_encoding
+        self._model = model
         self._channel: grpc.aio.Channel | None = None
         self._stub: EmbedServiceStub | None = None
         self._dimension: int | None = None
+        self._model_id: str | None = None
 
-    async def _ensure_connected(self) -> None:
+    async def _ensure_connected(self) -> EmbedServiceStub:
         """
         Ensure gRPC channel is connected.
 
         Creates channel and stub if not already connected.
+
+        Returns:
+            Stub bound to the channel.
         """
-        if self._channel is None:
+        if self._stub is None:
             target = f"{self._host}:{self._port}"
             self._channel = grpc.aio.insecure_channel(
                 target,
@@ -76,6 +124,7 @@ class EmbedderClient:
             )
             self._stub = EmbedServiceStub(self._channel)
             logger.info(f"🔗 Connected to Embedder at {self._host}:{self._port}")
+        return self._stub
 
     async def get_dimension(self) -> int:
         """
@@ -90,15 +139,16 @@ class EmbedderClient:
         if self._dimension is not None:
             return self._dimension
 
-        await self._ensure_connected()
+        stub = await self._ensure_connected()
 
         try:
-            request = DimensionRequest()
-            response = await self._stub.GetDimension(
+            request = DimensionRequest(model=self._model)
+            response = await stub.GetDimension(
                 request,
                 timeout=self._timeout,
             )
             self._dimension = response.dimension
+            self._model_id = response.model_id
             logger.debug(f"Embedder dimension: {response.dimension} (model: {response.model_id})")
             return response.dimension
 
@@ -109,11 +159,29 @@ class EmbedderClient:
                 code=e.code().name,
             ) from e
 
+    async def get_model_id(self) -> str:
+        """
+        Get the model the embedder serves for this client's requests.
+
+        Resolved by the embedder, so it names the actual model even when
+        no model is requested and the embedder's default changes.
+
+        Returns:
+            Served model ID, or the requested model name if the embedder
+            does not report one.
+
+        Raises:
+            GrpcError: If gRPC call fails.
+        """
+        if self._model_id is None:
+            await self.get_dimension()
+        return self._model_id or self._model
+
     async def embed_texts(
         self,
         texts: list[str],
         document_id: int | None = None,
-    ) -> list[list[float]]:
+    ) -> Vectors:
         """
         Embed text chunks via Embedder service.
 
@@ -122,30 +190,32 @@ class EmbedderClient:
             document_id: Optional document ID for error context.
 
         Returns:
-            List of embedding vectors.
+            Embedding vectors, as a float32 matrix for packed encodings.
 
         Raises:
             EmbeddingError: If embedding fails.
             GrpcError: If gRPC communication fails.
         """
-        await self._ensure_connected()
+        stub = await self._ensure_connected()
 
         if not texts:
             return []
 
         try:
-            request = EmbedRequest(texts=texts)
+            # Ingestion is bulk work; interactive queries pre-empt it
+            request = EmbedRequest(
+                texts=texts,
+                priority=EMBED_PRIORITY_BULK,
+                encoding=self._vector_encoding,
+                model=self._model,
+            )
 
-            response = await self._stub.Embed(
+            response = await stub.Embed(
                 request,
                 timeout=self._timeout,
             )
 
-            # Extract vectors from response
-            vectors = [
-                list(embedding.vector)
-                for embedding in response.embeddings
-            ]
+            vectors = self._decode_vectors(response)
 
             logger.debug(f"[id:{document_id or 'N/A'}] Embedded {len(vectors)} texts")
 
@@ -167,7 +237,7 @@ class EmbedderClient:
         texts: list[str],
         batch_size: int = 32,
         document_id: int | None = None,
-    ) -> list[list[float]]:
+    ) -> Vectors:
         """
         Embed texts in batches to avoid memory issues.
 
@@ -177,7 +247,7 @@ class EmbedderClient:
             document_id: Optional document ID for error context.
 
         Returns:
-            List of embedding vectors.
+            Embedding vectors, as a float32 matrix for packed encodings.
 
         Raises:
             EmbeddingError: If embedding fails.
@@ -186,7 +256,17 @@ class EmbedderClient:
         if not texts:
             return []
 
-        all_vectors: list[list[float]] = []
+        if self._stream_enabled:
+            try:
+                return await self.embed_stream(texts, batch_size, document_id)
+            except GrpcError as e:
+                if e.code != grpc.StatusCode.UNIMPLEMENTED.name:
+                    raise
+                # Older embedder without EmbedStream; stay on unary calls
+                logger.warning("⚠️ Embedder does not support EmbedStream, using unary Embed")
+                self._stream_enabled = False
+
+        parts: list[Vectors] = []
 
         for i in range(0, len(texts), batch_size):
             batch = texts[i:i + batch_size]
@@ -195,11 +275,110 @@ class EmbedderClient:
 
             logger.debug(f"🔄 Embedding batch {batch_num}/{total_batches} ({len(batch)} texts) for document {document_id or 'N/A'}")
 
-            vectors = await self.embed_texts(batch, document_id)
-            all_vectors.extend(vectors)
+            parts.append(await self.embed_texts(batch, document_id))
+
+        return join_vectors(parts)
+
+    async def embed_stream(
+        self,
+        texts: list[str],
+        batch_size: int = 32,
+        document_id: int | None = None,
+    ) -> Vectors:
+        """
+        Embed texts over one EmbedStream call with several batches in flight.
+
+        Batches are sent while earlier ones are still encoding, bounded by
+        max_in_flight, so the embedder's batcher always has queued work.
+
+        Args:
+            texts: List of text chunks to embed.
+            batch_size: Number of texts per batch.
+            document_id: Optional document ID for error context.
+
+        Returns:
+            Embedding vectors in input order, as a float32 matrix for
+            packed encodings.
+
+        Raises:
+            EmbeddingError: If the stream returns incomplete results.
+            GrpcError: If gRPC communication fails.
+        """
+        stub = await self._ensure_connected()
+
+        if not texts:
+            return []
+
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        in_flight = asyncio.Semaphore(self._max_in_flight)
+        results: dict[int, Vectors] = {}
+
+        async def requests() -> AsyncIterator[EmbedStreamRequest]:
+            for batch_id, batch in enumerate(batches):
+                await in_flight.acquire()
+                yield EmbedStreamRequest(
+                    batch_id=batch_id,
+                    texts=batch,
+                    priority=EMBED_PRIORITY_BULK,
+                    encoding=self._vector_encoding,
+                    model=self._model,
+                )
+
+        try:
+            call = stub.EmbedStream(requests(), timeout=self._timeout)
+            async for response in call:
+                results[response.batch_id] = self._decode_vectors(response)
+                in_flight.release()
+                logger.debug(
+                    f"🔄 Embedded batch {len(results)}/{len(batches)} "
+                    f"for document {document_id or 'N/A'}"
+                )
+
+        except grpc.aio.AioRpcError as e:
+            logger.error(f"❌ gRPC error streaming texts for document {document_id}: {e.details()}")
+            raise GrpcError(
+                service="embedder",
+                reason=str(e.details()),
+                code=e.code().name,
+            ) from e
+
+        parts: list[Vectors] = []
+        for batch_id, batch in enumerate(batches):
+            vectors = results.get(batch_id)
+            if vectors is None or len(vectors) != len(batch):
+                raise EmbeddingError(
+                    reason=f"Incomplete stream response for batch {batch_id}",
+                    document_id=document_id,
+                )
+            parts.append(vectors)
+        all_vectors = join_vectors(parts)
+
+        logger.debug(f"[id:{document_id or 'N/A'}] Streamed {len(all_vectors)} embeddings")
 
         return all_vectors
 
+    def _decode_vectors(self, response: Any) -> Vectors:
+        """
+        Read vectors from an EmbedResponse or EmbedStreamResponse.
+
+        Packed matrices are viewed in place and only copied when widening
+        float16 to float32. Servers that predate packed encodings ignore
+        the request field and answer with repeated floats.
+
+        Args:
+            response: Response message from the embedder.
+
+        Returns:
+            Float32 matrix for packed responses, else a list of float lists.
+        """
+        if is_packed(self._vector_encoding) and response.HasField("matrix"):
+            return unpack_matrix(response.matrix).astype(np.float32, copy=False)
+
+        return [
+            list(embedding.vector)
+            for embedding in response.embeddings
+        ]
+
     async def close(self) -> None:
         """
         Close gRPC channel.
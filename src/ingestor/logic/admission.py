@@ -0,0 +1,183 @@
+"""
+Memory-aware admission control for the Ingestor service.
+
+A pod's peak memory is the sum over its documents in flight of file
+bytes, base64 copies, extracted DataFrames and vectors. With several
+workers, a few large PDFs arriving together can exceed the container
+limit. ``MemoryBudget`` admits a document only when its estimated cost
+(``MimeRouter.estimate_memory``) fits next to the documents already
+running; otherwise its worker waits until enough memory is released.
+
+Smaller documents that fit are admitted ahead of a waiting large one, so
+mail and contact syncs keep flowing while a big file is processing. To
+keep the large document from starving, later documents stop overtaking
+it once it has waited ``max_wait`` seconds. A document larger than the
+whole budget runs alone.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator
+
+from ingestor.config import IngestorSettings
+
+logger = logging.getLogger("echomind-ingestor.admission")
+
+# Share of the container memory limit used when no budget is configured
+_LIMIT_FRACTION = 0.6
+
+_CGROUP_LIMIT_FILES = (
+    "/sys/fs/cgroup/memory.max",  # cgroup v2
+    "/sys/fs/cgroup/memory/memory.limit_in_bytes",  # cgroup v1
+)
+
+
+def container_memory_limit() -> int | None:
+    """
+    Read the container memory limit from the cgroup filesystem.
+
+    Returns:
+        Limit in bytes, or None if the container is unlimited or the
+        limit cannot be read.
+    """
+    for path in _CGROUP_LIMIT_FILES:
+        try:
+            with open(path) as f:
+                value = f.read().strip()
+        except OSError:
+            continue
+        if value.isdigit() and int(value) < 1 << 60:
+            return int(value)
+        return None
+    return None
+
+
+class MemoryBudget:
+    """
+    Bounds the estimated memory of documents processing at once.
+
+    Usage:
+        budget = MemoryBudget(limit=4 * 1024**3, max_wait=60.0)
+        async with budget.admit(cost):
+            ...
+
+    Attributes:
+        limit: Budget in bytes.
+        in_use: Estimated bytes of admitted documents.
+    """
+
+    def __init__(self, limit: int, max_wait: float) -> None:
+        """
+        Initialize the budget.
+
+        Args:
+            limit: Budget in bytes.
+            max_wait: Seconds a waiting document can be overtaken by
+                smaller ones.
+        """
+        self.limit = limit
+        self.in_use = 0
+        self._max_wait = max_wait
+        self._condition = asyncio.Condition()
+        # Waiting tickets in arrival order, with their start time
+        self._waiting: dict[object, float] = {}
+
+    @contextlib.asynccontextmanager
+    async def admit(self, cost: int) -> AsyncIterator[None]:
+        """
+        Wait until a document fits the budget and hold its share.
+
+        Args:
+            cost: Estimated bytes; capped at the budget.
+        """
+        cost = min(cost, self.limit)
+        loop = asyncio.get_running_loop()
+        ticket = object()
+
+        async with self._condition:
+            self._waiting[ticket] = loop.time()
+            try:
+                if not self._fits(cost, ticket):
+                    logger.debug(
+                        f"⏳ Waiting for memory: need {cost >> 20} MB, "
+                        f"{self.in_use >> 20}/{self.limit >> 20} MB in use"
+                    )
+                    await self._condition.wait_for(lambda: self._fits(cost, ticket))
+            finally:
+                del self._waiting[ticket]
+                # The head of the queue may have changed
+                self._condition.notify_all()
+            self.in_use += cost
+
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self.in_use -= cost
+                self._condition.notify_all()
+
+    def _fits(self, cost: int, ticket: object) -> bool:
+        """
+        Check whether a waiting document may start now.
+
+        Args:
+            cost: Capped cost of the document.
+            ticket: The document's place in the queue.
+
+        Returns:
+            True if it fits and no starving document is ahead of it.
+        """
+        oldest, since = next(iter(self._waiting.items()))
+        if oldest is not ticket and asyncio.get_running_loop().time() - since >= self._max_wait:
+            return False
+        return self.in_use + cost <= self.limit
+
+
+# Global budget
+_budget: MemoryBudget | None = None
+
+
+def get_memory_budget() -> MemoryBudget | None:
+    """
+    Get the global memory budget.
+
+    Returns:
+        The budget, or None when admission control is disabled.
+    """
+    return _budget
+
+
+def init_memory_budget(settings: IngestorSettings) -> MemoryBudget | None:
+    """
+    Create the global memory budget.
+
+    Uses ``memory_budget_mb``, or a share of the container memory limit
+    when it is 0. Admission control stays off with a single worker or
+    when no limit is known.
+
+    Args:
+        settings: Service configuration.
+
+    Returns:
+        The budget, or None when disabled.
+    """
+    global _budget
+    if settings.worker_count < 2:
+        return None
+
+    if _budget is None:
+        limit = settings.memory_budget_mb * 1024 * 1024
+        if not limit:
+            container_limit = container_memory_limit()
+            if container_limit is None:
+                return None
+            limit = int(container_limit * _LIMIT_FRACTION)
+        _budget = MemoryBudget(limit=limit, max_wait=settings.admission_max_wait)
+    return _budget
+
+
+def close_memory_budget() -> None:
+    """Drop the global memory budget."""
+    global _budget
+    _budget = None
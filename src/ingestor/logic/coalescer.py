@@ -0,0 +1,360 @@
+"""
+Cross-document embed and upsert coalescing for the Ingestor service.
+
+Connector syncs (mail, contacts) deliver thousands of documents that each
+produce one to three chunks. Embedding and upserting them one document at
+a time spends most of every RPC on per-call overhead. ``BatchCoalescer``
+collects the embed requests of all documents processing in this pod into
+shared embedder batches, and their upserts into shared Qdrant writes per
+collection.
+
+A request waits at most ``window`` seconds for other requests and is
+flushed at once when its batch is full, so large documents are not
+slowed down. Every caller gets back only its own vectors, and ``upsert``
+returns only after the shared write holding its points has completed:
+a document is still acknowledged only once its own points are durable.
+When a shared flush fails, each of its requests is retried on its own,
+so a request the embedder or Qdrant rejects (a too-short text, an
+oversized payload) fails only its own document.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from echomind_lib.db.qdrant import QdrantDB
+from echomind_lib.helpers.vector_codec import encoding_from_name
+
+from ingestor.config import IngestorSettings
+from ingestor.grpc.embedder_client import EmbedderClient, Vectors, join_vectors
+from ingestor.logic.exceptions import EmbeddingError
+
+logger = logging.getLogger("echomind-ingestor.coalescer")
+
+
+@dataclass(slots=True)
+class _Request:
+    """One caller's share of a batch."""
+
+    items: Any
+    size: int
+    future: asyncio.Future[Any]
+
+
+# Flushes the items of several requests, returning one result per request
+FlushFn = Callable[[list[Any], list[int]], Awaitable[list[Any]]]
+
+
+class _Batcher:
+    """
+    Collects requests and flushes them together.
+
+    A batch is flushed when it reaches ``max_size`` items or ``window``
+    seconds after its first request, whichever comes first.
+    """
+
+    def __init__(self, flush: FlushFn, max_size: int, window: float) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            flush: Coroutine flushing (items per request, size per request).
+            max_size: Items that trigger an immediate flush.
+            window: Seconds a batch waits for more requests.
+        """
+        self._flush = flush
+        self._max_size = max(1, max_size)
+        self._window = window
+        self._pending: list[_Request] = []
+        self._size = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, items: Any, size: int) -> Any:
+        """
+        Add a request to the current batch and wait for its result.
+
+        Args:
+            items: Request payload passed to the flush function.
+            size: Items the request adds to the batch.
+
+        Returns:
+            The flush result for this request.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending.append(_Request(items=items, size=size, future=future))
+        self._size += size
+
+        if self._size >= self._max_size:
+            self._flush_pending()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush_pending)
+
+        return await future
+
+    def _flush_pending(self) -> None:
+        """Start flushing the current batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        requests, self._pending, self._size = self._pending, [], 0
+        if requests:
+            task = asyncio.create_task(self._run(requests))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, requests: list[_Request]) -> None:
+        """
+        Flush a batch and hand each request its result.
+
+        If a shared flush fails, its requests are flushed one by one so
+        the error only reaches the requests that cause it.
+
+        Args:
+            requests: Requests of the batch.
+        """
+        try:
+            results = await self._flush(
+                [request.items for request in requests],
+                [request.size for request in requests],
+            )
+        except Exception as e:
+            # Callers cancelled while waiting are not retried
+            waiting = [request for request in requests if not request.future.done()]
+            if len(requests) == 1:
+                if waiting:
+                    waiting[0].future.set_exception(e)
+                return
+
+            logger.warning(f"⚠️ Shared flush of {len(requests)} requests failed, retrying them separately: {e}")
+            await asyncio.gather(*(self._run([request]) for request in waiting))
+            return
+
+        for request, result in zip(requests, results):
+            # Callers cancelled while waiting no longer want a result
+            if not request.future.done():
+                request.future.set_result(result)
+
+    async def drain(self) -> None:
+        """Flush the pending batch and wait for every flush to finish."""
+        self._flush_pending()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+class BatchCoalescer:
+    """
+    Shares embed batches and Qdrant upserts across concurrent documents.
+
+    Usage:
+        coalescer = BatchCoalescer(embedder, embed_batch_size=128,
+                                   upsert_batch_size=256, window=0.02)
+        vectors = await coalescer.embed(texts)
+        await coalescer.upsert(qdrant, "user_42", vectors, payloads, ids)
+        await coalescer.close()
+
+    Attributes:
+        window: Seconds a request waits for others before flushing.
+    """
+
+    def __init__(
+        self,
+        embedder: EmbedderClient,
+        embed_batch_size: int,
+        upsert_batch_size: int,
+        window: float,
+    ) -> None:
+        """
+        Initialize the coalescer.
+
+        Args:
+            embedder: Long-lived embedder client owned by the coalescer.
+            embed_batch_size: Texts that trigger an immediate embed flush.
+            upsert_batch_size: Points that trigger an immediate upsert flush.
+            window: Seconds a request waits for others before flushing.
+        """
+        self._embedder = embedder
+        self._upsert_batch_size = upsert_batch_size
+        self.window = window
+        self._embed_batcher = _Batcher(self._flush_embed, embed_batch_size, window)
+        self._upsert_batchers: dict[tuple[QdrantDB, str], _Batcher] = {}
+
+    async def embed(self, texts: list[str]) -> Vectors:
+        """
+        Embed texts in a batch shared with other documents.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            One vector per text, in order.
+
+        Raises:
+            EmbeddingError: If the shared batch fails.
+            GrpcError: If gRPC communication fails.
+        """
+        if not texts:
+            return []
+        return await self._embed_batcher.submit(texts, len(texts))
+
+    async def upsert(
+        self,
+        qdrant: QdrantDB,
+        collection_name: str,
+        vectors: Vectors,
+        payloads: list[dict[str, Any]],
+        ids: list[str | int],
+    ) -> None:
+        """
+        Upsert points in a write shared with other documents.
+
+        Returns once the shared write containing these points is done.
+
+        Args:
+            qdrant: Qdrant client to write with.
+            collection_name: Target collection.
+            vectors: One vector per point.
+            payloads: One payload per point.
+            ids: Point IDs.
+        """
+        if not ids:
+            return
+
+        key = (qdrant, collection_name)
+        batcher = self._upsert_batchers.get(key)
+        if batcher is None:
+            batcher = _Batcher(
+                lambda items, sizes: self._flush_upsert(qdrant, collection_name, items, sizes),
+                self._upsert_batch_size,
+                self.window,
+            )
+            self._upsert_batchers[key] = batcher
+
+        await batcher.submit((vectors, payloads, ids), len(ids))
+
+    async def _flush_embed(self, requests: list[list[str]], sizes: list[int]) -> list[Vectors]:
+        """
+        Embed the texts of several requests in one call.
+
+        Args:
+            requests: Texts per request.
+            sizes: Text count per request.
+
+        Returns:
+            Vectors per request.
+        """
+        texts = [text for request in requests for text in request]
+        vectors = await self._embedder.embed_batch(texts=texts, batch_size=32)
+        if len(vectors) != len(texts):
+            raise EmbeddingError(
+                reason=f"Vector count mismatch: expected {len(texts)}, got {len(vectors)}",
+            )
+
+        if len(requests) > 1:
+            logger.debug(f"🧺 Embedded {len(texts)} texts for {len(requests)} requests")
+
+        parts: list[Vectors] = []
+        start = 0
+        for size in sizes:
+            parts.append(vectors[start:start + size])
+            start += size
+        return parts
+
+    async def _flush_upsert(
+        self,
+        qdrant: QdrantDB,
+        collection_name: str,
+        requests: list[tuple[Vectors, list[dict[str, Any]], list[str | int]]],
+        sizes: list[int],
+    ) -> list[None]:
+        """
+        Write the points of several requests in one upsert.
+
+        Args:
+            qdrant: Qdrant client.
+            collection_name: Target collection.
+            requests: (vectors, payloads, ids) per request.
+            sizes: Point count per request.
+
+        Returns:
+            None per request.
+        """
+        await qdrant.upsert(
+            collection_name=collection_name,
+            vectors=join_vectors([vectors for vectors, _, _ in requests]),
+            payloads=[payload for _, payloads, _ in requests for payload in payloads],
+            ids=[point_id for _, _, ids in requests for point_id in ids],
+        )
+
+        if len(requests) > 1:
+            logger.debug(f"🧺 {collection_name}: upserted {sum(sizes)} points for {len(requests)} requests")
+
+        return [None] * len(requests)
+
+    async def close(self) -> None:
+        """Flush pending requests and close the embedder client."""
+        await self._embed_batcher.drain()
+        for batcher in self._upsert_batchers.values():
+            await batcher.drain()
+        await self._embedder.close()
+
+
+# Global coalescer
+_coalescer: BatchCoalescer | None = None
+
+
+def get_batch_coalescer() -> BatchCoalescer | None:
+    """
+    Get the global batch coalescer.
+
+    Returns:
+        The coalescer, or None when coalescing is disabled.
+    """
+    return _coalescer
+
+
+def init_batch_coalescer(settings: IngestorSettings) -> BatchCoalescer | None:
+    """
+    Create the global batch coalescer when it can help.
+
+    Coalescing needs several documents in flight, so it stays off with a
+    single worker or a zero window.
+
+    Args:
+        settings: Service configuration.
+
+    Returns:
+        The coalescer, or None when disabled.
+    """
+    global _coalescer
+    if settings.coalesce_window <= 0 or settings.worker_count < 2:
+        return None
+
+    if _coalescer is None:
+        _coalescer = BatchCoalescer(
+            embedder=EmbedderClient(
+                host=settings.embedder_host,
+                port=settings.embedder_port,
+                timeout=settings.embedder_timeout,
+                stream_enabled=settings.embedder_stream_enabled,
+                max_in_flight=settings.embedder_max_in_flight,
+                vector_encoding=encoding_from_name(settings.embedder_vector_encoding),
+                model=settings.embedder_model,
+            ),
+            embed_batch_size=settings.pipeline_embed_batch_size,
+            upsert_batch_size=settings.pipeline_upsert_batch_size,
+            window=settings.coalesce_window,
+        )
+    return _coalescer
+
+
+async def close_batch_coalescer() -> None:
+    """Flush and close the global batch coalescer."""
+    global _coalescer
+    if _coalescer is not None:
+        await _coalescer.close()
+        _coalescer = None
@@ -0,0 +1,124 @@
+"""
+Orphaned chunking-session compactor for the Ingestor service.
+
+Re-ingestion writes the new session's points before deleting the old
+ones, so a document whose processing fails after the upsert is left with
+points from two sessions. Deleted documents whose vector cleanup failed
+leave points behind entirely. The compactor scans a collection's
+``document_id`` / ``chunking_session`` payloads, compares them with the
+database and deletes every point that does not belong to a completed
+document's current session.
+"""
+
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from echomind_lib.db.models import Document
+from echomind_lib.db.qdrant import QdrantDB
+
+logger = logging.getLogger("echomind-ingestor.compactor")
+
+
+class SessionCompactor:
+    """
+    Deletes vectors of superseded chunking sessions and deleted documents.
+
+    Usage:
+        compactor = SessionCompactor(db_session=session, qdrant_client=qdrant)
+        removed = await compactor.compact("user_42")
+    """
+
+    def __init__(self, db_session: AsyncSession, qdrant_client: QdrantDB) -> None:
+        """
+        Initialize the compactor.
+
+        Args:
+            db_session: Database session for document lookups.
+            qdrant_client: Qdrant client.
+        """
+        self._db = db_session
+        self._qdrant = qdrant_client
+
+    async def compact_all(self) -> int:
+        """
+        Compact every collection.
+
+        Returns:
+            Number of documents whose orphaned points were deleted.
+        """
+        removed = 0
+        for collection_name in await self._qdrant.list_collections():
+            try:
+                removed += await self.compact(collection_name)
+            except Exception as e:
+                logger.warning(f"⚠️ Compaction of {collection_name} failed: {e}")
+        return removed
+
+    async def compact(self, collection_name: str) -> int:
+        """
+        Delete orphaned sessions in one collection.
+
+        Documents still being processed, whose last run failed, or whose
+        current session has no points are left alone: their points may
+        be the only copy of their content.
+
+        Args:
+            collection_name: Collection to compact.
+
+        Returns:
+            Number of documents whose orphaned points were deleted.
+        """
+        payloads = await self._qdrant.scroll_payloads(
+            collection_name=collection_name,
+            keys=["document_id", "chunking_session"],
+        )
+
+        sessions: dict[int, set[str]] = {}
+        for payload in payloads:
+            document_id = payload.get("document_id")
+            if document_id is None:
+                continue
+            sessions.setdefault(document_id, set()).add(payload.get("chunking_session") or "")
+
+        if not sessions:
+            return 0
+
+        result = await self._db.execute(
+            select(Document.id, Document.status, Document.chunking_session).where(
+                Document.id.in_(list(sessions))
+            )
+        )
+        documents = {row.id: row for row in result}
+
+        removed = 0
+        for document_id, stored_sessions in sessions.items():
+            document = documents.get(document_id)
+
+            if document is None:
+                # Document row is gone: all of its points are orphans
+                filter_ = {
+                    "must": [{"key": "document_id", "match": {"value": document_id}}],
+                }
+            elif (
+                document.status == "completed"
+                and document.chunking_session in stored_sessions
+                and len(stored_sessions) > 1
+            ):
+                filter_ = {
+                    "must": [{"key": "document_id", "match": {"value": document_id}}],
+                    "must_not": [
+                        {"key": "chunking_session", "match": {"value": document.chunking_session}}
+                    ],
+                }
+            else:
+                continue
+
+            await self._qdrant.delete_by_filter(collection_name=collection_name, filter_=filter_)
+            removed += 1
+
+        if removed:
+            logger.info(f"🧹 {collection_name}: removed orphaned points of {removed} documents")
+
+        return removed
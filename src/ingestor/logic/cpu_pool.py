@@ -0,0 +1,508 @@
+"""
+Process pool for CPU-bound nv-ingest work.
+
+PDF parsing and HuggingFace tokenization hold the GIL for most of their
+runtime, so running them on the default thread pool serializes concurrent
+documents in one pod. ``CpuPool`` runs them in warm worker processes
+instead:
+
+- Workers are spawned (not forked) and import nv_ingest_api and load the
+  chunking tokenizer once, in the pool initializer.
+- File bytes are handed over through a spool file (``/dev/shm`` when
+  available) instead of a pickled base64 DataFrame. Only the small ledger
+  DataFrame and the extracted result cross the process boundary.
+- Chunking sends only the row texts and returns ``TextChunk`` lists.
+- Large PDFs can be extracted as page ranges in parallel: each worker cuts
+  its range out of the spool file and page numbers are rebased afterwards.
+- A worker that dies (e.g. OOM-killed) breaks the executor; it is replaced
+  with fresh workers instead of failing every later call.
+"""
+
+import asyncio
+import contextlib
+import functools
+import importlib
+import io
+import logging
+import mmap
+import multiprocessing
+import os
+import tempfile
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TypeVar
+
+import pandas as pd
+
+from ingestor.config import IngestorSettings
+from ingestor.logic.text_chunker import TextChunk, TextChunker, load_tokenizer
+
+logger = logging.getLogger("echomind-ingestor.cpu_pool")
+
+_SHM_DIR = "/dev/shm"
+
+T = TypeVar("T")
+
+
+def collect_row_texts(extracted: pd.DataFrame) -> tuple[list[str], list[int]]:
+    """
+    Pull non-empty texts out of extracted rows.
+
+    nv-ingest stores extracted text in metadata["content"], NOT in
+    metadata["content_metadata"]["text"].
+
+    Args:
+        extracted: Extracted rows.
+
+    Returns:
+        Tuple of (texts, row index labels) in order.
+    """
+    texts: list[str] = []
+    rows: list[int] = []
+    for index, metadata in zip(extracted.index, extracted.get("metadata", [])):
+        text = metadata.get("content") if isinstance(metadata, dict) else None
+        if text and isinstance(text, str) and text.strip():
+            texts.append(text)
+            rows.append(int(index))
+    return texts, rows
+
+
+def _init_worker(tokenizer: str, hf_access_token: str | None) -> None:
+    """
+    Warm a worker process before its first task.
+
+    Args:
+        tokenizer: HuggingFace tokenizer used for chunking.
+        hf_access_token: Optional token for gated tokenizers.
+    """
+    importlib.import_module("nv_ingest_api.interface.extract")
+
+    try:
+        load_tokenizer(tokenizer, hf_access_token)
+    except Exception as e:
+        # Chunking loads the tokenizer itself; warming is best effort
+        logger.warning(f"⚠️ Worker could not preload tokenizer {tokenizer}: {e}")
+
+
+def _ping() -> int:
+    """Return the worker PID; used to start workers ahead of traffic."""
+    return os.getpid()
+
+
+def _page_count_in_worker(file_path: str) -> int:
+    """
+    Count the pages of a spooled PDF.
+
+    Args:
+        file_path: Spool file holding the PDF.
+
+    Returns:
+        Number of pages.
+    """
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+
+def _slice_pdf(file_path: str, first_page: int, last_page: int) -> bytes:
+    """
+    Copy a page range of a PDF into a new PDF.
+
+    Args:
+        file_path: Source PDF.
+        first_page: First page to copy (0-based).
+        last_page: Page after the last one to copy.
+
+    Returns:
+        Bytes of the new PDF.
+    """
+    import pypdfium2 as pdfium
+
+    source = pdfium.PdfDocument(file_path)
+    target = pdfium.PdfDocument.new()
+    try:
+        target.import_pages(source, list(range(first_page, last_page)))
+        buffer = io.BytesIO()
+        target.save(buffer)
+        return buffer.getvalue()
+    finally:
+        target.close()
+        source.close()
+
+
+def _rebase_pages(extracted: pd.DataFrame, first_page: int, page_count: int) -> None:
+    """
+    Shift page numbers of a page range's extraction to document pages.
+
+    nv-ingest numbers pages from 0 within the PDF it was given, so rows
+    extracted from a slice starting at ``first_page`` are offset here.
+
+    Args:
+        extracted: Rows extracted from the slice; updated in place.
+        first_page: Document page the slice starts at.
+        page_count: Pages in the whole document.
+    """
+    for metadata in extracted.get("metadata", []):
+        content_metadata = metadata.get("content_metadata") if isinstance(metadata, dict) else None
+        if not isinstance(content_metadata, dict):
+            continue
+
+        page = content_metadata.get("page_number")
+        if isinstance(page, int) and page >= 0:
+            content_metadata["page_number"] = page + first_page
+
+        hierarchy = content_metadata.get("hierarchy")
+        if isinstance(hierarchy, dict):
+            page = hierarchy.get("page")
+            if isinstance(page, int) and page >= 0:
+                hierarchy["page"] = page + first_page
+            hierarchy["page_count"] = page_count
+
+
+def _extract_in_worker(
+    func_name: str,
+    ledger_arg: str,
+    ledger: pd.DataFrame,
+    file_path: str,
+    kwargs: dict[str, Any],
+    page_range: tuple[int, int] | None = None,
+    page_count: int | None = None,
+) -> pd.DataFrame:
+    """
+    Run an nv-ingest extractor on a spooled file.
+
+    Args:
+        func_name: Function name in nv_ingest_api.interface.extract.
+        ledger_arg: Keyword the extractor takes the ledger under.
+        ledger: Ledger DataFrame without the content column.
+        file_path: Spool file holding the raw document bytes.
+        kwargs: Extractor keyword arguments.
+        page_range: (first, last) pages to extract from a PDF, last
+            exclusive; None extracts the whole file.
+        page_count: Pages in the whole PDF, for rebasing a page range.
+
+    Returns:
+        Extracted DataFrame.
+    """
+    import base64
+
+    if page_range is not None:
+        data = _slice_pdf(file_path, *page_range)
+    else:
+        with open(file_path, "rb") as f:
+            data = f.read()
+    ledger["content"] = [base64.b64encode(data).decode("utf-8")]
+    del data
+
+    func = getattr(importlib.import_module("nv_ingest_api.interface.extract"), func_name)
+    result = func(**{ledger_arg: ledger}, **kwargs)
+
+    # DOCX/PPTX/Image/Audio return (DataFrame, dict); keep the DataFrame.
+    # Drop any copy of the encoded source before pickling the result back.
+    df = result[0] if isinstance(result, tuple) else result
+    if page_range is not None:
+        _rebase_pages(df, page_range[0], page_count or page_range[1])
+    return df.drop(columns=["content"], errors="ignore")
+
+
+def _chunk_in_worker(
+    texts: list[str],
+    rows: list[int],
+    kwargs: dict[str, Any],
+) -> list[list[TextChunk]]:
+    """
+    Chunk texts with the worker's cached tokenizer.
+
+    Args:
+        texts: Texts to chunk.
+        rows: Source row per text.
+        kwargs: TextChunker keyword arguments.
+
+    Returns:
+        Chunks per text.
+    """
+    return TextChunker(**kwargs).split_batch(texts, rows)
+
+
+class CpuPool:
+    """
+    Warm process pool for extraction and chunking.
+
+    Usage:
+        pool = CpuPool(workers=4, tokenizer="gpt2")
+        await pool.warm()
+        df = await pool.extract("extract_primitives_from_pdf_pdfium",
+                                "df_extraction_ledger", ledger, file_bytes, kwargs)
+        chunks = await pool.chunk(texts, rows, chunker_kwargs)
+        pool.shutdown()
+
+    Attributes:
+        workers: Number of worker processes.
+        spool_dir: Directory for file handoff.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        tokenizer: str,
+        hf_access_token: str | None = None,
+        spool_dir: str = "",
+    ) -> None:
+        """
+        Initialize the pool. Worker processes start on first use or warm().
+
+        Args:
+            workers: Number of worker processes.
+            tokenizer: HuggingFace tokenizer to preload in each worker.
+            hf_access_token: Optional token for gated tokenizers.
+            spool_dir: Directory for file handoff; empty picks /dev/shm
+                when available, else the system temp directory.
+        """
+        self.workers = max(1, workers)
+        self.spool_dir = spool_dir or (_SHM_DIR if os.path.isdir(_SHM_DIR) else tempfile.gettempdir())
+        self._initargs = (tokenizer, hf_access_token)
+        self._executor = self._new_executor()
+        self._restart_lock = asyncio.Lock()
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        """Create the worker processes' executor."""
+        # Spawn: forking a process with live asyncio/gRPC state is unsafe
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=self._initargs,
+        )
+
+    async def warm(self) -> None:
+        """Start every worker process and run its initializer."""
+        pids = await asyncio.gather(*(self._run(_ping) for _ in range(self.workers)))
+        logger.info(f"🔥 CPU pool warm: {len(set(pids))} worker processes")
+
+    async def _run(self, func: Callable[[], T]) -> T:
+        """
+        Run a call in a worker process.
+
+        A dead worker fails every call in flight on the executor, not just
+        the one that killed it. The call is retried once on the fresh
+        workers, so documents that only shared the pool with the culprit
+        go through; a call that breaks the new pool as well fails.
+
+        Args:
+            func: Picklable callable without arguments.
+
+        Returns:
+            The call's result.
+
+        Raises:
+            BrokenProcessPool: If the retry lost its worker as well.
+        """
+        try:
+            return await self._submit(func)
+        except BrokenProcessPool:
+            logger.warning("⚠️ CPU pool worker died, retrying on fresh workers")
+            return await self._submit(func)
+
+    async def _submit(self, func: Callable[[], T]) -> T:
+        """
+        Run a call on the current executor, replacing it if it broke.
+
+        Args:
+            func: Picklable callable without arguments.
+
+        Returns:
+            The call's result.
+
+        Raises:
+            BrokenProcessPool: If a worker died; the executor is replaced.
+        """
+        executor = self._executor
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, func)
+        except BrokenProcessPool:
+            await self._restart(executor)
+            raise
+
+    async def _restart(self, broken: ProcessPoolExecutor) -> None:
+        """
+        Replace a broken executor with fresh worker processes.
+
+        Calls failing together on the same executor replace it only once.
+
+        Args:
+            broken: Executor the failed call ran on.
+        """
+        async with self._restart_lock:
+            if self._executor is not broken:
+                return
+
+            logger.warning(f"🔄 CPU pool broken by a dead worker, starting {self.workers} new workers")
+            # Reap the old processes before spawning their replacements
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None, functools.partial(broken.shutdown, wait=True, cancel_futures=True)
+            )
+            self._executor = self._new_executor()
+
+    @contextlib.asynccontextmanager
+    async def spool(
+        self,
+        file_bytes: bytes | mmap.mmap,
+        file_path: str | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Provide a file workers can read ``file_bytes`` from.
+
+        Args:
+            file_bytes: Raw document bytes.
+            file_path: Local file already holding ``file_bytes``; yielded
+                as-is instead of a fresh spool copy.
+
+        Yields:
+            Path of the file; a spool copy is removed on exit.
+        """
+        if file_path is not None:
+            yield file_path
+            return
+
+        fd, file_path = tempfile.mkstemp(prefix="ingest-", dir=self.spool_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(file_bytes)
+            yield file_path
+        finally:
+            try:
+                os.unlink(file_path)
+            except OSError:
+                pass
+
+    async def page_count(self, file_path: str) -> int:
+        """
+        Count the pages of a PDF in a worker process.
+
+        Args:
+            file_path: File holding the PDF.
+
+        Returns:
+            Number of pages.
+        """
+        return await self._run(functools.partial(_page_count_in_worker, file_path))
+
+    async def extract(
+        self,
+        func_name: str,
+        ledger_arg: str,
+        ledger: pd.DataFrame,
+        file_bytes: bytes | mmap.mmap,
+        kwargs: dict[str, Any],
+        file_path: str | None = None,
+        page_range: tuple[int, int] | None = None,
+        page_count: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Run an nv-ingest extractor in a worker process.
+
+        Args:
+            func_name: Function name in nv_ingest_api.interface.extract.
+            ledger_arg: Keyword the extractor takes the ledger under.
+            ledger: Ledger DataFrame; its content column is not sent.
+            file_bytes: Raw document bytes.
+            kwargs: Extractor keyword arguments.
+            file_path: Local file already holding ``file_bytes``; workers
+                read it directly instead of a fresh spool copy.
+            page_range: (first, last) PDF pages to extract, last
+                exclusive; page numbers in the result are document pages.
+            page_count: Pages in the whole PDF when ``page_range`` is set.
+
+        Returns:
+            Extracted DataFrame.
+        """
+        async with self.spool(file_bytes, file_path) as path:
+            return await self._run(
+                functools.partial(
+                    _extract_in_worker,
+                    func_name,
+                    ledger_arg,
+                    ledger.drop(columns=["content"], errors="ignore"),
+                    path,
+                    kwargs,
+                    page_range,
+                    page_count,
+                ),
+            )
+
+    async def chunk(
+        self,
+        texts: list[str],
+        rows: list[int],
+        kwargs: dict[str, Any],
+    ) -> list[list[TextChunk]]:
+        """
+        Chunk texts in a worker process.
+
+        Args:
+            texts: Texts to chunk.
+            rows: Source row per text.
+            kwargs: TextChunker keyword arguments.
+
+        Returns:
+            Chunks per text.
+        """
+        return await self._run(functools.partial(_chunk_in_worker, texts, rows, kwargs))
+
+    def shutdown(self) -> None:
+        """Stop worker processes, cancelling queued tasks."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_cpu_pool: CpuPool | None = None
+
+
+def get_cpu_pool() -> CpuPool | None:
+    """
+    Get the global CPU pool.
+
+    Returns:
+        The pool when the process backend is initialized, else None
+        (callers fall back to the default thread pool).
+    """
+    return _cpu_pool
+
+
+async def init_cpu_pool(settings: IngestorSettings) -> CpuPool | None:
+    """
+    Create and warm the global CPU pool when the process backend is enabled.
+
+    Args:
+        settings: Ingestor settings.
+
+    Returns:
+        The pool, or None for the thread backend.
+    """
+    global _cpu_pool
+    if settings.cpu_backend != "process":
+        return None
+
+    if _cpu_pool is None:
+        _cpu_pool = CpuPool(
+            workers=settings.cpu_workers,
+            tokenizer=settings.tokenizer,
+            hf_access_token=settings.hf_access_token,
+            spool_dir=settings.cpu_spool_dir,
+        )
+        await _cpu_pool.warm()
+    return _cpu_pool
+
+
+def close_cpu_pool() -> None:
+    """Shut down the global CPU pool."""
+    global _cpu_pool
+    if _cpu_pool is not None:
+        _cpu_pool.shutdown()
+        _cpu_pool = None
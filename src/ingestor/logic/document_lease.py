@@ -0,0 +1,237 @@
+"""
+Per-document processing lease for the Ingestor service.
+
+JetStream redelivers a message after ``ack_wait`` or a pod restart, and
+the same document may be redelivered while another worker is still on
+it. The lease makes processing idempotent per
+(document_id, chunking_session, signature) using the document's own row:
+
+- A document already ``completed`` in the message's session is skipped.
+- A worker claims the document by setting ``status='processing'`` and its
+  session, and keeps the claim fresh by bumping ``last_update``. Other
+  workers defer the message while the claim is fresher than ``ttl``.
+- A claim older than ``ttl`` belongs to a dead worker and is taken over.
+  The new worker resumes cheaply: point IDs are content-addressed, so
+  chunks already upserted by the dead worker are reused, not re-embedded.
+  The run that lost its claim notices on its next renewal and stops.
+- Completion only marks the row ``completed`` if the signature is still
+  the one that was claimed. If the connector uploaded a newer version
+  meanwhile, the row stays ``pending`` for the newer message.
+- A failed run marks the row ``error`` under the same condition, so a run
+  that lost its claim or was superseded never overwrites the row of the
+  worker that took over.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, Result, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from echomind_lib.db.models import Document
+
+from ingestor.logic.exceptions import DatabaseError, DocumentLeasedError
+from ingestor.logic.metrics import db_update_duration
+
+logger = logging.getLogger("echomind-ingestor.document_lease")
+
+
+def _updated(result: Result[Any]) -> bool:
+    """Check if an UPDATE matched a row; UPDATEs return a CursorResult."""
+    return cast(CursorResult[Any], result).rowcount != 0
+
+
+class DocumentLease:
+    """
+    Claims a document row for one processing run.
+
+    Usage:
+        lease = DocumentLease(document, chunking_session, ttl=120.0)
+        if lease.already_completed(document):
+            return
+        await lease.acquire(session)
+        await lease.renew(other_session)  # periodically
+        await lease.complete(session, chunk_count)  # or lease.fail(session, message)
+
+    Attributes:
+        document_id: Claimed document.
+        chunking_session: Session of the processing run.
+        signature: Document signature when the run started.
+    """
+
+    def __init__(self, document: Document, chunking_session: str, ttl: float) -> None:
+        """
+        Initialize the lease.
+
+        Args:
+            document: Document row loaded for this run.
+            chunking_session: Session of the processing run.
+            ttl: Seconds a claim stays valid without renewal.
+        """
+        self.document_id = document.id
+        self.chunking_session = chunking_session
+        self.signature = document.signature
+        self._ttl = ttl
+
+    def already_completed(self, document: Document) -> bool:
+        """
+        Check whether this session already finished the document.
+
+        The connector resets the status to ``pending`` whenever it
+        uploads a new version, so a completed row in the same session
+        holds the current content.
+
+        Args:
+            document: Document row loaded for this run.
+
+        Returns:
+            True if the work can be skipped.
+        """
+        return document.status == "completed" and document.chunking_session == self.chunking_session
+
+    async def acquire(self, session: AsyncSession) -> None:
+        """
+        Claim the document and commit, so other workers see the claim.
+
+        Args:
+            session: Database session.
+
+        Raises:
+            DocumentLeasedError: If another worker holds a fresh claim.
+            DatabaseError: If the update fails.
+        """
+        now = datetime.now(timezone.utc)
+        try:
+            with db_update_duration.labels(operation="claim").time():
+                result = await session.execute(
+                    update(Document)
+                    .where(Document.id == self.document_id)
+                    .where(
+                        or_(
+                            Document.status != "processing",
+                            Document.last_update.is_(None),
+                            Document.last_update < now - timedelta(seconds=self._ttl),
+                        )
+                    )
+                    .values(
+                        status="processing",
+                        chunking_session=self.chunking_session,
+                        last_update=now,
+                    )
+                )
+                claimed = _updated(result)
+                if claimed:
+                    await session.commit()
+            if not claimed:
+                held = await session.execute(
+                    select(Document.last_update).where(Document.id == self.document_id)
+                )
+                last_update = held.scalar_one_or_none()
+        except Exception as e:
+            raise DatabaseError("claim", str(e)) from e
+
+        if not claimed:
+            remaining = self._ttl
+            if last_update is not None:
+                if last_update.tzinfo is None:
+                    last_update = last_update.replace(tzinfo=timezone.utc)
+                remaining = self._ttl - (now - last_update).total_seconds()
+            raise DocumentLeasedError(self.document_id, retry_after=max(1.0, remaining))
+
+        logger.debug(f"[id:{self.document_id}] Claimed for session {self.chunking_session}")
+
+    async def renew(self, session: AsyncSession) -> bool:
+        """
+        Extend the claim.
+
+        Args:
+            session: Database session, committed by the caller.
+
+        Returns:
+            False if the claim was lost to another worker.
+        """
+        result = await session.execute(
+            update(Document)
+            .where(Document.id == self.document_id)
+            .where(Document.status == "processing")
+            .where(Document.chunking_session == self.chunking_session)
+            .values(last_update=datetime.now(timezone.utc))
+        )
+        return _updated(result)
+
+    async def complete(self, session: AsyncSession, chunk_count: int) -> bool:
+        """
+        Mark the document completed if its content did not change.
+
+        Args:
+            session: Database session, committed by the caller.
+            chunk_count: Chunks stored for the document.
+
+        Returns:
+            False if a newer version or another worker superseded the run.
+
+        Raises:
+            DatabaseError: If the update fails.
+        """
+        return await self._finish(
+            session,
+            "complete",
+            status="completed",
+            chunk_count=chunk_count,
+            last_update=datetime.now(timezone.utc),
+        )
+
+    async def fail(self, session: AsyncSession, message: str) -> bool:
+        """
+        Mark the document errored if this run still holds its claim.
+
+        Args:
+            session: Database session, committed by the caller.
+            message: Error stored in ``status_message``.
+
+        Returns:
+            False if another worker or a newer version owns the row now.
+
+        Raises:
+            DatabaseError: If the update fails.
+        """
+        return await self._finish(
+            session,
+            "error",
+            status="error",
+            status_message=message,
+            last_update=datetime.now(timezone.utc),
+        )
+
+    async def _finish(self, session: AsyncSession, operation: str, **values: object) -> bool:
+        """
+        Update the row, conditional on the claim and the claimed signature.
+
+        Args:
+            session: Database session, committed by the caller.
+            operation: Label for the update duration metric.
+            **values: Columns to set.
+
+        Returns:
+            False if the claim or the claimed version is gone.
+
+        Raises:
+            DatabaseError: If the update fails.
+        """
+        statement = (
+            update(Document)
+            .where(Document.id == self.document_id)
+            .where(Document.status == "processing")
+            .where(Document.chunking_session == self.chunking_session)
+            .where(Document.signature.is_not_distinct_from(self.signature))
+            .values(**values)
+        )
+        try:
+            with db_update_duration.labels(operation=operation).time():
+                result = await session.execute(statement)
+                await session.flush()
+        except Exception as e:
+            raise DatabaseError("update", str(e)) from e
+
+        return _updated(result)
@@ -8,12 +8,16 @@ Uses NVIDIA's tokenizer-based splitter (not langchain character-based).
 import asyncio
 import base64
 import functools
+import importlib
 import logging
+import mmap
+from collections.abc import AsyncIterator
 from typing import Any
 
 import pandas as pd
 
 from ingestor.config import IngestorSettings
+from ingestor.logic.cpu_pool import CpuPool, collect_row_texts, get_cpu_pool
 from ingestor.logic.exceptions import (
     AudioExtractionError,
     ChunkingError,
@@ -27,7 +31,10 @@ from ingestor.logic.exceptions import (
     UnsupportedMimeTypeError,
     VideoExtractionError,
 )
+from ingestor.logic.extraction_cache import ExtractionCache
+from ingestor.logic.metrics import chunk_duration, extract_duration
 from ingestor.logic.mime_router import MimeRouter
+from ingestor.logic.text_chunker import TextChunk, TextChunker
 
 logger = logging.getLogger("echomind-ingestor.processor")
 
@@ -59,15 +66,37 @@ class DocumentProcessor:
         settings: Ingestor service settings.
     """
 
-    def __init__(self, settings: IngestorSettings) -> None:
+    def __init__(
+        self,
+        settings: IngestorSettings,
+        cache: ExtractionCache | None = None,
+    ) -> None:
         """
         Initialize document processor.
 
         Args:
             settings: Service configuration.
+            cache: Optional cache of chunked text, consulted before
+                extraction.
         """
         self._settings = settings
+        self._cache = cache
         self._router = MimeRouter()
+        self._chunker = TextChunker(**self._chunker_kwargs())
+
+    def _chunker_kwargs(self) -> dict[str, Any]:
+        """
+        Build TextChunker arguments from settings.
+
+        Returns:
+            Keyword arguments for TextChunker.
+        """
+        return {
+            "tokenizer": self._settings.tokenizer,
+            "chunk_size": self._settings.chunk_size,
+            "chunk_overlap": self._settings.chunk_overlap,
+            "hf_access_token": self._settings.hf_access_token,
+        }
 
     def _build_yolox_endpoints(self) -> tuple[str | None, str]:
         """
@@ -86,25 +115,86 @@ class DocumentProcessor:
 
     async def process(
         self,
-        file_bytes: bytes,
+        file_bytes: bytes | mmap.mmap,
         document_id: int,
         file_name: str,
         mime_type: str,
-    ) -> tuple[list[str], list[bytes]]:
+        file_path: str | None = None,
+    ) -> tuple[list[TextChunk], list[bytes]]:
         """
         Extract content and chunk using nv_ingest_api.
 
+        Collects every group from ``process_stream``.
+
         Args:
-            file_bytes: Raw file content.
+            file_bytes: Raw file content (bytes or a read-only memory map).
             document_id: Document ID for tracking.
             file_name: Original filename.
             mime_type: MIME type of file.
+            file_path: Local file holding the content, if any.
 
         Returns:
             Tuple of (text_chunks, structured_images):
             - text_chunks: List of text strings ready for embedding
             - structured_images: List of image bytes (tables/charts)
 
+        Raises:
+            UnsupportedMimeTypeError: If MIME type not supported.
+            ExtractionError: If extraction fails.
+            ChunkingError: If chunking fails.
+        """
+        chunks: list[TextChunk] = []
+        structured_images: list[bytes] = []
+
+        async for group_chunks, group_images in self.process_stream(
+            file_bytes=file_bytes,
+            document_id=document_id,
+            file_name=file_name,
+            mime_type=mime_type,
+            file_path=file_path,
+        ):
+            chunks.extend(group_chunks)
+            structured_images.extend(group_images)
+
+        logger.debug(f"[id:{document_id}] Extracted: {len(chunks)} chunks, {len(structured_images)} images")
+
+        return chunks, structured_images
+
+    async def process_stream(
+        self,
+        file_bytes: bytes | mmap.mmap,
+        document_id: int,
+        file_name: str,
+        mime_type: str,
+        file_path: str | None = None,
+    ) -> AsyncIterator[tuple[list[TextChunk], list[bytes]]]:
+        """
+        Extract content, then chunk it a few extracted rows at a time.
+
+        With ``text_depth=page`` each extracted row is a page, so the
+        caller can start embedding the first pages while later ones are
+        still being tokenized.
+
+        The file is base64-encoded only for nv_ingest_api extractors
+        running in this process and pool workers read ``file_path``.
+        Text and HTML take a fast path: decoded once and chunked directly
+        with the cached tokenizer, yielded as a single group.
+
+        With an extraction cache, content already chunked with the same
+        settings is yielded from the cache as a single group; otherwise
+        the chunks are cached once every group has been yielded.
+
+        Args:
+            file_bytes: Raw file content (bytes or a read-only memory map).
+            document_id: Document ID for tracking.
+            file_name: Original filename.
+            mime_type: MIME type of file.
+            file_path: Local file holding the content, if any.
+
+        Yields:
+            Tuple of (text_chunks, structured_images) per row group, in
+            document order.
+
         Raises:
             UnsupportedMimeTypeError: If MIME type not supported.
             ExtractionError: If extraction fails.
@@ -114,30 +204,181 @@ class DocumentProcessor:
         if not self._router.is_supported(mime_type):
             raise UnsupportedMimeTypeError(mime_type)
 
+        if self._cache is None or not len(file_bytes):
+            async for group in self._extract_and_chunk(
+                file_bytes, document_id, file_name, mime_type, file_path
+            ):
+                yield group
+            return
+
+        # Identical content was extracted and chunked before: reuse it
+        cache_key = await self._cache.key(file_bytes, mime_type)
+        cached = await self._cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"♻️ [id:{document_id}] Extraction cache hit: {len(cached)} chunks")
+            yield cached, []
+            return
+
+        chunks: list[TextChunk] = []
+        has_images = False
+        async for group in self._extract_and_chunk(
+            file_bytes, document_id, file_name, mime_type, file_path
+        ):
+            chunks.extend(group[0])
+            has_images = has_images or bool(group[1])
+            yield group
+
+        # Structured images are not cached; re-extract documents with them
+        if chunks and not has_images:
+            await self._cache.put(cache_key, chunks)
+
+    async def _extract_and_chunk(
+        self,
+        file_bytes: bytes | mmap.mmap,
+        document_id: int,
+        file_name: str,
+        mime_type: str,
+        file_path: str | None,
+    ) -> AsyncIterator[tuple[list[TextChunk], list[bytes]]]:
+        """
+        Extract and chunk a document, bypassing the cache.
+
+        Args:
+            file_bytes: Raw file content.
+            document_id: Document ID for tracking.
+            file_name: Original filename.
+            mime_type: Supported MIME type of file.
+            file_path: Local file holding the content, if any.
+
+        Yields:
+            Tuple of (text_chunks, structured_images) per row group.
+        """
         logger.debug(f"[id:{document_id}] Extracting {file_name} ({mime_type})")
 
-        # Build input DataFrame
-        df = self._build_dataframe(file_bytes, document_id, file_name, mime_type)
+        # Text and HTML (mostly small connector-generated markdown) skip
+        # the DataFrame and nv-ingest entirely
+        extractor_type = self._router.get_extractor_type(mime_type)
+        if extractor_type in ("text", "html"):
+            yield await self._process_text(file_bytes, extractor_type, document_id), []
+            return
+
+        # Build input DataFrame; content is encoded later only if needed
+        df = self._build_dataframe(
+            file_bytes, document_id, file_name, mime_type, encode_content=False
+        )
 
         # Extract content
-        extracted_df = await self._extract(df, mime_type, document_id)
+        with extract_duration.labels(extractor=extractor_type).time():
+            extracted_df = await self._extract(
+                df, mime_type, document_id, file_bytes=file_bytes, file_path=file_path
+            )
 
-        # Chunk text content
-        chunks = await self._chunk_content(extracted_df, document_id)
+        rows = self._settings.pipeline_chunk_rows
+        for start in range(0, len(extracted_df), rows):
+            group = extracted_df.iloc[start:start + rows]
 
-        # Extract structured images (tables/charts)
-        structured_images = self._extract_structured_images(extracted_df)
+            # Chunk text content
+            with chunk_duration.labels(extractor=extractor_type).time():
+                chunks = await self._chunk_content(group, document_id)
 
-        logger.debug(f"[id:{document_id}] Extracted: {len(chunks)} chunks, {len(structured_images)} images")
+            # Extract structured images (tables/charts)
+            structured_images = self._extract_structured_images(group)
 
-        return chunks, structured_images
+            yield chunks, structured_images
+
+    async def _process_text(
+        self,
+        file_bytes: bytes | mmap.mmap,
+        extractor_type: str,
+        document_id: int,
+    ) -> list[TextChunk]:
+        """
+        Decode and chunk a text or HTML document without pandas.
+
+        Args:
+            file_bytes: Raw file content.
+            extractor_type: "text" or "html".
+            document_id: Document ID for error context.
+
+        Returns:
+            Text chunks.
+
+        Raises:
+            TextExtractionError: If a text file cannot be decoded.
+            HtmlExtractionError: If HTML conversion fails.
+            ChunkingError: If chunking fails.
+        """
+        loop = asyncio.get_running_loop()
+        decode = self._html_to_text if extractor_type == "html" else self._decode_text
+
+        try:
+            with extract_duration.labels(extractor=extractor_type).time():
+                text = await loop.run_in_executor(None, decode, file_bytes)
+        except Exception as e:
+            logger.exception(f"❌ [id:{document_id}] Extraction failed: {e}")
+            error_cls = HtmlExtractionError if extractor_type == "html" else TextExtractionError
+            raise error_cls(reason=str(e), document_id=document_id) from e
+
+        try:
+            with chunk_duration.labels(extractor=extractor_type).time():
+                chunks = await loop.run_in_executor(None, self._chunker.split, text)
+        except Exception as e:
+            logger.exception(f"❌ [id:{document_id}] Chunking failed: {e}")
+            raise ChunkingError(str(e), document_id) from e
+
+        logger.debug(f"✂️ [id:{document_id}] Chunked: {len(chunks)} chunks")
+        return chunks
+
+    @staticmethod
+    def _decode_text(raw: bytes | mmap.mmap) -> str:
+        """
+        Decode a text file, falling back to latin-1.
+
+        Args:
+            raw: Raw file content.
+
+        Returns:
+            Decoded text.
+        """
+        try:
+            return str(raw, "utf-8")
+        except UnicodeDecodeError:
+            return str(raw, "latin-1")
+
+    @staticmethod
+    def _html_to_text(raw: bytes | mmap.mmap) -> str:
+        """
+        Convert HTML to markdown text without scripts and styles.
+
+        Args:
+            raw: Raw HTML file content.
+
+        Returns:
+            Markdown text.
+        """
+        from bs4 import BeautifulSoup
+        import html2text
+
+        h = html2text.HTML2Text()
+        h.ignore_links = False
+        h.ignore_images = True
+
+        soup = BeautifulSoup(str(raw, "utf-8"), "html.parser")
+
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+
+        # Convert to markdown
+        return h.handle(str(soup)).strip()
 
     def _build_dataframe(
         self,
-        file_bytes: bytes,
+        file_bytes: bytes | mmap.mmap,
         document_id: int,
         file_name: str,
         mime_type: str,
+        encode_content: bool = True,
     ) -> pd.DataFrame:
         """
         Build pandas DataFrame in nv_ingest_api format.
@@ -147,6 +388,8 @@ class DocumentProcessor:
             document_id: Document ID.
             file_name: Original filename.
             mime_type: MIME type.
+            encode_content: Base64-encode the file into the content
+                column; when False the column is None.
 
         Returns:
             DataFrame with columns: source_id, source_name, content,
@@ -157,7 +400,7 @@ class DocumentProcessor:
         return pd.DataFrame({
             "source_id": [str(document_id)],
             "source_name": [file_name],
-            "content": [base64.b64encode(file_bytes).decode("utf-8")],
+            "content": [self._encode(file_bytes) if encode_content else None],
             "document_type": [document_type],
             "metadata": [{
                 "content_metadata": {"type": "document"},
@@ -168,6 +411,19 @@ class DocumentProcessor:
             }],
         })
 
+    @staticmethod
+    def _encode(file_bytes: bytes | mmap.mmap) -> str:
+        """
+        Base64-encode file content for nv_ingest_api ledgers.
+
+        Args:
+            file_bytes: Raw file content.
+
+        Returns:
+            Base64 string.
+        """
+        return base64.b64encode(file_bytes).decode("ascii")
+
     @staticmethod
     def _unpack_extraction_result(result: pd.DataFrame | tuple) -> pd.DataFrame:
         """
@@ -187,19 +443,92 @@ class DocumentProcessor:
             return result[0]
         return result
 
+    def _nv_ingest_call(self, extractor_type: str) -> tuple[str, str, dict[str, Any]] | None:
+        """
+        Describe the nv_ingest_api extractor call for an extractor type.
+
+        YOLOX-dependent flags (tables, charts, images, infographics) are
+        gated on yolox_enabled. When YOLOX NIM is not deployed, these flags
+        cause nv-ingest to hang ~30s/page retrying. yolox_endpoints tuple is
+        ALWAYS passed — schema crashes on None.
+
+        Args:
+            extractor_type: Extractor type from the MIME router.
+
+        Returns:
+            Tuple of (function name in nv_ingest_api.interface.extract,
+            ledger keyword, keyword arguments), or None for extractors that
+            do not go through nv_ingest_api.
+        """
+        yolox_on = self._settings.yolox_enabled
+
+        if extractor_type == "pdf":
+            # PDF extractor (decorator path) takes df_extraction_ledger
+            return (
+                "extract_primitives_from_pdf_pdfium",
+                "df_extraction_ledger",
+                {
+                    "extract_text": True,
+                    "text_depth": self._settings.text_depth,
+                    "extract_tables": yolox_on,
+                    "extract_charts": yolox_on,
+                    "extract_images": yolox_on,
+                    "extract_infographics": yolox_on,
+                    "yolox_endpoints": self._build_yolox_endpoints(),
+                },
+            )
+
+        if extractor_type in ("docx", "pptx", "image"):
+            # DOCX/PPTX/Image (direct path) take df_ledger
+            return (
+                f"extract_primitives_from_{extractor_type}",
+                "df_ledger",
+                {
+                    "extract_text": True,
+                    "text_depth": self._settings.text_depth,
+                    "extract_tables": yolox_on,
+                    "extract_charts": yolox_on,
+                    "extract_images": yolox_on,
+                    "yolox_endpoints": self._build_yolox_endpoints(),
+                },
+            )
+
+        if extractor_type == "audio":
+            return (
+                "extract_primitives_from_audio",
+                "df_ledger",
+                {
+                    "audio_endpoints": (self._settings.riva_endpoint, ""),
+                    "audio_infer_protocol": "grpc",
+                },
+            )
+
+        return None
+
     async def _extract(
         self,
         df: pd.DataFrame,
         mime_type: str,
         document_id: int,
+        file_bytes: bytes | mmap.mmap | None = None,
+        file_path: str | None = None,
     ) -> pd.DataFrame:
         """
         Extract content using appropriate nv_ingest_api function.
 
+        nv_ingest_api extractors run in the CPU process pool when it is
+        enabled and ``file_bytes`` is given, else in the default thread
+        pool to avoid blocking the event loop.
+
         Args:
-            df: Input DataFrame.
+            df: Input DataFrame; a None content column is filled from
+                ``file_bytes`` when an in-process extractor needs it.
             mime_type: MIME type for routing.
             document_id: Document ID for error context.
+            file_bytes: Raw file content, handed to pool workers through a
+                spool file instead of the base64 ledger.
+            file_path: Local file holding ``file_bytes``; pool workers
+                read it directly.
 
         Returns:
             DataFrame with extracted content.
@@ -210,125 +539,41 @@ class DocumentProcessor:
         extractor_type = self._router.get_extractor_type(mime_type)
 
         try:
-            # Import nv_ingest_api functions lazily to avoid startup cost
-            #
-            # YOLOX-dependent flags (tables, charts, images, infographics)
-            # are gated on yolox_enabled. When YOLOX NIM is not deployed,
-            # these flags cause nv-ingest to hang ~30s/page retrying.
-            # yolox_endpoints tuple is ALWAYS passed — schema crashes on None.
-            #
-            # All nv-ingest extraction calls are synchronous and CPU-bound.
-            # We run them in a thread pool executor to avoid blocking the
-            # event loop for large files.
-            yolox_on = self._settings.yolox_enabled
             loop = asyncio.get_running_loop()
 
-            if extractor_type == "pdf":
-                from nv_ingest_api.interface.extract import (
-                    extract_primitives_from_pdf_pdfium,
-                )
-
-                # PDF extractor (decorator path) returns DataFrame directly
-                return await loop.run_in_executor(
-                    None,
-                    functools.partial(
-                        extract_primitives_from_pdf_pdfium,
-                        df_extraction_ledger=df,
-                        extract_text=True,
-                        text_depth=self._settings.text_depth,
-                        extract_tables=yolox_on,
-                        extract_charts=yolox_on,
-                        extract_images=yolox_on,
-                        extract_infographics=yolox_on,
-                        yolox_endpoints=self._build_yolox_endpoints(),
-                    ),
-                )
-
-            elif extractor_type == "docx":
-                from nv_ingest_api.interface.extract import (
-                    extract_primitives_from_docx,
-                )
-
-                # DOCX/PPTX/Image/Audio (direct path) return (DataFrame, dict)
-                raw = await loop.run_in_executor(
-                    None,
-                    functools.partial(
-                        extract_primitives_from_docx,
-                        df_ledger=df,
-                        extract_text=True,
-                        text_depth=self._settings.text_depth,
-                        extract_tables=yolox_on,
-                        extract_charts=yolox_on,
-                        extract_images=yolox_on,
-                        yolox_endpoints=self._build_yolox_endpoints(),
-                    ),
-                )
-                return self._unpack_extraction_result(raw)
-
-            elif extractor_type == "pptx":
-                from nv_ingest_api.interface.extract import (
-                    extract_primitives_from_pptx,
-                )
-
-                raw = await loop.run_in_executor(
-                    None,
-                    functools.partial(
-                        extract_primitives_from_pptx,
-                        df_ledger=df,
-                        extract_text=True,
-                        text_depth=self._settings.text_depth,
-                        extract_tables=yolox_on,
-                        extract_charts=yolox_on,
-                        extract_images=yolox_on,
-                        yolox_endpoints=self._build_yolox_endpoints(),
-                    ),
-                )
-                return self._unpack_extraction_result(raw)
-
-            elif extractor_type == "html":
-                # HTML uses our own text extractor (lightweight, no NIM needed)
-                return await loop.run_in_executor(
-                    None, self._extract_html, df,
-                )
-
-            elif extractor_type == "image":
-                from nv_ingest_api.interface.extract import (
-                    extract_primitives_from_image,
-                )
-
-                raw = await loop.run_in_executor(
-                    None,
-                    functools.partial(
-                        extract_primitives_from_image,
-                        df_ledger=df,
-                        extract_text=True,
-                        text_depth=self._settings.text_depth,
-                        extract_tables=yolox_on,
-                        extract_charts=yolox_on,
-                        extract_images=yolox_on,
-                        yolox_endpoints=self._build_yolox_endpoints(),
-                    ),
+            if extractor_type == "audio" and not self._settings.riva_enabled:
+                logger.warning(
+                    "⚠️ Audio extraction disabled (Riva NIM not enabled)"
                 )
-                return self._unpack_extraction_result(raw)
-
-            elif extractor_type == "audio":
-                if not self._settings.riva_enabled:
-                    logger.warning(
-                        "⚠️ Audio extraction disabled (Riva NIM not enabled)"
+                return pd.DataFrame()
+
+            call = self._nv_ingest_call(extractor_type)
+            if call is not None:
+                func_name, ledger_arg, kwargs = call
+
+                pool = get_cpu_pool()
+                if pool is not None and file_bytes is not None:
+                    if extractor_type == "pdf" and self._settings.pdf_split_threshold:
+                        return await self._extract_pdf_pages(
+                            pool, func_name, ledger_arg, df, file_bytes, kwargs,
+                            file_path, document_id,
+                        )
+                    return await pool.extract(
+                        func_name, ledger_arg, df, file_bytes, kwargs, file_path=file_path
                     )
-                    return pd.DataFrame()
 
-                from nv_ingest_api.interface.extract import (
-                    extract_primitives_from_audio,
-                )
+                # nv_ingest_api only accepts base64 ledger content
+                if file_bytes is not None and df["content"].isna().all():
+                    df = df.assign(content=[self._encode(file_bytes)])
 
+                # Import nv_ingest_api lazily to avoid startup cost
+                extract_module = importlib.import_module("nv_ingest_api.interface.extract")
                 raw = await loop.run_in_executor(
                     None,
                     functools.partial(
-                        extract_primitives_from_audio,
-                        df_ledger=df,
-                        audio_endpoints=(self._settings.riva_endpoint, ""),
-                        audio_infer_protocol="grpc",
+                        getattr(extract_module, func_name),
+                        **{ledger_arg: df},
+                        **kwargs,
                     ),
                 )
                 return self._unpack_extraction_result(raw)
@@ -337,12 +582,6 @@ class DocumentProcessor:
                 logger.warning("⚠️ Video extraction is early access")
                 return self._extract_video(df)
 
-            elif extractor_type == "text":
-                # Text extraction is lightweight (base64 decode only)
-                return await loop.run_in_executor(
-                    None, self._extract_text, df,
-                )
-
             else:
                 raise UnsupportedMimeTypeError(mime_type)
 
@@ -364,83 +603,76 @@ class DocumentProcessor:
                 document_id=document_id,
             ) from e
 
-    def _extract_html(self, df: pd.DataFrame) -> pd.DataFrame:
+    async def _extract_pdf_pages(
+        self,
+        pool: CpuPool,
+        func_name: str,
+        ledger_arg: str,
+        df: pd.DataFrame,
+        file_bytes: bytes | mmap.mmap,
+        kwargs: dict[str, Any],
+        file_path: str | None,
+        document_id: int,
+    ) -> pd.DataFrame:
         """
-        Extract content from HTML files.
+        Extract a PDF in page ranges spread across the process pool.
 
-        Converts HTML to markdown for text extraction.
+        PDFs below ``pdf_split_threshold`` pages are extracted in one
+        call. Larger ones are split into ranges of ``pdf_split_pages``
+        pages, at most ``pdf_split_concurrency`` in flight, and the
+        results are concatenated in page order.
 
         Args:
-            df: Input DataFrame with HTML content.
+            pool: CPU process pool.
+            func_name: Extractor function name.
+            ledger_arg: Keyword the extractor takes the ledger under.
+            df: Ledger DataFrame.
+            file_bytes: Raw PDF bytes.
+            kwargs: Extractor keyword arguments.
+            file_path: Local file holding ``file_bytes``, if any.
+            document_id: Document ID for logging.
 
         Returns:
-            DataFrame with extracted text.
+            Extracted DataFrame with document page numbers.
         """
-        from bs4 import BeautifulSoup
-        import html2text
-
-        h = html2text.HTML2Text()
-        h.ignore_links = False
-        h.ignore_images = True
-
-        for idx, row in df.iterrows():
-            try:
-                content = base64.b64decode(row["content"]).decode("utf-8")
-                soup = BeautifulSoup(content, "html.parser")
-
-                # Remove script and style elements
-                for script in soup(["script", "style"]):
-                    script.decompose()
-
-                # Convert to markdown
-                markdown = h.handle(str(soup))
-
-                text = markdown.strip()
-                df.at[idx, "metadata"] = {
-                    **row["metadata"],
-                    "content": text,
-                    "content_metadata": {
-                        **row["metadata"].get("content_metadata", {}),
-                        "text": text,
-                    },
-                }
-            except Exception as e:
-                logger.warning(f"⚠️ HTML extraction warning: {e}")
-
-        return df
+        async with pool.spool(file_bytes, file_path) as path:
+            page_count = await pool.page_count(path)
+            if page_count < self._settings.pdf_split_threshold:
+                return await pool.extract(
+                    func_name, ledger_arg, df, file_bytes, kwargs, file_path=path
+                )
 
-    def _extract_text(self, df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Extract content from plain text files.
+            size = self._settings.pdf_split_pages
+            ranges = [
+                (first, min(first + size, page_count))
+                for first in range(0, page_count, size)
+            ]
+            concurrency = self._settings.pdf_split_concurrency or pool.workers
+            logger.info(
+                f"📑 [id:{document_id}] Extracting {page_count} pages in "
+                f"{len(ranges)} ranges, {concurrency} at a time"
+            )
 
-        Text files are passed through as-is.
+            semaphore = asyncio.Semaphore(concurrency)
 
-        Args:
-            df: Input DataFrame with text content.
+            async def extract_range(page_range: tuple[int, int]) -> pd.DataFrame:
+                async with semaphore:
+                    return await pool.extract(
+                        func_name, ledger_arg, df, file_bytes, kwargs,
+                        file_path=path, page_range=page_range, page_count=page_count,
+                    )
 
-        Returns:
-            DataFrame with text content in metadata.
-        """
-        for idx, row in df.iterrows():
+            tasks = [asyncio.create_task(extract_range(r)) for r in ranges]
             try:
-                content = base64.b64decode(row["content"]).decode("utf-8")
-            except UnicodeDecodeError:
-                # Try with latin-1 as fallback
-                content = base64.b64decode(row["content"]).decode("latin-1")
-
-            # Set text in both locations:
-            # - metadata["content"]: where nv-ingest chunker reads from
-            # - content_metadata["text"]: for consistency
-            df.at[idx, "metadata"] = {
-                **row["metadata"],
-                "content": content,
-                "content_metadata": {
-                    **row["metadata"].get("content_metadata", {}),
-                    "text": content,
-                },
-            }
+                parts = await asyncio.gather(*tasks)
+            except BaseException:
+                # Don't leave ranges queued once one has failed
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
 
-        return df
+        return pd.concat(parts, ignore_index=True)
 
     def _extract_video(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -461,60 +693,42 @@ class DocumentProcessor:
         self,
         extracted_df: pd.DataFrame,
         document_id: int,
-    ) -> list[str]:
+    ) -> list[TextChunk]:
         """
-        Chunk content using NVIDIA's tokenizer-based splitter.
+        Chunk extracted rows with the resident tokenizer-based chunker.
 
-        Uses HuggingFace AutoTokenizer for token-boundary splitting.
-        NOT character-based like langchain.
+        Uses a cached HuggingFace fast tokenizer for token-boundary
+        splitting (NOT character-based like langchain) and tokenizes all
+        rows of the group in one batched call.
 
         Args:
             extracted_df: DataFrame with extracted content.
             document_id: Document ID for error context.
 
         Returns:
-            List of text chunks.
+            Chunks with offsets into their source row, in row order.
 
         Raises:
             ChunkingError: If chunking fails.
         """
-        if extracted_df.empty:
+        texts, rows = collect_row_texts(extracted_df)
+        if not texts:
             return []
 
         try:
-            from nv_ingest_api.interface.transform import (
-                transform_text_split_and_tokenize,
-            )
-
-            # Tokenization is CPU-bound; run in executor to avoid
-            # blocking the event loop for large documents.
-            kwargs: dict[str, object] = {
-                "inputs": extracted_df,
-                "tokenizer": self._settings.tokenizer,
-                "chunk_size": self._settings.chunk_size,
-                "chunk_overlap": self._settings.chunk_overlap,
-                "split_source_types": ["text", "PDF", "DOCX", "PPTX", "HTML"],
-            }
-            if self._settings.hf_access_token:
-                kwargs["hugging_face_access_token"] = self._settings.hf_access_token
-
-            loop = asyncio.get_running_loop()
-            chunked_df = await loop.run_in_executor(
-                None,
-                functools.partial(transform_text_split_and_tokenize, **kwargs),
-            )
+            # Tokenization is CPU-bound; run it in the process pool when
+            # enabled, else in the thread pool so the event loop stays free.
+            pool = get_cpu_pool()
+            if pool is not None:
+                per_row = await pool.chunk(texts, rows, self._chunker_kwargs())
+            else:
+                loop = asyncio.get_running_loop()
+                per_row = await loop.run_in_executor(
+                    None, self._chunker.split_batch, texts, rows,
+                )
+            chunks = [chunk for row_chunks in per_row for chunk in row_chunks]
 
-            # Extract text from chunked DataFrame.
-            # nv-ingest stores chunk text in metadata["content"],
-            # NOT in metadata["content_metadata"]["text"].
-            chunks: list[str] = []
-            for _, row in chunked_df.iterrows():
-                metadata = row.get("metadata", {})
-                text = metadata.get("content")
-                if text and isinstance(text, str) and text.strip():
-                    chunks.append(text.strip())
-
-            logger.info(f"✂️ [id:{document_id}] Chunked: {len(chunks)} chunks")
+            logger.debug(f"✂️ [id:{document_id}] Chunked: {len(chunks)} chunks")
 
             return chunks
 
@@ -432,6 +432,46 @@ class EmbeddingError(IngestorError):
         super().__init__(msg)
 
 
+class DocumentLeasedError(IngestorError):
+    """
+    Raised when another worker is processing the document.
+
+    Transient - the message is redelivered once the other worker's
+    claim has had time to complete or expire.
+    """
+
+    def __init__(self, document_id: int, retry_after: float) -> None:
+        """
+        Initialize DocumentLeasedError.
+
+        Args:
+            document_id: Document being processed elsewhere.
+            retry_after: Seconds until the other worker's claim expires.
+        """
+        self.document_id = document_id
+        self.retry_after = retry_after
+        super().__init__(f"Document {document_id} is being processed by another worker")
+
+
+class LeaseLostError(IngestorError):
+    """
+    Raised when a run loses its claim on the document mid-processing.
+
+    Another worker, or a newer version of the document, owns the row
+    and its points now, so the run stops without touching either.
+    """
+
+    def __init__(self, document_id: int) -> None:
+        """
+        Initialize LeaseLostError.
+
+        Args:
+            document_id: Document taken over by another run.
+        """
+        self.document_id = document_id
+        super().__init__(f"Lost the processing claim on document {document_id}")
+
+
 class MinioError(IngestorError):
     """
     Raised when MinIO operations fail.
@@ -0,0 +1,376 @@
+"""
+Content-addressed cache of extracted, chunked text.
+
+The same attachment or shared Drive file is often ingested many times:
+for several users and teams, on re-syncs and on redeliveries. The cache
+stores a document's chunks under a key built from the SHA-256 of the
+file content and every setting that changes extraction or chunking
+output, so identical content is extracted and tokenized once.
+
+``Document.signature`` is not used for the key: depending on the
+connector it is a provider etag, an OneDrive cTag or a Gmail historyId,
+none of which identifies content across documents. The key uses the same
+SHA-256 as ``MinIOHelper.compute_signature`` over the downloaded file.
+
+Entries are gzipped JSON, stored on local disk or in MinIO. Cache errors
+are logged and never fail a document. The disk tier is pruned to
+``extract_cache_max_mb``, least recently used entries first (hits bump
+the file's mtime). The MinIO tier is not pruned here: expire it with a
+bucket lifecycle rule on ``extract_cache_prefix``.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import mmap
+import os
+import tempfile
+import threading
+
+from echomind_lib.db.minio import MinIOClient
+
+from ingestor.config import IngestorSettings
+from ingestor.logic.text_chunker import TextChunk
+
+logger = logging.getLogger("echomind-ingestor.extraction_cache")
+
+# Bump when the entry format or chunk semantics change
+_FORMAT_VERSION = 1
+
+
+def _encode_entry(chunks: list[TextChunk]) -> bytes:
+    """
+    Serialize chunks to a cache entry.
+
+    Args:
+        chunks: Chunks in document order.
+
+    Returns:
+        Gzipped JSON rows of chunk fields.
+    """
+    rows = [
+        [chunk.text, chunk.char_start, chunk.char_end, chunk.token_count, chunk.source_index]
+        for chunk in chunks
+    ]
+    return gzip.compress(json.dumps(rows).encode())
+
+
+def _decode_entry(data: bytes) -> list[TextChunk]:
+    """
+    Deserialize a cache entry.
+
+    Args:
+        data: Entry bytes.
+
+    Returns:
+        Chunks in document order.
+    """
+    return [TextChunk(*row) for row in json.loads(gzip.decompress(data))]
+
+
+class ExtractionCache:
+    """
+    Stores chunked text keyed by file content and processing settings.
+
+    Usage:
+        cache = ExtractionCache(settings, minio_client)
+        key = await cache.key(file_bytes, mime_type)
+        chunks = await cache.get(key)
+        if chunks is None:
+            chunks = ...
+            await cache.put(key, chunks)
+    """
+
+    def __init__(self, settings: IngestorSettings, minio_client: MinIOClient | None = None) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            settings: Service configuration; ``extract_cache`` selects
+                the backend.
+            minio_client: MinIO client, required for the minio backend.
+
+        Raises:
+            ValueError: If the minio backend has no client.
+        """
+        self._settings = settings
+        self.backend = settings.extract_cache
+        if self.backend == "minio" and minio_client is None:
+            raise ValueError("The minio extraction cache needs a MinIO client")
+        # Only the minio backend talks to MinIO
+        self._minio = minio_client if self.backend == "minio" else None
+        # Bytes in the disk tier; counted on the first write
+        self._disk_bytes: int | None = None
+        self._disk_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: IngestorSettings,
+        minio_client: MinIOClient | None = None,
+    ) -> "ExtractionCache | None":
+        """
+        Build the configured cache.
+
+        Args:
+            settings: Service configuration.
+            minio_client: MinIO client for the minio backend.
+
+        Returns:
+            The cache, or None when caching is disabled.
+        """
+        if settings.extract_cache == "none":
+            return None
+        if settings.extract_cache == "minio" and minio_client is None:
+            return None
+        return cls(settings, minio_client)
+
+    async def key(self, file_bytes: bytes | mmap.mmap, mime_type: str) -> str:
+        """
+        Build the cache key for a file.
+
+        Args:
+            file_bytes: Raw file content.
+            mime_type: MIME type, which selects the extractor.
+
+        Returns:
+            Hex key.
+        """
+        loop = asyncio.get_running_loop()
+        # hashlib releases the GIL on large buffers
+        content_hash = await loop.run_in_executor(
+            None, lambda: hashlib.sha256(file_bytes).hexdigest()
+        )
+
+        settings = self._settings
+        material = json.dumps(
+            [
+                _FORMAT_VERSION,
+                content_hash,
+                mime_type,
+                settings.extract_method,
+                settings.text_depth,
+                settings.yolox_enabled,
+                settings.riva_enabled,
+                settings.tokenizer,
+                settings.chunk_size,
+                settings.chunk_overlap,
+            ]
+        )
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    async def get(self, key: str) -> list[TextChunk] | None:
+        """
+        Load cached chunks.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Chunks in document order, or None on a miss.
+        """
+        data: bytes | None
+        try:
+            if self._minio is not None:
+                data = await self._minio.download_file(
+                    bucket_name=self._settings.minio_bucket,
+                    object_name=self._object_name(key),
+                )
+            else:
+                loop = asyncio.get_running_loop()
+                data = await loop.run_in_executor(None, self._read_file, key)
+        except Exception as e:
+            logger.debug(f"Extraction cache miss for {key}: {e}")
+            return None
+
+        if data is None:
+            return None
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, _decode_entry, data)
+        except Exception as e:
+            logger.warning(f"⚠️ Discarding unreadable extraction cache entry {key}: {e}")
+            return None
+
+    async def put(self, key: str, chunks: list[TextChunk]) -> None:
+        """
+        Store chunks.
+
+        Args:
+            key: Cache key.
+            chunks: Chunks in document order.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            data = await loop.run_in_executor(None, _encode_entry, chunks)
+            if self._minio is not None:
+                await self._minio.upload_file(
+                    bucket_name=self._settings.minio_bucket,
+                    object_name=self._object_name(key),
+                    data=data,
+                    content_type="application/gzip",
+                )
+            else:
+                await loop.run_in_executor(None, self._write_file, key, data)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not store extraction cache entry {key}: {e}")
+
+    def _object_name(self, key: str) -> str:
+        """
+        MinIO object name of an entry.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Object name under ``extract_cache_prefix``.
+        """
+        return f"{self._settings.extract_cache_prefix}{key[:2]}/{key}.json.gz"
+
+    def _file_path(self, key: str) -> str:
+        """
+        Local path of an entry.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Path under ``extract_cache_dir``.
+        """
+        return os.path.join(self._settings.extract_cache_dir, key[:2], f"{key}.json.gz")
+
+    def _read_file(self, key: str) -> bytes | None:
+        """
+        Read an entry from disk.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Entry bytes, or None if missing.
+        """
+        path = self._file_path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        # The mtime orders entries for pruning
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def _write_file(self, key: str, data: bytes) -> None:
+        """
+        Write an entry to disk atomically.
+
+        Args:
+            key: Cache key.
+            data: Entry bytes.
+        """
+        path = self._file_path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        # Readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self._account(len(data))
+
+    def _account(self, size: int) -> None:
+        """
+        Count a written entry and prune the disk tier if it is over the cap.
+
+        Pruning goes down to three quarters of the cap, so it runs once
+        per many writes rather than on each one.
+
+        Args:
+            size: Bytes just written.
+        """
+        limit = self._settings.extract_cache_max_mb << 20
+        if not limit:
+            return
+
+        with self._disk_lock:
+            if self._disk_bytes is None:
+                # Includes the entry just written
+                self._disk_bytes = sum(entry[2] for entry in self._scan_files())
+            else:
+                self._disk_bytes += size
+            if self._disk_bytes > limit:
+                self._disk_bytes = self._prune(limit * 3 // 4)
+
+    def _scan_files(self) -> list[tuple[float, str, int]]:
+        """
+        List the entries of the disk tier.
+
+        Returns:
+            (mtime, path, size) per entry; files being written are skipped.
+        """
+        entries: list[tuple[float, str, int]] = []
+        root = self._settings.extract_cache_dir
+        try:
+            shards = [shard.path for shard in os.scandir(root) if shard.is_dir()]
+        except FileNotFoundError:
+            return entries
+
+        for shard in shards:
+            try:
+                with os.scandir(shard) as files:
+                    for entry in files:
+                        if not entry.name.endswith(".json.gz"):
+                            continue
+                        try:
+                            stat = entry.stat()
+                        except FileNotFoundError:
+                            continue
+                        entries.append((stat.st_mtime, entry.path, stat.st_size))
+            except FileNotFoundError:
+                continue
+        return entries
+
+    def _prune(self, target: int) -> int:
+        """
+        Delete the least recently used entries until the disk tier fits.
+
+        Args:
+            target: Bytes to shrink the disk tier to.
+
+        Returns:
+            Bytes left in the disk tier.
+        """
+        entries = sorted(self._scan_files())
+        total = sum(size for _, _, size in entries)
+        removed = 0
+        freed = 0
+        for _, path, size in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            freed += size
+            removed += 1
+
+        if removed:
+            logger.info(f"🧹 Pruned {removed} extraction cache entries ({freed >> 20} MB)")
+        return total
+
@@ -5,32 +5,53 @@ Orchestrates document ingestion without protocol concerns.
 Coordinates extraction, chunking, embedding, and storage.
 """
 
+import asyncio
+import contextlib
 import hashlib
 import logging
+import mmap
+import os
+import tempfile
 import uuid
-from datetime import datetime, timezone
+from collections.abc import AsyncIterable, AsyncIterator, Callable
 from typing import Any
 
-from sqlalchemy import select, update
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from echomind_lib.db.minio import MinIOClient
 from echomind_lib.db.models import Document
 from echomind_lib.db.qdrant import QdrantDB
+from echomind_lib.helpers.vector_codec import encoding_from_name
 
 from ingestor.config import IngestorSettings
-from ingestor.grpc.embedder_client import EmbedderClient
+from ingestor.grpc.embedder_client import EmbedderClient, Vectors
+from ingestor.logic.admission import get_memory_budget
+from ingestor.logic.coalescer import get_batch_coalescer
+from ingestor.logic.document_lease import DocumentLease
 from ingestor.logic.document_processor import DocumentProcessor
 from ingestor.logic.exceptions import (
     DatabaseError,
     DocumentNotFoundError,
     EmbeddingError,
     FileNotFoundInStorageError,
+    LeaseLostError,
     MinioError,
     NoExtractableContentError,
     OwnershipMismatchError,
 )
+from ingestor.logic.extraction_cache import ExtractionCache
+from ingestor.logic.metrics import (
+    chunks_stored,
+    download_duration,
+    downloaded_bytes,
+    embed_duration,
+    upsert_duration,
+)
+from ingestor.logic.mime_router import MimeRouter
+from ingestor.logic.pipeline import Chunk, EmbedPipeline
+from ingestor.logic.text_chunker import TextChunk
 
 logger = logging.getLogger("echomind-ingestor.service")
 
@@ -59,6 +80,7 @@ class IngestorService:
         minio_client: MinIOClient,
         qdrant_client: QdrantDB,
         settings: IngestorSettings,
+        session_factory: Callable[[], contextlib.AbstractAsyncContextManager[AsyncSession]] | None = None,
     ) -> None:
         """
         Initialize Ingestor service.
@@ -68,16 +90,28 @@ class IngestorService:
             minio_client: MinIO client for file storage.
             qdrant_client: Qdrant client for vector storage.
             settings: Service configuration.
+            session_factory: Opens short sessions for renewing the
+                document lease while ``db_session`` is in use. Without
+                it the lease is not renewed.
         """
         self._db = db_session
+        self._session_factory = session_factory
         self._minio = minio_client
         self._qdrant = qdrant_client
         self._settings = settings
-        self._processor = DocumentProcessor(settings)
+        self._processor = DocumentProcessor(
+            settings,
+            cache=ExtractionCache.from_settings(settings, minio_client),
+        )
+        self._router = MimeRouter()
         self._embedder = EmbedderClient(
             host=settings.embedder_host,
             port=settings.embedder_port,
             timeout=settings.embedder_timeout,
+            stream_enabled=settings.embedder_stream_enabled,
+            max_in_flight=settings.embedder_max_in_flight,
+            vector_encoding=encoding_from_name(settings.embedder_vector_encoding),
+            model=settings.embedder_model,
         )
 
     async def process_document(
@@ -95,6 +129,11 @@ class IngestorService:
         Process a document for ingestion.
 
         Full pipeline: download → extract → chunk → embed → store → update status.
+        Chunking, embedding and upserts run as concurrent stages.
+
+        Redeliveries are idempotent: a document already completed in
+        ``chunking_session`` is skipped, and one claimed by a live worker
+        is deferred (see ``DocumentLease``).
 
         Args:
             document_id: Document ID in database.
@@ -111,9 +150,12 @@ class IngestorService:
             - document_id: Processed document ID
             - chunk_count: Number of chunks created
             - collection_name: Qdrant collection used
+            - skipped: True if the session had already completed, or
+              another run took the document over
 
         Raises:
             DocumentNotFoundError: If document not in database.
+            DocumentLeasedError: If another worker is processing it.
             FileNotFoundInStorageError: If file not in MinIO.
             ExtractionError: If content extraction fails.
             ChunkingError: If chunking fails.
@@ -130,71 +172,78 @@ class IngestorService:
         # Prevents cross-user data poisoning from forged messages
         self._verify_ownership(document, connector_id, user_id)
 
-        # Update status to processing
-        await self._update_status(document_id, "processing")
+        # Build collection name based on scope
+        collection_name = self._build_collection_name(
+            user_id=user_id,
+            scope=scope,
+            scope_id=scope_id,
+            team_id=team_id,
+        )
 
-        try:
-            # Download file from MinIO
-            logger.debug(f"[id:{document_id}] Downloading from MinIO: {minio_path}")
-            file_bytes = await self._download_file(minio_path)
+        # Redelivered after the work was already done
+        lease = DocumentLease(document, chunking_session, ttl=self._settings.lease_ttl)
+        if lease.already_completed(document):
+            logger.info(f"⏭️ [id:{document_id}] Already completed in session {chunking_session}, skipping")
+            return {
+                "document_id": document_id,
+                "chunk_count": document.chunk_count,
+                "collection_name": collection_name,
+                "skipped": True,
+            }
+
+        # Claim the document; committed so other workers see it
+        await lease.acquire(self._db)
 
+        try:
             # Get file metadata
             file_name = minio_path.split("/")[-1]
             mime_type = document.content_type or "application/octet-stream"
 
-            # Extract and chunk content
-            logger.info(f"📥 [id:{document_id}] Received {file_name} ({mime_type})")
-            chunks, structured_images = await self._processor.process(
-                file_bytes=file_bytes,
-                document_id=document_id,
-                file_name=file_name,
-                mime_type=mime_type,
-            )
-
-            if not chunks and not structured_images:
+            # Spool the file from MinIO to disk instead of memory
+            logger.debug(f"[id:{document_id}] Downloading from MinIO: {minio_path}")
+            async with self._hold_claim(lease), self._open_file(minio_path) as (file_bytes, file_path):
+                # Extract, chunk, embed and store as a streaming pipeline:
+                # chunks are embedded as soon as chunking yields them and
+                # upserted while later batches are still embedding.
+                logger.info(f"📥 [id:{document_id}] Received {file_name} ({mime_type}, {len(file_bytes)} bytes)")
+                structured_images: list[bytes] = []
+
+                async def chunk_groups() -> AsyncIterator[list[TextChunk]]:
+                    async for chunks, images in self._processor.process_stream(
+                        file_bytes=file_bytes,
+                        document_id=document_id,
+                        file_name=file_name,
+                        mime_type=mime_type,
+                        file_path=file_path,
+                    ):
+                        structured_images.extend(images)
+                        yield chunks
+
+                async with self._admit(document_id, mime_type, len(file_bytes)):
+                    total_stored = await self._run_pipeline(
+                        groups=chunk_groups(),
+                        document_id=document_id,
+                        collection_name=collection_name,
+                        chunking_session=chunking_session,
+                        content_type="text",
+                        lease=lease,
+                    )
+
+            if not total_stored and not structured_images:
                 logger.error(f"❌ [id:{document_id}] No extractable content from {mime_type}")
                 raise NoExtractableContentError(
                     document_id=document_id,
                     mime_type=mime_type,
                 )
 
-            # Build collection name based on scope
-            collection_name = self._build_collection_name(
-                user_id=user_id,
-                scope=scope,
-                scope_id=scope_id,
-                team_id=team_id,
-            )
-
-            # Ensure collection exists
-            dimension = await self._embedder.get_dimension()
-            await self._ensure_collection(collection_name, dimension)
-
-            # Embed and store text chunks
-            total_stored = 0
-            if chunks:
-                logger.info(f"🧠 [id:{document_id}] Embedding {len(chunks)} chunks")
-                stored = await self._embed_and_store(
-                    texts=chunks,
-                    document_id=document_id,
-                    collection_name=collection_name,
-                    chunking_session=chunking_session,
-                    content_type="text",
-                )
-                total_stored += stored
-
             # Handle structured images (tables/charts)
             if structured_images and self._settings.yolox_enabled:
                 logger.info(f"🖼️ [id:{document_id}] {len(structured_images)} structured images (multimodal embedding not implemented)")
                 # TODO: Implement multimodal embedding when embedder supports it
 
-            # Update document status
-            await self._update_status(
-                document_id,
-                "completed",
-                chunk_count=total_stored,
-                chunking_session=chunking_session,
-            )
+            # Update document status, unless a newer version arrived meanwhile
+            if not await lease.complete(self._db, total_stored):
+                logger.warning(f"⚠️ [id:{document_id}] Superseded while processing, leaving status to the newer run")
 
             logger.info(f"✅ [id:{document_id}] Done: {total_stored} chunks in {collection_name}")
 
@@ -202,17 +251,136 @@ class IngestorService:
                 "document_id": document_id,
                 "chunk_count": total_stored,
                 "collection_name": collection_name,
+                "skipped": False,
+            }
+
+        except LeaseLostError:
+            # Another run owns the document and its points now
+            logger.warning(f"⚠️ [id:{document_id}] Lost processing claim to another run, stopping")
+            await self._db.rollback()
+            return {
+                "document_id": document_id,
+                "chunk_count": 0,
+                "collection_name": collection_name,
+                "skipped": True,
             }
 
         except Exception as e:
             logger.exception(f"❌ [id:{document_id}] Processing failed")
-            await self._update_status(
-                document_id,
-                "error",
-                error_message=str(e)[:500],
-            )
+            # Only while the claim is ours: a worker that took over, or a
+            # newer version, owns the row otherwise
+            if not await lease.fail(self._db, str(e)[:500]):
+                logger.warning(f"⚠️ [id:{document_id}] Claim lost before the failure was recorded, leaving status as is")
+            # Release the claim; the caller's session is rolled back on raise
+            await self._db.commit()
             raise
 
+    @contextlib.asynccontextmanager
+    async def _admit(self, document_id: int, mime_type: str, file_size: int) -> AsyncIterator[None]:
+        """
+        Wait until the pod's memory budget has room for a document.
+
+        Args:
+            document_id: Document being admitted, for logging.
+            mime_type: MIME type, which selects the memory factor.
+            file_size: Downloaded file size in bytes.
+        """
+        budget = get_memory_budget()
+        if budget is None:
+            yield
+            return
+
+        cost = self._router.estimate_memory(mime_type, file_size)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        async with budget.admit(cost):
+            waited = loop.time() - started
+            if waited >= 1.0:
+                logger.info(f"🧮 [id:{document_id}] Admitted after {waited:.1f}s (~{cost >> 20} MB)")
+            yield
+
+    @contextlib.asynccontextmanager
+    async def _hold_claim(self, lease: DocumentLease) -> AsyncIterator[None]:
+        """
+        Keep the document claim fresh while the block runs.
+
+        The claim is renewed in the background; if another run takes the
+        document over, the block is cancelled so it never writes points
+        the new run owns.
+
+        Args:
+            lease: Claim held by this run.
+
+        Raises:
+            LeaseLostError: If the claim was lost while the block ran.
+        """
+        owner = asyncio.current_task()
+        if self._session_factory is None or owner is None:
+            yield
+            return
+
+        cancelling = owner.cancelling()
+        renewal = asyncio.create_task(self._renew_lease(lease, self._session_factory, owner))
+        try:
+            yield
+        except asyncio.CancelledError:
+            # Cancelled by _renew_lease, not by whoever awaits this run
+            if renewal.done() and not renewal.cancelled() and owner.uncancel() <= cancelling:
+                raise LeaseLostError(lease.document_id) from None
+            raise
+        finally:
+            renewal.cancel()
+            await asyncio.gather(renewal, return_exceptions=True)
+
+    async def _renew_lease(
+        self,
+        lease: DocumentLease,
+        session_factory: Callable[[], contextlib.AbstractAsyncContextManager[AsyncSession]],
+        owner: asyncio.Task[Any],
+    ) -> None:
+        """
+        Keep the document claim fresh until cancelled.
+
+        Args:
+            lease: Claim held by this run.
+            session_factory: Opens the short sessions used for renewal.
+            owner: Task processing the document, cancelled if the claim is lost.
+        """
+        while True:
+            await asyncio.sleep(self._settings.in_progress_interval)
+            try:
+                async with session_factory() as session:
+                    held = await lease.renew(session)
+            except Exception as e:
+                logger.debug(f"Lease renewal failed for document {lease.document_id}: {e}")
+                continue
+            if not held:
+                owner.cancel()
+                return
+
+    async def _confirm_claim(self, lease: DocumentLease | None) -> None:
+        """
+        Renew the claim right before touching points other runs may share.
+
+        A successful renewal keeps other workers out for another
+        ``lease_ttl``, which covers the session swap that follows.
+
+        Args:
+            lease: Claim held by this run, or None to skip the check.
+
+        Raises:
+            LeaseLostError: If another run took the document over.
+        """
+        if lease is None:
+            return
+        if self._session_factory is not None:
+            async with self._session_factory() as session:
+                held = await lease.renew(session)
+        else:
+            held = await lease.renew(self._db)
+        if not held:
+            raise LeaseLostError(lease.document_id)
+
     async def _get_document(self, document_id: int) -> Document | None:
         """
         Load document from database with connector relationship.
@@ -292,74 +460,79 @@ class IngestorService:
 
         logger.debug(f"✅ Ownership verified for document {document.id} (connector={actual_connector_id}, user={actual_user_id})")
 
-    async def _update_status(
-        self,
-        document_id: int,
-        status: str,
-        chunk_count: int | None = None,
-        error_message: str | None = None,
-        chunking_session: str | None = None,
-    ) -> None:
+    @contextlib.asynccontextmanager
+    async def _open_file(self, file_path: str) -> AsyncIterator[tuple[bytes | mmap.mmap, str]]:
         """
-        Update document status in database.
+        Download a file from MinIO to local disk and map it read-only.
+
+        The object is streamed to a temporary file rather than held in
+        memory, and extractors read the memory map (or the path), so
+        large documents cost page cache instead of process memory.
 
         Args:
-            document_id: Document ID to update.
-            status: New status (pending, processing, completed, error).
-            chunk_count: Optional chunk count for completed status.
-            error_message: Optional error message for error status.
-            chunking_session: Optional chunking session UUID.
+            file_path: Path to file in MinIO bucket.
+
+        Yields:
+            Tuple of (file content, local path). Content is a read-only
+            memory map, or empty bytes for an empty file.
 
         Raises:
-            DatabaseError: If update fails.
+            FileNotFoundInStorageError: If file doesn't exist.
+            MinioError: If download fails.
         """
+        fd, local_path = tempfile.mkstemp(
+            prefix="ingest-",
+            dir=self._settings.download_dir or None,
+        )
+        os.close(fd)
         try:
-            values: dict[str, Any] = {
-                "status": status,
-                "last_update": datetime.now(timezone.utc),
-            }
-
-            if chunk_count is not None:
-                values["chunk_count"] = chunk_count
-
-            if error_message:
-                values["status_message"] = error_message
-
-            if chunking_session:
-                values["chunking_session"] = chunking_session
-
-            await self._db.execute(
-                update(Document)
-                .where(Document.id == document_id)
-                .values(**values)
-            )
-            await self._db.flush()
-
-        except Exception as e:
-            raise DatabaseError("update", str(e)) from e
-
-    async def _download_file(self, file_path: str) -> bytes:
+            with download_duration.time():
+                size = await self._download_file(file_path, local_path)
+            downloaded_bytes.inc(size)
+            if not size:
+                yield b"", local_path
+                return
+
+            with open(local_path, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield data, local_path
+            finally:
+                try:
+                    data.close()
+                except BufferError:
+                    # An abandoned executor thread still reads it; GC closes it
+                    pass
+        finally:
+            try:
+                os.unlink(local_path)
+            except OSError:
+                pass
+
+    async def _download_file(self, file_path: str, local_path: str) -> int:
         """
-        Download file from MinIO.
+        Download file from MinIO into a local file.
 
         Args:
             file_path: Path to file in MinIO bucket.
+            local_path: Destination file.
 
         Returns:
-            File contents as bytes.
+            File size in bytes.
 
         Raises:
             FileNotFoundInStorageError: If file doesn't exist.
             MinioError: If download fails.
         """
         try:
-            data = await self._minio.download_file(
+            size = await self._minio.download_to_file(
                 bucket_name=self._settings.minio_bucket,
                 object_name=file_path,
+                file_path=local_path,
             )
-            if data is None:
+            if size is None:
                 raise FileNotFoundInStorageError(file_path, self._settings.minio_bucket)
-            return data
+            return size
         except FileNotFoundInStorageError:
             raise
         except Exception as e:
@@ -437,94 +610,277 @@ class IngestorService:
             # Collection may already exist
             logger.debug(f"Collection {collection_name} already exists or creation failed: {e}")
 
-    async def _embed_and_store(
+    async def _run_pipeline(
         self,
-        texts: list[str],
+        groups: AsyncIterable[list[TextChunk]],
         document_id: int,
         collection_name: str,
         chunking_session: str,
         content_type: str = "text",
+        lease: DocumentLease | None = None,
     ) -> int:
         """
-        Embed texts and store in Qdrant.
+        Incrementally embed and store chunk groups through the pipeline.
+
+        Point IDs are derived from chunk content, so chunks that already
+        exist for the document keep their vectors: only new chunks are
+        embedded and existing ones are moved to the new session. Points
+        of any other session are deleted only after that, so searches
+        see the old version until the new one is complete. The
+        collection is created lazily before the first upsert, so
+        documents without content never touch Qdrant.
 
         Args:
-            texts: List of text chunks.
+            groups: Async iterable of chunk lists, in document order.
+                Chunk offsets and token counts are stored in the payload.
             document_id: Document ID for metadata.
             collection_name: Target collection.
             chunking_session: Processing session UUID.
             content_type: Content type (text, image).
+            lease: Claim of the run, confirmed before points shared with
+                other sessions are relabelled or deleted.
 
         Returns:
-            Number of vectors stored.
+            Number of chunks now stored for the document.
 
         Raises:
             EmbeddingError: If embedding fails.
+            LeaseLostError: If another run took the document over.
+        """
+        collection_ready = False
+        # Point IDs follow the model actually served, not the requested name
+        model_id = await self._embedder.get_model_id()
+        existing_ids = await self._existing_point_ids(collection_name, document_id)
+        current_ids: set[str] = set()
+        reused: dict[str | int, dict[str, Any]] = {}
+
+        async def new_chunks() -> AsyncIterator[list[Chunk]]:
+            index = 0
+            occurrences: dict[bytes, int] = {}
+            async for text_chunks in groups:
+                fresh: list[Chunk] = []
+                for text_chunk in text_chunks:
+                    text = text_chunk.text
+                    # Identical chunks in one document get distinct IDs
+                    digest = hashlib.sha256(text.encode()).digest()
+                    occurrence = occurrences.get(digest, 0)
+                    occurrences[digest] = occurrence + 1
+
+                    point_id = self._generate_point_id(document_id, text, model_id, occurrence)
+                    current_ids.add(point_id)
+                    # Offsets can move even when the text is unchanged
+                    position = {
+                        "char_start": text_chunk.char_start,
+                        "char_end": text_chunk.char_end,
+                        "token_count": text_chunk.token_count,
+                        "source_index": text_chunk.source_index,
+                    }
+                    if point_id in existing_ids:
+                        reused[point_id] = {
+                            "chunk_index": index,
+                            "chunking_session": chunking_session,
+                            **position,
+                        }
+                    else:
+                        fresh.append(Chunk(index=index, text=text, point_id=point_id, payload=position))
+                    index += 1
+                yield fresh
+
+        coalescer = get_batch_coalescer()
+
+        async def embed(texts: list[str]) -> Vectors:
+            with embed_duration.time():
+                if coalescer is not None:
+                    # Share the embed call with other documents in flight
+                    vectors = await coalescer.embed(texts)
+                else:
+                    vectors = await self._embedder.embed_batch(
+                        texts=texts,
+                        batch_size=32,
+                        document_id=document_id,
+                    )
+            if len(vectors) != len(texts):
+                raise EmbeddingError(
+                    reason=f"Vector count mismatch: expected {len(texts)}, got {len(vectors)}",
+                    document_id=document_id,
+                )
+            return vectors
+
+        async def store(chunks: list[Chunk], vectors: Vectors) -> None:
+            nonlocal collection_ready
+            if not collection_ready:
+                dimension = await self._embedder.get_dimension()
+                await self._ensure_collection(collection_name, dimension)
+                collection_ready = True
+
+            with upsert_duration.time():
+                await self._store_vectors(
+                    chunks=chunks,
+                    vectors=vectors,
+                    document_id=document_id,
+                    collection_name=collection_name,
+                    chunking_session=chunking_session,
+                    content_type=content_type,
+                )
+            chunks_stored.labels(result="embedded").inc(len(chunks))
+
+        pipeline = EmbedPipeline(
+            embed=embed,
+            store=store,
+            embed_batch_size=self._settings.pipeline_embed_batch_size,
+            upsert_batch_size=self._settings.pipeline_upsert_batch_size,
+            queue_size=self._settings.pipeline_queue_size,
+        )
+        embedded = await pipeline.run(new_chunks())
+
+        # Unchanged chunks keep their vectors; only positions move. Points
+        # are shared with any run that took over, so only while ours
+        if reused:
+            await self._confirm_claim(lease)
+            await self._qdrant.set_payloads(collection_name=collection_name, payloads=reused)
+            chunks_stored.labels(result="reused").inc(len(reused))
+
+        # Every live point now carries the new session; drop the rest
+        stale = [point_id for point_id in existing_ids if point_id not in current_ids]
+        if existing_ids or embedded:
+            await self._confirm_claim(lease)
+            await self._delete_other_sessions(collection_name, document_id, chunking_session)
+
+        if embedded or reused or stale:
+            logger.info(
+                f"💾 [id:{document_id}] {collection_name}: embedded {embedded}, "
+                f"reused {len(reused)}, deleted {len(stale)} stale"
+            )
+
+        return embedded + len(reused)
+
+    async def _delete_other_sessions(
+        self,
+        collection_name: str,
+        document_id: int,
+        chunking_session: str,
+    ) -> None:
         """
-        if not texts:
-            return 0
+        Delete a document's points from every session but the given one.
 
-        # Get embeddings in batches
-        vectors = await self._embedder.embed_batch(
-            texts=texts,
-            batch_size=32,
-            document_id=document_id,
+        Args:
+            collection_name: Target collection.
+            document_id: Document ID.
+            chunking_session: Session whose points are kept.
+        """
+        await self._qdrant.delete_by_filter(
+            collection_name=collection_name,
+            filter_={
+                "must": [
+                    {"key": "document_id", "match": {"value": document_id}}
+                ],
+                "must_not": [
+                    {"key": "chunking_session", "match": {"value": chunking_session}}
+                ],
+            },
         )
 
-        if len(vectors) != len(texts):
-            raise EmbeddingError(
-                reason=f"Vector count mismatch: expected {len(texts)}, got {len(vectors)}",
-                document_id=document_id,
-            )
+    async def _existing_point_ids(self, collection_name: str, document_id: int) -> set[str]:
+        """
+        Load the IDs of points already stored for a document.
 
-        # Build point IDs and payloads
-        ids: list[str] = []
-        payloads: list[dict[str, Any]] = []
+        Args:
+            collection_name: Collection to scan.
+            document_id: Document ID.
 
-        for idx, text in enumerate(texts):
-            # Deterministic ID based on document + chunk index
-            point_id = self._generate_point_id(document_id, idx, chunking_session)
-            ids.append(point_id)
+        Returns:
+            Point IDs as strings; empty if the collection does not exist.
+        """
+        try:
+            ids = await self._qdrant.scroll_ids(
+                collection_name=collection_name,
+                filter_={
+                    "must": [
+                        {"key": "document_id", "match": {"value": document_id}}
+                    ]
+                },
+            )
+        except Exception as e:
+            logger.debug(f"No existing points for document {document_id} in {collection_name}: {e}")
+            return set()
+        return {str(point_id) for point_id in ids}
+
+    async def _store_vectors(
+        self,
+        chunks: list[Chunk],
+        vectors: Vectors,
+        document_id: int,
+        collection_name: str,
+        chunking_session: str,
+        content_type: str = "text",
+    ) -> None:
+        """
+        Upsert one batch of embedded chunks to Qdrant.
 
-            payloads.append({
+        Args:
+            chunks: Chunks of the batch.
+            vectors: One vector per chunk.
+            document_id: Document ID for metadata.
+            collection_name: Target collection.
+            chunking_session: Processing session UUID.
+            content_type: Content type (text, image).
+        """
+        payloads: list[dict[str, Any]] = [
+            {
                 "document_id": document_id,
-                "chunk_index": idx,
+                "chunk_index": chunk.index,
                 "chunking_session": chunking_session,
                 "content_type": content_type,
-                "text": text[:1000],  # Store truncated text for preview
-            })
+                "text": chunk.text[:1000],  # Store truncated text for preview
+                **chunk.payload,
+            }
+            for chunk in chunks
+        ]
 
-        # Upsert to Qdrant
-        await self._qdrant.upsert(
-            collection_name=collection_name,
-            vectors=vectors,
-            payloads=payloads,
-            ids=ids,
-        )
+        ids: list[str | int] = [chunk.point_id for chunk in chunks]
 
-        logger.info(f"💾 [id:{document_id}] Stored {len(vectors)} vectors in {collection_name}")
+        # Upsert to Qdrant, in a write shared with other documents when
+        # coalescing is on; either way this returns once the points are stored
+        coalescer = get_batch_coalescer()
+        if coalescer is not None:
+            await coalescer.upsert(self._qdrant, collection_name, vectors, payloads, ids)
+        else:
+            await self._qdrant.upsert(
+                collection_name=collection_name,
+                vectors=vectors,
+                payloads=payloads,
+                ids=ids,
+            )
 
-        return len(vectors)
+        logger.debug(f"[id:{document_id}] Upserted {len(chunks)} vectors from chunk {chunks[0].index}")
 
     def _generate_point_id(
         self,
         document_id: int,
-        chunk_index: int,
-        session: str,
+        text: str,
+        model_id: str,
+        occurrence: int = 0,
     ) -> str:
         """
-        Generate deterministic point ID for upsert.
+        Generate a content-addressed point ID.
+
+        The same chunk text in the same document maps to the same point
+        across re-ingestions, so unchanged chunks are not re-embedded.
+        The embedding model is part of the key so a model change
+        re-embeds everything.
 
         Args:
             document_id: Document ID.
-            chunk_index: Chunk index.
-            session: Chunking session UUID.
+            text: Chunk text.
+            model_id: Model the embedder serves (``get_model_id``).
+            occurrence: How many identical chunks precede this one in
+                the document.
 
         Returns:
             UUID string for point ID.
         """
-        # Create deterministic UUID from document + index
-        content = f"{document_id}:{chunk_index}:{session}"
+        text_hash = hashlib.sha256(text.encode()).hexdigest()
+        content = f"{document_id}:{model_id}:{text_hash}:{occurrence}"
         hash_bytes = hashlib.sha256(content.encode()).digest()[:16]
         return str(uuid.UUID(bytes=hash_bytes))
 
@@ -0,0 +1,73 @@
+"""
+Prometheus metrics for the Ingestor Service.
+
+Metric instruments are module-level singletons registered in the default
+registry and exposed on the health server's /metrics endpoint. Stage
+histograms show where a document's time goes, so scaling decisions
+(embedders, ingestor pods or Qdrant) can follow the slowest stage.
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# Whole-file stages range from milliseconds (mail) to minutes (large PDFs)
+FILE_STAGE_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+# Per-batch and database calls are short
+CALL_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+document_duration = Histogram(
+    "ingestor_document_duration_seconds",
+    "End-to-end processing time of a document message",
+    ["status"],
+    buckets=FILE_STAGE_BUCKETS,
+)
+download_duration = Histogram(
+    "ingestor_download_duration_seconds",
+    "Time spent streaming a document from MinIO to local disk",
+    buckets=FILE_STAGE_BUCKETS,
+)
+extract_duration = Histogram(
+    "ingestor_extract_duration_seconds",
+    "Time spent extracting content from a document",
+    ["extractor"],
+    buckets=FILE_STAGE_BUCKETS,
+)
+chunk_duration = Histogram(
+    "ingestor_chunk_duration_seconds",
+    "Time spent tokenizing and chunking one group of extracted rows",
+    ["extractor"],
+    buckets=CALL_BUCKETS,
+)
+embed_duration = Histogram(
+    "ingestor_embed_duration_seconds",
+    "Time spent embedding one batch of chunks",
+    buckets=CALL_BUCKETS,
+)
+upsert_duration = Histogram(
+    "ingestor_upsert_duration_seconds",
+    "Time spent upserting one batch of vectors into Qdrant",
+    buckets=CALL_BUCKETS,
+)
+db_update_duration = Histogram(
+    "ingestor_db_update_duration_seconds",
+    "Time spent updating a document row",
+    ["operation"],
+    buckets=CALL_BUCKETS,
+)
+downloaded_bytes = Counter(
+    "ingestor_downloaded_bytes",
+    "Bytes of documents downloaded from MinIO",
+)
+chunks_stored = Counter(
+    "ingestor_chunks",
+    "Chunks stored per result (embedded: new vector, reused: unchanged point)",
+    ["result"],
+)
+documents_in_flight = Gauge(
+    "ingestor_documents_in_flight",
+    "Documents currently being processed by this pod",
+)
+admitted_memory = Gauge(
+    "ingestor_admitted_memory_bytes",
+    "Estimated memory of documents admitted by the memory budget",
+)
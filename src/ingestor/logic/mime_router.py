@@ -63,6 +63,23 @@ class MimeRouter:
         "text/x-shellscript": ("sh", "text"),
     }
 
+    # Peak memory per byte of file, by extractor type. Extraction holds a
+    # base64 copy, decoded pages or images and result DataFrames at once;
+    # Office files and images expand most when decompressed.
+    MEMORY_FACTORS: dict[str, float] = {
+        "pdf": 8.0,
+        "docx": 10.0,
+        "pptx": 10.0,
+        "html": 4.0,
+        "image": 12.0,
+        "audio": 2.0,
+        "video": 2.0,
+        "text": 4.0,
+    }
+
+    # Fixed per-document memory (tokenizer batches, vectors, queues)
+    MEMORY_OVERHEAD = 32 * 1024 * 1024
+
     def is_supported(self, mime_type: str) -> bool:
         """
         Check if MIME type is supported.
@@ -138,3 +155,17 @@ class MimeRouter:
             if doc_type == ext:
                 return extractor_type
         return None
+
+    def estimate_memory(self, mime_type: str, file_size: int) -> int:
+        """
+        Estimate peak memory of processing a file.
+
+        Args:
+            mime_type: MIME type.
+            file_size: File size in bytes.
+
+        Returns:
+            Estimated bytes; unsupported types use the text factor.
+        """
+        extractor = self.MIME_MAP.get(mime_type.lower(), ("", "text"))[1]
+        return int(file_size * self.MEMORY_FACTORS[extractor]) + self.MEMORY_OVERHEAD
@@ -0,0 +1,212 @@
+"""
+Streaming embed → upsert pipeline for the Ingestor service.
+
+Chunk groups flow through three concurrent stages connected by bounded
+queues:
+
+    feed:   re-batch incoming chunk groups into embedding batches
+    embed:  embed one batch at a time
+    upsert: accumulate vectors and write them to Qdrant in batches
+
+Chunks are embedded as soon as chunking yields them, and Qdrant writes
+overlap with the embedding of later batches. The bounded queues keep at
+most a few batches of text and vectors in memory regardless of document
+size, and stall chunking when the embedder falls behind.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterable, Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from ingestor.grpc.embedder_client import Vectors, join_vectors
+
+logger = logging.getLogger("echomind-ingestor.pipeline")
+
+
+@dataclass(slots=True)
+class Chunk:
+    """A text chunk with its document-wide position and Qdrant point ID."""
+
+    index: int
+    text: str
+    point_id: str
+    payload: dict[str, Any] = field(default_factory=dict)
+
+
+# Embeds a batch of texts
+EmbedFn = Callable[[list[str]], Awaitable[Vectors]]
+# Stores chunks with their vectors
+StoreFn = Callable[[list[Chunk], Vectors], Awaitable[None]]
+
+_DONE = None
+
+
+class EmbedPipeline:
+    """
+    Bounded-queue pipeline from chunk groups to stored vectors.
+
+    Usage:
+        pipeline = EmbedPipeline(embed=embed_fn, store=store_fn)
+        stored = await pipeline.run(chunk_groups)
+
+    Attributes:
+        embed_batch_size: Chunks sent to the embed stage per batch.
+        upsert_batch_size: Vectors written per store call.
+        queue_size: Batches buffered between consecutive stages.
+    """
+
+    def __init__(
+        self,
+        embed: EmbedFn,
+        store: StoreFn,
+        embed_batch_size: int = 128,
+        upsert_batch_size: int = 256,
+        queue_size: int = 2,
+    ) -> None:
+        """
+        Initialize the pipeline.
+
+        Args:
+            embed: Coroutine embedding a batch of texts, one vector per text.
+            store: Coroutine storing (chunks, vectors).
+            embed_batch_size: Chunks per embedding batch.
+            upsert_batch_size: Vectors per store call.
+            queue_size: Max batches waiting between stages.
+        """
+        self._embed = embed
+        self._store = store
+        self.embed_batch_size = max(1, embed_batch_size)
+        self.upsert_batch_size = max(1, upsert_batch_size)
+        self.queue_size = max(1, queue_size)
+
+    async def run(self, groups: AsyncIterable[list[Chunk]]) -> int:
+        """
+        Embed and store every chunk from the incoming groups.
+
+        Args:
+            groups: Async iterable of chunk lists, in document order.
+
+        Returns:
+            Number of vectors stored.
+
+        Raises:
+            Exception: The first error raised by any stage; the other
+                stages are cancelled.
+        """
+        embed_queue: asyncio.Queue[list[Chunk] | None] = asyncio.Queue(
+            maxsize=self.queue_size
+        )
+        store_queue: asyncio.Queue[tuple[list[Chunk], Vectors] | None] = asyncio.Queue(
+            maxsize=self.queue_size
+        )
+
+        upsert = asyncio.create_task(self._upsert_stage(store_queue))
+        tasks = [
+            asyncio.create_task(self._feed(groups, embed_queue)),
+            asyncio.create_task(self._embed_stage(embed_queue, store_queue)),
+            upsert,
+        ]
+
+        try:
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        if pending:
+            # A stage failed; the rest would block on its queue forever
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        for task in done:
+            error = task.exception()
+            if error is not None:
+                raise error
+
+        return upsert.result()
+
+    async def _feed(
+        self,
+        groups: AsyncIterable[list[Chunk]],
+        embed_queue: asyncio.Queue[list[Chunk] | None],
+    ) -> None:
+        """
+        Re-batch chunk groups into fixed-size embedding batches.
+
+        Args:
+            groups: Incoming chunk groups.
+            embed_queue: Queue of chunk batches.
+        """
+        buffer: list[Chunk] = []
+
+        try:
+            async for group in groups:
+                buffer.extend(group)
+                while len(buffer) >= self.embed_batch_size:
+                    batch = buffer[:self.embed_batch_size]
+                    buffer = buffer[self.embed_batch_size:]
+                    await embed_queue.put(batch)
+        finally:
+            # Stop extraction promptly when a later stage fails
+            aclose = getattr(groups, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        if buffer:
+            await embed_queue.put(buffer)
+        await embed_queue.put(_DONE)
+
+    async def _embed_stage(
+        self,
+        embed_queue: asyncio.Queue[list[Chunk] | None],
+        store_queue: asyncio.Queue[tuple[list[Chunk], Vectors] | None],
+    ) -> None:
+        """
+        Embed batches in order and hand them to the upsert stage.
+
+        Args:
+            embed_queue: Queue of chunk batches.
+            store_queue: Queue of (chunks, vectors) batches.
+        """
+        while (batch := await embed_queue.get()) is not _DONE:
+            vectors = await self._embed([chunk.text for chunk in batch])
+            await store_queue.put((batch, vectors))
+        await store_queue.put(_DONE)
+
+    async def _upsert_stage(
+        self,
+        store_queue: asyncio.Queue[tuple[list[Chunk], Vectors] | None],
+    ) -> int:
+        """
+        Accumulate embedded batches and store them in upsert-sized writes.
+
+        Args:
+            store_queue: Queue of (chunks, vectors) batches.
+
+        Returns:
+            Number of vectors stored.
+        """
+        stored = 0
+        chunks: list[Chunk] = []
+        parts: list[Vectors] = []
+
+        while (item := await store_queue.get()) is not _DONE:
+            batch, vectors = item
+            chunks.extend(batch)
+            parts.append(vectors)
+
+            if len(chunks) >= self.upsert_batch_size:
+                await self._store(chunks, join_vectors(parts))
+                stored += len(chunks)
+                chunks, parts = [], []
+
+        if chunks:
+            await self._store(chunks, join_vectors(parts))
+            stored += len(chunks)
+
+        return stored
@@ -0,0 +1,190 @@
+"""
+Token-window chunker for already-decoded text.
+
+Splits text into windows of ``chunk_size`` tokens overlapping by
+``chunk_overlap`` tokens with a HuggingFace fast tokenizer. Chunk
+boundaries come from the tokenizer's offset mapping, so every chunk is an
+exact slice of its source text and carries its character offsets and
+token count.
+
+The tokenizer is loaded once per process and reused across documents;
+``split_batch`` tokenizes many texts (e.g. all pages of a row group) in
+one call.
+"""
+
+import functools
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger("echomind-ingestor.text_chunker")
+
+
+@functools.lru_cache(maxsize=4)
+def load_tokenizer(name: str, hf_access_token: str | None = None) -> Any:
+    """
+    Load a HuggingFace fast tokenizer, cached per process.
+
+    Args:
+        name: HuggingFace model identifier or local path.
+        hf_access_token: Optional token for gated tokenizers.
+
+    Returns:
+        Tokenizer instance.
+    """
+    from transformers import AutoTokenizer
+
+    logger.info(f"🔤 Loading tokenizer {name}")
+    return AutoTokenizer.from_pretrained(name, token=hf_access_token, use_fast=True)
+
+
+@dataclass(slots=True)
+class TextChunk:
+    """
+    A chunk of text with its position in the source text.
+
+    Attributes:
+        text: Chunk text, stripped of surrounding whitespace.
+        char_start: Offset of the first character in the source text.
+        char_end: Offset after the last character in the source text.
+        token_count: Tokens in the chunk, or None if not tokenized.
+        source_index: Extracted element the offsets refer to (page for
+            PDFs with text_depth=page, 0 for single-text documents).
+    """
+
+    text: str
+    char_start: int
+    char_end: int
+    token_count: int | None = None
+    source_index: int = 0
+
+
+class TextChunker:
+    """
+    Splits text into overlapping token windows.
+
+    Usage:
+        chunker = TextChunker(tokenizer="gpt2", chunk_size=512, chunk_overlap=50)
+        chunks = chunker.split(text)
+        per_page = chunker.split_batch(page_texts)
+
+    Attributes:
+        chunk_size: Maximum tokens per chunk.
+        chunk_overlap: Tokens shared by consecutive chunks.
+    """
+
+    def __init__(
+        self,
+        tokenizer: str,
+        chunk_size: int,
+        chunk_overlap: int,
+        hf_access_token: str | None = None,
+    ) -> None:
+        """
+        Initialize the chunker. The tokenizer loads on first use.
+
+        Args:
+            tokenizer: HuggingFace tokenizer identifier.
+            chunk_size: Maximum tokens per chunk.
+            chunk_overlap: Tokens shared by consecutive chunks; must be
+                less than chunk_size.
+            hf_access_token: Optional token for gated tokenizers.
+        """
+        self._tokenizer_name = tokenizer
+        self._hf_access_token = hf_access_token
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+
+    @property
+    def tokenizer(self) -> Any:
+        """The cached tokenizer."""
+        return load_tokenizer(self._tokenizer_name, self._hf_access_token)
+
+    def split(self, text: str, source_index: int = 0) -> list[TextChunk]:
+        """
+        Split text into token windows.
+
+        Args:
+            text: Decoded document text.
+            source_index: Source element recorded on each chunk.
+
+        Returns:
+            Non-empty chunks in order.
+        """
+        return self.split_batch([text], [source_index])[0]
+
+    def split_batch(
+        self,
+        texts: list[str],
+        source_indices: list[int] | None = None,
+    ) -> list[list[TextChunk]]:
+        """
+        Split several texts, tokenizing them in one batched call.
+
+        Args:
+            texts: Decoded texts.
+            source_indices: Source element per text; defaults to the
+                position in ``texts``.
+
+        Returns:
+            Chunks per input text, in order.
+        """
+        if source_indices is None:
+            source_indices = list(range(len(texts)))
+
+        # Blank texts produce no chunks; don't spend tokenizer time on them
+        todo = [i for i, text in enumerate(texts) if text.strip()]
+        result: list[list[TextChunk]] = [[] for _ in texts]
+        if not todo:
+            return result
+
+        encoding = self.tokenizer(
+            [texts[i] for i in todo],
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+        )
+        for i, offsets in zip(todo, encoding["offset_mapping"]):
+            result[i] = self._windows(texts[i], offsets, source_indices[i])
+
+        return result
+
+    def _windows(
+        self,
+        text: str,
+        offsets: list[tuple[int, int]],
+        source_index: int,
+    ) -> list[TextChunk]:
+        """
+        Slice text into windows of token offsets.
+
+        Args:
+            text: Source text.
+            offsets: (start, end) character offsets per token.
+            source_index: Source element recorded on each chunk.
+
+        Returns:
+            Non-empty chunks in order.
+        """
+        chunks: list[TextChunk] = []
+        stride = self.chunk_size - self.chunk_overlap
+
+        for start in range(0, len(offsets), stride):
+            window = offsets[start:start + self.chunk_size]
+            char_start, char_end = window[0][0], window[-1][1]
+            raw = text[char_start:char_end]
+            chunk = raw.strip()
+            if chunk:
+                # Keep offsets pointing at the stripped text
+                char_start += len(raw) - len(raw.lstrip())
+                chunks.append(TextChunk(
+                    text=chunk,
+                    char_start=char_start,
+                    char_end=char_start + len(chunk),
+                    token_count=len(window),
+                    source_index=source_index,
+                ))
+            # Later windows would only repeat the tail of this one
+            if start + self.chunk_size >= len(offsets):
+                break
+
+        return chunks
@@ -38,7 +38,12 @@ from echomind_lib.models.public.connector_model import ConnectorScope
 from echomind_lib.helpers.langfuse_helper import init_langfuse, shutdown_langfuse, create_trace
 
 from ingestor.config import get_settings, IngestorSettings
-from ingestor.logic.exceptions import IngestorError
+from ingestor.logic.admission import close_memory_budget, get_memory_budget, init_memory_budget
+from ingestor.logic.coalescer import close_batch_coalescer, init_batch_coalescer
+from ingestor.logic.compactor import SessionCompactor
+from ingestor.logic.cpu_pool import close_cpu_pool, init_cpu_pool
+from ingestor.logic.exceptions import DocumentLeasedError, IngestorError
+from ingestor.logic.metrics import admitted_memory, document_duration, documents_in_flight
 from ingestor.logic.ingestor_service import IngestorService
 from ingestor.middleware.error_handler import handle_ingestor_error
 
@@ -56,7 +61,7 @@ class IngestorApp:
 
     Handles:
     - Database connection management
-    - NATS subscription lifecycle
+    - NATS pull consumer with a fixed pool of document workers
     - MinIO client initialization
     - Qdrant client initialization
     - Health server for Kubernetes probes
@@ -71,6 +76,10 @@ class IngestorApp:
         self._health_server: HealthServer | None = None
         self._running = False
         self._retry_tasks: list[asyncio.Task[None]] = []
+        self._pull_subscription: Any = None
+        self._worker_tasks: list[asyncio.Task[None]] = []
+        self._compaction_task: asyncio.Task[None] | None = None
+        self._in_flight = 0
 
         # Connection status flags
         self._db_connected = False
@@ -93,11 +102,13 @@ class IngestorApp:
         logger.info(f"   NATS: {self._settings.nats_url}")
         logger.info(f"   MinIO: {self._settings.minio_endpoint}")
         logger.info(f"   Embedder: {self._settings.embedder_host}:{self._settings.embedder_port}")
+        logger.info(f"   Workers: {self._settings.worker_count} (ack wait {self._settings.nats_ack_wait:.0f}s, heartbeat every {self._settings.in_progress_interval:.0f}s)")
         logger.info(f"   Extract method: {self._settings.extract_method}")
         logger.info(f"   Text depth: {self._settings.text_depth}")
         logger.info(f"   Chunk size: {self._settings.chunk_size} tokens")
         logger.info(f"   Chunk overlap: {self._settings.chunk_overlap} tokens ({self._settings.chunk_overlap / self._settings.chunk_size * 100:.1f}%)")
         logger.info(f"   Tokenizer: {self._settings.tokenizer}")
+        logger.info(f"   CPU backend: {self._settings.cpu_backend}" + (f" ({self._settings.cpu_workers} workers)" if self._settings.cpu_backend == "process" else ""))
         if self._settings.hf_access_token:
             logger.info(f"   HF token: {'*' * 8}{self._settings.hf_access_token[-4:]}")
         else:
@@ -115,6 +126,7 @@ class IngestorApp:
         )
         health_thread.start()
         logger.info(f"💓 Health server started on port {self._settings.health_port}")
+        self._report_in_flight()
 
         # Initialize services with graceful degradation
         # Each service failure spawns a background retry task
@@ -171,6 +183,22 @@ class IngestorApp:
                 asyncio.create_task(self._retry_qdrant_connection())
             )
 
+        # Start extraction/tokenization workers before taking documents
+        try:
+            await init_cpu_pool(self._settings)
+        except Exception as e:
+            close_cpu_pool()
+            logger.warning(f"⚠️ CPU process pool failed to start, using threads: {e}")
+
+        # Share embed batches and upserts across concurrent documents
+        if init_batch_coalescer(self._settings) is not None:
+            logger.info(f"🧺 Coalescing embed/upsert batches ({self._settings.coalesce_window * 1000:.0f}ms window)")
+
+        # Keep concurrent documents within the pod's memory
+        budget = init_memory_budget(self._settings)
+        if budget is not None:
+            logger.info(f"🧮 Memory budget: {budget.limit >> 20} MB across {self._settings.worker_count} workers")
+
         # Initialize NATS subscriber
         logger.info("🛠️ Connecting to NATS...")
         try:
@@ -202,6 +230,9 @@ class IngestorApp:
         self._update_readiness()
         self._running = True
 
+        if self._settings.compaction_interval > 0:
+            self._compaction_task = asyncio.create_task(self._compaction_loop())
+
         if self._is_ready():
             logger.info("🚀 Ingestor ready and listening")
         else:
@@ -294,26 +325,145 @@ class IngestorApp:
             if ready:
                 logger.info("🚀 All services connected - marking as ready")
 
+    @property
+    def in_flight(self) -> int:
+        """Number of documents currently being processed by this pod."""
+        return self._in_flight
+
     async def _setup_subscriptions(self) -> None:
         """
-        Setup NATS JetStream subscriptions.
+        Setup NATS JetStream pull consumer and document workers.
 
         Subscribes to:
         - document.process: Process uploaded documents
+
+        Each worker pulls one message at a time, so a pod never holds more
+        than ``worker_count`` unacknowledged documents and the rest stay
+        available to other pods.
         """
         if not self._subscriber:
             return
 
         subject = "document.process"
-        consumer_name = f"{self._settings.nats_consumer_name}-{subject.replace('.', '-')}"
+        push_consumer = f"{self._settings.nats_consumer_name}-{subject.replace('.', '-')}"
 
-        await self._subscriber.subscribe(
+        # A new durable name, so pods still on the push consumer keep it
+        # during a rolling deploy; the pull consumer starts where it left off
+        self._pull_subscription = await self._subscriber.pull_subscribe(
             stream=self._settings.nats_stream_name,
-            consumer=consumer_name,
+            consumer=f"{push_consumer}-pull",
             subject=subject,
-            handler=self._handle_message,
+            batch_size=1,
+            ack_wait=self._settings.nats_ack_wait,
+            max_deliver=self._settings.nats_max_deliver,
+            legacy_consumer=push_consumer,
         )
-        logger.info(f"📥 Subscribed to {subject}")
+
+        # Restart workers on reconnect so they use the new subscription
+        await self._stop_workers()
+        self._worker_tasks = [
+            asyncio.create_task(self._worker_loop(worker_id))
+            for worker_id in range(self._settings.worker_count)
+        ]
+        logger.info(f"📥 Pulling {subject} with {self._settings.worker_count} workers")
+
+    async def _stop_workers(self) -> None:
+        """Cancel document workers and wait for them to exit."""
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+    async def _worker_loop(self, worker_id: int) -> None:
+        """
+        Pull and process one document at a time until cancelled.
+
+        Args:
+            worker_id: Worker index for logging.
+        """
+        while True:
+            # Leave messages on the server while dependencies are down
+            if not self._is_ready() or not self._subscriber:
+                await asyncio.sleep(1)
+                continue
+
+            try:
+                messages = await self._subscriber.fetch_messages(
+                    self._pull_subscription,
+                    batch_size=1,
+                    timeout=self._settings.nats_fetch_timeout,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ Worker {worker_id} fetch failed: {e}")
+                await asyncio.sleep(1)
+                continue
+
+            for msg in messages:
+                await self._process_message(msg)
+
+    async def _process_message(self, msg: Msg) -> None:
+        """
+        Handle a message while sending in-progress heartbeats.
+
+        Heartbeats reset the ack deadline, so documents that take longer
+        than ``nats_ack_wait`` are not redelivered to another worker.
+
+        Args:
+            msg: NATS message with protobuf payload.
+        """
+        self._in_flight += 1
+        self._report_in_flight()
+        heartbeat = asyncio.create_task(self._heartbeat(msg))
+
+        try:
+            await self._handle_message(msg)
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+            self._in_flight -= 1
+            self._report_in_flight()
+
+    async def _heartbeat(self, msg: Msg) -> None:
+        """
+        Periodically tell JetStream the message is still being worked on.
+
+        Args:
+            msg: Message being processed.
+        """
+        while True:
+            await asyncio.sleep(self._settings.in_progress_interval)
+            try:
+                await msg.in_progress()
+            except Exception as e:
+                logger.debug(f"In-progress heartbeat failed: {e}")
+
+    def _report_in_flight(self) -> None:
+        """Publish the in-flight document count and memory estimate on the health server."""
+        documents_in_flight.set(self._in_flight)
+        budget = get_memory_budget()
+        if budget is not None:
+            admitted_memory.set(budget.in_use)
+
+        if self._health_server:
+            self._health_server.set_detail("in_flight", self._in_flight)
+            if budget is not None:
+                self._health_server.set_detail("memory_in_use_mb", budget.in_use >> 20)
+
+    async def _compaction_loop(self) -> None:
+        """Periodically delete vectors of superseded sessions and deleted documents."""
+        while self._running:
+            await asyncio.sleep(self._settings.compaction_interval)
+            if not (self._db_connected and self._qdrant_connected):
+                continue
+
+            try:
+                async with get_db_manager().session() as session:
+                    compactor = SessionCompactor(db_session=session, qdrant_client=get_qdrant())
+                    await compactor.compact_all()
+            except Exception as e:
+                logger.warning(f"⚠️ Session compaction failed: {e}")
 
     async def _handle_message(self, msg: Msg) -> None:
         """
@@ -330,6 +480,7 @@ class IngestorApp:
 
         start_time = asyncio.get_event_loop().time()
         document_id: int | None = None
+        outcome = "retry"
 
         try:
             # Parse protobuf message
@@ -353,55 +504,30 @@ class IngestorApp:
                 tags=["ingestor", "document"],
             )
 
-            # Get database session and clients
-            db = get_db_manager()
-            minio = get_minio()
-            qdrant = get_qdrant()
-
-            async with db.session() as session:
-                # Create service instance
-                service = IngestorService(
-                    db_session=session,
-                    minio_client=minio,
-                    qdrant_client=qdrant,
-                    settings=self._settings,
-                )
-
+            # Another worker holds the document: wait until its claim ends
+            # or expires, holding the message in progress (the heartbeat
+            # runs meanwhile). A nak would use up a delivery attempt per
+            # deferral and drop the document after nats_max_deliver.
+            while True:
                 try:
-                    # Map scope enum to string
-                    scope_map = {
-                        ConnectorScope.CONNECTOR_SCOPE_USER: "user",
-                        ConnectorScope.CONNECTOR_SCOPE_GROUP: "group",
-                        ConnectorScope.CONNECTOR_SCOPE_ORG: "org",
-                    }
-                    scope = scope_map.get(request.scope, "user")
-
-                    # Process document
-                    result = await service.process_document(
-                        document_id=request.document_id,
-                        connector_id=request.connector_id,
-                        user_id=request.user_id,
-                        minio_path=request.minio_path,
-                        chunking_session=request.chunking_session,
-                        scope=scope,
-                        scope_id=request.scope_id or None,
-                        team_id=request.team_id if request.team_id else None,
-                    )
-
-                    trace.update(
-                        output={
-                            "status": "completed",
-                            "chunk_count": result.get("chunk_count", 0),
-                            "collection_name": result.get("collection_name", ""),
-                        },
-                    )
-
-                    # ACK message on success
-                    await msg.ack()
-                    # Main completion log is in ingestor_service.py
-
-                finally:
-                    await service.close()
+                    result = await self._process_request(request)
+                    break
+                except DocumentLeasedError as e:
+                    error_info = await handle_ingestor_error(e)
+                    await asyncio.sleep(error_info["retry_after"])
+
+            trace.update(
+                output={
+                    "status": "completed",
+                    "chunk_count": result.get("chunk_count", 0),
+                    "collection_name": result.get("collection_name", ""),
+                },
+            )
+
+            # ACK message on success
+            await msg.ack()
+            outcome = "skipped" if result.get("skipped") else "completed"
+            # Main completion log is in ingestor_service.py
 
         except IngestorError as e:
             error_info = await handle_ingestor_error(e)
@@ -411,6 +537,7 @@ class IngestorApp:
                 await msg.nak()  # NATS will redeliver
             else:
                 await msg.term()  # Terminal failure, don't retry
+                outcome = "failed"
 
         except Exception as e:
             logger.exception(f"💀 [id:{document_id}] Unexpected error: {e}")
@@ -418,8 +545,59 @@ class IngestorApp:
 
         finally:
             elapsed = asyncio.get_event_loop().time() - start_time
+            document_duration.labels(status=outcome).observe(elapsed)
             logger.info(f"⏰ [id:{document_id}] Elapsed: {elapsed:.2f}s")
 
+    async def _process_request(self, request: DocumentProcessRequest) -> dict[str, Any]:
+        """
+        Process a document request in its own database session.
+
+        Args:
+            request: Parsed document process request.
+
+        Returns:
+            Result of ``IngestorService.process_document``.
+
+        Raises:
+            IngestorError: If processing fails.
+        """
+        db = get_db_manager()
+        minio = get_minio()
+        qdrant = get_qdrant()
+
+        async with db.session() as session:
+            # Create service instance
+            service = IngestorService(
+                db_session=session,
+                minio_client=minio,
+                qdrant_client=qdrant,
+                settings=self._settings,
+                session_factory=db.session,
+            )
+
+            try:
+                # Map scope enum to string
+                scope_map = {
+                    ConnectorScope.CONNECTOR_SCOPE_USER: "user",
+                    ConnectorScope.CONNECTOR_SCOPE_GROUP: "group",
+                    ConnectorScope.CONNECTOR_SCOPE_ORG: "org",
+                }
+                scope = scope_map.get(request.scope, "user")
+
+                # Process document
+                return await service.process_document(
+                    document_id=request.document_id,
+                    connector_id=request.connector_id,
+                    user_id=request.user_id,
+                    minio_path=request.minio_path,
+                    chunking_session=request.chunking_session,
+                    scope=scope,
+                    scope_id=request.scope_id or None,
+                    team_id=request.team_id if request.team_id else None,
+                )
+            finally:
+                await service.close()
+
     async def stop(self) -> None:
         """
         Stop the Ingestor service gracefully.
@@ -436,6 +614,18 @@ class IngestorApp:
         for task in self._retry_tasks:
             task.cancel()
 
+        if self._compaction_task:
+            self._compaction_task.cancel()
+
+        # Stop pulling; unacked documents are redelivered after ack_wait
+        await self._stop_workers()
+
+        try:
+            await close_batch_coalescer()
+        except Exception:
+            pass
+        close_memory_budget()
+
         # Close connections (ignore errors for cleanup)
         try:
             await close_nats_subscriber()
@@ -443,6 +633,11 @@ class IngestorApp:
         except Exception:
             pass
 
+        try:
+            close_cpu_pool()
+        except Exception:
+            pass
+
         try:
             await close_qdrant()
             logger.info("🔍 Qdrant disconnected")
@@ -12,6 +12,7 @@ from ingestor.logic.exceptions import (
     AudioExtractionError,
     ChunkingError,
     DatabaseError,
+    DocumentLeasedError,
     DocumentNotFoundError,
     EmbeddingError,
     ExtractionError,
@@ -131,6 +132,13 @@ async def handle_ingestor_error(error: IngestorError) -> dict[str, Any]:
         error_info["details"]["document_id"] = error.document_id
         error_info["details"]["chunk_index"] = error.chunk_index
 
+    elif isinstance(error, DocumentLeasedError):
+        # Redelivered while another worker holds the document
+        logger.info(f"⏳ Document {error.document_id} in progress elsewhere, retry in {error.retry_after:.0f}s")
+        error_info["should_retry"] = True
+        error_info["retry_after"] = error.retry_after
+        error_info["details"]["document_id"] = error.document_id
+
     elif isinstance(error, MinioError):
         logger.warning(f"⚠️ MinIO error in {error.operation}: {error.reason}")
         error_info["should_retry"] = True
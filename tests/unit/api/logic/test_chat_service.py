@@ -244,6 +244,94 @@ class TestChatServiceRetrieveContext:
             assert "Embedder" in str(exc_info.value)
 
 
+class TestChatServiceRerank:
+    """Tests for the rerank stage of ChatService.retrieve_context()."""
+
+    @pytest.fixture
+    def mock_qdrant(self) -> AsyncMock:
+        """Create mock Qdrant client returning three candidates."""
+        qdrant = AsyncMock()
+        qdrant.search.return_value = [
+            {"id": f"chunk_{i}", "score": score, "payload": {"document_id": i, "text": f"t{i}"}}
+            for i, score in enumerate([0.9, 0.8, 0.7])
+        ]
+        return qdrant
+
+    @pytest.fixture
+    def mock_embedder(self) -> AsyncMock:
+        """Create mock Embedder client."""
+        client = AsyncMock()
+        client.embed_query.return_value = [0.1, 0.2, 0.3]
+        return client
+
+    @pytest.fixture
+    def mock_user(self) -> MagicMock:
+        """Create mock user."""
+        user = MagicMock()
+        user.id = 1
+        return user
+
+    @pytest.fixture
+    def service(self, mock_qdrant: AsyncMock, mock_embedder: AsyncMock) -> ChatService:
+        """Create ChatService with reranking enabled."""
+        service = ChatService(
+            db=AsyncMock(),
+            qdrant=mock_qdrant,
+            embedder=mock_embedder,
+            llm=AsyncMock(),
+            rerank_candidates=10,
+            rerank_budget_ms=200,
+        )
+        service._permissions.get_search_collections = AsyncMock(return_value=["user_1"])
+        return service
+
+    @pytest.mark.asyncio
+    async def test_rerank_reorders_overfetched_candidates(
+        self,
+        service: ChatService,
+        mock_qdrant: AsyncMock,
+        mock_embedder: AsyncMock,
+        mock_user: MagicMock,
+    ) -> None:
+        """Test candidates are over-fetched and reordered by rerank score."""
+        mock_embedder.rerank.return_value = [0.1, 0.2, 0.95]
+
+        sources = await service.retrieve_context("query", mock_user, limit=2)
+
+        assert mock_qdrant.search.call_args.kwargs["limit"] == 10
+        mock_embedder.rerank.assert_called_once_with("query", ["t0", "t1", "t2"], timeout=0.2)
+        assert [s.chunk_id for s in sources] == ["chunk_2", "chunk_1"]
+        assert sources[0].score == 0.95
+
+    @pytest.mark.asyncio
+    async def test_rerank_failure_keeps_vector_order(
+        self,
+        service: ChatService,
+        mock_embedder: AsyncMock,
+        mock_user: MagicMock,
+    ) -> None:
+        """Test a failed or timed-out rerank falls back to vector scores."""
+        mock_embedder.rerank.side_effect = ServiceUnavailableError("Embedder")
+
+        sources = await service.retrieve_context("query", mock_user, limit=2)
+
+        assert [s.chunk_id for s in sources] == ["chunk_0", "chunk_1"]
+        assert sources[0].score == 0.9
+
+    @pytest.mark.asyncio
+    async def test_rerank_skipped_when_nothing_to_trim(
+        self,
+        service: ChatService,
+        mock_embedder: AsyncMock,
+        mock_user: MagicMock,
+    ) -> None:
+        """Test no rerank call is made when all candidates fit the limit."""
+        sources = await service.retrieve_context("query", mock_user, limit=5)
+
+        assert len(sources) == 3
+        mock_embedder.rerank.assert_not_called()
+
+
 class TestChatServiceSaveMessages:
     """Tests for ChatService message persistence."""
 
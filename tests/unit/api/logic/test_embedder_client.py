@@ -47,6 +47,27 @@ class TestEmbedderClientEmbedQuery:
         assert result == [0.1, 0.2, 0.3]
         mock_stub.Embed.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_embed_query_uses_interactive_priority(
+        self,
+        client: EmbedderClient,
+    ) -> None:
+        """Test embed_query marks the request as interactive."""
+        from echomind_lib.models.internal.embedding_pb2 import EMBED_PRIORITY_INTERACTIVE
+
+        mock_stub = AsyncMock()
+        mock_response = MagicMock()
+        mock_response.embeddings = [MagicMock(vector=[0.1])]
+        mock_stub.Embed.return_value = mock_response
+
+        client._channel = MagicMock()
+        client._stub = mock_stub
+
+        await client.embed_query("test query")
+
+        request = mock_stub.Embed.call_args[0][0]
+        assert request.priority == EMBED_PRIORITY_INTERACTIVE
+
     @pytest.mark.asyncio
     async def test_embed_query_raises_on_empty_response(
         self,
@@ -97,6 +118,101 @@ class TestEmbedderClientEmbedQuery:
         assert "Embedder" in str(exc_info.value)
 
 
+    @pytest.mark.asyncio
+    async def test_embed_query_decodes_packed_matrix(self) -> None:
+        """Test packed responses are decoded into a float32 numpy vector."""
+        import numpy as np
+
+        from echomind_lib.helpers.vector_codec import pack_matrix
+        from echomind_lib.models.internal.embedding_pb2 import (
+            VECTOR_ENCODING_FLOAT16,
+            EmbedResponse,
+        )
+
+        client = EmbedderClient(
+            host="localhost",
+            port=50051,
+            vector_encoding=VECTOR_ENCODING_FLOAT16,
+        )
+        mock_stub = AsyncMock()
+        mock_stub.Embed.return_value = EmbedResponse(
+            matrix=pack_matrix([[0.5, -0.25, 1.0]], VECTOR_ENCODING_FLOAT16)
+        )
+        client._channel = MagicMock()
+        client._stub = mock_stub
+
+        result = await client.embed_query("test query")
+
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.float32
+        assert result.tolist() == [0.5, -0.25, 1.0]
+        request = mock_stub.Embed.call_args[0][0]
+        assert request.encoding == VECTOR_ENCODING_FLOAT16
+
+    @pytest.mark.asyncio
+    async def test_embed_query_packed_falls_back_to_repeated(self) -> None:
+        """Test servers without packed support still return a vector."""
+        from echomind_lib.models.internal.embedding_pb2 import (
+            VECTOR_ENCODING_FLOAT32,
+            EmbedResponse,
+            Embedding,
+        )
+
+        client = EmbedderClient(
+            host="localhost",
+            port=50051,
+            vector_encoding=VECTOR_ENCODING_FLOAT32,
+        )
+        mock_stub = AsyncMock()
+        mock_stub.Embed.return_value = EmbedResponse(
+            embeddings=[Embedding(vector=[0.5, 0.25], dimension=2)]
+        )
+        client._channel = MagicMock()
+        client._stub = mock_stub
+
+        result = await client.embed_query("test query")
+
+        assert result == [0.5, 0.25]
+
+
+class TestEmbedderClientRerank:
+    """Tests for EmbedderClient.rerank()."""
+
+    @pytest.fixture
+    def client(self) -> EmbedderClient:
+        """Create EmbedderClient instance."""
+        client = EmbedderClient(host="localhost", port=50051, timeout=30.0)
+        client._channel = MagicMock()
+        client._stub = AsyncMock()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_rerank_returns_scores(self, client: EmbedderClient) -> None:
+        """Test rerank returns one score per passage with the given deadline."""
+        client._stub.Rerank.return_value = MagicMock(scores=[0.9, 0.1])
+
+        scores = await client.rerank("query", ["a", "b"], timeout=0.25)
+
+        assert scores == [0.9, 0.1]
+        request = client._stub.Rerank.call_args[0][0]
+        assert list(request.passages) == ["a", "b"]
+        assert client._stub.Rerank.call_args.kwargs["timeout"] == 0.25
+
+    @pytest.mark.asyncio
+    async def test_rerank_empty_skips_call(self, client: EmbedderClient) -> None:
+        """Test rerank with no passages does not call the embedder."""
+        assert await client.rerank("query", []) == []
+        client._stub.Rerank.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rerank_score_count_mismatch(self, client: EmbedderClient) -> None:
+        """Test rerank rejects responses with the wrong number of scores."""
+        client._stub.Rerank.return_value = MagicMock(scores=[0.9])
+
+        with pytest.raises(ServiceUnavailableError):
+            await client.rerank("query", ["a", "b"])
+
+
 class TestEmbedderClientClose:
     """Tests for EmbedderClient.close()."""
 
@@ -101,6 +101,46 @@ class TestMinIOClientStreamUpload:
         assert result.size == 0
 
 
+class TestMinIOClientDownloadToFile:
+    """Tests for streaming downloads to a local file."""
+
+    @pytest.fixture
+    def response(self):
+        """Create a mock object response yielding two chunks."""
+        async def iter_chunked(size):
+            yield b"chunk1"
+            yield b"chunk2"
+
+        response = MagicMock()
+        response.content.iter_chunked = iter_chunked
+        response.release = AsyncMock()
+        return response
+
+    @pytest.fixture
+    def client(self, response):
+        """Create MinIOClient with mocked underlying client."""
+        client = MinIOClient(
+            endpoint="localhost:9000",
+            access_key="test",
+            secret_key="test",
+        )
+        client._client = MagicMock()
+        client._client.get_object = AsyncMock(return_value=response)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_download_to_file_writes_chunks(self, client, response, tmp_path):
+        """Test chunks are written to the file and the response is released."""
+        target = tmp_path / "object.bin"
+
+        size = await client.download_to_file("bucket", "path/file.pdf", str(target))
+
+        assert size == 12
+        assert target.read_bytes() == b"chunk1chunk2"
+        response.close.assert_called_once()
+        response.release.assert_awaited_once()
+
+
 class TestMinIOClientPresignedPutUrl:
     """Tests for pre-signed PUT URL generation."""
 
@@ -0,0 +1,105 @@
+"""
+Unit tests for packed embedding matrix encoding.
+
+Tests pack/unpack round trips, zero-copy decoding, encoding names,
+and rejection of malformed buffers.
+"""
+
+import numpy as np
+import pytest
+
+from echomind_lib.helpers.vector_codec import (
+    encoding_from_name,
+    is_packed,
+    pack_matrix,
+    unpack_matrix,
+)
+from echomind_lib.models.internal.embedding_pb2 import (
+    VECTOR_ENCODING_FLOAT16,
+    VECTOR_ENCODING_FLOAT32,
+    VECTOR_ENCODING_UNSPECIFIED,
+    EmbeddingMatrix,
+)
+
+
+class TestPackMatrix:
+    """Tests for pack_matrix and unpack_matrix."""
+
+    def test_float32_round_trip(self) -> None:
+        """Test float32 vectors survive a round trip exactly."""
+        vectors = np.random.default_rng(0).random((3, 8), dtype=np.float32)
+
+        matrix = pack_matrix(vectors, VECTOR_ENCODING_FLOAT32)
+
+        assert matrix.rows == 3
+        assert matrix.dimension == 8
+        assert len(matrix.data) == 3 * 8 * 4
+        np.testing.assert_array_equal(unpack_matrix(matrix), vectors)
+
+    def test_float16_round_trip(self) -> None:
+        """Test float16 packing halves the buffer within float16 precision."""
+        vectors = np.random.default_rng(0).random((2, 4)).astype(np.float32)
+
+        matrix = pack_matrix(vectors, VECTOR_ENCODING_FLOAT16)
+
+        assert len(matrix.data) == 2 * 4 * 2
+        np.testing.assert_allclose(unpack_matrix(matrix), vectors, atol=1e-3)
+
+    def test_accepts_float_lists(self) -> None:
+        """Test list input is packed like an array."""
+        matrix = pack_matrix([[1.0, 2.0], [3.0, 4.0]], VECTOR_ENCODING_FLOAT32)
+
+        assert unpack_matrix(matrix).tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+    def test_unpack_is_zero_copy(self) -> None:
+        """Test unpack returns a read-only view over the message buffer."""
+        matrix = pack_matrix(np.ones((2, 2), dtype=np.float32), VECTOR_ENCODING_FLOAT32)
+
+        array = unpack_matrix(matrix)
+
+        assert not array.flags.owndata
+        assert not array.flags.writeable
+
+    def test_pack_rejects_repeated_encoding(self) -> None:
+        """Test packing with the unpacked encoding raises ValueError."""
+        with pytest.raises(ValueError):
+            pack_matrix([[1.0]], VECTOR_ENCODING_UNSPECIFIED)
+
+    def test_unpack_rejects_wrong_size(self) -> None:
+        """Test a buffer that does not match rows x dimension is rejected."""
+        matrix = EmbeddingMatrix(
+            data=b"\x00" * 12,
+            rows=2,
+            dimension=2,
+            encoding=VECTOR_ENCODING_FLOAT32,
+        )
+
+        with pytest.raises(ValueError, match="expected 16"):
+            unpack_matrix(matrix)
+
+
+class TestEncodingNames:
+    """Tests for encoding name helpers."""
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("repeated", VECTOR_ENCODING_UNSPECIFIED),
+            ("float32", VECTOR_ENCODING_FLOAT32),
+            ("FLOAT16", VECTOR_ENCODING_FLOAT16),
+        ],
+    )
+    def test_encoding_from_name(self, name: str, expected: int) -> None:
+        """Test setting values resolve to enum values."""
+        assert encoding_from_name(name) == expected
+
+    def test_encoding_from_name_invalid(self) -> None:
+        """Test unknown names raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid vector encoding"):
+            encoding_from_name("int8")
+
+    def test_is_packed(self) -> None:
+        """Test only float32/float16 are packed encodings."""
+        assert is_packed(VECTOR_ENCODING_FLOAT32)
+        assert is_packed(VECTOR_ENCODING_FLOAT16)
+        assert not is_packed(VECTOR_ENCODING_UNSPECIFIED)
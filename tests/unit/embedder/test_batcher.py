@@ -0,0 +1,294 @@
+"""Unit tests for EmbedBatcher micro-batching scheduler."""
+
+import threading
+import time
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from embedder.logic.batcher import EmbedBatcher, Priority, _PendingRequest
+from embedder.logic.exceptions import EncoderError, EncodingError
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> None:
+    """Poll until predicate() is truthy or fail after timeout."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+def _fake_encode(texts: list[str], model_name: str, batch_size: int, encode_type: str):
+    """Return one vector per text encoding its length, for order checks."""
+    return np.array([[float(len(text))] for text in texts], dtype=np.float32)
+
+
+class TestEmbedBatcher:
+    """Tests for EmbedBatcher class."""
+
+    @pytest.fixture
+    def batcher(self):
+        """Create and start a batcher with a wide wait window."""
+        batcher = EmbedBatcher(max_batch_size=8, max_wait_ms=200.0)
+        batcher.start()
+        yield batcher
+        batcher.stop()
+
+    @mock.patch("embedder.logic.batcher.SentenceEncoder")
+    def test_submit_single_request(self, mock_encoder: mock.MagicMock) -> None:
+        """Test a single request is encoded and returned."""
+        mock_encoder.encode_array.side_effect = _fake_encode
+        batcher = EmbedBatcher(max_batch_size=8, max_wait_ms=0.0)
+        batcher.start()
+        try:
+            vectors = batcher.submit(["a", "bb"], model_name="test-model")
+        finally:
+            batcher.stop()
+
+        assert vectors.tolist() == [[1.0], [2.0]]
+        mock_encoder.encode_array.assert_called_once_with(
+            texts=["a", "bb"],
+            model_name="test-model",
+            batch_size=8,
+            encode_type="document",
+        )
+
+    @mock.patch("embedder.logic.batcher.SentenceEncoder")
+    def test_submit_empty_texts(self, mock_encoder: mock.MagicMock, batcher) -> None:
+        """Test empty input returns without a forward pass."""
+        assert len(batcher.submit([], model_name="test-model")) == 0
+        mock_encoder.encode_array.assert_not_called()
+
+    @mock.patch("embedder.logic.batcher.SentenceEncoder")
+    def test_concurrent_requests_share_forward_pass(
+        self,
+        mock_encoder: mock.MagicMock,
+        batcher,
+    ) -> None:
+        """Test concurrent requests are merged and split back per caller."""
+        mock_encoder.encode_array.side_effect = _fake_encode
+        results: dict[int, np.ndarray] = {}
+
+        def call(idx: int, texts: list[str]) -> None:
+            results[idx] = batcher.submit(texts, model_name="test-model")
+
+        threads = [
+            threading.Thread(target=call, args=(0, ["a", "bb"])),
+            threading.Thread(target=call, args=(1, ["ccc"])),
+            threading.Thread(target=call, args=(2, ["dddd", "eeeee"])),
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert mock_encoder.encode_array.call_count == 1
+        assert results[0].tolist() == [[1.0], [2.0]]
+        assert results[1].tolist() == [[3.0]]
+        assert results[2].tolist() == [[4.0], [5.0]]
+
+    @mock.patch("embedder.logic.batcher.SentenceEncoder")
+    def test_batch_flushes_when_full(self, mock_encoder: mock.MagicMock) -> None:
+        """Test a full batch is encoded without waiting for the window."""
+        mock_encoder.encode_array.side_effect = _fake_encode
+        batcher = EmbedBatcher(max_batch_size=2, max_wait_ms=60_000.0)
+        batcher.start()
+        try:
+            vectors = batcher.submit(["a", "bb"], model_name="test-model", timeout=5)
+        finally:
+            batcher.stop()
+
+        assert vectors.tolist() == [[1.0], [2.0]]
+
+    @mock.patch("embedder.logic.batcher.SentenceEncoder")
+    def test_errors_propagate_to_callers(
+        self,
+        mock_encoder: mock.MagicMock,
+        batcher,
+    ) -> None:
+        """Test encoder errors are raised in the submitting thread."""
+        mock_encoder.encode_array.side_effect = EncodingError("boom", 1)
+
+        with pytest.raises(EncodingError):
+            batcher.submit(["a"], model_name="test-model", timeout=5)
+
+    def test_submit_when_stopped_raises(self) -> None:
+        """Test submitting to a stopped batcher raises EncoderError."""
+        batcher = EmbedBatcher()
+
+        with pytest.raises(EncoderError):
+            batcher.submit(["a"], model_name="test-model")
+
+
+class TestTakeBatch:
+    """Tests for batch selection from the queue."""
+
+    def _enqueue(
+        self,
+        batcher: EmbedBatcher,
+        texts: list[str],
+        model: str,
+        encode_type: str = "document",
+        priority: Priority = Priority.BULK,
+    ) -> _PendingRequest:
+        request = _PendingRequest(
+            texts=texts,
+            model_name=model,
+            encode_type=encode_type,
+            priority=priority,
+        )
+        batcher._queues[priority].append(request)
+        batcher._queued_texts[priority] += len(texts)
+        return request
+
+    def test_respects_max_batch_size(self) -> None:
+        """Test requests beyond max_batch_size stay queued."""
+        batcher = EmbedBatcher(max_batch_size=3)
+        first = self._enqueue(batcher, ["a", "b"], "m")
+        second = self._enqueue(batcher, ["c", "d"], "m")
+
+        batch = batcher._take_batch(Priority.BULK)
+
+        assert batch == [first]
+        assert list(batcher._queues[Priority.BULK]) == [second]
+        assert batcher._queued_texts[Priority.BULK] == 2
+
+    def test_oversized_request_taken_alone(self) -> None:
+        """Test a request larger than max_batch_size is still dispatched."""
+        batcher = EmbedBatcher(max_batch_size=2)
+        big = self._enqueue(batcher, ["a", "b", "c"], "m")
+
+        assert batcher._take_batch(Priority.BULK) == [big]
+        assert batcher._queued_texts[Priority.BULK] == 0
+
+    def test_groups_by_model_and_encode_type(self) -> None:
+        """Test only requests matching the oldest request's key are merged."""
+        batcher = EmbedBatcher(max_batch_size=10)
+        doc_a = self._enqueue(batcher, ["a"], "m1")
+        other_model = self._enqueue(batcher, ["b"], "m2")
+        query = self._enqueue(batcher, ["c"], "m1", encode_type="query")
+        doc_b = self._enqueue(batcher, ["d"], "m1")
+
+        batch = batcher._take_batch(Priority.BULK)
+
+        assert batch == [doc_a, doc_b]
+        assert list(batcher._queues[Priority.BULK]) == [other_model, query]
+
+
+class TestPriority:
+    """Tests for interactive priority scheduling."""
+
+    @mock.patch("embedder.logic.batcher.SentenceEncoder")
+    def test_interactive_skips_wait_window(self, mock_encoder: mock.MagicMock) -> None:
+        """Test interactive requests are dispatched without the batching window."""
+        mock_encoder.encode_array.side_effect = _fake_encode
+        batcher = EmbedBatcher(max_batch_size=8, max_wait_ms=60_000.0)
+        batcher.start()
+        try:
+            vectors = batcher.submit(
+                ["query"],
+                model_name="test-model",
+                priority=Priority.INTERACTIVE,
+                timeout=5,
+            )
+        finally:
+            batcher.stop()
+
+        assert vectors.tolist() == [[5.0]]
+
+    @mock.patch("embedder.logic.batcher.SentenceEncoder")
+    def test_interactive_preempts_queued_bulk(self, mock_encoder: mock.MagicMock) -> None:
+        """Test queued interactive work runs before queued bulk work."""
+        order: list[str] = []
+        release = threading.Event()
+
+        def encode(texts, model_name, batch_size, encode_type):
+            order.append(texts[0])
+            if texts[0] == "first":
+                release.wait(timeout=5)
+            return np.zeros((len(texts), 1), dtype=np.float32)
+
+        mock_encoder.encode_array.side_effect = encode
+        batcher = EmbedBatcher(max_batch_size=1, max_wait_ms=0.0)
+        batcher.start()
+        try:
+            # Occupy the forward pass, then queue bulk before interactive
+            first = threading.Thread(target=batcher.submit, args=(["first"], "m"))
+            first.start()
+            _wait_until(lambda: order)
+            bulk = threading.Thread(target=batcher.submit, args=(["bulk"], "m"))
+            bulk.start()
+            _wait_until(lambda: batcher._queues[Priority.BULK])
+            query = threading.Thread(
+                target=batcher.submit,
+                args=(["query"], "m"),
+                kwargs={"priority": Priority.INTERACTIVE},
+            )
+            query.start()
+            _wait_until(lambda: batcher._queues[Priority.INTERACTIVE])
+
+            release.set()
+            for t in (first, bulk, query):
+                t.join(timeout=5)
+        finally:
+            batcher.stop()
+
+        assert order == ["first", "query", "bulk"]
+
+
+class TestEmbedBatcherWithPool:
+    """Tests for dispatching batches to an inference worker pool."""
+
+    def test_one_batch_in_flight_per_worker(self) -> None:
+        """Test the batcher keeps each worker busy without waiting for results."""
+        from concurrent.futures import Future
+
+        pool = mock.MagicMock()
+        pool.num_workers = 2
+        dispatched: list[Future] = []
+
+        def submit(texts, **kwargs):
+            future = Future()
+            future.texts = texts
+            dispatched.append(future)
+            return future
+
+        pool.submit.side_effect = submit
+        batcher = EmbedBatcher(max_batch_size=1, max_wait_ms=0.0, pool=pool)
+        batcher.start()
+        try:
+            results = [batcher.enqueue([f"text-{i}"], model_name="m") for i in range(3)]
+
+            # Two workers: the third batch waits for a free slot
+            _wait_until(lambda: len(dispatched) == 2)
+            time.sleep(0.05)
+            assert len(dispatched) == 2
+
+            dispatched[0].set_result(np.array([[1.0]], dtype=np.float32))
+            _wait_until(lambda: len(dispatched) == 3)
+            for future in dispatched[1:]:
+                future.set_result(np.array([[2.0]], dtype=np.float32))
+
+            assert results[0].result(timeout=5).tolist() == [[1.0]]
+            assert [f.texts for f in dispatched] == [["text-0"], ["text-1"], ["text-2"]]
+        finally:
+            batcher.stop()
+
+    def test_pool_errors_reach_callers(self) -> None:
+        """Test a worker error fails every request of its batch."""
+        from concurrent.futures import Future
+
+        failed = Future()
+        failed.set_exception(EncodingError("worker failed", 2))
+        pool = mock.MagicMock()
+        pool.num_workers = 1
+        pool.submit.return_value = failed
+
+        batcher = EmbedBatcher(max_batch_size=8, max_wait_ms=0.0, pool=pool)
+        batcher.start()
+        try:
+            with pytest.raises(EncodingError):
+                batcher.submit(["a", "b"], model_name="m", timeout=5)
+        finally:
+            batcher.stop()
@@ -68,3 +68,19 @@ class TestSettingsValidation:
             # Should not raise
             settings = EmbedderSettings()
             assert not hasattr(settings, "unknown_setting")
+
+    def test_backend_normalized(self) -> None:
+        """Test backend and quantization values are lower-cased."""
+        env = {"EMBEDDER_BACKEND": "ONNX", "EMBEDDER_ONNX_QUANTIZE": "AVX2"}
+        with mock.patch.dict(os.environ, env, clear=True):
+            settings = EmbedderSettings()
+
+        assert settings.backend == "onnx"
+        assert settings.onnx_quantize == "avx2"
+
+    def test_invalid_backend(self) -> None:
+        """Test unknown backends are rejected."""
+        env = {"EMBEDDER_BACKEND": "tensorrt"}
+        with mock.patch.dict(os.environ, env, clear=True):
+            with pytest.raises(Exception, match="Invalid backend"):
+                EmbedderSettings()
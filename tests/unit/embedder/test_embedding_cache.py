@@ -0,0 +1,100 @@
+"""Unit tests for the content-addressed EmbeddingCache."""
+
+import numpy as np
+import pytest
+
+from embedder.logic.embedding_cache import EmbeddingCache
+
+
+def _vectors(*values: float) -> np.ndarray:
+    """Build a matrix with one 4-dim row per value."""
+    return np.array([[value] * 4 for value in values], dtype=np.float32)
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache class."""
+
+    def test_miss_then_hit(self) -> None:
+        """Test stored vectors are returned for the same text."""
+        cache = EmbeddingCache(memory_mb=1)
+
+        assert cache.get_many("m", "document", ["a", "b"]) == [None, None]
+        cache.put_many("m", "document", ["a", "b"], _vectors(1.0, 2.0))
+
+        hits = cache.get_many("m", "document", ["b", "c", "a"])
+        assert hits[0].tolist() == [2.0] * 4
+        assert hits[1] is None
+        assert hits[2].tolist() == [1.0] * 4
+
+    def test_key_includes_model_and_encode_type(self) -> None:
+        """Test vectors do not leak across models or encode types."""
+        cache = EmbeddingCache(memory_mb=1)
+        cache.put_many("m", "document", ["a"], _vectors(1.0))
+
+        assert cache.get_many("other", "document", ["a"]) == [None]
+        assert cache.get_many("m", "query", ["a"]) == [None]
+
+    def test_stored_rows_are_copies(self) -> None:
+        """Test cached rows do not alias the caller's batch matrix."""
+        cache = EmbeddingCache(memory_mb=1)
+        batch = _vectors(1.0, 2.0)
+        cache.put_many("m", "document", ["a", "b"], batch)
+        batch[:] = 0
+
+        cached = cache.get_many("m", "document", ["a"])[0]
+        assert cached.tolist() == [1.0] * 4
+        assert not cached.flags.writeable
+
+    def test_memory_tier_evicts_lru(self) -> None:
+        """Test the least recently used vector is evicted over budget."""
+        # Budget for exactly two 16-byte vectors
+        cache = EmbeddingCache(memory_mb=32 / (1024 * 1024))
+        cache.put_many("m", "document", ["a", "b"], _vectors(1.0, 2.0))
+        cache.get_many("m", "document", ["a"])
+        cache.put_many("m", "document", ["c"], _vectors(3.0))
+
+        hits = cache.get_many("m", "document", ["a", "b", "c"])
+        assert [hit is not None for hit in hits] == [True, False, True]
+
+    def test_disk_tier_survives_restart(self, tmp_path) -> None:
+        """Test vectors persist in SQLite across cache instances."""
+        path = str(tmp_path / "cache" / "embeddings.db")
+        cache = EmbeddingCache(memory_mb=1, disk_path=path)
+        cache.put_many("m", "document", ["a"], _vectors(1.0))
+        cache.close()
+
+        reopened = EmbeddingCache(memory_mb=1, disk_path=path)
+        try:
+            assert reopened.get_many("m", "document", ["a"])[0].tolist() == [1.0] * 4
+        finally:
+            reopened.close()
+
+    def test_disk_tier_prunes_oldest(self, tmp_path) -> None:
+        """Test the disk tier keeps at most disk_max_entries rows."""
+        cache = EmbeddingCache(
+            memory_mb=0,
+            disk_path=str(tmp_path / "embeddings.db"),
+            disk_max_entries=2,
+        )
+        try:
+            cache.put_many("m", "document", ["a", "b", "c"], _vectors(1.0, 2.0, 3.0))
+
+            hits = cache.get_many("m", "document", ["a", "b", "c"])
+            assert [hit is not None for hit in hits] == [False, True, True]
+        finally:
+            cache.close()
+
+    def test_metrics_count_hits_and_misses(self) -> None:
+        """Test lookups are counted per tier and result."""
+        from embedder.logic.metrics import embed_cache_lookups
+
+        hit = embed_cache_lookups.labels(tier="memory", result="hit")
+        miss = embed_cache_lookups.labels(tier="memory", result="miss")
+        hits_before, misses_before = hit._value.get(), miss._value.get()
+
+        cache = EmbeddingCache(memory_mb=1)
+        cache.put_many("m", "document", ["a"], _vectors(1.0))
+        cache.get_many("m", "document", ["a", "b"])
+
+        assert hit._value.get() - hits_before == pytest.approx(1)
+        assert miss._value.get() - misses_before == pytest.approx(1)
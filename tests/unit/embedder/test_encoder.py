@@ -4,7 +4,9 @@ from unittest import mock
 
 import pytest
 
-from embedder.logic.encoder import NVIDIA_EMBED_MODELS, SentenceEncoder
+import numpy as np
+
+from embedder.logic.encoder import NVIDIA_EMBED_MODELS, SentenceEncoder, token_buckets
 from embedder.logic.exceptions import EncodingError, ModelNotFoundError
 
 
@@ -16,6 +18,8 @@ class TestSentenceEncoder:
         SentenceEncoder.clear_cache()
         SentenceEncoder._device = None
         SentenceEncoder._cache_limit = 1
+        SentenceEncoder._memory_budget = 0
+        SentenceEncoder._max_batch_tokens = 0
 
     def test_set_cache_limit(self) -> None:
         """Test setting cache limit."""
@@ -94,6 +98,51 @@ class TestSentenceEncoder:
             show_progress_bar=False,
         )
 
+    @mock.patch("embedder.logic.encoder.SentenceTransformer")
+    def test_encode_array_returns_float32_matrix(
+        self,
+        mock_transformer_class: mock.MagicMock,
+    ) -> None:
+        """Test encode_array returns a float32 matrix without list conversion."""
+        import numpy as np
+
+        mock_model = mock.MagicMock()
+        mock_model.encode.return_value = np.array([[0.1, 0.2], [0.3, 0.4]], dtype=np.float64)
+        mock_transformer_class.return_value = mock_model
+
+        SentenceEncoder.set_device("cpu")
+
+        result = SentenceEncoder.encode_array(texts=["a", "b"], model_name="test-model")
+
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.float32
+        assert result.shape == (2, 2)
+
+    @mock.patch("embedder.logic.encoder.SentenceTransformer")
+    def test_encode_array_converts_bfloat16_tensor(
+        self,
+        mock_transformer_class: mock.MagicMock,
+    ) -> None:
+        """Test bfloat16 tensors from NVIDIA encode methods are widened."""
+        import numpy as np
+        import torch
+
+        mock_model = mock.MagicMock()
+        mock_model.encode_document.return_value = torch.tensor(
+            [[0.5, 0.25]], dtype=torch.bfloat16
+        )
+        mock_transformer_class.return_value = mock_model
+
+        SentenceEncoder.set_device("cpu")
+
+        result = SentenceEncoder.encode_array(
+            texts=["a"],
+            model_name="nvidia/llama-nemotron-embed-1b-v2",
+        )
+
+        assert result.dtype == np.float32
+        assert result.tolist() == [[0.5, 0.25]]
+
     @mock.patch("embedder.logic.encoder.SentenceTransformer")
     def test_get_dimension(self, mock_transformer_class: mock.MagicMock) -> None:
         """Test getting model dimension."""
@@ -138,6 +187,124 @@ class TestSentenceEncoder:
         assert "model-b" in SentenceEncoder.get_cached_models()
         assert "model-a" not in SentenceEncoder.get_cached_models()
 
+    @mock.patch("embedder.logic.encoder.SentenceTransformer")
+    def test_cache_eviction_is_lru(self, mock_transformer_class: mock.MagicMock) -> None:
+        """Test the least recently used model is evicted, not the oldest loaded."""
+        mock_transformer_class.return_value = mock.MagicMock()
+        SentenceEncoder.set_device("cpu")
+        SentenceEncoder.set_cache_limit(2)
+
+        SentenceEncoder.get_dimension("model-a")
+        SentenceEncoder.get_dimension("model-b")
+        SentenceEncoder.get_dimension("model-a")  # a is now most recent
+        SentenceEncoder.get_dimension("model-c")
+
+        assert SentenceEncoder.get_cached_models() == ["model-a", "model-c"]
+
+    @mock.patch("embedder.logic.encoder.SentenceTransformer")
+    def test_memory_budget_eviction(self, mock_transformer_class: mock.MagicMock) -> None:
+        """Test models are evicted to fit the memory budget."""
+        mock_transformer_class.return_value = mock.MagicMock()
+        SentenceEncoder.set_device("cpu")
+        SentenceEncoder.set_cache_limit(10)
+        SentenceEncoder.set_memory_budget(100)
+
+        with mock.patch.object(
+            SentenceEncoder, "_model_size", return_value=60 * 1024 * 1024
+        ):
+            SentenceEncoder.get_dimension("model-a")
+            SentenceEncoder.get_dimension("model-b")
+
+        assert SentenceEncoder.get_cached_models() == ["model-b"]
+        assert SentenceEncoder.get_cache_size_mb() == pytest.approx(60)
+
+    @mock.patch("embedder.logic.encoder.SentenceTransformer")
+    def test_pinned_model_not_evicted(self, mock_transformer_class: mock.MagicMock) -> None:
+        """Test pinned models survive eviction."""
+        mock_transformer_class.return_value = mock.MagicMock()
+        SentenceEncoder.set_device("cpu")
+        SentenceEncoder.set_cache_limit(1)
+        SentenceEncoder.pin("model-a")
+
+        SentenceEncoder.get_dimension("model-a")
+        SentenceEncoder.get_dimension("model-b")
+
+        assert "model-a" in SentenceEncoder.get_cached_models()
+
+    def test_model_size_from_parameters(self) -> None:
+        """Test model size is summed over parameters and buffers."""
+        import torch
+
+        module = torch.nn.Linear(4, 2)  # 8 weights + 2 bias float32
+
+        assert SentenceEncoder._model_size("org/model", module) == 10 * 4
+
+    @mock.patch("embedder.logic.encoder.SentenceTransformer")
+    def test_loading_does_not_block_cached_models(
+        self,
+        mock_transformer_class: mock.MagicMock,
+    ) -> None:
+        """Test a slow model load does not hold the cache lock."""
+        import threading
+
+        release = threading.Event()
+        cached = mock.MagicMock()
+        SentenceEncoder._model_cache["cached-model"] = cached
+
+        def slow_load(model_name, **kwargs):
+            release.wait(timeout=5)
+            return mock.MagicMock()
+
+        mock_transformer_class.side_effect = slow_load
+        SentenceEncoder.set_device("cpu")
+        SentenceEncoder.set_cache_limit(2)
+
+        future = SentenceEncoder.load_async("slow-model")
+        try:
+            assert SentenceEncoder._get_model("cached-model") is cached
+            assert not future.done()
+        finally:
+            release.set()
+
+        future.result(timeout=5)
+        assert "slow-model" in SentenceEncoder.get_cached_models()
+
+    @mock.patch("embedder.logic.encoder.SentenceTransformer")
+    def test_require_loaded_starts_background_load(
+        self,
+        mock_transformer_class: mock.MagicMock,
+    ) -> None:
+        """Test require_loaded raises ModelLoadingError until the model is cached."""
+        import threading
+
+        from embedder.logic.exceptions import ModelLoadingError
+
+        release = threading.Event()
+        mock_transformer_class.side_effect = lambda *a, **k: release.wait(5) and mock.MagicMock()
+        SentenceEncoder.set_device("cpu")
+
+        with pytest.raises(ModelLoadingError):
+            SentenceEncoder.require_loaded("model-x")
+
+        release.set()
+        SentenceEncoder.load_async("model-x").result(timeout=5)
+        SentenceEncoder.require_loaded("model-x")
+
+    @mock.patch("embedder.logic.encoder.SentenceTransformer")
+    def test_require_loaded_reports_failed_load(
+        self,
+        mock_transformer_class: mock.MagicMock,
+    ) -> None:
+        """Test a failed background load surfaces as ModelNotFoundError."""
+        mock_transformer_class.side_effect = Exception("no such repo")
+        SentenceEncoder.set_device("cpu")
+
+        with pytest.raises(ModelNotFoundError):
+            SentenceEncoder.load_async("bad-model").result(timeout=5)
+
+        with pytest.raises(ModelNotFoundError):
+            SentenceEncoder.require_loaded("bad-model")
+
     @mock.patch("embedder.logic.encoder.SentenceTransformer")
     def test_model_not_found_error(self, mock_transformer_class: mock.MagicMock) -> None:
         """Test ModelNotFoundError is raised when model fails to load."""
@@ -165,6 +332,77 @@ class TestSentenceEncoder:
         assert exc_info.value.texts_count == 1
 
 
+class TestTokenBudgetBatching:
+    """Tests for length-sorted, token-budgeted batching."""
+
+    def setup_method(self) -> None:
+        """Reset encoder state before each test."""
+        SentenceEncoder.clear_cache()
+        SentenceEncoder._device = "cpu"
+        SentenceEncoder._cache_limit = 1
+        SentenceEncoder._max_batch_tokens = 0
+
+    def teardown_method(self) -> None:
+        """Disable the token budget for other tests."""
+        SentenceEncoder._max_batch_tokens = 0
+
+    def test_token_buckets_respect_padded_budget(self) -> None:
+        """Test batches are length-sorted and bounded by size x longest."""
+        lengths = [500, 10, 12, 480, 11, 9]
+
+        batches = token_buckets(lengths, max_tokens=1000)
+
+        assert batches == [[5, 1, 4, 2], [3, 0]]
+        for batch in batches:
+            assert len(batch) * max(lengths[i] for i in batch) <= 1000
+
+    def test_token_buckets_oversized_text_alone(self) -> None:
+        """Test a text over the budget still gets its own batch."""
+        assert token_buckets([5, 2000, 5], max_tokens=100) == [[0, 2], [1]]
+
+    @mock.patch("embedder.logic.encoder.SentenceTransformer")
+    def test_encode_restores_original_order(
+        self,
+        mock_transformer_class: mock.MagicMock,
+    ) -> None:
+        """Test bucketed encoding returns vectors in input order."""
+        texts = ["long " * 100, "short", "medium " * 10, "tiny"]
+        mock_model = mock.MagicMock()
+        mock_model.max_seq_length = 512
+        mock_model.tokenizer.side_effect = lambda batch, **kwargs: {
+            "input_ids": [[0] * len(text.split()) for text in batch]
+        }
+        mock_model.encode.side_effect = lambda batch, **kwargs: np.array(
+            [[float(len(text))] for text in batch]
+        )
+        mock_transformer_class.return_value = mock_model
+        SentenceEncoder.set_max_batch_tokens(100)
+
+        result = SentenceEncoder.encode(texts=texts, model_name="test-model")
+
+        assert result == [[float(len(text))] for text in texts]
+        batches = [call.args[0] for call in mock_model.encode.call_args_list]
+        assert batches[-1] == [texts[0]]
+        assert all(texts[0] not in batch for batch in batches[:-1])
+
+    @mock.patch("embedder.logic.encoder.SentenceTransformer")
+    def test_encode_without_tokenizer_estimates_lengths(
+        self,
+        mock_transformer_class: mock.MagicMock,
+    ) -> None:
+        """Test character-based estimates are used when tokenizing fails."""
+        mock_model = mock.MagicMock()
+        mock_model.max_seq_length = 512
+        mock_model.tokenizer.side_effect = TypeError("no tokenizer")
+        mock_model.encode.side_effect = lambda batch, **kwargs: np.ones((len(batch), 2))
+        mock_transformer_class.return_value = mock_model
+        SentenceEncoder.set_max_batch_tokens(4096)
+
+        result = SentenceEncoder.encode_array(texts=["a" * 40, "b" * 4000], model_name="m")
+
+        assert result.shape == (2, 2)
+
+
 class TestExceptions:
     """Tests for encoder exceptions."""
 
@@ -190,6 +428,7 @@ class TestNvidiaModelSupport:
         SentenceEncoder.clear_cache()
         SentenceEncoder._device = None
         SentenceEncoder._cache_limit = 1
+        SentenceEncoder._max_batch_tokens = 0
 
     def test_is_nvidia_model_true(self) -> None:
         """Test NVIDIA model detection."""
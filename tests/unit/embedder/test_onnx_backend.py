@@ -0,0 +1,213 @@
+"""Unit tests for the ONNX Runtime backend and its accuracy check."""
+
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from embedder.accuracy_check import compare_embeddings, load_corpus, main
+from embedder.logic.encoder import SentenceEncoder
+from embedder.logic.onnx_backend import export_dir, load_onnx_model, onnx_file_name, onnx_model_size
+
+
+class TestOnnxBackend:
+    """Tests for ONNX model export and loading."""
+
+    def test_export_dir_per_model(self, tmp_path) -> None:
+        """Test each model gets its own flat export directory."""
+        assert export_dir(str(tmp_path), "BAAI/bge-small-en-v1.5") == (
+            tmp_path / "BAAI__bge-small-en-v1.5"
+        )
+
+    def test_onnx_file_name(self) -> None:
+        """Test float and quantized graphs use distinct files."""
+        assert onnx_file_name("") == "onnx/model.onnx"
+        assert onnx_file_name("avx2") == "onnx/model_qint8_avx2.onnx"
+
+    def test_onnx_model_size_counts_graph_and_external_data(self, tmp_path) -> None:
+        """Test the size covers the selected graph and its external weights only."""
+        graph = tmp_path / "org__model" / "onnx"
+        graph.mkdir(parents=True)
+        (graph / "model.onnx").write_bytes(b"x" * 10)
+        (graph / "model.onnx_data").write_bytes(b"x" * 90)
+        (graph / "model_qint8_avx2.onnx").write_bytes(b"x" * 25)
+
+        assert onnx_model_size(str(tmp_path), "org/model") == 100
+        assert onnx_model_size(str(tmp_path), "org/model", quantize="avx2") == 25
+        assert onnx_model_size(str(tmp_path), "other/model") == 0
+
+    @mock.patch("embedder.logic.onnx_backend.SentenceTransformer")
+    def test_load_uses_cached_export(self, mock_st: mock.MagicMock, tmp_path) -> None:
+        """Test an existing export is loaded without exporting again."""
+        target = export_dir(str(tmp_path), "org/model")
+        (target / "onnx").mkdir(parents=True)
+        (target / "onnx" / "model_qint8_avx2.onnx").touch()
+
+        load_onnx_model("org/model", "cpu", str(tmp_path), quantize="avx2")
+
+        mock_st.assert_called_once_with(
+            str(target),
+            device="cpu",
+            backend="onnx",
+            model_kwargs={"file_name": "onnx/model_qint8_avx2.onnx"},
+        )
+
+    @mock.patch("embedder.logic.onnx_backend.export_dynamic_quantized_onnx_model")
+    @mock.patch("embedder.logic.onnx_backend.SentenceTransformer")
+    def test_load_exports_and_quantizes(
+        self,
+        mock_st: mock.MagicMock,
+        mock_quantize: mock.MagicMock,
+        tmp_path,
+    ) -> None:
+        """Test a missing export is created, saved and quantized."""
+        exported = mock.MagicMock()
+        mock_st.return_value = exported
+        target = str(export_dir(str(tmp_path), "org/model"))
+
+        load_onnx_model("org/model", "cpu", str(tmp_path), quantize="avx512_vnni")
+
+        assert mock_st.call_args_list[0] == mock.call("org/model", device="cpu", backend="onnx")
+        exported.save_pretrained.assert_called_once_with(target)
+        mock_quantize.assert_called_once_with(
+            exported, "avx512_vnni", target, file_suffix="qint8_avx512_vnni"
+        )
+        assert mock_st.call_args_list[1].kwargs["model_kwargs"] == {
+            "file_name": "onnx/model_qint8_avx512_vnni.onnx"
+        }
+
+    def test_load_rejects_unknown_preset(self, tmp_path) -> None:
+        """Test unknown quantization presets raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid ONNX quantization"):
+            load_onnx_model("org/model", "cpu", str(tmp_path), quantize="int4")
+
+
+class TestEncoderBackendSelection:
+    """Tests for SentenceEncoder backend selection."""
+
+    def setup_method(self) -> None:
+        """Reset encoder state before each test."""
+        SentenceEncoder.clear_cache()
+        SentenceEncoder._device = "cpu"
+
+    def teardown_method(self) -> None:
+        """Restore the torch backend and cache limits."""
+        SentenceEncoder._backend = "torch"
+        SentenceEncoder._onnx_quantize = ""
+        SentenceEncoder._cache_limit = 1
+        SentenceEncoder._memory_budget = 0
+
+    def test_set_backend_invalid(self) -> None:
+        """Test unknown backends are rejected."""
+        with pytest.raises(ValueError):
+            SentenceEncoder.set_backend("tensorrt")
+
+    @mock.patch("embedder.logic.encoder.load_onnx_model")
+    def test_onnx_backend_loads_onnx_model(self, mock_load: mock.MagicMock, tmp_path) -> None:
+        """Test the onnx backend loads through load_onnx_model."""
+        SentenceEncoder.set_backend("onnx", quantize="avx2", cache_dir=str(tmp_path))
+
+        SentenceEncoder.get_dimension("org/model")
+
+        mock_load.assert_called_once_with(
+            "org/model", device="cpu", cache_dir=str(tmp_path), quantize="avx2"
+        )
+
+    @mock.patch("embedder.logic.encoder.SentenceTransformer")
+    @mock.patch("embedder.logic.encoder.load_onnx_model")
+    def test_onnx_backend_skips_remote_code_models(
+        self,
+        mock_load: mock.MagicMock,
+        mock_st: mock.MagicMock,
+    ) -> None:
+        """Test NVIDIA remote-code models stay on the torch backend."""
+        SentenceEncoder.set_backend("onnx")
+
+        SentenceEncoder.get_dimension("nvidia/llama-nemotron-embed-1b-v2")
+
+        mock_load.assert_not_called()
+        assert mock_st.call_args.kwargs["trust_remote_code"] is True
+
+    @mock.patch("embedder.logic.encoder.load_onnx_model")
+    def test_memory_budget_enforced_for_onnx_models(
+        self,
+        mock_load: mock.MagicMock,
+        tmp_path,
+    ) -> None:
+        """Test ONNX models count toward the memory budget by their graph size."""
+        mock_load.return_value = mock.MagicMock()
+        SentenceEncoder.set_backend("onnx", quantize="avx2", cache_dir=str(tmp_path))
+        SentenceEncoder.set_cache_limit(10)
+        SentenceEncoder.set_memory_budget(100)
+        for model_name in ("org/model-a", "org/model-b"):
+            graph = export_dir(str(tmp_path), model_name) / onnx_file_name("avx2")
+            graph.parent.mkdir(parents=True)
+            with graph.open("wb") as f:
+                f.truncate(60 * 1024 * 1024)
+
+        SentenceEncoder.get_dimension("org/model-a")
+        SentenceEncoder.get_dimension("org/model-b")
+
+        assert SentenceEncoder.get_cached_models() == ["org/model-b"]
+        assert SentenceEncoder.get_cache_size_mb() == pytest.approx(60)
+
+    def test_fingerprint_names_backend_and_quantization(self) -> None:
+        """Test each backend variant gets its own fingerprint."""
+        assert SentenceEncoder.fingerprint("org/model") == "org/model#torch"
+
+        SentenceEncoder.set_backend("onnx")
+        assert SentenceEncoder.fingerprint("org/model") == "org/model#onnx"
+        # Remote-code models keep running on torch
+        assert SentenceEncoder.fingerprint("nvidia/llama-nemotron-embed-1b-v2").endswith("#torch")
+
+        SentenceEncoder.set_backend("onnx", quantize="avx512_vnni")
+        assert SentenceEncoder.fingerprint("org/model") == "org/model#onnx-int8-avx512_vnni"
+
+
+class TestAccuracyCheck:
+    """Tests for the ONNX accuracy check tool."""
+
+    def test_identical_embeddings(self) -> None:
+        """Test identical vectors agree perfectly."""
+        vectors = np.random.default_rng(0).normal(size=(6, 8))
+
+        report = compare_embeddings(vectors, vectors.copy())
+
+        assert report.min_cosine == pytest.approx(1.0)
+        assert report.neighbour_agreement == 1.0
+
+    def test_noisy_embeddings_lower_cosine(self) -> None:
+        """Test perturbed vectors report a lower minimum cosine."""
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(6, 8))
+
+        report = compare_embeddings(vectors, vectors + rng.normal(scale=0.5, size=(6, 8)))
+
+        assert report.min_cosine < 0.99
+        assert report.texts == 6
+
+    def test_load_corpus_skips_blank_lines(self, tmp_path) -> None:
+        """Test corpus files are read one passage per line."""
+        path = tmp_path / "corpus.txt"
+        path.write_text("first\n\n  second  \n")
+
+        assert load_corpus(str(path)) == ["first", "second"]
+        assert len(load_corpus(None)) > 1
+
+    @mock.patch("embedder.accuracy_check.load_onnx_model")
+    @mock.patch("embedder.accuracy_check.SentenceTransformer")
+    def test_main_exit_status(
+        self,
+        mock_st: mock.MagicMock,
+        mock_load: mock.MagicMock,
+    ) -> None:
+        """Test the tool fails when the candidate drifts from the reference."""
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(12, 8))
+        mock_st.return_value.encode.return_value = vectors
+        mock_load.return_value.encode.return_value = vectors
+
+        assert main(["--model", "org/model"]) == 0
+
+        mock_load.return_value.encode.return_value = -vectors
+        assert main(["--model", "org/model", "--quantize", "avx2"]) == 1
@@ -0,0 +1,63 @@
+"""Unit tests for CrossEncoderReranker."""
+
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from embedder.logic.exceptions import EncodingError, ModelNotFoundError
+from embedder.logic.reranker import CrossEncoderReranker
+
+
+class TestCrossEncoderReranker:
+    """Tests for CrossEncoderReranker."""
+
+    def setup_method(self) -> None:
+        """Reset reranker state before each test."""
+        CrossEncoderReranker.clear_cache()
+        CrossEncoderReranker._device = "cpu"
+
+    @mock.patch("embedder.logic.reranker.CrossEncoder")
+    def test_score_keeps_input_order(self, mock_ce: mock.MagicMock) -> None:
+        """Test pairs are scored shortest first but returned in input order."""
+        # Score = passage length, so the sorted order is visible in the result
+        mock_ce.return_value.predict.side_effect = lambda pairs, **_: np.array(
+            [float(len(p)) for _, p in pairs]
+        )
+
+        scores = CrossEncoderReranker.score("q", ["long passage", "a", "mid"], "ce")
+
+        pairs = mock_ce.return_value.predict.call_args[0][0]
+        assert [p for _, p in pairs] == ["a", "mid", "long passage"]
+        assert scores.tolist() == [12.0, 1.0, 3.0]
+        assert scores.dtype == np.float32
+
+    @mock.patch("embedder.logic.reranker.CrossEncoder")
+    def test_model_cached(self, mock_ce: mock.MagicMock) -> None:
+        """Test the cross-encoder is loaded once per model name."""
+        mock_ce.return_value.predict.return_value = np.array([0.5])
+
+        CrossEncoderReranker.score("q", ["a"], "ce")
+        CrossEncoderReranker.score("q", ["b"], "ce")
+
+        mock_ce.assert_called_once_with("ce", device="cpu", max_length=mock.ANY)
+
+    def test_score_empty(self) -> None:
+        """Test scoring no passages returns an empty array."""
+        assert CrossEncoderReranker.score("q", [], "ce").shape == (0,)
+
+    @mock.patch("embedder.logic.reranker.CrossEncoder")
+    def test_load_failure(self, mock_ce: mock.MagicMock) -> None:
+        """Test load failures raise ModelNotFoundError."""
+        mock_ce.side_effect = OSError("not found")
+
+        with pytest.raises(ModelNotFoundError):
+            CrossEncoderReranker.load("missing")
+
+    @mock.patch("embedder.logic.reranker.CrossEncoder")
+    def test_predict_failure(self, mock_ce: mock.MagicMock) -> None:
+        """Test inference failures raise EncodingError."""
+        mock_ce.return_value.predict.side_effect = RuntimeError("boom")
+
+        with pytest.raises(EncodingError):
+            CrossEncoderReranker.score("q", ["a"], "ce")
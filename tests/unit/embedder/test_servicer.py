@@ -119,9 +119,11 @@ class TestEmbedServicer:
         mock_context,
     ) -> None:
         """Test successful dimension request."""
+        from echomind_lib.models.internal.embedding_pb2 import DimensionRequest
+
         mock_encoder.get_dimension.return_value = 384
 
-        request = mock.MagicMock()
+        request = DimensionRequest()
 
         response = servicer.GetDimension(request, mock_context)
 
@@ -139,12 +141,407 @@ class TestEmbedServicer:
         """Test handling of ModelNotFoundError in GetDimension."""
         from embedder.logic.exceptions import ModelNotFoundError
 
+        from echomind_lib.models.internal.embedding_pb2 import DimensionRequest
+
         mock_encoder.get_dimension.side_effect = ModelNotFoundError("test-model")
 
-        request = mock.MagicMock()
+        request = DimensionRequest()
 
         servicer.GetDimension(request, mock_context)
 
         mock_context.abort.assert_called_once()
         call_args = mock_context.abort.call_args
         assert call_args[0][0] == grpc.StatusCode.NOT_FOUND
+
+    @mock.patch("embedder.main.SentenceEncoder")
+    def test_embed_uses_batcher_when_configured(
+        self,
+        mock_encoder: mock.MagicMock,
+        mock_context,
+    ) -> None:
+        """Test that requests are routed through the batcher when set."""
+        from echomind_lib.models.internal.embedding_pb2 import EmbedRequest
+        from embedder.logic.batcher import Priority
+        from embedder.main import EmbedServicer
+
+        batcher = mock.MagicMock()
+        batcher.submit.return_value = [[0.1, 0.2]]
+        servicer = EmbedServicer(default_model="test-model", batcher=batcher)
+
+        request = EmbedRequest(
+            texts=["This text is long enough to pass the minimum length validation."]
+        )
+
+        response = servicer.Embed(request, mock_context)
+
+        batcher.submit.assert_called_once_with(
+            texts=list(request.texts),
+            model_name="test-model",
+            priority=Priority.BULK,
+        )
+        mock_encoder.encode.assert_not_called()
+        assert len(response.embeddings) == 1
+        mock_context.abort.assert_not_called()
+
+    @mock.patch("embedder.main.SentenceEncoder")
+    def test_embed_interactive_priority(
+        self,
+        mock_encoder: mock.MagicMock,
+        mock_context,
+    ) -> None:
+        """Test that interactive requests are submitted with interactive priority."""
+        from echomind_lib.models.internal.embedding_pb2 import (
+            EMBED_PRIORITY_INTERACTIVE,
+            EmbedRequest,
+        )
+        from embedder.logic.batcher import Priority
+        from embedder.main import EmbedServicer
+
+        batcher = mock.MagicMock()
+        batcher.submit.return_value = [[0.1, 0.2]]
+        servicer = EmbedServicer(default_model="test-model", batcher=batcher)
+
+        request = EmbedRequest(
+            texts=["This query is long enough to pass the minimum length validation."],
+            priority=EMBED_PRIORITY_INTERACTIVE,
+        )
+
+        servicer.Embed(request, mock_context)
+
+        assert batcher.submit.call_args.kwargs["priority"] == Priority.INTERACTIVE
+
+    @mock.patch("embedder.main.SentenceEncoder")
+    def test_embed_stream_yields_per_batch(
+        self,
+        mock_encoder: mock.MagicMock,
+        servicer,
+        mock_context,
+    ) -> None:
+        """Test each stream batch is answered with its batch_id."""
+        from echomind_lib.models.internal.embedding_pb2 import EmbedStreamRequest
+
+        mock_encoder.encode.side_effect = lambda texts, model_name, batch_size: [
+            [float(len(text))] for text in texts
+        ]
+        long_text = "This text is long enough to pass the minimum length validation."
+        requests = [
+            EmbedStreamRequest(batch_id=0, texts=[long_text]),
+            EmbedStreamRequest(batch_id=1, texts=[long_text, long_text + "!"]),
+        ]
+
+        responses = list(servicer.EmbedStream(iter(requests), mock_context))
+
+        by_id = {r.batch_id: [list(e.vector) for e in r.embeddings] for r in responses}
+        assert by_id == {
+            0: [[float(len(long_text))]],
+            1: [[float(len(long_text))], [float(len(long_text) + 1)]],
+        }
+        mock_context.abort.assert_not_called()
+
+    def test_embed_stream_uses_batcher(self, mock_context) -> None:
+        """Test stream batches are enqueued on the batcher without blocking."""
+        from concurrent.futures import Future
+
+        from echomind_lib.models.internal.embedding_pb2 import EmbedStreamRequest
+        from embedder.logic.batcher import Priority
+        from embedder.main import EmbedServicer
+
+        future: Future = Future()
+        future.set_result([[0.5]])
+        batcher = mock.MagicMock()
+        batcher.enqueue.return_value = future
+        servicer = EmbedServicer(default_model="test-model", batcher=batcher)
+        request = EmbedStreamRequest(
+            batch_id=7,
+            texts=["This text is long enough to pass the minimum length validation."],
+        )
+
+        responses = list(servicer.EmbedStream(iter([request]), mock_context))
+
+        assert [r.batch_id for r in responses] == [7]
+        batcher.enqueue.assert_called_once_with(
+            texts=list(request.texts),
+            model_name="test-model",
+            priority=Priority.BULK,
+        )
+
+    def test_embed_stream_invalid_batch_aborts(self, servicer, mock_context) -> None:
+        """Test an invalid stream batch aborts with INVALID_ARGUMENT."""
+        from echomind_lib.models.internal.embedding_pb2 import EmbedStreamRequest
+
+        requests = [EmbedStreamRequest(batch_id=0, texts=[])]
+
+        list(servicer.EmbedStream(iter(requests), mock_context))
+
+        mock_context.abort.assert_called_once()
+        assert mock_context.abort.call_args[0][0] == grpc.StatusCode.INVALID_ARGUMENT
+
+    def test_embed_packed_float16_matrix(self, mock_context) -> None:
+        """Test packed encodings return one matrix instead of repeated floats."""
+        import numpy as np
+
+        from echomind_lib.helpers.vector_codec import unpack_matrix
+        from echomind_lib.models.internal.embedding_pb2 import (
+            VECTOR_ENCODING_FLOAT16,
+            EmbedRequest,
+        )
+        from embedder.main import EmbedServicer
+
+        batcher = mock.MagicMock()
+        batcher.submit.return_value = np.array([[0.5, -0.25], [1.0, 0.0]], dtype=np.float32)
+        servicer = EmbedServicer(default_model="test-model", batcher=batcher)
+        long_text = "This text is long enough to pass the minimum length validation."
+        request = EmbedRequest(texts=[long_text, long_text], encoding=VECTOR_ENCODING_FLOAT16)
+
+        response = servicer.Embed(request, mock_context)
+
+        assert len(response.embeddings) == 0
+        assert response.matrix.rows == 2
+        assert response.matrix.dimension == 2
+        assert len(response.matrix.data) == 2 * 2 * 2
+        assert unpack_matrix(response.matrix).tolist() == [[0.5, -0.25], [1.0, 0.0]]
+
+    @mock.patch("embedder.main.SentenceEncoder")
+    def test_embed_selects_allowed_model(
+        self,
+        mock_encoder: mock.MagicMock,
+        mock_context,
+    ) -> None:
+        """Test a request can select an allowed non-default model."""
+        from echomind_lib.models.internal.embedding_pb2 import EmbedRequest
+        from embedder.main import EmbedServicer
+
+        batcher = mock.MagicMock()
+        batcher.submit.return_value = [[0.1]]
+        servicer = EmbedServicer(
+            default_model="test-model",
+            batcher=batcher,
+            allowed_models=["other-model"],
+        )
+        request = EmbedRequest(
+            texts=["This text is long enough to pass the minimum length validation."],
+            model="other-model",
+        )
+
+        servicer.Embed(request, mock_context)
+
+        mock_encoder.require_loaded.assert_called_once_with("other-model")
+        assert batcher.submit.call_args.kwargs["model_name"] == "other-model"
+        mock_context.abort.assert_not_called()
+
+    @mock.patch("embedder.main.SentenceEncoder")
+    def test_embed_rejects_unlisted_model(
+        self,
+        mock_encoder: mock.MagicMock,
+        servicer,
+        mock_context,
+    ) -> None:
+        """Test models outside the allow list abort with NOT_FOUND."""
+        from echomind_lib.models.internal.embedding_pb2 import EmbedRequest
+
+        request = EmbedRequest(
+            texts=["This text is long enough to pass the minimum length validation."],
+            model="someone/untrusted-model",
+        )
+
+        servicer.Embed(request, mock_context)
+
+        assert mock_context.abort.call_args[0][0] == grpc.StatusCode.NOT_FOUND
+        mock_encoder.require_loaded.assert_not_called()
+
+    @mock.patch("embedder.main.SentenceEncoder")
+    def test_embed_model_loading_unavailable(
+        self,
+        mock_encoder: mock.MagicMock,
+        mock_context,
+    ) -> None:
+        """Test a model still loading aborts with UNAVAILABLE for retry."""
+        from echomind_lib.models.internal.embedding_pb2 import EmbedRequest
+        from embedder.logic.exceptions import ModelLoadingError
+        from embedder.main import EmbedServicer
+
+        mock_encoder.require_loaded.side_effect = ModelLoadingError("other-model")
+        servicer = EmbedServicer(default_model="test-model", allowed_models=["other-model"])
+        request = EmbedRequest(
+            texts=["This text is long enough to pass the minimum length validation."],
+            model="other-model",
+        )
+
+        servicer.Embed(request, mock_context)
+
+        assert mock_context.abort.call_args[0][0] == grpc.StatusCode.UNAVAILABLE
+        mock_encoder.encode.assert_not_called()
+
+    @mock.patch("embedder.main.SentenceEncoder")
+    def test_embed_cache_hits_skip_encoding(
+        self,
+        mock_encoder: mock.MagicMock,
+        mock_context,
+    ) -> None:
+        """Test cached texts are not re-encoded and order is preserved."""
+        import numpy as np
+
+        from echomind_lib.models.internal.embedding_pb2 import EmbedRequest
+        from embedder.logic.embedding_cache import EmbeddingCache
+        from embedder.main import EmbedServicer
+
+        first = "The first text is long enough to pass the minimum length check."
+        second = "The second text is long enough to pass the minimum length check."
+        cache = EmbeddingCache(memory_mb=1)
+        cache.put_many("test-model#torch", "document", [second], np.array([[2.0, 2.0]]))
+        mock_encoder.fingerprint.side_effect = lambda model_name: f"{model_name}#torch"
+        mock_encoder.encode_array.return_value = np.array([[1.0, 1.0]], dtype=np.float32)
+        servicer = EmbedServicer(default_model="test-model", cache=cache)
+
+        response = servicer.Embed(EmbedRequest(texts=[first, second]), mock_context)
+
+        assert mock_encoder.encode_array.call_args.kwargs["texts"] == [first]
+        assert [list(e.vector) for e in response.embeddings] == [[1.0, 1.0], [2.0, 2.0]]
+
+        mock_encoder.encode_array.reset_mock()
+        servicer.Embed(EmbedRequest(texts=[second, first]), mock_context)
+
+        mock_encoder.encode_array.assert_not_called()
+        mock_context.abort.assert_not_called()
+
+    @mock.patch("embedder.main.SentenceEncoder")
+    def test_embed_cache_separates_backends(
+        self,
+        mock_encoder: mock.MagicMock,
+        mock_context,
+    ) -> None:
+        """Test vectors cached by one backend are not served by another."""
+        import numpy as np
+
+        from echomind_lib.models.internal.embedding_pb2 import EmbedRequest
+        from embedder.logic.embedding_cache import EmbeddingCache
+        from embedder.main import EmbedServicer
+
+        text = "This text is long enough to pass the minimum length validation."
+        cache = EmbeddingCache(memory_mb=1)
+        cache.put_many("test-model#torch", "document", [text], np.array([[2.0, 2.0]]))
+        mock_encoder.fingerprint.side_effect = lambda model_name: f"{model_name}#onnx-int8-avx2"
+        mock_encoder.encode_array.return_value = np.array([[1.0, 1.0]], dtype=np.float32)
+        servicer = EmbedServicer(default_model="test-model", cache=cache)
+
+        response = servicer.Embed(EmbedRequest(texts=[text]), mock_context)
+
+        assert mock_encoder.encode_array.call_args.kwargs["texts"] == [text]
+        assert list(response.embeddings[0].vector) == [1.0, 1.0]
+
+    def test_embed_stream_cache_hits_skip_batcher(self, mock_context) -> None:
+        """Test a fully cached stream batch is answered without the batcher."""
+        import numpy as np
+
+        from echomind_lib.models.internal.embedding_pb2 import EmbedStreamRequest
+        from embedder.logic.embedding_cache import EmbeddingCache
+        from embedder.main import EmbedServicer
+
+        text = "This text is long enough to pass the minimum length validation."
+        cache = EmbeddingCache(memory_mb=1)
+        cache.put_many("test-model#torch", "document", [text], np.array([[0.5]]))
+        batcher = mock.MagicMock()
+        servicer = EmbedServicer(default_model="test-model", batcher=batcher, cache=cache)
+
+        responses = list(
+            servicer.EmbedStream(iter([EmbedStreamRequest(batch_id=3, texts=[text])]), mock_context)
+        )
+
+        batcher.enqueue.assert_not_called()
+        assert responses[0].batch_id == 3
+        assert list(responses[0].embeddings[0].vector) == [0.5]
+
+    @mock.patch("embedder.main.SentenceEncoder")
+    def test_get_dimension_uses_worker_pool(
+        self,
+        mock_encoder: mock.MagicMock,
+        mock_context,
+    ) -> None:
+        """Test dimensions come from the worker pool instead of a local model."""
+        from echomind_lib.models.internal.embedding_pb2 import DimensionRequest
+        from embedder.main import EmbedServicer
+
+        pool = mock.MagicMock()
+        pool.get_dimension.return_value = 768
+        servicer = EmbedServicer(
+            default_model="test-model",
+            allowed_models=["other-model"],
+            pool=pool,
+        )
+
+        response = servicer.GetDimension(DimensionRequest(model="other-model"), mock_context)
+
+        assert response.dimension == 768
+        pool.get_dimension.assert_called_once_with("other-model")
+        mock_encoder.get_dimension.assert_not_called()
+        mock_encoder.require_loaded.assert_not_called()
+
+    @mock.patch("embedder.main.CrossEncoderReranker")
+    def test_rerank_returns_scores(
+        self,
+        mock_reranker: mock.MagicMock,
+        mock_context,
+    ) -> None:
+        """Test Rerank scores passages with the configured cross-encoder."""
+        import numpy as np
+
+        from echomind_lib.models.internal.embedding_pb2 import RerankRequest
+        from embedder.main import EmbedServicer
+
+        mock_reranker.score.return_value = np.array([0.25, 0.75], dtype=np.float32)
+        servicer = EmbedServicer(
+            default_model="test-model",
+            rerank_model="test-reranker",
+            rerank_batch_size=16,
+        )
+
+        response = servicer.Rerank(
+            RerankRequest(query="q", passages=["a", "b"]),
+            mock_context,
+        )
+
+        assert list(response.scores) == [0.25, 0.75]
+        assert response.model_id == "test-reranker"
+        mock_reranker.score.assert_called_once_with(
+            query="q",
+            passages=["a", "b"],
+            model_name="test-reranker",
+            batch_size=16,
+        )
+        mock_context.abort.assert_not_called()
+
+    @mock.patch("embedder.main.CrossEncoderReranker")
+    def test_rerank_disabled(
+        self,
+        mock_reranker: mock.MagicMock,
+        servicer,
+        mock_context,
+    ) -> None:
+        """Test Rerank fails with FAILED_PRECONDITION without a reranker."""
+        from echomind_lib.models.internal.embedding_pb2 import RerankRequest
+
+        servicer.Rerank(RerankRequest(query="q", passages=["a"]), mock_context)
+
+        assert mock_context.abort.call_args[0][0] == grpc.StatusCode.FAILED_PRECONDITION
+        mock_reranker.score.assert_not_called()
+
+    @mock.patch("embedder.main.CrossEncoderReranker")
+    def test_rerank_too_many_passages(
+        self,
+        mock_reranker: mock.MagicMock,
+        mock_context,
+    ) -> None:
+        """Test Rerank rejects requests over the passage limit."""
+        from echomind_lib.models.internal.embedding_pb2 import RerankRequest
+        from embedder.main import EmbedServicer
+
+        servicer = EmbedServicer(
+            default_model="test-model",
+            rerank_model="test-reranker",
+            rerank_max_passages=2,
+        )
+
+        servicer.Rerank(RerankRequest(query="q", passages=["a", "b", "c"]), mock_context)
+
+        assert mock_context.abort.call_args[0][0] == grpc.StatusCode.INVALID_ARGUMENT
+        mock_reranker.score.assert_not_called()
@@ -0,0 +1,137 @@
+"""Unit tests for the multi-process InferenceWorkerPool."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from embedder.logic import worker_pool
+
+from embedder.logic.exceptions import EncoderError, EncodingError, ModelNotFoundError
+from embedder.logic.worker_pool import (
+    InferenceWorkerPool,
+    _read_result,
+    _share_result,
+    _to_exception,
+    default_threads,
+)
+
+
+class TestSharedMemoryResults:
+    """Tests for the shared memory result handoff."""
+
+    def test_round_trip(self) -> None:
+        """Test a matrix survives the shared memory handoff."""
+        vectors = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+        name, shape = _share_result(vectors)
+        result = _read_result(name, shape)
+
+        np.testing.assert_array_equal(result, vectors)
+
+    def test_block_released_after_read(self) -> None:
+        """Test the shared memory block is unlinked once read."""
+        from multiprocessing import shared_memory
+
+        name, shape = _share_result(np.ones((1, 2), dtype=np.float32))
+        _read_result(name, shape)
+
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+
+class TestWorkerHelpers:
+    """Tests for worker pool helpers."""
+
+    @pytest.mark.parametrize(
+        ("status", "value", "expected"),
+        [
+            ("model_not_found", "m", ModelNotFoundError),
+            ("encoding", ("boom", 3), EncodingError),
+            ("error", "boom", EncoderError),
+        ],
+    )
+    def test_to_exception(self, status: str, value, expected: type) -> None:
+        """Test worker errors are rebuilt as encoder exceptions."""
+        assert isinstance(_to_exception(status, value), expected)
+
+    def test_encoding_error_message_not_nested(self) -> None:
+        """Test a rebuilt EncodingError keeps the worker's message."""
+        error = _to_exception("encoding", ("boom", 3))
+
+        assert str(error) == "Encoding failed for 3 texts: boom"
+
+    def test_default_threads_at_least_one(self) -> None:
+        """Test cores are split between workers with a floor of one."""
+        assert default_threads(10_000) == 1
+        assert default_threads(1) >= 1
+
+    def test_submit_requires_start(self) -> None:
+        """Test submitting to a stopped pool raises EncoderError."""
+        pool = InferenceWorkerPool(num_workers=1, default_model="test-model")
+
+        with pytest.raises(EncoderError):
+            pool.submit(["text"], model_name="test-model")
+
+    def test_dead_worker_noticed_under_load(self, monkeypatch) -> None:
+        """Test a crashed worker fails its tasks while results keep arriving."""
+        monkeypatch.setattr(worker_pool, "_POLL_INTERVAL", 0.05)
+        pool = InferenceWorkerPool(num_workers=2, default_model="test-model")
+        live = MagicMock(**{"is_alive.return_value": True})
+        dead = MagicMock(exitcode=-9, **{"is_alive.return_value": False})
+        pool._processes = [live, dead]
+        pool._spawn = MagicMock(return_value=live)
+        pool._running = True
+        lost: Future = Future()
+        pool._pending[0] = lost
+
+        class BusyResults:
+            """Results queue that is never idle while the pool runs."""
+
+            def get(self, timeout: float) -> tuple:
+                if not pool._running:
+                    raise queue.Empty
+                time.sleep(0.001)
+                return (99, "ok", 1)
+
+        pool._results = BusyResults()
+        collector = threading.Thread(target=pool._collect, daemon=True)
+        collector.start()
+        try:
+            with pytest.raises(EncoderError, match="exited"):
+                lost.result(timeout=5)
+            pool._spawn.assert_called_once_with(1)
+        finally:
+            pool._running = False
+            collector.join(5)
+
+
+class TestInferenceWorkerPool:
+    """End-to-end tests with a real spawned worker process."""
+
+    @pytest.fixture
+    def pool(self, monkeypatch):
+        """Start a one-worker pool whose model cannot be loaded."""
+        monkeypatch.setenv("HF_HUB_OFFLINE", "1")
+        pool = InferenceWorkerPool(
+            num_workers=1,
+            default_model="/nonexistent/embedding-model",
+            threads_per_worker=1,
+            pin_cpus=False,
+        )
+        pool.start()
+        yield pool
+        pool.stop()
+
+    def test_errors_cross_process_boundary(self, pool) -> None:
+        """Test worker failures surface as typed exceptions in the parent."""
+        with pytest.raises(ModelNotFoundError):
+            pool.get_dimension("/nonexistent/embedding-model", timeout=120)
+
+        future = pool.submit(["text"], model_name="/nonexistent/embedding-model")
+        with pytest.raises(ModelNotFoundError):
+            future.result(timeout=120)
@@ -0,0 +1,143 @@
+"""Unit tests for memory-aware admission control."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from ingestor.config import IngestorSettings, reset_settings
+from ingestor.logic import admission as admission_module
+from ingestor.logic.admission import MemoryBudget, init_memory_budget
+
+
+class TestMemoryBudget:
+    """Tests for MemoryBudget."""
+
+    @pytest.mark.asyncio
+    async def test_admits_documents_that_fit(self) -> None:
+        """Test documents within the budget run together."""
+        budget = MemoryBudget(limit=100, max_wait=60.0)
+
+        async with budget.admit(40):
+            async with budget.admit(60):
+                assert budget.in_use == 100
+
+        assert budget.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_waits_until_memory_is_released(self) -> None:
+        """Test a document that does not fit starts after another finishes."""
+        budget = MemoryBudget(limit=100, max_wait=60.0)
+        release = asyncio.Event()
+        order: list[str] = []
+
+        async def run(name: str, cost: int, wait: asyncio.Event | None = None) -> None:
+            async with budget.admit(cost):
+                order.append(name)
+                if wait is not None:
+                    await wait.wait()
+
+        big = asyncio.create_task(run("big", 80, release))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(run("second", 80))
+        await asyncio.sleep(0.01)
+        assert order == ["big"]
+
+        release.set()
+        await asyncio.gather(big, second)
+        assert order == ["big", "second"]
+
+    @pytest.mark.asyncio
+    async def test_small_documents_overtake_waiting_large_one(self) -> None:
+        """Test small documents keep flowing while a large one waits."""
+        budget = MemoryBudget(limit=100, max_wait=60.0)
+        release = asyncio.Event()
+        order: list[str] = []
+
+        async def run(name: str, cost: int, wait: asyncio.Event | None = None) -> None:
+            async with budget.admit(cost):
+                order.append(name)
+                if wait is not None:
+                    await wait.wait()
+
+        running = asyncio.create_task(run("running", 50, release))
+        await asyncio.sleep(0)
+        large = asyncio.create_task(run("large", 90))
+        await asyncio.sleep(0)
+        await run("small", 10)
+        assert order == ["running", "small"]
+
+        release.set()
+        await asyncio.gather(running, large)
+        assert order == ["running", "small", "large"]
+
+    @pytest.mark.asyncio
+    async def test_starving_document_blocks_overtaking(self) -> None:
+        """Test documents queue behind one that waited longer than max_wait."""
+        budget = MemoryBudget(limit=100, max_wait=0.0)
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with budget.admit(50):
+                await release.wait()
+
+        running = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        large = asyncio.create_task(budget.admit(90).__aenter__())
+        await asyncio.sleep(0)
+
+        small = asyncio.create_task(budget.admit(20).__aenter__())
+        await asyncio.sleep(0.01)
+        assert not small.done()
+
+        release.set()
+        await running
+        await large
+        assert budget.in_use == 90
+        small.cancel()
+
+    @pytest.mark.asyncio
+    async def test_oversized_document_runs_alone(self) -> None:
+        """Test a document larger than the budget is admitted when idle."""
+        budget = MemoryBudget(limit=100, max_wait=60.0)
+
+        async with budget.admit(500):
+            assert budget.in_use == 100
+
+
+class TestInitMemoryBudget:
+    """Tests for the global budget lifecycle."""
+
+    def setup_method(self) -> None:
+        """Reset settings and the global budget."""
+        reset_settings()
+        admission_module._budget = None
+
+    def teardown_method(self) -> None:
+        """Reset settings and the global budget."""
+        reset_settings()
+        admission_module._budget = None
+
+    def test_disabled_with_single_worker(self) -> None:
+        """Test a single worker needs no admission control."""
+        assert init_memory_budget(IngestorSettings(worker_count=1, memory_budget_mb=512)) is None
+
+    def test_configured_budget(self) -> None:
+        """Test an explicit budget is used as is."""
+        budget = init_memory_budget(IngestorSettings(worker_count=4, memory_budget_mb=512))
+
+        assert budget is not None
+        assert budget.limit == 512 * 1024 * 1024
+
+    def test_budget_from_container_limit(self) -> None:
+        """Test the default budget is a share of the container limit."""
+        with patch.object(admission_module, "container_memory_limit", return_value=1000):
+            budget = init_memory_budget(IngestorSettings(worker_count=4))
+
+        assert budget is not None
+        assert budget.limit == 600
+
+    def test_disabled_without_container_limit(self) -> None:
+        """Test admission control stays off when no limit is known."""
+        with patch.object(admission_module, "container_memory_limit", return_value=None):
+            assert init_memory_budget(IngestorSettings(worker_count=4)) is None
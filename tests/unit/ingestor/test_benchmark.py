@@ -0,0 +1,79 @@
+"""Unit tests for the ingestion benchmark helpers."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from ingestor.benchmark import (
+    CorpusGenerator,
+    LocalObjectStore,
+    StageTime,
+    build_pdf,
+    stage_times,
+)
+
+
+class TestCorpus:
+    """Tests for corpus generation."""
+
+    def test_same_seed_same_corpus(self) -> None:
+        """Test documents are reproducible from the seed."""
+        first = CorpusGenerator(seed=3, paragraphs=10)
+        second = CorpusGenerator(seed=3, paragraphs=10)
+
+        for kind in ("pdf", "html", "md"):
+            assert first.render(kind, "Title") == second.render(kind, "Title")
+
+    def test_unknown_kind(self) -> None:
+        """Test unknown kinds are rejected."""
+        with pytest.raises(ValueError):
+            CorpusGenerator(seed=3, paragraphs=1).render("xlsx", "Title")
+
+    def test_pdf_xref_points_at_objects(self) -> None:
+        """Test the PDF cross-reference table matches its objects."""
+        pdf = build_pdf("Title", [("Heading", ["word " * 400])], lines_per_page=10)
+
+        offsets = [int(offset) for offset in re.findall(rb"(\d{10}) 00000 n", pdf)]
+        for number, offset in enumerate(offsets, start=1):
+            assert pdf[offset:].startswith(b"%d 0 obj" % number)
+        xref = int(re.search(rb"startxref\n(\d+)", pdf).group(1))
+        assert pdf[xref:].startswith(b"xref")
+        assert pdf.count(b"/Type /Page ") > 1
+
+
+class TestLocalObjectStore:
+    """Tests for the MinIO stand-in."""
+
+    @pytest.mark.asyncio
+    async def test_download_to_file(self, tmp_path: Path) -> None:
+        """Test objects are copied to the destination file."""
+        store = LocalObjectStore(tmp_path / "objects")
+        store.put("bucket", "1/doc.md", b"# Hello")
+        destination = tmp_path / "download"
+
+        size = await store.download_to_file("bucket", "1/doc.md", str(destination))
+
+        assert size == 7
+        assert destination.read_bytes() == b"# Hello"
+
+    @pytest.mark.asyncio
+    async def test_missing_object(self, tmp_path: Path) -> None:
+        """Test a missing object reads as not found, like MinIO."""
+        store = LocalObjectStore(tmp_path)
+
+        with pytest.raises(FileNotFoundError, match="not found"):
+            await store.download_to_file("bucket", "missing", str(tmp_path / "out"))
+
+
+def test_stage_times_between_snapshots() -> None:
+    """Test only calls made during the run are reported."""
+    before = {"embed": (1.0, 4.0), "extract/pdf": (2.0, 1.0)}
+    after = {"embed": (3.0, 8.0), "extract/pdf": (2.0, 1.0), "upsert": (0.5, 2.0)}
+
+    times = stage_times(before, after)
+
+    assert times == {
+        "embed": StageTime(calls=4, seconds=2.0, mean_ms=500.0),
+        "upsert": StageTime(calls=2, seconds=0.5, mean_ms=250.0),
+    }
@@ -0,0 +1,180 @@
+"""Unit tests for cross-document embed/upsert coalescing."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ingestor.config import IngestorSettings, reset_settings
+from ingestor.logic import coalescer as coalescer_module
+from ingestor.logic.coalescer import BatchCoalescer, init_batch_coalescer
+from ingestor.logic.exceptions import EmbeddingError
+
+
+def _coalescer(embed_batch_size: int = 8, upsert_batch_size: int = 8, window: float = 0.01) -> BatchCoalescer:
+    """Build a coalescer around a fake embedder returning one-element vectors."""
+    async def embed_batch(texts: list[str], **kwargs: Any) -> list[list[float]]:
+        return [[float(len(text))] for text in texts]
+
+    embedder = MagicMock()
+    embedder.embed_batch = AsyncMock(side_effect=embed_batch)
+    embedder.close = AsyncMock()
+    return BatchCoalescer(
+        embedder=embedder,
+        embed_batch_size=embed_batch_size,
+        upsert_batch_size=upsert_batch_size,
+        window=window,
+    )
+
+
+class TestBatchCoalescer:
+    """Tests for BatchCoalescer."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_embeds_share_one_call(self) -> None:
+        """Test small requests from several documents are embedded together."""
+        coalescer = _coalescer()
+
+        first, second = await asyncio.gather(
+            coalescer.embed(["a", "bb"]),
+            coalescer.embed(["ccc"]),
+        )
+
+        coalescer._embedder.embed_batch.assert_called_once()
+        assert coalescer._embedder.embed_batch.call_args[1]["texts"] == ["a", "bb", "ccc"]
+        assert first == [[1.0], [2.0]]
+        assert second == [[3.0]]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_without_waiting(self) -> None:
+        """Test a request filling the batch is sent before the window ends."""
+        coalescer = _coalescer(embed_batch_size=2, window=60.0)
+
+        vectors = await asyncio.wait_for(coalescer.embed(["a", "b"]), timeout=1.0)
+
+        assert vectors == [[1.0], [1.0]]
+
+    @pytest.mark.asyncio
+    async def test_embed_failure_fails_every_request(self) -> None:
+        """Test an embedder failure reaches every document once their retries also fail."""
+        coalescer = _coalescer()
+        coalescer._embedder.embed_batch.side_effect = EmbeddingError(reason="overloaded")
+
+        results = await asyncio.gather(
+            coalescer.embed(["a"]),
+            coalescer.embed(["b"]),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, EmbeddingError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_embed_failure_only_fails_offending_request(self) -> None:
+        """Test a request the embedder rejects does not fail the documents batched with it."""
+        coalescer = _coalescer()
+
+        async def embed_batch(texts: list[str], **kwargs: Any) -> list[list[float]]:
+            if "" in texts:
+                raise EmbeddingError(reason="text too short")
+            return [[float(len(text))] for text in texts]
+
+        coalescer._embedder.embed_batch.side_effect = embed_batch
+
+        good, bad, other = await asyncio.gather(
+            coalescer.embed(["a", "bb"]),
+            coalescer.embed([""]),
+            coalescer.embed(["ccc"]),
+            return_exceptions=True,
+        )
+
+        assert good == [[1.0], [2.0]]
+        assert isinstance(bad, EmbeddingError)
+        assert other == [[3.0]]
+        # One shared call, then one call per request
+        assert coalescer._embedder.embed_batch.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_upsert_failure_only_fails_offending_request(self) -> None:
+        """Test a rejected upsert does not fail the points of other documents."""
+        coalescer = _coalescer()
+        qdrant = MagicMock()
+
+        async def upsert(ids: list[str], **kwargs: Any) -> None:
+            if "bad" in ids:
+                raise ValueError("payload too large")
+
+        qdrant.upsert = AsyncMock(side_effect=upsert)
+
+        results = await asyncio.gather(
+            coalescer.upsert(qdrant, "user_1", [[0.1]], [{"document_id": 1}], ["p1"]),
+            coalescer.upsert(qdrant, "user_1", [[0.2]], [{"document_id": 2}], ["bad"]),
+            return_exceptions=True,
+        )
+
+        assert results[0] is None
+        assert isinstance(results[1], ValueError)
+
+    @pytest.mark.asyncio
+    async def test_upserts_are_merged_per_collection(self) -> None:
+        """Test upserts share one write per collection and return after it."""
+        coalescer = _coalescer()
+        qdrant = MagicMock()
+        qdrant.upsert = AsyncMock()
+
+        await asyncio.gather(
+            coalescer.upsert(qdrant, "user_1", [[0.1]], [{"document_id": 1}], ["p1"]),
+            coalescer.upsert(qdrant, "user_1", [[0.2]], [{"document_id": 2}], ["p2"]),
+            coalescer.upsert(qdrant, "user_2", [[0.3]], [{"document_id": 3}], ["p3"]),
+        )
+
+        assert qdrant.upsert.call_count == 2
+        calls = {call[1]["collection_name"]: call[1] for call in qdrant.upsert.call_args_list}
+        assert calls["user_1"]["ids"] == ["p1", "p2"]
+        assert calls["user_1"]["vectors"] == [[0.1], [0.2]]
+        assert [p["document_id"] for p in calls["user_1"]["payloads"]] == [1, 2]
+        assert calls["user_2"]["ids"] == ["p3"]
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_requests(self) -> None:
+        """Test close sends waiting requests and closes the embedder."""
+        coalescer = _coalescer(window=60.0)
+
+        pending = asyncio.create_task(coalescer.embed(["a"]))
+        await asyncio.sleep(0)
+        await coalescer.close()
+
+        assert await pending == [[1.0]]
+        coalescer._embedder.close.assert_called_once()
+
+
+class TestInitBatchCoalescer:
+    """Tests for the global coalescer lifecycle."""
+
+    def setup_method(self) -> None:
+        """Reset settings and the global coalescer."""
+        reset_settings()
+        coalescer_module._coalescer = None
+
+    def teardown_method(self) -> None:
+        """Reset settings and the global coalescer."""
+        reset_settings()
+        coalescer_module._coalescer = None
+
+    def test_disabled_with_single_worker(self) -> None:
+        """Test coalescing stays off when only one document is in flight."""
+        assert init_batch_coalescer(IngestorSettings(worker_count=1)) is None
+
+    def test_disabled_with_zero_window(self) -> None:
+        """Test a zero window disables coalescing."""
+        assert init_batch_coalescer(IngestorSettings(worker_count=4, coalesce_window=0)) is None
+
+    def test_enabled_with_several_workers(self) -> None:
+        """Test the coalescer is created once and shared."""
+        settings = IngestorSettings(worker_count=4)
+
+        coalescer = init_batch_coalescer(settings)
+
+        assert coalescer is not None
+        assert coalescer.window == settings.coalesce_window
+        assert init_batch_coalescer(settings) is coalescer
@@ -0,0 +1,96 @@
+"""Unit tests for the orphaned session compactor."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from ingestor.logic.compactor import SessionCompactor
+
+
+def _row(document_id: int, status: str, session: str | None) -> SimpleNamespace:
+    """Build a (id, status, chunking_session) result row."""
+    return SimpleNamespace(id=document_id, status=status, chunking_session=session)
+
+
+class TestSessionCompactor:
+    """Tests for SessionCompactor."""
+
+    def setup_method(self) -> None:
+        """Create compactor with mock clients."""
+        self.mock_db_session = AsyncMock()
+        self.mock_qdrant = AsyncMock()
+        self.compactor = SessionCompactor(
+            db_session=self.mock_db_session,
+            qdrant_client=self.mock_qdrant,
+        )
+
+    def _points(self, *points: tuple[int, str]) -> None:
+        self.mock_qdrant.scroll_payloads.return_value = [
+            {"document_id": document_id, "chunking_session": session}
+            for document_id, session in points
+        ]
+
+    def _deleted_filters(self) -> list[dict]:
+        return [call[1]["filter_"] for call in self.mock_qdrant.delete_by_filter.call_args_list]
+
+    @pytest.mark.asyncio
+    async def test_empty_collection_skips_database(self) -> None:
+        """Test an empty collection needs no document lookup."""
+        self._points()
+
+        assert await self.compactor.compact("user_1") == 0
+        self.mock_db_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_deletes_superseded_sessions(self) -> None:
+        """Test completed documents keep only their current session."""
+        self._points((1, "old"), (1, "new"), (2, "only"))
+        self.mock_db_session.execute.return_value = [
+            _row(1, "completed", "new"),
+            _row(2, "completed", "only"),
+        ]
+
+        assert await self.compactor.compact("user_1") == 1
+        assert self._deleted_filters() == [
+            {
+                "must": [{"key": "document_id", "match": {"value": 1}}],
+                "must_not": [{"key": "chunking_session", "match": {"value": "new"}}],
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_deletes_points_of_deleted_documents(self) -> None:
+        """Test points whose document row is gone are removed."""
+        self._points((3, "s"))
+        self.mock_db_session.execute.return_value = []
+
+        assert await self.compactor.compact("user_1") == 1
+        assert self._deleted_filters() == [
+            {"must": [{"key": "document_id", "match": {"value": 3}}]}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_skips_documents_not_safely_swappable(self) -> None:
+        """Test in-progress, failed and unmatched-session documents are untouched."""
+        self._points((1, "a"), (1, "b"), (2, "a"), (2, "b"), (3, "a"), (3, "b"))
+        self.mock_db_session.execute.return_value = [
+            _row(1, "processing", "b"),
+            _row(2, "error", "b"),
+            _row(3, "completed", "c"),
+        ]
+
+        assert await self.compactor.compact("user_1") == 0
+        self.mock_qdrant.delete_by_filter.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_compact_all_continues_after_failure(self) -> None:
+        """Test one failing collection does not stop the scan."""
+        self.mock_qdrant.list_collections.return_value = ["broken", "user_1"]
+        self.mock_qdrant.scroll_payloads.side_effect = [
+            Exception("timeout"),
+            [{"document_id": 3, "chunking_session": "s"}],
+        ]
+        self.mock_db_session.execute.return_value = []
+
+        assert await self.compactor.compact_all() == 1
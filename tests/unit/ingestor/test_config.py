@@ -65,6 +65,35 @@ class TestIngestorSettings:
         assert settings.nats_user is None
         assert settings.nats_password is None
 
+    def test_worker_defaults(self) -> None:
+        """Test pull consumer and worker defaults."""
+        settings = IngestorSettings()
+
+        assert settings.worker_count == 2
+        assert settings.nats_ack_wait == 60.0
+        assert settings.in_progress_interval == 15.0
+        assert settings.in_progress_interval < settings.nats_ack_wait
+
+    def test_in_progress_interval_must_be_below_ack_wait(self) -> None:
+        """Test heartbeats slower than the ack deadline are rejected."""
+        with pytest.raises(ValueError, match="in_progress_interval"):
+            IngestorSettings(nats_ack_wait=30.0, in_progress_interval=30.0)
+
+    def test_memory_admission_defaults(self) -> None:
+        """Test the memory budget follows the container limit by default."""
+        settings = IngestorSettings()
+
+        assert settings.memory_budget_mb == 0
+        assert settings.admission_max_wait == 60.0
+        with pytest.raises(ValueError):
+            IngestorSettings(memory_budget_mb=-1)
+
+    def test_lease_ttl_must_exceed_in_progress_interval(self) -> None:
+        """Test document claims that would expire between renewals are rejected."""
+        assert IngestorSettings().lease_ttl == 120.0
+        with pytest.raises(ValueError, match="lease_ttl"):
+            IngestorSettings(lease_ttl=15.0, in_progress_interval=15.0)
+
     def test_minio_defaults(self) -> None:
         """Test MinIO default configuration."""
         settings = IngestorSettings()
@@ -103,6 +132,73 @@ class TestIngestorSettings:
         # HF token comes from test fixture
         assert settings.hf_access_token == "hf_test_token_for_unit_tests"
 
+    def test_pipeline_defaults(self) -> None:
+        """Test streaming pipeline default configuration."""
+        settings = IngestorSettings()
+
+        assert settings.pipeline_chunk_rows == 16
+        assert settings.pipeline_embed_batch_size == 128
+        assert settings.pipeline_upsert_batch_size == 256
+        assert settings.pipeline_queue_size == 2
+
+    def test_pipeline_queue_size_must_be_positive(self) -> None:
+        """Test pipeline queue size rejects zero (unbounded queues)."""
+        with pytest.raises(ValueError):
+            IngestorSettings(pipeline_queue_size=0)
+
+    def test_download_dir_defaults_to_system_temp(self) -> None:
+        """Test downloads spool to the system temp dir unless configured."""
+        assert IngestorSettings().download_dir == ""
+        assert IngestorSettings(download_dir="/data/spool").download_dir == "/data/spool"
+
+    def test_compaction_interval(self) -> None:
+        """Test compaction runs hourly by default and can be disabled."""
+        assert IngestorSettings().compaction_interval == 3600.0
+        assert IngestorSettings(compaction_interval=0).compaction_interval == 0
+
+        with pytest.raises(ValueError):
+            IngestorSettings(compaction_interval=-1)
+
+    def test_cpu_backend_defaults(self) -> None:
+        """Test extraction runs on threads unless the process pool is enabled."""
+        settings = IngestorSettings()
+
+        assert settings.cpu_backend == "thread"
+        assert settings.cpu_workers == 2
+        assert settings.cpu_spool_dir == ""
+
+    def test_pdf_split_defaults(self) -> None:
+        """Test large PDFs are split into page ranges by default."""
+        settings = IngestorSettings()
+
+        assert settings.pdf_split_threshold == 500
+        assert settings.pdf_split_pages == 100
+        assert settings.pdf_split_concurrency == 0
+
+        with pytest.raises(ValueError):
+            IngestorSettings(pdf_split_pages=0)
+
+    def test_coalesce_window_defaults(self) -> None:
+        """Test cross-document coalescing waits 20ms by default and can be disabled."""
+        assert IngestorSettings().coalesce_window == 0.02
+        assert IngestorSettings(coalesce_window=0).coalesce_window == 0
+
+        with pytest.raises(ValueError):
+            IngestorSettings(coalesce_window=-1)
+
+    def test_extract_cache_validation(self) -> None:
+        """Test the extraction cache is off by default and accepts known backends."""
+        assert IngestorSettings().extract_cache == "none"
+        assert IngestorSettings(extract_cache="MinIO").extract_cache == "minio"
+        with pytest.raises(ValueError, match="Invalid extract cache"):
+            IngestorSettings(extract_cache="redis")
+
+    def test_cpu_backend_validation(self) -> None:
+        """Test CPU backend accepts thread/process only."""
+        assert IngestorSettings(cpu_backend="Process").cpu_backend == "process"
+        with pytest.raises(ValueError, match="Invalid cpu backend"):
+            IngestorSettings(cpu_backend="gpu")
+
     def test_optional_nims_defaults(self) -> None:
         """Test optional NIMs have correct defaults."""
         settings = IngestorSettings()
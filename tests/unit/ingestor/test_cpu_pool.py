@@ -0,0 +1,376 @@
+"""Unit tests for the CPU process pool."""
+
+import asyncio
+import base64
+import contextlib
+import functools
+import multiprocessing
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from ingestor.config import IngestorSettings, reset_settings
+from ingestor.logic import cpu_pool
+from ingestor.logic.cpu_pool import (
+    CpuPool,
+    _extract_in_worker,
+    _rebase_pages,
+    collect_row_texts,
+    get_cpu_pool,
+    init_cpu_pool,
+)
+from ingestor.logic.document_processor import DocumentProcessor
+from ingestor.logic.text_chunker import TextChunk
+
+
+def _thread_backed_pool(tmp_path: Any) -> CpuPool:
+    """Build a CpuPool whose executor is a thread pool (no spawned processes)."""
+    pool = CpuPool.__new__(CpuPool)
+    pool.workers = 1
+    pool.spool_dir = str(tmp_path)
+    pool._executor = ThreadPoolExecutor(max_workers=1)
+    pool._restart_lock = asyncio.Lock()
+    return pool
+
+
+class _BarePool(CpuPool):
+    """CpuPool with real worker processes that skip the nv-ingest warm-up."""
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+class TestCollectRowTexts:
+    """Tests for collect_row_texts."""
+
+    def test_reads_metadata_content_and_skips_blank(self) -> None:
+        """Test row text comes from metadata['content'] and blanks are dropped."""
+        df = pd.DataFrame({
+            "metadata": [
+                {"content": " chunk 1 "},
+                {"content": "   "},
+                {"content_metadata": {"text": "not here"}},
+                {"content": "chunk 2"},
+            ]
+        })
+
+        assert collect_row_texts(df) == ([" chunk 1 ", "chunk 2"], [0, 3])
+
+
+class TestWorkerFunctions:
+    """Tests for functions executed inside worker processes."""
+
+    def test_extract_in_worker_reads_spool_file(self, tmp_path: Any) -> None:
+        """Test the worker rebuilds the ledger content from the spool file."""
+        file_path = tmp_path / "doc.pdf"
+        file_path.write_bytes(b"%PDF raw")
+        seen: dict[str, Any] = {}
+
+        def fake_extractor(df_extraction_ledger: pd.DataFrame, **kwargs: Any) -> pd.DataFrame:
+            seen["content"] = df_extraction_ledger["content"][0]
+            seen["kwargs"] = kwargs
+            return pd.DataFrame({"metadata": [{"content": "page"}], "content": ["copy"]})
+
+        extract_module = MagicMock(extract_primitives_from_pdf_pdfium=fake_extractor)
+        with patch.dict("sys.modules", {"nv_ingest_api.interface.extract": extract_module}):
+            result = _extract_in_worker(
+                "extract_primitives_from_pdf_pdfium",
+                "df_extraction_ledger",
+                pd.DataFrame({"source_id": ["1"]}),
+                str(file_path),
+                {"extract_text": True},
+            )
+
+        assert base64.b64decode(seen["content"]) == b"%PDF raw"
+        assert seen["kwargs"] == {"extract_text": True}
+        # The encoded source is not shipped back to the parent
+        assert "content" not in result.columns
+
+    def test_extract_in_worker_unpacks_tuple_results(self, tmp_path: Any) -> None:
+        """Test (DataFrame, dict) extractor results return the DataFrame."""
+        file_path = tmp_path / "doc.docx"
+        file_path.write_bytes(b"docx")
+        extracted = pd.DataFrame({"metadata": [{"content": "text"}]})
+
+        extract_module = MagicMock(
+            extract_primitives_from_docx=MagicMock(return_value=(extracted, {}))
+        )
+        with patch.dict("sys.modules", {"nv_ingest_api.interface.extract": extract_module}):
+            result = _extract_in_worker(
+                "extract_primitives_from_docx",
+                "df_ledger",
+                pd.DataFrame({"source_id": ["1"]}),
+                str(file_path),
+                {},
+            )
+
+        pd.testing.assert_frame_equal(result, extracted)
+
+    def test_extract_in_worker_slices_page_range(self, tmp_path: Any) -> None:
+        """Test a page range is cut out of the PDF and rebased to document pages."""
+        file_path = tmp_path / "doc.pdf"
+        file_path.write_bytes(b"%PDF full")
+        seen: dict[str, Any] = {}
+
+        def fake_extractor(df_extraction_ledger: pd.DataFrame, **kwargs: Any) -> pd.DataFrame:
+            seen["content"] = df_extraction_ledger["content"][0]
+            return pd.DataFrame({"metadata": [
+                {"content_metadata": {"page_number": 0, "hierarchy": {"page": 0, "page_count": 2}}},
+            ]})
+
+        extract_module = MagicMock(extract_primitives_from_pdf_pdfium=fake_extractor)
+        with patch.dict("sys.modules", {"nv_ingest_api.interface.extract": extract_module}), patch.object(
+            cpu_pool, "_slice_pdf", return_value=b"%PDF slice"
+        ) as slice_pdf:
+            result = _extract_in_worker(
+                "extract_primitives_from_pdf_pdfium",
+                "df_extraction_ledger",
+                pd.DataFrame({"source_id": ["1"]}),
+                str(file_path),
+                {},
+                page_range=(100, 102),
+                page_count=700,
+            )
+
+        slice_pdf.assert_called_once_with(str(file_path), 100, 102)
+        assert base64.b64decode(seen["content"]) == b"%PDF slice"
+        content_metadata = result["metadata"][0]["content_metadata"]
+        assert content_metadata["page_number"] == 100
+        assert content_metadata["hierarchy"] == {"page": 100, "page_count": 700}
+
+    def test_rebase_pages_skips_unpaged_rows(self) -> None:
+        """Test rows without page metadata or with page -1 are left alone."""
+        df = pd.DataFrame({"metadata": [
+            {"content": "no content metadata"},
+            {"content_metadata": {"page_number": -1}},
+        ]})
+
+        _rebase_pages(df, first_page=50, page_count=200)
+
+        assert df["metadata"][0] == {"content": "no content metadata"}
+        assert df["metadata"][1]["content_metadata"]["page_number"] == -1
+
+
+class TestCpuPool:
+    """Tests for CpuPool file handoff."""
+
+    @pytest.mark.asyncio
+    async def test_extract_hands_file_over_and_cleans_up(self, tmp_path: Any) -> None:
+        """Test extract spools raw bytes, drops ledger content and removes the file."""
+        pool = _thread_backed_pool(tmp_path)
+        seen: dict[str, Any] = {}
+
+        def fake_worker(func_name: str, ledger_arg: str, ledger: pd.DataFrame, file_path: str, kwargs: dict, *page_args: Any) -> pd.DataFrame:
+            seen["columns"] = list(ledger.columns)
+            with open(file_path, "rb") as f:
+                seen["bytes"] = f.read()
+            seen["path"] = file_path
+            return pd.DataFrame()
+
+        ledger = pd.DataFrame({"source_id": ["1"], "content": ["YmFzZTY0"]})
+        with patch.object(cpu_pool, "_extract_in_worker", fake_worker):
+            await pool.extract("extract_primitives_from_pdf_pdfium", "df_extraction_ledger", ledger, b"raw", {})
+
+        pool.shutdown()
+        assert seen["bytes"] == b"raw"
+        assert "content" not in seen["columns"]
+        assert os.path.dirname(seen["path"]) == str(tmp_path)
+        assert not os.path.exists(seen["path"])
+
+    @pytest.mark.asyncio
+    async def test_extract_removes_spool_file_on_error(self, tmp_path: Any) -> None:
+        """Test the spool file is removed when extraction fails."""
+        pool = _thread_backed_pool(tmp_path)
+
+        def failing_worker(*args: Any) -> pd.DataFrame:
+            raise RuntimeError("pdfium crashed")
+
+        with patch.object(cpu_pool, "_extract_in_worker", failing_worker):
+            with pytest.raises(RuntimeError):
+                await pool.extract("f", "df_ledger", pd.DataFrame({"a": [1]}), b"raw", {})
+
+        pool.shutdown()
+        assert os.listdir(tmp_path) == []
+
+
+    @pytest.mark.asyncio
+    async def test_extract_reads_existing_file_without_spooling(self, tmp_path: Any) -> None:
+        """Test a given file path is handed to the worker and left in place."""
+        pool = _thread_backed_pool(tmp_path / "spool")
+        source = tmp_path / "download"
+        source.write_bytes(b"raw")
+        seen: dict[str, Any] = {}
+
+        def fake_worker(func_name: str, ledger_arg: str, ledger: pd.DataFrame, file_path: str, kwargs: dict, *page_args: Any) -> pd.DataFrame:
+            seen["path"] = file_path
+            return pd.DataFrame()
+
+        with patch.object(cpu_pool, "_extract_in_worker", fake_worker):
+            await pool.extract("f", "df_ledger", pd.DataFrame({"a": [1]}), b"raw", {}, file_path=str(source))
+
+        pool.shutdown()
+        assert seen["path"] == str(source)
+        assert source.exists()
+
+    @pytest.mark.asyncio
+    async def test_recovers_after_worker_is_killed(self, tmp_path: Any) -> None:
+        """Test a killed worker does not break the calls that come after it."""
+        pool = _BarePool(workers=1, tokenizer="gpt2", spool_dir=str(tmp_path))
+        try:
+            pid = await pool._run(os.getpid)
+            broken = pool._executor
+            os.kill(pid, signal.SIGKILL)
+
+            assert await pool._run(os.getpid) != pid
+            assert pool._executor is not broken
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_call_that_kills_workers_fails_alone(self, tmp_path: Any) -> None:
+        """Test a call that keeps killing its worker fails and leaves a working pool."""
+        pool = _BarePool(workers=1, tokenizer="gpt2", spool_dir=str(tmp_path))
+        try:
+            with pytest.raises(BrokenProcessPool):
+                await pool._run(functools.partial(os._exit, 1))
+
+            assert await pool._run(os.getpid) > 0
+        finally:
+            pool.shutdown()
+
+
+class TestInitCpuPool:
+    """Tests for the global pool lifecycle."""
+
+    def setup_method(self) -> None:
+        """Reset settings."""
+        reset_settings()
+
+    def teardown_method(self) -> None:
+        """Reset settings."""
+        reset_settings()
+
+    @pytest.mark.asyncio
+    async def test_thread_backend_creates_no_pool(self) -> None:
+        """Test the default thread backend leaves the pool unset."""
+        settings = IngestorSettings()
+
+        assert settings.cpu_backend == "thread"
+        assert await init_cpu_pool(settings) is None
+        assert get_cpu_pool() is None
+
+
+class TestDocumentProcessorWithPool:
+    """Tests for DocumentProcessor routing through the pool."""
+
+    def setup_method(self) -> None:
+        """Create processor and a mock pool."""
+        reset_settings()
+        self.processor = DocumentProcessor(IngestorSettings())
+        self.pool = MagicMock()
+        self.pool.extract = AsyncMock(return_value=pd.DataFrame({"metadata": [{}]}))
+        self.chunk = TextChunk(text="chunk", char_start=0, char_end=5)
+        self.pool.chunk = AsyncMock(return_value=[[self.chunk]])
+
+    def teardown_method(self) -> None:
+        """Reset after tests."""
+        reset_settings()
+
+    @pytest.mark.asyncio
+    async def test_pdf_extraction_uses_pool_with_raw_bytes(self) -> None:
+        """Test nv-ingest extractors run in the pool with the raw file bytes."""
+        df = pd.DataFrame({"test": [1]})
+        self.processor._settings.pdf_split_threshold = 0
+        with patch("ingestor.logic.document_processor.get_cpu_pool", return_value=self.pool):
+            await self.processor._extract(df, "application/pdf", document_id=1, file_bytes=b"%PDF")
+
+        func_name, ledger_arg, ledger, file_bytes, kwargs = self.pool.extract.call_args[0]
+        assert self.pool.extract.call_args[1]["file_path"] is None
+        assert func_name == "extract_primitives_from_pdf_pdfium"
+        assert ledger_arg == "df_extraction_ledger"
+        assert file_bytes == b"%PDF"
+        assert kwargs["extract_text"] is True
+
+    @pytest.mark.asyncio
+    async def test_text_extraction_stays_in_process(self) -> None:
+        """Test lightweight text extraction does not use the pool."""
+        with patch("ingestor.logic.document_processor.get_cpu_pool", return_value=self.pool), patch.object(
+            self.processor._chunker,
+            "split",
+            side_effect=lambda text: [TextChunk(text=text, char_start=0, char_end=len(text))],
+        ):
+            chunks, _ = await self.processor.process(
+                file_bytes=b"hello", document_id=1, file_name="a.txt", mime_type="text/plain"
+            )
+
+        self.pool.extract.assert_not_called()
+        self.pool.chunk.assert_not_called()
+        assert [chunk.text for chunk in chunks] == ["hello"]
+
+    @pytest.mark.asyncio
+    async def test_chunking_uses_pool(self) -> None:
+        """Test chunking runs in the pool with the configured settings."""
+        df = pd.DataFrame({"metadata": [{"content": "text"}]})
+        with patch("ingestor.logic.document_processor.get_cpu_pool", return_value=self.pool):
+            chunks = await self.processor._chunk_content(df, document_id=1)
+
+        assert chunks == [self.chunk]
+        texts, rows, kwargs = self.pool.chunk.call_args[0]
+        assert texts == ["text"]
+        assert rows == [0]
+        assert kwargs == self.processor._chunker_kwargs()
+
+    def _split_pool(self, page_count: int) -> MagicMock:
+        """Mock pool that reports a page count and echoes page ranges."""
+        @contextlib.asynccontextmanager
+        async def spool(file_bytes: bytes, file_path: str | None = None) -> Any:
+            yield file_path or "/dev/shm/ingest-1"
+
+        async def extract(*args: Any, page_range: tuple[int, int] | None = None, **kwargs: Any) -> pd.DataFrame:
+            first, last = page_range or (0, page_count)
+            return pd.DataFrame({"metadata": [{"page": page} for page in range(first, last)]})
+
+        self.pool.workers = 2
+        self.pool.spool = spool
+        self.pool.page_count = AsyncMock(return_value=page_count)
+        self.pool.extract = AsyncMock(side_effect=extract)
+        return self.pool
+
+    @pytest.mark.asyncio
+    async def test_large_pdf_is_extracted_in_page_ranges(self) -> None:
+        """Test PDFs over the threshold are split and merged in page order."""
+        settings = self.processor._settings
+        settings.pdf_split_threshold = 10
+        settings.pdf_split_pages = 4
+        pool = self._split_pool(page_count=10)
+
+        with patch("ingestor.logic.document_processor.get_cpu_pool", return_value=pool):
+            result = await self.processor._extract(
+                pd.DataFrame({"source_id": ["1"]}), "application/pdf", document_id=1, file_bytes=b"%PDF"
+            )
+
+        ranges = [call[1]["page_range"] for call in pool.extract.call_args_list]
+        assert ranges == [(0, 4), (4, 8), (8, 10)]
+        assert all(call[1]["page_count"] == 10 for call in pool.extract.call_args_list)
+        assert [row["page"] for row in result["metadata"]] == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_small_pdf_is_extracted_whole(self) -> None:
+        """Test PDFs under the threshold are extracted in a single call."""
+        self.processor._settings.pdf_split_threshold = 10
+        pool = self._split_pool(page_count=9)
+
+        with patch("ingestor.logic.document_processor.get_cpu_pool", return_value=pool):
+            await self.processor._extract(
+                pd.DataFrame({"source_id": ["1"]}), "application/pdf", document_id=1, file_bytes=b"%PDF"
+            )
+
+        pool.extract.assert_called_once()
+        assert "page_range" not in pool.extract.call_args[1]
+        assert pool.extract.call_args[1]["file_path"] == "/dev/shm/ingest-1"
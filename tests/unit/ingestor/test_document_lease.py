@@ -0,0 +1,111 @@
+"""Unit tests for the per-document processing lease."""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ingestor.logic.document_lease import DocumentLease
+from ingestor.logic.exceptions import DatabaseError, DocumentLeasedError
+
+
+def _document(status: str = "pending", session: str | None = None) -> SimpleNamespace:
+    """Build a document row."""
+    return SimpleNamespace(id=7, status=status, chunking_session=session, signature="sha-1")
+
+
+def _result(rowcount: int, last_update: datetime | None = None) -> MagicMock:
+    """Build an execute() result."""
+    result = MagicMock()
+    result.rowcount = rowcount
+    result.scalar_one_or_none.return_value = last_update
+    return result
+
+
+class TestDocumentLease:
+    """Tests for DocumentLease."""
+
+    def setup_method(self) -> None:
+        """Create a lease and a mock session."""
+        self.session = AsyncMock()
+        self.lease = DocumentLease(_document(), "session-2", ttl=120.0)
+
+    def test_already_completed_in_same_session(self) -> None:
+        """Test only a completed row of the same session is skipped."""
+        assert self.lease.already_completed(_document("completed", "session-2"))
+        assert not self.lease.already_completed(_document("completed", "session-1"))
+        assert not self.lease.already_completed(_document("processing", "session-2"))
+
+    @pytest.mark.asyncio
+    async def test_acquire_commits_claim(self) -> None:
+        """Test a successful claim is committed for other workers to see."""
+        self.session.execute.return_value = _result(1)
+
+        await self.lease.acquire(self.session)
+
+        self.session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_acquire_held_claim_raises_with_remaining_time(self) -> None:
+        """Test a fresh claim by another worker defers the message."""
+        held_since = datetime.now(timezone.utc) - timedelta(seconds=20)
+        self.session.execute.side_effect = [_result(0), _result(0, held_since)]
+
+        with pytest.raises(DocumentLeasedError) as exc_info:
+            await self.lease.acquire(self.session)
+
+        assert exc_info.value.document_id == 7
+        assert 95.0 < exc_info.value.retry_after <= 100.0
+        self.session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_acquire_database_failure(self) -> None:
+        """Test database errors are wrapped."""
+        self.session.execute.side_effect = Exception("connection lost")
+
+        with pytest.raises(DatabaseError):
+            await self.lease.acquire(self.session)
+
+    @pytest.mark.asyncio
+    async def test_renew_reports_lost_claim(self) -> None:
+        """Test renewal notices when the row is no longer ours."""
+        self.session.execute.return_value = _result(1)
+        assert await self.lease.renew(self.session) is True
+
+        self.session.execute.return_value = _result(0)
+        assert await self.lease.renew(self.session) is False
+
+    @pytest.mark.asyncio
+    async def test_complete_requires_unchanged_signature(self) -> None:
+        """Test completion is conditional on the claimed signature."""
+        self.session.execute.return_value = _result(1)
+        assert await self.lease.complete(self.session, chunk_count=3) is True
+
+        statement = str(self.session.execute.call_args[0][0])
+        assert "signature IS NOT DISTINCT FROM" in statement
+
+        self.session.execute.return_value = _result(0)
+        assert await self.lease.complete(self.session, chunk_count=3) is False
+
+    @pytest.mark.asyncio
+    async def test_fail_only_while_claim_held(self) -> None:
+        """Test a failure is recorded only on a row this run still owns."""
+        self.session.execute.return_value = _result(1)
+        assert await self.lease.fail(self.session, "boom") is True
+
+        statement = str(self.session.execute.call_args[0][0])
+        assert "documents.status =" in statement
+        assert "documents.chunking_session =" in statement
+        assert "signature IS NOT DISTINCT FROM" in statement
+
+        self.session.execute.return_value = _result(0)
+        assert await self.lease.fail(self.session, "boom") is False
+
+    @pytest.mark.asyncio
+    async def test_fail_database_failure(self) -> None:
+        """Test database errors are wrapped."""
+        self.session.execute.side_effect = Exception("connection lost")
+
+        with pytest.raises(DatabaseError):
+            await self.lease.fail(self.session, "boom")
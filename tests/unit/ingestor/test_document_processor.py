@@ -14,6 +14,7 @@ from ingestor.logic.exceptions import (
     PDFExtractionError,
     UnsupportedMimeTypeError,
 )
+from ingestor.logic.text_chunker import TextChunk
 
 
 class TestDocumentProcessor:
@@ -155,104 +156,38 @@ class TestDocumentProcessor:
     # Text extraction tests
     # ==========================================
 
-    def test_extract_text_basic(self) -> None:
-        """Test _extract_text extracts plain text to both metadata fields."""
-        import base64
-
-        content = "Hello, World!"
-        encoded = base64.b64encode(content.encode()).decode()
-
-        df = pd.DataFrame({
-            "content": [encoded],
-            "metadata": [{"content_metadata": {}}],
-        })
-
-        result = self.processor._extract_text(df)
-
-        meta = result.iloc[0]["metadata"]
-        # Must be in metadata["content"] for nv-ingest chunker
-        assert meta["content"] == content
-        # Also in content_metadata["text"] for consistency
-        assert meta["content_metadata"]["text"] == content
-
-    def test_extract_text_handles_unicode(self) -> None:
-        """Test _extract_text handles UTF-8 content."""
-        import base64
-
+    def test_decode_text_basic(self) -> None:
+        """Test _decode_text decodes UTF-8 text."""
         content = "Hello, \u4e16\u754c!"  # "Hello, 世界!"
-        encoded = base64.b64encode(content.encode("utf-8")).decode()
-
-        df = pd.DataFrame({
-            "content": [encoded],
-            "metadata": [{"content_metadata": {}}],
-        })
-
-        result = self.processor._extract_text(df)
 
-        text = result.iloc[0]["metadata"]["content_metadata"]["text"]
-        assert content in text
+        assert self.processor._decode_text(content.encode("utf-8")) == content
 
-    def test_extract_text_fallback_to_latin1(self) -> None:
-        """Test _extract_text falls back to latin-1 encoding."""
-        import base64
-
-        # Create content that's valid latin-1 but not UTF-8
-        content = bytes([0xe0, 0xe1, 0xe2])  # Latin-1 specific chars
-        encoded = base64.b64encode(content).decode()
+    def test_decode_text_fallback_to_latin1(self) -> None:
+        """Test _decode_text falls back to latin-1 encoding."""
+        # Content that's valid latin-1 but not UTF-8
+        content = bytes([0xe0, 0xe1, 0xe2])
 
-        df = pd.DataFrame({
-            "content": [encoded],
-            "metadata": [{"content_metadata": {}}],
-        })
-
-        # Should not raise, should fall back to latin-1
-        result = self.processor._extract_text(df)
-        meta = result.iloc[0]["metadata"]
-        assert "text" in meta["content_metadata"]
-        # metadata["content"] must also be set for chunker
-        assert "content" in meta
-        assert len(meta["content"]) > 0
+        assert self.processor._decode_text(content) == "\xe0\xe1\xe2"
 
     # ==========================================
     # HTML extraction tests
     # ==========================================
 
-    def test_extract_html_removes_script_tags(self) -> None:
-        """Test _extract_html removes script elements and sets both fields."""
-        import base64
-
-        html = "<html><body><script>alert('xss')</script><p>Hello</p></body></html>"
-        encoded = base64.b64encode(html.encode()).decode()
+    def test_html_to_text_removes_script_tags(self) -> None:
+        """Test _html_to_text removes script elements."""
+        html = b"<html><body><script>alert('xss')</script><p>Hello</p></body></html>"
 
-        df = pd.DataFrame({
-            "content": [encoded],
-            "metadata": [{"content_metadata": {}}],
-        })
+        text = self.processor._html_to_text(html)
 
-        result = self.processor._extract_html(df)
-
-        meta = result.iloc[0]["metadata"]
-        text = meta["content_metadata"]["text"]
         assert "alert" not in text
         assert "Hello" in text
-        # metadata["content"] must also be set for nv-ingest chunker
-        assert meta["content"] == text
 
-    def test_extract_html_removes_style_tags(self) -> None:
-        """Test _extract_html removes style elements."""
-        import base64
+    def test_html_to_text_removes_style_tags(self) -> None:
+        """Test _html_to_text removes style elements."""
+        html = b"<html><head><style>body{color:red}</style></head><body>Content</body></html>"
 
-        html = "<html><head><style>body{color:red}</style></head><body>Content</body></html>"
-        encoded = base64.b64encode(html.encode()).decode()
-
-        df = pd.DataFrame({
-            "content": [encoded],
-            "metadata": [{"content_metadata": {}}],
-        })
+        text = self.processor._html_to_text(html)
 
-        result = self.processor._extract_html(df)
-
-        text = result.iloc[0]["metadata"]["content_metadata"]["text"]
         assert "color:red" not in text
         assert "Content" in text
 
@@ -394,6 +329,26 @@ class TestDocumentProcessor:
                 assert kwargs["extract_images"] is False
                 assert kwargs["extract_infographics"] is False
 
+    @pytest.mark.asyncio
+    async def test_extract_pdf_encodes_deferred_content_in_process(self) -> None:
+        """Test in-process nv-ingest extraction gets base64 content from file_bytes."""
+        mock_fn = MagicMock(return_value=pd.DataFrame())
+        with patch.dict(
+            "sys.modules",
+            {"nv_ingest_api": MagicMock(), "nv_ingest_api.interface": MagicMock(), "nv_ingest_api.interface.extract": MagicMock()},
+        ):
+            with patch(
+                "nv_ingest_api.interface.extract.extract_primitives_from_pdf_pdfium",
+                mock_fn,
+            ):
+                df = self.processor._build_dataframe(
+                    b"%PDF", 1, "a.pdf", "application/pdf", encode_content=False
+                )
+                await self.processor._extract(df, "application/pdf", document_id=1, file_bytes=b"%PDF")
+
+                ledger = mock_fn.call_args[1]["df_extraction_ledger"]
+                assert ledger["content"][0] == "JVBERg=="
+
     @pytest.mark.asyncio
     async def test_extract_pdf_passes_correct_kwargs_yolox_enabled(self) -> None:
         """Test PDF extraction with yolox_enabled=True enables all flags."""
@@ -708,108 +663,50 @@ class TestDocumentProcessor:
 
     @pytest.mark.asyncio
     async def test_chunk_content_extracts_text_from_metadata(self) -> None:
-        """Test chunking extracts text from metadata['content'].
+        """Test chunking reads text from metadata['content'].
 
-        nv-ingest stores chunk text in metadata['content'], NOT in
+        nv-ingest stores extracted text in metadata['content'], NOT in
         metadata['content_metadata']['text'].
         """
-        nv_ingest = pytest.importorskip("nv_ingest_api", reason="nv_ingest_api not installed")
-
-        # Mock matches real nv-ingest chunker output: text in metadata["content"]
-        with patch(
-            "nv_ingest_api.interface.transform.transform_text_split_and_tokenize"
-        ) as mock_transform:
-            mock_transform.return_value = pd.DataFrame({
-                "metadata": [
-                    {"content": "chunk 1", "content_metadata": {"type": "text"}},
-                    {"content": "chunk 2", "content_metadata": {"type": "text"}},
-                    {"content": "  ", "content_metadata": {"type": "text"}},  # Empty, should be filtered
-                ]
-            })
+        df = pd.DataFrame({
+            "metadata": [
+                {"content": "page 1", "content_metadata": {"type": "text"}},
+                {"content": "  ", "content_metadata": {"type": "text"}},  # Blank, filtered
+                {"content": "page 3", "content_metadata": {"type": "text"}},
+            ]
+        })
+        per_row = [
+            [TextChunk(text="page 1", char_start=0, char_end=6, source_index=0)],
+            [TextChunk(text="page 3", char_start=0, char_end=6, source_index=2)],
+        ]
 
-            df = pd.DataFrame({"test": [1]})
+        with patch.object(self.processor._chunker, "split_batch", return_value=per_row) as split_batch:
             result = await self.processor._chunk_content(df, document_id=1)
 
-            assert result == ["chunk 1", "chunk 2"]
-
-    @pytest.mark.asyncio
-    async def test_chunk_content_uses_settings(self) -> None:
-        """Test chunking uses settings for size and overlap."""
-        nv_ingest = pytest.importorskip("nv_ingest_api", reason="nv_ingest_api not installed")
-
-        with patch(
-            "nv_ingest_api.interface.transform.transform_text_split_and_tokenize"
-        ) as mock_transform:
-            mock_transform.return_value = pd.DataFrame()
-
-            df = pd.DataFrame({"test": [1]})
-            await self.processor._chunk_content(df, document_id=1)
-
-            # Verify settings were passed
-            call_kwargs = mock_transform.call_args[1]
-            assert call_kwargs["chunk_size"] == self.settings.chunk_size
-            assert call_kwargs["chunk_overlap"] == self.settings.chunk_overlap
-            assert call_kwargs["tokenizer"] == self.settings.tokenizer
-
-    @pytest.mark.asyncio
-    async def test_chunk_content_passes_hf_token_when_set(self) -> None:
-        """Test chunking passes hugging_face_access_token (not 'params') when token is set.
-
-        The nv-ingest-api function signature uses hugging_face_access_token
-        as a direct kwarg, NOT a 'params' dict. This test prevents regression
-        of the wrong kwarg name being used.
-        """
-        nv_ingest = pytest.importorskip("nv_ingest_api", reason="nv_ingest_api not installed")
-
-        with patch(
-            "nv_ingest_api.interface.transform.transform_text_split_and_tokenize"
-        ) as mock_transform:
-            mock_transform.return_value = pd.DataFrame()
-
-            with patch.object(self.processor._settings, "hf_access_token", "hf_test_token"):
-                df = pd.DataFrame({"test": [1]})
-                await self.processor._chunk_content(df, document_id=1)
-
-                call_kwargs = mock_transform.call_args[1]
-                # Must use hugging_face_access_token, NOT params
-                assert "hugging_face_access_token" in call_kwargs
-                assert call_kwargs["hugging_face_access_token"] == "hf_test_token"
-                assert "params" not in call_kwargs
+        split_batch.assert_called_once_with(["page 1", "page 3"], [0, 2])
+        assert [chunk.text for chunk in result] == ["page 1", "page 3"]
+        assert [chunk.source_index for chunk in result] == [0, 2]
 
-    @pytest.mark.asyncio
-    async def test_chunk_content_omits_hf_token_when_none(self) -> None:
-        """Test chunking does NOT pass hugging_face_access_token when token is None.
-
-        When no HF token is configured (models are pre-cached at Docker build
-        time), the kwarg should be omitted entirely to let nv-ingest-api
-        use its default.
-        """
-        nv_ingest = pytest.importorskip("nv_ingest_api", reason="nv_ingest_api not installed")
+    def test_chunker_kwargs_use_settings(self) -> None:
+        """Test the chunker is configured from settings."""
+        with patch.object(self.processor._settings, "hf_access_token", "hf_test_token"):
+            kwargs = self.processor._chunker_kwargs()
 
-        with patch(
-            "nv_ingest_api.interface.transform.transform_text_split_and_tokenize"
-        ) as mock_transform:
-            mock_transform.return_value = pd.DataFrame()
-
-            with patch.object(self.processor._settings, "hf_access_token", None):
-                df = pd.DataFrame({"test": [1]})
-                await self.processor._chunk_content(df, document_id=1)
-
-                call_kwargs = mock_transform.call_args[1]
-                assert "hugging_face_access_token" not in call_kwargs
-                assert "params" not in call_kwargs
+        assert kwargs == {
+            "tokenizer": self.settings.tokenizer,
+            "chunk_size": self.settings.chunk_size,
+            "chunk_overlap": self.settings.chunk_overlap,
+            "hf_access_token": "hf_test_token",
+        }
 
     @pytest.mark.asyncio
     async def test_chunk_content_raises_chunking_error(self) -> None:
         """Test chunking raises ChunkingError on failure."""
-        nv_ingest = pytest.importorskip("nv_ingest_api", reason="nv_ingest_api not installed")
+        df = pd.DataFrame({"metadata": [{"content": "text"}]})
 
-        with patch(
-            "nv_ingest_api.interface.transform.transform_text_split_and_tokenize",
-            side_effect=Exception("tokenizer failed"),
+        with patch.object(
+            self.processor._chunker, "split_batch", side_effect=Exception("tokenizer failed")
         ):
-            df = pd.DataFrame({"test": [1]})
-
             with pytest.raises(ChunkingError) as exc_info:
                 await self.processor._chunk_content(df, document_id=123)
 
@@ -832,20 +729,11 @@ class TestDocumentProcessorIntegration:
     @pytest.mark.asyncio
     async def test_process_text_file_end_to_end(self) -> None:
         """Test full processing of a text file."""
-        nv_ingest = pytest.importorskip("nv_ingest_api", reason="nv_ingest_api not installed")
-
         content = "This is a test document with some content for chunking."
 
-        # Mock the chunking function — nv-ingest puts text in metadata["content"]
-        with patch(
-            "nv_ingest_api.interface.transform.transform_text_split_and_tokenize"
-        ) as mock_transform:
-            mock_transform.return_value = pd.DataFrame({
-                "metadata": [
-                    {"content": content, "content_metadata": {"type": "text"}},
-                ]
-            })
-
+        # Text files are chunked by the resident chunker, not nv-ingest
+        chunk = TextChunk(text=content, char_start=0, char_end=len(content), token_count=10)
+        with patch.object(self.processor._chunker, "split", return_value=[chunk]) as split:
             chunks, images = await self.processor.process(
                 file_bytes=content.encode(),
                 document_id=1,
@@ -853,10 +741,54 @@ class TestDocumentProcessorIntegration:
                 mime_type="text/plain",
             )
 
+            split.assert_called_once_with(content)
             assert len(chunks) == 1
-            assert chunks[0] == content
+            assert chunks[0].text == content
             assert images == []  # No structured images for text
 
+    @pytest.mark.asyncio
+    async def test_process_text_bypasses_dataframe(self) -> None:
+        """Test text and HTML never build a DataFrame or call nv-ingest."""
+        with patch.object(self.processor, "_build_dataframe") as build, patch.object(
+            self.processor, "_extract"
+        ) as extract, patch.object(
+            self.processor, "_chunk_content"
+        ) as chunk_content, patch.object(
+            self.processor._chunker,
+            "split",
+            side_effect=lambda text: [TextChunk(text=text, char_start=0, char_end=len(text))],
+        ):
+            md_chunks, _ = await self.processor.process(
+                file_bytes=b"# Meeting\n\nAgenda",
+                document_id=1,
+                file_name="event.md",
+                mime_type="text/markdown",
+            )
+            html_chunks, _ = await self.processor.process(
+                file_bytes=b"<html><script>x()</script><p>Hello</p></html>",
+                document_id=2,
+                file_name="page.html",
+                mime_type="text/html",
+            )
+
+        build.assert_not_called()
+        extract.assert_not_called()
+        chunk_content.assert_not_called()
+        assert [chunk.text for chunk in md_chunks] == ["# Meeting\n\nAgenda"]
+        assert "Hello" in html_chunks[0].text and "x()" not in html_chunks[0].text
+
+    @pytest.mark.asyncio
+    async def test_process_text_chunking_error(self) -> None:
+        """Test chunker failures on the fast path raise ChunkingError."""
+        with patch.object(self.processor._chunker, "split", side_effect=OSError("no tokenizer")):
+            with pytest.raises(ChunkingError):
+                await self.processor.process(
+                    file_bytes=b"text",
+                    document_id=1,
+                    file_name="a.txt",
+                    mime_type="text/plain",
+                )
+
     @pytest.mark.asyncio
     async def test_process_returns_tuple(self) -> None:
         """Test process returns (chunks, images) tuple."""
@@ -875,3 +807,93 @@ class TestDocumentProcessorIntegration:
                     chunks, images = result
                     assert isinstance(chunks, list)
                     assert isinstance(images, list)
+
+    @pytest.mark.asyncio
+    async def test_process_stream_defers_base64_encoding(self) -> None:
+        """Test the ledger is built without content; the file goes to _extract as-is."""
+        extract = AsyncMock(return_value=pd.DataFrame())
+
+        with patch.object(self.processor, "_extract", new=extract):
+            async for _ in self.processor.process_stream(
+                file_bytes=b"%PDF",
+                document_id=1,
+                file_name="test.pdf",
+                mime_type="application/pdf",
+                file_path="/tmp/ingest-1",
+            ):
+                pass
+
+        df = extract.call_args[0][0]
+        assert df["content"][0] is None
+        assert extract.call_args[1] == {"file_bytes": b"%PDF", "file_path": "/tmp/ingest-1"}
+
+    @pytest.mark.asyncio
+    async def test_process_stream_chunks_rows_in_groups(self) -> None:
+        """Test process_stream chunks pipeline_chunk_rows extracted rows at a time."""
+        self.settings.pipeline_chunk_rows = 2
+        extracted = pd.DataFrame({"metadata": [{"page": i} for i in range(5)]})
+
+        async def chunk_content(df: pd.DataFrame, document_id: int) -> list[str]:
+            return [f"page-{row['page']}" for row in df["metadata"]]
+
+        with patch.object(self.processor, "_extract", return_value=extracted):
+            with patch.object(self.processor, "_chunk_content", side_effect=chunk_content):
+                groups = [
+                    chunks
+                    async for chunks, _ in self.processor.process_stream(
+                        file_bytes=b"test",
+                        document_id=1,
+                        file_name="test.pdf",
+                        mime_type="application/pdf",
+                    )
+                ]
+
+        assert groups == [["page-0", "page-1"], ["page-2", "page-3"], ["page-4"]]
+
+    @pytest.mark.asyncio
+    async def test_process_stream_caches_chunks(self) -> None:
+        """Test chunks are stored after a miss and served from the cache after."""
+        cache = MagicMock()
+        cache.key = AsyncMock(return_value="key")
+        cache.get = AsyncMock(return_value=None)
+        cache.put = AsyncMock()
+        processor = DocumentProcessor(self.settings, cache=cache)
+        chunk = TextChunk(text="hello", char_start=0, char_end=5)
+
+        with patch.object(processor._chunker, "split", return_value=[chunk]):
+            chunks, _ = await processor.process(
+                file_bytes=b"hello", document_id=1, file_name="a.txt", mime_type="text/plain"
+            )
+
+        cache.key.assert_called_once_with(b"hello", "text/plain")
+        cache.put.assert_called_once_with("key", [chunk])
+        assert chunks == [chunk]
+
+        cache.get.return_value = [chunk]
+        with patch.object(processor, "_extract_and_chunk") as extract_and_chunk:
+            chunks, _ = await processor.process(
+                file_bytes=b"hello", document_id=2, file_name="b.txt", mime_type="text/plain"
+            )
+
+        extract_and_chunk.assert_not_called()
+        assert chunks == [chunk]
+        cache.put.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_process_stream_does_not_cache_structured_images(self) -> None:
+        """Test documents with structured images are not cached."""
+        cache = MagicMock()
+        cache.key = AsyncMock(return_value="key")
+        cache.get = AsyncMock(return_value=None)
+        cache.put = AsyncMock()
+        processor = DocumentProcessor(self.settings, cache=cache)
+        chunk = TextChunk(text="table", char_start=0, char_end=5)
+
+        with patch.object(processor, "_extract", return_value=pd.DataFrame({"metadata": [{}]})), patch.object(
+            processor, "_chunk_content", return_value=[chunk]
+        ), patch.object(processor, "_extract_structured_images", return_value=[b"png"]):
+            await processor.process(
+                file_bytes=b"%PDF", document_id=1, file_name="a.pdf", mime_type="application/pdf"
+            )
+
+        cache.put.assert_not_called()
@@ -149,6 +149,38 @@ class TestEmbedderClient:
                 # Should only call gRPC once due to caching
                 assert mock_stub.GetDimension.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_get_model_id_returns_served_model(self) -> None:
+        """Test the model resolved by the embedder is reported, and cached with the dimension."""
+        mock_stub = MagicMock()
+        mock_stub.GetDimension = AsyncMock(return_value=MagicMock(dimension=768, model_id="default-model"))
+
+        with patch("grpc.aio.insecure_channel") as mock_channel:
+            mock_channel.return_value = MagicMock()
+            with patch(
+                "ingestor.grpc.embedder_client.EmbedServiceStub",
+                return_value=mock_stub,
+            ):
+                assert await self.client.get_model_id() == "default-model"
+                await self.client.get_dimension()
+
+        assert mock_stub.GetDimension.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_model_id_falls_back_to_requested_model(self) -> None:
+        """Test an embedder that reports no model ID falls back to the requested name."""
+        client = EmbedderClient(host="localhost", port=50051, model="requested-model")
+        mock_stub = MagicMock()
+        mock_stub.GetDimension = AsyncMock(return_value=MagicMock(dimension=768, model_id=""))
+
+        with patch("grpc.aio.insecure_channel") as mock_channel:
+            mock_channel.return_value = MagicMock()
+            with patch(
+                "ingestor.grpc.embedder_client.EmbedServiceStub",
+                return_value=mock_stub,
+            ):
+                assert await client.get_model_id() == "requested-model"
+
     @pytest.mark.asyncio
     async def test_get_dimension_raises_grpc_error(self) -> None:
         """Test get_dimension raises GrpcError on failure."""
@@ -233,6 +265,27 @@ class TestEmbedderClient:
 
                 assert len(result) == 3
 
+    @pytest.mark.asyncio
+    async def test_embed_texts_uses_bulk_priority(self) -> None:
+        """Test embed_texts marks ingestion requests as bulk."""
+        from echomind_lib.models.internal.embedding_pb2 import EMBED_PRIORITY_BULK
+
+        mock_stub = MagicMock()
+        mock_response = MagicMock()
+        mock_response.embeddings = [MagicMock(vector=[0.1])]
+        mock_stub.Embed = AsyncMock(return_value=mock_response)
+
+        with patch("grpc.aio.insecure_channel") as mock_channel:
+            mock_channel.return_value = MagicMock()
+            with patch(
+                "ingestor.grpc.embedder_client.EmbedServiceStub",
+                return_value=mock_stub,
+            ):
+                await self.client.embed_texts(["hello"])
+
+        request = mock_stub.Embed.call_args[0][0]
+        assert request.priority == EMBED_PRIORITY_BULK
+
     @pytest.mark.asyncio
     async def test_embed_texts_passes_document_id(self) -> None:
         """Test embed_texts logs document_id."""
@@ -363,6 +416,204 @@ class TestEmbedderClient:
         with patch.object(self.client, "embed_texts", return_value=[]):
             await self.client.embed_batch(["test"])
 
+    # ==========================================
+    # embed_stream tests
+    # ==========================================
+
+    @staticmethod
+    def _stream_stub(sent: list, max_seen: list) -> MagicMock:
+        """Create a stub whose EmbedStream echoes one vector per text."""
+
+        def embed_stream(request_iterator, timeout=None):
+            async def responses():
+                pending = []
+                async for request in request_iterator:
+                    sent.append(request)
+                    pending.append(request)
+                    max_seen[0] = max(max_seen[0], len(pending))
+                    # Answer once the window is full so the client must wait
+                    if len(pending) == 2:
+                        for req in pending:
+                            yield MagicMock(
+                                batch_id=req.batch_id,
+                                embeddings=[MagicMock(vector=[float(len(t))]) for t in req.texts],
+                            )
+                        pending.clear()
+                for req in reversed(pending):
+                    yield MagicMock(
+                        batch_id=req.batch_id,
+                        embeddings=[MagicMock(vector=[float(len(t))]) for t in req.texts],
+                    )
+
+            return responses()
+
+        stub = MagicMock()
+        stub.EmbedStream = MagicMock(side_effect=embed_stream)
+        return stub
+
+    @pytest.mark.asyncio
+    async def test_embed_stream_orders_and_bounds_in_flight(self) -> None:
+        """Test embed_stream keeps at most max_in_flight batches and restores order."""
+        client = EmbedderClient(host="localhost", port=50051, max_in_flight=2)
+        sent: list = []
+        max_seen = [0]
+        mock_stub = self._stream_stub(sent, max_seen)
+
+        with patch("grpc.aio.insecure_channel") as mock_channel:
+            mock_channel.return_value = MagicMock()
+            with patch(
+                "ingestor.grpc.embedder_client.EmbedServiceStub",
+                return_value=mock_stub,
+            ):
+                result = await client.embed_stream(
+                    ["a", "bb", "ccc", "dddd", "eeeee"],
+                    batch_size=1,
+                )
+
+        assert result == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+        assert [r.batch_id for r in sent] == [0, 1, 2, 3, 4]
+        assert max_seen[0] <= 2
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_uses_stream_when_enabled(self) -> None:
+        """Test embed_batch sends batches over EmbedStream when enabled."""
+        client = EmbedderClient(host="localhost", port=50051, stream_enabled=True)
+        mock_stub = self._stream_stub([], [0])
+        mock_stub.Embed = AsyncMock()
+
+        with patch("grpc.aio.insecure_channel") as mock_channel:
+            mock_channel.return_value = MagicMock()
+            with patch(
+                "ingestor.grpc.embedder_client.EmbedServiceStub",
+                return_value=mock_stub,
+            ):
+                result = await client.embed_batch(["a", "bb", "ccc"], batch_size=2)
+
+        assert result == [[1.0], [2.0], [3.0]]
+        mock_stub.Embed.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_falls_back_when_stream_unimplemented(self) -> None:
+        """Test embed_batch falls back to unary Embed on UNIMPLEMENTED."""
+        client = EmbedderClient(host="localhost", port=50051, stream_enabled=True)
+
+        with patch.object(
+            client,
+            "embed_stream",
+            side_effect=GrpcError("embedder", "Method not found", code="UNIMPLEMENTED"),
+        ), patch.object(client, "embed_texts", return_value=[[0.1]]) as mock_embed:
+            result = await client.embed_batch(["test"])
+
+        assert result == [[0.1]]
+        mock_embed.assert_called_once()
+        assert client._stream_enabled is False
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_stream_error_propagates(self) -> None:
+        """Test non-UNIMPLEMENTED stream errors are not retried as unary."""
+        client = EmbedderClient(host="localhost", port=50051, stream_enabled=True)
+
+        with patch.object(
+            client,
+            "embed_stream",
+            side_effect=GrpcError("embedder", "down", code="UNAVAILABLE"),
+        ), patch.object(client, "embed_texts") as mock_embed:
+            with pytest.raises(GrpcError):
+                await client.embed_batch(["test"])
+
+        mock_embed.assert_not_called()
+
+    # ==========================================
+    # packed vector encoding tests
+    # ==========================================
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_packed_returns_matrix(self) -> None:
+        """Test packed batches are joined into one float32 matrix."""
+        import numpy as np
+
+        from echomind_lib.helpers.vector_codec import pack_matrix
+        from echomind_lib.models.internal.embedding_pb2 import (
+            VECTOR_ENCODING_FLOAT32,
+            EmbedResponse,
+        )
+
+        client = EmbedderClient(
+            host="localhost",
+            port=50051,
+            vector_encoding=VECTOR_ENCODING_FLOAT32,
+        )
+        mock_stub = MagicMock()
+        mock_stub.Embed = AsyncMock(side_effect=[
+            EmbedResponse(matrix=pack_matrix([[1.0, 2.0], [3.0, 4.0]], VECTOR_ENCODING_FLOAT32)),
+            EmbedResponse(matrix=pack_matrix([[5.0, 6.0]], VECTOR_ENCODING_FLOAT32)),
+        ])
+
+        with patch("grpc.aio.insecure_channel") as mock_channel:
+            mock_channel.return_value = MagicMock()
+            with patch(
+                "ingestor.grpc.embedder_client.EmbedServiceStub",
+                return_value=mock_stub,
+            ):
+                result = await client.embed_batch(["a", "b", "c"], batch_size=2)
+
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+        request = mock_stub.Embed.call_args[0][0]
+        assert request.encoding == VECTOR_ENCODING_FLOAT32
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_packed_float16_widened(self) -> None:
+        """Test float16 matrices are widened to float32 for Qdrant."""
+        import numpy as np
+
+        from echomind_lib.helpers.vector_codec import pack_matrix
+        from echomind_lib.models.internal.embedding_pb2 import (
+            VECTOR_ENCODING_FLOAT16,
+            EmbedResponse,
+        )
+
+        client = EmbedderClient(
+            host="localhost",
+            port=50051,
+            vector_encoding=VECTOR_ENCODING_FLOAT16,
+        )
+        mock_stub = MagicMock()
+        mock_stub.Embed = AsyncMock(
+            return_value=EmbedResponse(matrix=pack_matrix([[0.5, 0.25]], VECTOR_ENCODING_FLOAT16))
+        )
+
+        with patch("grpc.aio.insecure_channel") as mock_channel:
+            mock_channel.return_value = MagicMock()
+            with patch(
+                "ingestor.grpc.embedder_client.EmbedServiceStub",
+                return_value=mock_stub,
+            ):
+                result = await client.embed_texts(["a"])
+
+        assert result.dtype == np.float32
+        assert result.tolist() == [[0.5, 0.25]]
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_sends_model(self) -> None:
+        """Test the configured model is sent with embed and dimension requests."""
+        client = EmbedderClient(host="localhost", port=50051, model="new-model")
+        mock_stub = MagicMock()
+        mock_stub.Embed = AsyncMock(return_value=MagicMock(embeddings=[MagicMock(vector=[0.1])]))
+        mock_stub.GetDimension = AsyncMock(return_value=MagicMock(dimension=8, model_id="new-model"))
+
+        with patch("grpc.aio.insecure_channel") as mock_channel:
+            mock_channel.return_value = MagicMock()
+            with patch(
+                "ingestor.grpc.embedder_client.EmbedServiceStub",
+                return_value=mock_stub,
+            ):
+                await client.embed_texts(["a"])
+                await client.get_dimension()
+
+        assert mock_stub.Embed.call_args[0][0].model == "new-model"
+        assert mock_stub.GetDimension.call_args[0][0].model == "new-model"
+
     # ==========================================
     # close tests
     # ==========================================
@@ -6,6 +6,7 @@ from ingestor.logic.exceptions import (
     AudioExtractionError,
     ChunkingError,
     DatabaseError,
+    DocumentLeasedError,
     DocumentNotFoundError,
     EmbeddingError,
     ExtractionError,
@@ -171,6 +172,17 @@ class TestHandleIngestorError:
         assert result["retry_after"] == 5.0
         assert result["details"]["operation"] == "select"
 
+    @pytest.mark.asyncio
+    async def test_document_leased_error_retries_after_claim(self) -> None:
+        """Test DocumentLeasedError is retried once the other claim can expire."""
+        error = DocumentLeasedError(document_id=7, retry_after=42.0)
+
+        result = await handle_ingestor_error(error)
+
+        assert result["should_retry"] is True
+        assert result["retry_after"] == 42.0
+        assert result["details"]["document_id"] == 7
+
     @pytest.mark.asyncio
     async def test_grpc_error_should_retry(self) -> None:
         """Test GrpcError should retry (service unavailable)."""
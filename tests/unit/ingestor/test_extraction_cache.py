@@ -0,0 +1,133 @@
+"""Unit tests for the extraction cache."""
+
+import os
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ingestor.config import IngestorSettings, reset_settings
+from ingestor.logic.extraction_cache import ExtractionCache
+from ingestor.logic.text_chunker import TextChunk
+
+CHUNKS = [
+    TextChunk(text="first", char_start=0, char_end=5, token_count=1, source_index=0),
+    TextChunk(text="second", char_start=6, char_end=12, token_count=1, source_index=2),
+]
+
+
+class TestExtractionCache:
+    """Tests for ExtractionCache."""
+
+    def setup_method(self) -> None:
+        """Reset settings."""
+        reset_settings()
+
+    def teardown_method(self) -> None:
+        """Reset settings."""
+        reset_settings()
+
+    def test_disabled_by_default(self) -> None:
+        """Test no cache is built unless a backend is configured."""
+        assert ExtractionCache.from_settings(IngestorSettings()) is None
+
+    @pytest.mark.asyncio
+    async def test_key_depends_on_content_and_settings(self, tmp_path: Any) -> None:
+        """Test identical content shares a key and settings changes split it."""
+        settings = IngestorSettings(extract_cache="disk", extract_cache_dir=str(tmp_path))
+        cache = ExtractionCache(settings)
+
+        key = await cache.key(b"same bytes", "application/pdf")
+
+        assert key == await cache.key(b"same bytes", "application/pdf")
+        assert key != await cache.key(b"other bytes", "application/pdf")
+        assert key != await cache.key(b"same bytes", "text/plain")
+
+        other = ExtractionCache(IngestorSettings(extract_cache="disk", chunk_size=256))
+        assert key != await other.key(b"same bytes", "application/pdf")
+
+    @pytest.mark.asyncio
+    async def test_disk_round_trip(self, tmp_path: Any) -> None:
+        """Test chunks stored on disk come back with their offsets."""
+        cache = ExtractionCache(IngestorSettings(extract_cache="disk", extract_cache_dir=str(tmp_path)))
+
+        assert await cache.get("ab12") is None
+        await cache.put("ab12", CHUNKS)
+
+        assert await cache.get("ab12") == CHUNKS
+        assert os.listdir(tmp_path / "ab") == ["ab12.json.gz"]
+
+    @pytest.mark.asyncio
+    async def test_corrupt_entry_is_a_miss(self, tmp_path: Any) -> None:
+        """Test unreadable entries are ignored."""
+        cache = ExtractionCache(IngestorSettings(extract_cache="disk", extract_cache_dir=str(tmp_path)))
+        (tmp_path / "ab").mkdir()
+        (tmp_path / "ab" / "ab12.json.gz").write_bytes(b"not gzip")
+
+        assert await cache.get("ab12") is None
+
+    @pytest.mark.asyncio
+    async def test_minio_round_trip(self) -> None:
+        """Test the minio backend stores entries under the configured prefix."""
+        stored: dict[str, bytes] = {}
+        minio = MagicMock()
+
+        async def upload_file(bucket_name: str, object_name: str, data: bytes, **kwargs: Any) -> str:
+            stored[object_name] = data
+            return "etag"
+
+        async def download_file(bucket_name: str, object_name: str) -> bytes:
+            if object_name not in stored:
+                raise Exception("NoSuchKey")
+            return stored[object_name]
+
+        minio.upload_file = AsyncMock(side_effect=upload_file)
+        minio.download_file = AsyncMock(side_effect=download_file)
+        cache = ExtractionCache.from_settings(IngestorSettings(extract_cache="minio"), minio)
+
+        assert await cache.get("cd34") is None
+        await cache.put("cd34", CHUNKS)
+
+        assert list(stored) == ["extract-cache/cd/cd34.json.gz"]
+        assert await cache.get("cd34") == CHUNKS
+
+    @pytest.mark.asyncio
+    async def test_store_errors_are_swallowed(self) -> None:
+        """Test a failing backend never fails the document."""
+        minio = MagicMock()
+        minio.upload_file = AsyncMock(side_effect=Exception("minio down"))
+        cache = ExtractionCache(IngestorSettings(extract_cache="minio"), minio)
+
+        await cache.put("cd34", CHUNKS)
+
+    def test_disk_tier_prunes_least_recently_used(self, tmp_path: Any) -> None:
+        """Test the disk tier stays under its cap, dropping the oldest-read entries first."""
+        cache = ExtractionCache(IngestorSettings(
+            extract_cache="disk", extract_cache_dir=str(tmp_path), extract_cache_max_mb=1,
+        ))
+        entry = os.urandom(300 * 1024)
+
+        for stamp, key in enumerate(["aa01", "bb02", "cc03"], start=1):
+            cache._write_file(key, entry)
+            os.utime(cache._file_path(key), (stamp, stamp))
+        # A hit makes the oldest entry the most recently used
+        assert cache._read_file("aa01") == entry
+
+        cache._write_file("dd04", entry)
+
+        assert [key for key in ["aa01", "bb02", "cc03", "dd04"] if os.path.exists(cache._file_path(key))] == [
+            "aa01",
+            "dd04",
+        ]
+        assert cache._disk_bytes == 2 * len(entry)
+
+    def test_disk_tier_unbounded_when_cap_is_zero(self, tmp_path: Any) -> None:
+        """Test a zero cap never prunes."""
+        cache = ExtractionCache(IngestorSettings(
+            extract_cache="disk", extract_cache_dir=str(tmp_path), extract_cache_max_mb=0,
+        ))
+
+        for key in ["aa01", "bb02", "cc03", "dd04"]:
+            cache._write_file(key, os.urandom(300 * 1024))
+
+        assert all(os.path.exists(cache._file_path(key)) for key in ["aa01", "bb02", "cc03", "dd04"])
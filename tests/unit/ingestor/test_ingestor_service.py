@@ -1,20 +1,33 @@
 """Unit tests for IngestorService."""
 
+from collections.abc import AsyncIterator
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import contextlib
+import mmap
+import os
 import uuid
 
 import pytest
 
 from ingestor.config import IngestorSettings, reset_settings
+from ingestor.logic.document_lease import DocumentLease
 from ingestor.logic.ingestor_service import IngestorService
 from ingestor.logic.exceptions import (
     DatabaseError,
+    DocumentLeasedError,
     DocumentNotFoundError,
     EmbeddingError,
     FileNotFoundInStorageError,
+    LeaseLostError,
     MinioError,
     OwnershipMismatchError,
 )
+from ingestor.logic.text_chunker import TextChunk
+
+# Model the fake embedder reports serving
+MODEL = "test-model"
 
 
 class TestIngestorService:
@@ -29,6 +42,7 @@ class TestIngestorService:
         self.mock_db_session = AsyncMock()
         self.mock_minio = AsyncMock()
         self.mock_qdrant = AsyncMock()
+        self.mock_qdrant.scroll_ids.return_value = []
 
         self.service = IngestorService(
             db_session=self.mock_db_session,
@@ -36,11 +50,52 @@ class TestIngestorService:
             qdrant_client=self.mock_qdrant,
             settings=self.settings,
         )
+        self.service._embedder.get_dimension = AsyncMock(return_value=1024)
+        self.service._embedder.get_model_id = AsyncMock(return_value=MODEL)
 
     def teardown_method(self) -> None:
         """Reset after tests."""
         reset_settings()
 
+    @staticmethod
+    def _stream(*groups: list[str | TextChunk]) -> Any:
+        """Helper to fake DocumentProcessor.process_stream yielding chunk groups."""
+        async def process_stream(**kwargs: Any) -> AsyncIterator[tuple[list[TextChunk], list[bytes]]]:
+            for chunks in groups:
+                yield [
+                    chunk if isinstance(chunk, TextChunk)
+                    else TextChunk(text=chunk, char_start=0, char_end=len(chunk))
+                    for chunk in chunks
+                ], []
+
+        return process_stream
+
+    @staticmethod
+    async def _groups(*groups: list[str]) -> AsyncIterator[list[TextChunk]]:
+        """Helper to build the chunk groups process_document feeds the pipeline."""
+        for texts in groups:
+            yield [TextChunk(text=text, char_start=0, char_end=len(text)) for text in texts]
+
+    @staticmethod
+    def _object(content: bytes) -> Any:
+        """Helper to fake MinIOClient.download_to_file for an object."""
+        async def download_to_file(file_path: str, **kwargs: Any) -> int:
+            with open(file_path, "wb") as f:
+                f.write(content)
+            return len(content)
+
+        return download_to_file
+
+    @classmethod
+    def _download(cls, content: bytes) -> Any:
+        """Helper to fake IngestorService._download_file for an object."""
+        write = cls._object(content)
+
+        async def download_file(file_path: str, local_path: str) -> int:
+            return await write(file_path=local_path)
+
+        return download_file
+
     # ==========================================
     # Initialization tests
     # ==========================================
@@ -212,8 +267,8 @@ class TestIngestorService:
         """Test _generate_point_id returns valid UUID string."""
         result = self.service._generate_point_id(
             document_id=1,
-            chunk_index=0,
-            session="test-session",
+            text="chunk text",
+            model_id=MODEL,
         )
 
         # Should be valid UUID format
@@ -221,20 +276,45 @@ class TestIngestorService:
 
     def test_generate_point_id_is_deterministic(self) -> None:
         """Test _generate_point_id is deterministic for same input."""
-        id1 = self.service._generate_point_id(1, 0, "session")
-        id2 = self.service._generate_point_id(1, 0, "session")
+        id1 = self.service._generate_point_id(1, "chunk", MODEL)
+        id2 = self.service._generate_point_id(1, "chunk", MODEL)
 
         assert id1 == id2
 
     def test_generate_point_id_different_for_different_input(self) -> None:
         """Test _generate_point_id differs for different input."""
-        id1 = self.service._generate_point_id(1, 0, "session")
-        id2 = self.service._generate_point_id(1, 1, "session")
-        id3 = self.service._generate_point_id(2, 0, "session")
+        id1 = self.service._generate_point_id(1, "chunk", MODEL)
+        id2 = self.service._generate_point_id(1, "other chunk", MODEL)
+        id3 = self.service._generate_point_id(2, "chunk", MODEL)
+        id4 = self.service._generate_point_id(1, "chunk", MODEL, occurrence=1)
+
+        assert len({id1, id2, id3, id4}) == 4
+
+    def test_generate_point_id_depends_on_embedder_model(self) -> None:
+        """Test switching the embedding model invalidates existing points."""
+        id1 = self.service._generate_point_id(1, "chunk", MODEL)
+        id2 = self.service._generate_point_id(1, "chunk", "another-model")
 
         assert id1 != id2
-        assert id1 != id3
-        assert id2 != id3
+
+    @pytest.mark.asyncio
+    async def test_run_pipeline_reembeds_after_served_model_changes(self) -> None:
+        """Test a new default model on the embedder is not mistaken for stored chunks."""
+        self.mock_qdrant.scroll_ids.return_value = [self.service._generate_point_id(7, "chunk", MODEL)]
+        self.service._embedder.get_model_id.return_value = "new-default-model"
+
+        with patch.object(self.service._embedder, "embed_batch", return_value=[[0.1]]) as mock_embed:
+            await self.service._run_pipeline(
+                groups=self._groups(["chunk"]),
+                document_id=7,
+                collection_name="collection",
+                chunking_session="session-2",
+            )
+
+        mock_embed.assert_called_once()
+        self.mock_qdrant.set_payloads.assert_not_called()
+        ids = self.mock_qdrant.upsert.call_args[1]["ids"]
+        assert ids == [self.service._generate_point_id(7, "chunk", "new-default-model")]
 
     # ==========================================
     # Document retrieval tests
@@ -274,87 +354,87 @@ class TestIngestorService:
 
         assert exc_info.value.operation == "select"
 
-    # ==========================================
-    # Status update tests
-    # ==========================================
-
-    @pytest.mark.asyncio
-    async def test_update_status_updates_database(self) -> None:
-        """Test _update_status updates document in database."""
-        await self.service._update_status(123, "completed")
-
-        self.mock_db_session.execute.assert_called_once()
-        self.mock_db_session.flush.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_update_status_with_chunk_count(self) -> None:
-        """Test _update_status with chunk_count."""
-        await self.service._update_status(123, "completed", chunk_count=50)
-
-        # Verify execute was called with values including chunk_count
-        self.mock_db_session.execute.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_update_status_with_error_message(self) -> None:
-        """Test _update_status with error_message."""
-        await self.service._update_status(123, "error", error_message="Failed")
-
-        self.mock_db_session.execute.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_update_status_raises_database_error(self) -> None:
-        """Test _update_status raises DatabaseError on failure."""
-        self.mock_db_session.execute.side_effect = Exception("update failed")
-
-        with pytest.raises(DatabaseError) as exc_info:
-            await self.service._update_status(1, "processing")
-
-        assert exc_info.value.operation == "update"
-
     # ==========================================
     # File download tests
     # ==========================================
 
     @pytest.mark.asyncio
-    async def test_download_file_returns_bytes(self) -> None:
-        """Test _download_file returns file content."""
-        self.mock_minio.download_file.return_value = b"file content"
+    async def test_download_file_streams_to_local_file(self) -> None:
+        """Test _download_file streams the object to the given path."""
+        self.mock_minio.download_to_file.side_effect = self._object(b"file content")
 
-        result = await self.service._download_file("path/to/file.pdf")
+        result = await self.service._download_file("path/to/file.pdf", "/tmp/local")
 
-        assert result == b"file content"
-        self.mock_minio.download_file.assert_called_once_with(
+        assert result == len(b"file content")
+        self.mock_minio.download_to_file.assert_called_once_with(
             bucket_name=self.settings.minio_bucket,
             object_name="path/to/file.pdf",
+            file_path="/tmp/local",
         )
 
     @pytest.mark.asyncio
     async def test_download_file_raises_file_not_found(self) -> None:
         """Test _download_file raises FileNotFoundInStorageError."""
-        self.mock_minio.download_file.return_value = None
+        self.mock_minio.download_to_file.return_value = None
 
         with pytest.raises(FileNotFoundInStorageError) as exc_info:
-            await self.service._download_file("missing.pdf")
+            await self.service._download_file("missing.pdf", "/tmp/local")
 
         assert exc_info.value.file_path == "missing.pdf"
 
     @pytest.mark.asyncio
     async def test_download_file_raises_minio_error(self) -> None:
         """Test _download_file raises MinioError on other failures."""
-        self.mock_minio.download_file.side_effect = Exception("connection refused")
+        self.mock_minio.download_to_file.side_effect = Exception("connection refused")
 
         with pytest.raises(MinioError) as exc_info:
-            await self.service._download_file("file.pdf")
+            await self.service._download_file("file.pdf", "/tmp/local")
 
         assert exc_info.value.operation == "download"
 
     @pytest.mark.asyncio
     async def test_download_file_handles_no_such_key(self) -> None:
         """Test _download_file raises FileNotFoundInStorageError for NoSuchKey."""
-        self.mock_minio.download_file.side_effect = Exception("NoSuchKey: file not found")
+        self.mock_minio.download_to_file.side_effect = Exception("NoSuchKey: file not found")
 
         with pytest.raises(FileNotFoundInStorageError):
-            await self.service._download_file("missing.pdf")
+            await self.service._download_file("missing.pdf", "/tmp/local")
+
+    @pytest.mark.asyncio
+    async def test_open_file_maps_download_and_cleans_up(self, tmp_path: Any) -> None:
+        """Test _open_file yields a memory map of the spooled file and removes it."""
+        self.settings.download_dir = str(tmp_path)
+        self.mock_minio.download_to_file.side_effect = self._object(b"%PDF content")
+
+        async with self.service._open_file("docs/file.pdf") as (data, local_path):
+            assert isinstance(data, mmap.mmap)
+            assert data[:] == b"%PDF content"
+            assert os.path.dirname(local_path) == str(tmp_path)
+
+        assert os.listdir(tmp_path) == []
+
+    @pytest.mark.asyncio
+    async def test_open_file_empty_object(self, tmp_path: Any) -> None:
+        """Test an empty object yields empty bytes (empty files cannot be mapped)."""
+        self.settings.download_dir = str(tmp_path)
+        self.mock_minio.download_to_file.side_effect = self._object(b"")
+
+        async with self.service._open_file("empty.txt") as (data, _):
+            assert data == b""
+
+        assert os.listdir(tmp_path) == []
+
+    @pytest.mark.asyncio
+    async def test_open_file_removes_file_on_download_error(self, tmp_path: Any) -> None:
+        """Test the spool file is removed when the download fails."""
+        self.settings.download_dir = str(tmp_path)
+        self.mock_minio.download_to_file.side_effect = Exception("connection refused")
+
+        with pytest.raises(MinioError):
+            async with self.service._open_file("file.pdf"):
+                pass
+
+        assert os.listdir(tmp_path) == []
 
     # ==========================================
     # Collection management tests
@@ -393,27 +473,28 @@ class TestIngestorService:
     # ==========================================
 
     @pytest.mark.asyncio
-    async def test_embed_and_store_empty_texts(self) -> None:
-        """Test _embed_and_store returns 0 for empty texts."""
-        result = await self.service._embed_and_store(
-            texts=[],
+    async def test_run_pipeline_empty_texts(self) -> None:
+        """Test _run_pipeline returns 0 and creates no collection without chunks."""
+        result = await self.service._run_pipeline(
+            groups=self._groups(),
             document_id=1,
             collection_name="test",
             chunking_session="session",
         )
 
         assert result == 0
+        self.mock_qdrant.create_collection.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_embed_and_store_calls_embedder(self) -> None:
-        """Test _embed_and_store calls embedder service."""
+    async def test_run_pipeline_calls_embedder(self) -> None:
+        """Test _run_pipeline calls embedder service."""
         with patch.object(
             self.service._embedder,
             "embed_batch",
             return_value=[[0.1, 0.2], [0.3, 0.4]],
         ):
-            result = await self.service._embed_and_store(
-                texts=["chunk1", "chunk2"],
+            result = await self.service._run_pipeline(
+                groups=self._groups(["chunk1", "chunk2"]),
                 document_id=123,
                 collection_name="user_1",
                 chunking_session="session-123",
@@ -423,15 +504,15 @@ class TestIngestorService:
             self.service._embedder.embed_batch.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_embed_and_store_upserts_to_qdrant(self) -> None:
-        """Test _embed_and_store upserts vectors to Qdrant."""
+    async def test_run_pipeline_upserts_to_qdrant(self) -> None:
+        """Test _run_pipeline upserts vectors to Qdrant."""
         with patch.object(
             self.service._embedder,
             "embed_batch",
             return_value=[[0.1], [0.2]],
         ):
-            await self.service._embed_and_store(
-                texts=["a", "b"],
+            await self.service._run_pipeline(
+                groups=self._groups(["a", "b"]),
                 document_id=1,
                 collection_name="collection",
                 chunking_session="session",
@@ -445,15 +526,15 @@ class TestIngestorService:
             assert len(call_kwargs["ids"]) == 2
 
     @pytest.mark.asyncio
-    async def test_embed_and_store_payload_structure(self) -> None:
-        """Test _embed_and_store creates correct payload structure."""
+    async def test_run_pipeline_payload_structure(self) -> None:
+        """Test _run_pipeline creates correct payload structure."""
         with patch.object(
             self.service._embedder,
             "embed_batch",
             return_value=[[0.1]],
         ):
-            await self.service._embed_and_store(
-                texts=["test content"],
+            await self.service._run_pipeline(
+                groups=self._groups(["test content"]),
                 document_id=123,
                 collection_name="collection",
                 chunking_session="session-id",
@@ -470,8 +551,8 @@ class TestIngestorService:
             assert "text" in payload  # Truncated text for preview
 
     @pytest.mark.asyncio
-    async def test_embed_and_store_raises_on_vector_count_mismatch(self) -> None:
-        """Test _embed_and_store raises EmbeddingError when vector count != text count.
+    async def test_run_pipeline_raises_on_vector_count_mismatch(self) -> None:
+        """Test _run_pipeline raises EmbeddingError when vector count != text count.
 
         If the embedder returns fewer vectors than texts (e.g., partial failure),
         continuing would corrupt Qdrant with misaligned vectors/payloads.
@@ -482,8 +563,8 @@ class TestIngestorService:
             return_value=[[0.1]],  # Only 1 vector for 3 texts
         ):
             with pytest.raises(EmbeddingError) as exc_info:
-                await self.service._embed_and_store(
-                    texts=["chunk1", "chunk2", "chunk3"],
+                await self.service._run_pipeline(
+                    groups=self._groups(["chunk1", "chunk2", "chunk3"]),
                     document_id=99,
                     collection_name="test",
                     chunking_session="session",
@@ -495,6 +576,183 @@ class TestIngestorService:
             # Verify Qdrant was NOT called (data integrity protection)
             self.mock_qdrant.upsert.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_run_pipeline_batches_upserts(self) -> None:
+        """Test large inputs are embedded and upserted in pipeline batches."""
+        self.settings.pipeline_embed_batch_size = 2
+        self.settings.pipeline_upsert_batch_size = 2
+
+        async def embed_batch(texts: list[str], **kwargs: Any) -> list[list[float]]:
+            return [[0.1] for _ in texts]
+
+        with patch.object(self.service._embedder, "embed_batch", side_effect=embed_batch) as mock_embed:
+            result = await self.service._run_pipeline(
+                groups=self._groups(["a", "b", "c"]),
+                document_id=5,
+                collection_name="collection",
+                chunking_session="session",
+            )
+
+        assert result == 3
+        assert mock_embed.call_count == 2
+        assert self.mock_qdrant.upsert.call_count == 2
+        indices = [
+            payload["chunk_index"]
+            for call in self.mock_qdrant.upsert.call_args_list
+            for payload in call[1]["payloads"]
+        ]
+        assert indices == [0, 1, 2]
+        # Point IDs are derived from chunk content
+        last_ids = self.mock_qdrant.upsert.call_args_list[-1][1]["ids"]
+        assert last_ids == [self.service._generate_point_id(5, "c", MODEL)]
+
+    @pytest.mark.asyncio
+    async def test_run_pipeline_skips_unchanged_chunks(self) -> None:
+        """Test re-ingestion only embeds chunks that are not stored yet."""
+        kept = self.service._generate_point_id(7, "unchanged", MODEL)
+        self.mock_qdrant.scroll_ids.return_value = [kept]
+
+        async def embed_batch(texts: list[str], **kwargs: Any) -> list[list[float]]:
+            return [[0.1] for _ in texts]
+
+        with patch.object(self.service._embedder, "embed_batch", side_effect=embed_batch) as mock_embed:
+            result = await self.service._run_pipeline(
+                groups=self._groups(["new", "unchanged"]),
+                document_id=7,
+                collection_name="collection",
+                chunking_session="session-2",
+            )
+
+        assert result == 2
+        assert mock_embed.call_args[1]["texts"] == ["new"]
+        call_kwargs = self.mock_qdrant.upsert.call_args[1]
+        assert call_kwargs["ids"] == [self.service._generate_point_id(7, "new", MODEL)]
+        assert call_kwargs["payloads"][0]["chunk_index"] == 0
+        # The kept chunk moves to its new position and session
+        self.mock_qdrant.set_payloads.assert_called_once_with(
+            collection_name="collection",
+            payloads={kept: {
+                "chunk_index": 1,
+                "chunking_session": "session-2",
+                "char_start": 0,
+                "char_end": 9,
+                "token_count": None,
+                "source_index": 0,
+            }},
+        )
+
+    @pytest.mark.asyncio
+    async def test_run_pipeline_records_stage_metrics(self) -> None:
+        """Test embedded and reused chunks and stage timings are recorded."""
+        from ingestor.logic.metrics import chunks_stored, embed_duration, upsert_duration
+
+        kept = self.service._generate_point_id(7, "unchanged", MODEL)
+        self.mock_qdrant.scroll_ids.return_value = [kept]
+        embedded = chunks_stored.labels(result="embedded")
+        reused = chunks_stored.labels(result="reused")
+        embedded_before, reused_before = embedded._value.get(), reused._value.get()
+        embeds_before = embed_duration._sum.get()
+        upserts_before = upsert_duration._sum.get()
+
+        with patch.object(self.service._embedder, "embed_batch", return_value=[[0.1]]):
+            await self.service._run_pipeline(
+                groups=self._groups(["new", "unchanged"]),
+                document_id=7,
+                collection_name="collection",
+                chunking_session="session-2",
+            )
+
+        assert embedded._value.get() - embedded_before == pytest.approx(1)
+        assert reused._value.get() - reused_before == pytest.approx(1)
+        assert embed_duration._sum.get() > embeds_before
+        assert upsert_duration._sum.get() > upserts_before
+
+    @pytest.mark.asyncio
+    async def test_run_pipeline_swaps_sessions_after_upsert(self) -> None:
+        """Test points of other sessions are deleted only after the new ones are stored."""
+        self.mock_qdrant.scroll_ids.return_value = ["stale-id"]
+        calls: list[str] = []
+        self.mock_qdrant.upsert.side_effect = lambda **kwargs: calls.append("upsert")
+        self.mock_qdrant.delete_by_filter.side_effect = lambda **kwargs: calls.append("delete")
+
+        with patch.object(self.service._embedder, "embed_batch", return_value=[[0.1]]):
+            await self.service._run_pipeline(
+                groups=self._groups(["fresh"]),
+                document_id=7,
+                collection_name="collection",
+                chunking_session="session-2",
+            )
+
+        assert calls == ["upsert", "delete"]
+        self.mock_qdrant.delete_by_filter.assert_called_once_with(
+            collection_name="collection",
+            filter_={
+                "must": [{"key": "document_id", "match": {"value": 7}}],
+                "must_not": [{"key": "chunking_session", "match": {"value": "session-2"}}],
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_run_pipeline_failure_keeps_old_session(self) -> None:
+        """Test a failed re-ingestion leaves the previous version searchable."""
+        self.mock_qdrant.scroll_ids.return_value = ["old-id"]
+        self.mock_qdrant.upsert.side_effect = Exception("qdrant down")
+
+        with patch.object(self.service._embedder, "embed_batch", return_value=[[0.1]]):
+            with pytest.raises(Exception, match="qdrant down"):
+                await self.service._run_pipeline(
+                    groups=self._groups(["fresh"]),
+                    document_id=7,
+                    collection_name="collection",
+                    chunking_session="session-2",
+                )
+
+        self.mock_qdrant.delete_by_filter.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_pipeline_uses_batch_coalescer(self) -> None:
+        """Test embedding and upserts go through the shared coalescer when enabled."""
+        coalescer = MagicMock()
+        coalescer.embed = AsyncMock(return_value=[[0.1]])
+        coalescer.upsert = AsyncMock()
+
+        with patch("ingestor.logic.ingestor_service.get_batch_coalescer", return_value=coalescer):
+            result = await self.service._run_pipeline(
+                groups=self._groups(["chunk"]),
+                document_id=7,
+                collection_name="collection",
+                chunking_session="session",
+            )
+
+        assert result == 1
+        coalescer.embed.assert_called_once_with(["chunk"])
+        qdrant, collection_name, vectors, payloads, ids = coalescer.upsert.call_args[0]
+        assert qdrant is self.mock_qdrant
+        assert collection_name == "collection"
+        assert ids == [self.service._generate_point_id(7, "chunk", MODEL)]
+        self.mock_qdrant.upsert.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_pipeline_identical_chunks_get_distinct_ids(self) -> None:
+        """Test repeated chunk texts in one document are stored as separate points."""
+        with patch.object(
+            self.service._embedder,
+            "embed_batch",
+            return_value=[[0.1], [0.2]],
+        ):
+            await self.service._run_pipeline(
+                groups=self._groups(["same", "same"]),
+                document_id=1,
+                collection_name="collection",
+                chunking_session="session",
+            )
+
+        ids = self.mock_qdrant.upsert.call_args[1]["ids"]
+        assert ids == [
+            self.service._generate_point_id(1, "same", MODEL, 0),
+            self.service._generate_point_id(1, "same", MODEL, 1),
+        ]
+
     # ==========================================
     # Delete vectors tests
     # ==========================================
@@ -571,13 +829,13 @@ class TestIngestorService:
         self.mock_db_session.execute.return_value = mock_result
 
         # Mock file download
-        self.mock_minio.download_file.return_value = b"PDF content"
+        self.mock_minio.download_to_file.side_effect = self._object(b"PDF content")
 
         # Mock processing
         with patch.object(
             self.service._processor,
-            "process",
-            return_value=(["chunk1", "chunk2"], []),
+            "process_stream",
+            new=self._stream(["chunk1", "chunk2"]),
         ):
             # Mock embedder
             with patch.object(
@@ -606,6 +864,133 @@ class TestIngestorService:
                     assert result["chunk_count"] == 2
                     assert result["collection_name"] == "user_456"
 
+    @pytest.mark.asyncio
+    async def test_process_document_skips_completed_session(self) -> None:
+        """Test a redelivery of already completed work is not reprocessed."""
+        mock_document = self._create_mock_document(connector_id=1, user_id=456)
+        mock_document.status = "completed"
+        mock_document.chunking_session = "session-123"
+        mock_document.chunk_count = 4
+
+        with patch.object(self.service, "_get_document", return_value=mock_document):
+            result = await self.service.process_document(
+                document_id=1,
+                connector_id=1,
+                user_id=456,
+                minio_path="docs/file.pdf",
+                chunking_session="session-123",
+                scope="user",
+            )
+
+        assert result["skipped"] is True
+        assert result["chunk_count"] == 4
+        self.mock_db_session.execute.assert_not_called()
+        self.mock_minio.download_to_file.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_process_document_defers_when_claimed_elsewhere(self) -> None:
+        """Test a document another worker is processing is not processed twice."""
+        mock_document = self._create_mock_document(connector_id=1, user_id=456)
+        claim = MagicMock()
+        claim.rowcount = 0
+        claim.scalar_one_or_none.return_value = None
+        self.mock_db_session.execute.return_value = claim
+
+        with patch.object(self.service, "_get_document", return_value=mock_document):
+            with pytest.raises(DocumentLeasedError):
+                await self.service.process_document(
+                    document_id=1,
+                    connector_id=1,
+                    user_id=456,
+                    minio_path="docs/file.pdf",
+                    chunking_session="session-123",
+                    scope="user",
+                )
+
+        self.mock_minio.download_to_file.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_admit_holds_estimated_memory(self) -> None:
+        """Test documents hold their estimated memory in the pod budget."""
+        from ingestor.logic.admission import MemoryBudget
+
+        budget = MemoryBudget(limit=1024 ** 3, max_wait=60.0)
+        expected = self.service._router.estimate_memory("application/pdf", 1000)
+
+        with patch("ingestor.logic.ingestor_service.get_memory_budget", return_value=budget):
+            async with self.service._admit(1, "application/pdf", 1000):
+                assert budget.in_use == expected
+
+        assert budget.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_process_document_streams_chunk_groups(self) -> None:
+        """Test chunk groups from process_stream are stored with global indices."""
+        mock_document = self._create_mock_document(connector_id=1, user_id=456)
+        self.settings.pipeline_embed_batch_size = 2
+
+        async def embed_batch(texts: list[str], **kwargs: Any) -> list[list[float]]:
+            return [[0.1] for _ in texts]
+
+        with patch.object(
+            self.service, "_get_document", return_value=mock_document
+        ), patch.object(
+            self.service, "_download_file", side_effect=self._download(b"PDF content")
+        ), patch.object(
+            self.service._processor, "process_stream", new=self._stream(["c0", "c1", "c2"], ["c3"])
+        ), patch.object(
+            self.service._embedder, "get_dimension", return_value=1024
+        ), patch.object(
+            self.service._embedder, "embed_batch", side_effect=embed_batch
+        ) as mock_embed:
+            result = await self.service.process_document(
+                document_id=123,
+                connector_id=1,
+                user_id=456,
+                minio_path="docs/file.pdf",
+                chunking_session="session-123",
+                scope="user",
+            )
+
+        assert result["chunk_count"] == 4
+        assert mock_embed.call_count == 2
+        self.mock_qdrant.create_collection.assert_called_once()
+        payloads = self.mock_qdrant.upsert.call_args[1]["payloads"]
+        assert [p["chunk_index"] for p in payloads] == [0, 1, 2, 3]
+        assert [p["text"] for p in payloads] == ["c0", "c1", "c2", "c3"]
+
+    @pytest.mark.asyncio
+    async def test_process_document_stores_chunk_offsets(self) -> None:
+        """Test chunk offsets and token counts are stored in the payload."""
+        mock_document = self._create_mock_document(connector_id=1, user_id=456)
+        chunk = TextChunk(text="body", char_start=120, char_end=124, token_count=1, source_index=3)
+
+        with patch.object(
+            self.service, "_get_document", return_value=mock_document
+        ), patch.object(
+            self.service, "_download_file", side_effect=self._download(b"PDF content")
+        ), patch.object(
+            self.service._processor, "process_stream", new=self._stream([chunk])
+        ), patch.object(
+            self.service._embedder, "get_dimension", return_value=1024
+        ), patch.object(
+            self.service._embedder, "embed_batch", return_value=[[0.1]]
+        ):
+            await self.service.process_document(
+                document_id=123,
+                connector_id=1,
+                user_id=456,
+                minio_path="docs/file.pdf",
+                chunking_session="session-123",
+                scope="user",
+            )
+
+        payload = self.mock_qdrant.upsert.call_args[1]["payloads"][0]
+        assert payload["char_start"] == 120
+        assert payload["char_end"] == 124
+        assert payload["token_count"] == 1
+        assert payload["source_index"] == 3
+
     @pytest.mark.asyncio
     async def test_process_document_with_team_scope(self) -> None:
         """Test process_document routes team-scoped docs to team collection."""
@@ -618,13 +1003,13 @@ class TestIngestorService:
         self.mock_db_session.execute.return_value = mock_result
 
         # Mock file download
-        self.mock_minio.download_file.return_value = b"PDF content"
+        self.mock_minio.download_to_file.side_effect = self._object(b"PDF content")
 
         # Mock processing
         with patch.object(
             self.service._processor,
-            "process",
-            return_value=(["chunk1"], []),
+            "process_stream",
+            new=self._stream(["chunk1"]),
         ):
             with patch.object(
                 self.service._embedder,
@@ -665,13 +1050,13 @@ class TestIngestorService:
         self.mock_db_session.execute.return_value = mock_result
 
         # Mock file download
-        self.mock_minio.download_file.return_value = b"text content"
+        self.mock_minio.download_to_file.side_effect = self._object(b"text content")
 
         # Mock processing
         with patch.object(
             self.service._processor,
-            "process",
-            return_value=(["chunk"], []),
+            "process_stream",
+            new=self._stream(["chunk"]),
         ):
             with patch.object(
                 self.service._embedder,
@@ -709,13 +1094,13 @@ class TestIngestorService:
         self.mock_db_session.execute.return_value = mock_result
 
         # Mock file download
-        self.mock_minio.download_file.return_value = b"PDF"
+        self.mock_minio.download_to_file.side_effect = self._object(b"PDF")
 
         # Mock processing
         with patch.object(
             self.service._processor,
-            "process",
-            return_value=(["chunk"], []),
+            "process_stream",
+            new=self._stream(["chunk"]),
         ):
             with patch.object(
                 self.service._embedder,
@@ -756,13 +1141,13 @@ class TestIngestorService:
         self.mock_db_session.execute.return_value = mock_result
 
         # Mock file download
-        self.mock_minio.download_file.return_value = b""
+        self.mock_minio.download_to_file.side_effect = self._object(b"")
 
         # Mock processing - returns empty (no chunks, no structured images)
         with patch.object(
             self.service._processor,
-            "process",
-            return_value=([], []),
+            "process_stream",
+            new=self._stream([]),
         ):
             # Should raise NoExtractableContentError instead of returning success
             with pytest.raises(NoExtractableContentError) as exc_info:
@@ -778,6 +1163,8 @@ class TestIngestorService:
             # Verify exception details
             assert exc_info.value.document_id == 1
             assert "No extractable content" in str(exc_info.value)
+            # Nothing to store, so no collection is created
+            self.mock_qdrant.create_collection.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_process_document_updates_status_on_error(self) -> None:
@@ -791,7 +1178,7 @@ class TestIngestorService:
         self.mock_db_session.execute.return_value = mock_result
 
         # Mock file download to fail
-        self.mock_minio.download_file.side_effect = Exception("download failed")
+        self.mock_minio.download_to_file.side_effect = Exception("download failed")
 
         with pytest.raises(Exception):
             await self.service.process_document(
@@ -968,12 +1355,10 @@ class TestIngestorService:
         with patch.object(
             self.service, "_get_document", return_value=mock_document
         ), patch.object(
-            self.service, "_download_file", return_value=b"fake file bytes"
-        ), patch.object(
-            self.service._processor, "process", return_value=([], [])  # No chunks!
+            self.service, "_download_file", side_effect=self._download(b"fake file bytes")
         ), patch.object(
-            self.service, "_update_status"
-        ) as mock_update:
+            self.service._processor, "process_stream", new=self._stream([])  # No chunks!
+        ):
             with pytest.raises(NoExtractableContentError) as exc_info:
                 await self.service.process_document(
                     document_id=1,
@@ -989,8 +1374,6 @@ class TestIngestorService:
             assert exc_info.value.mime_type == "application/pdf"
             assert "No extractable content" in str(exc_info.value)
 
-            # Should have updated status to "error" via exception handling
-            # (The exception is caught by the outer try/except in process_document)
 
     @pytest.mark.asyncio
     async def test_process_document_empty_chunks_updates_error_status(self) -> None:
@@ -1006,12 +1389,12 @@ class TestIngestorService:
         with patch.object(
             self.service, "_get_document", return_value=mock_document
         ), patch.object(
-            self.service, "_download_file", return_value=b""
+            self.service, "_download_file", side_effect=self._download(b"")
         ), patch.object(
-            self.service._processor, "process", return_value=([], [])
+            self.service._processor, "process_stream", new=self._stream([])
         ), patch.object(
-            self.service, "_update_status"
-        ) as mock_update:
+            DocumentLease, "fail", new_callable=AsyncMock, return_value=True
+        ) as mock_fail:
             with pytest.raises(NoExtractableContentError):
                 await self.service.process_document(
                     document_id=1,
@@ -1022,5 +1405,159 @@ class TestIngestorService:
                     scope="user",
                 )
 
-            # Exception should be raised before any success status update
-            # The outer exception handler will call _update_status with "error"
+            # The failure is recorded through the lease, never unconditionally
+            mock_fail.assert_awaited_once()
+            assert "No extractable" in mock_fail.call_args.args[1]
+
+    @pytest.mark.asyncio
+    async def test_process_document_failure_after_claim_lost(self) -> None:
+        """Test a run that lost its claim still raises without writing the error."""
+        from ingestor.logic.exceptions import NoExtractableContentError
+
+        mock_document = MagicMock()
+        mock_document.id = 1
+        mock_document.connector_id = 1
+        mock_document.connector.user_id = 42
+        mock_document.content_type = "text/plain"
+
+        with patch.object(
+            self.service, "_get_document", return_value=mock_document
+        ), patch.object(
+            self.service, "_download_file", side_effect=self._download(b"")
+        ), patch.object(
+            self.service._processor, "process_stream", new=self._stream([])
+        ), patch.object(
+            DocumentLease, "fail", new_callable=AsyncMock, return_value=False
+        ) as mock_fail:
+            with pytest.raises(NoExtractableContentError):
+                await self.service.process_document(
+                    document_id=1,
+                    connector_id=1,
+                    user_id=42,
+                    minio_path="empty.txt",
+                    chunking_session="session",
+                    scope="user",
+                )
+
+            mock_fail.assert_awaited_once()
+            # The claim is still released so the session is not left open
+            self.mock_db_session.commit.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_interleaved_runs_keep_newer_points(self) -> None:
+        """Test a run superseded mid-pipeline leaves the newer run's points alone."""
+        points: dict[str, dict[str, Any]] = {}
+        row = {"chunking_session": "session-1"}
+
+        async def scroll_ids(collection_name: str, filter_: dict[str, Any]) -> list[str]:
+            return list(points)
+
+        async def upsert(ids: list[str], payloads: list[dict[str, Any]], **kwargs: Any) -> None:
+            points.update(zip(ids, payloads))
+
+        async def set_payloads(collection_name: str, payloads: dict[str, dict[str, Any]]) -> None:
+            for point_id, payload in payloads.items():
+                points[str(point_id)].update(payload)
+
+        async def delete_by_filter(collection_name: str, filter_: dict[str, Any]) -> None:
+            keep = filter_["must_not"][0]["match"]["value"]
+            for point_id in [p for p, payload in points.items() if payload["chunking_session"] != keep]:
+                del points[point_id]
+
+        async def renew(lease: DocumentLease, session: Any) -> bool:
+            return lease.chunking_session == row["chunking_session"]
+
+        self.mock_qdrant.scroll_ids.side_effect = scroll_ids
+        self.mock_qdrant.upsert.side_effect = upsert
+        self.mock_qdrant.set_payloads.side_effect = set_payloads
+        self.mock_qdrant.delete_by_filter.side_effect = delete_by_filter
+        shared = self.service._generate_point_id(7, "shared", MODEL)
+        points[shared] = {"document_id": 7, "chunking_session": "session-0"}
+
+        newer = IngestorService(
+            db_session=AsyncMock(),
+            minio_client=self.mock_minio,
+            qdrant_client=self.mock_qdrant,
+            settings=self.settings,
+        )
+        newer._embedder.get_dimension = AsyncMock(return_value=1024)
+        newer._embedder.get_model_id = AsyncMock(return_value=MODEL)
+        newer._embedder.embed_batch = AsyncMock(return_value=[[0.2]])
+
+        async def embed_then_taken_over(texts: list[str], **kwargs: Any) -> list[list[float]]:
+            # A newer run claims the document and finishes while this one embeds
+            row["chunking_session"] = "session-2"
+            await newer._run_pipeline(
+                groups=self._groups(["shared", "newer"]),
+                document_id=7,
+                collection_name="collection",
+                chunking_session="session-2",
+                lease=DocumentLease(self._create_mock_document(1, 1, document_id=7), "session-2", ttl=60.0),
+            )
+            return [[0.1] for _ in texts]
+
+        self.service._embedder.embed_batch = AsyncMock(side_effect=embed_then_taken_over)
+        older = DocumentLease(self._create_mock_document(1, 1, document_id=7), "session-1", ttl=60.0)
+
+        with patch.object(DocumentLease, "renew", new=renew):
+            with pytest.raises(LeaseLostError):
+                await self.service._run_pipeline(
+                    groups=self._groups(["shared", "older"]),
+                    document_id=7,
+                    collection_name="collection",
+                    chunking_session="session-1",
+                    lease=older,
+                )
+
+        # The superseded run neither relabelled shared points nor deleted newer ones
+        sessions = {point_id: payload["chunking_session"] for point_id, payload in points.items()}
+        assert sessions[shared] == "session-2"
+        assert sessions[self.service._generate_point_id(7, "newer", MODEL)] == "session-2"
+        assert sessions[self.service._generate_point_id(7, "older", MODEL)] == "session-1"
+
+    @pytest.mark.asyncio
+    async def test_process_document_stops_when_claim_lost(self) -> None:
+        """Test losing the claim cancels the run instead of letting it finish."""
+        mock_document = self._create_mock_document(connector_id=1, user_id=42, content_type="text/plain")
+        renewed = AsyncMock(return_value=False)
+        session = AsyncMock()
+
+        @contextlib.asynccontextmanager
+        async def session_factory() -> AsyncIterator[Any]:
+            yield session
+
+        async def process_stream(**kwargs: Any) -> AsyncIterator[tuple[list[TextChunk], list[bytes]]]:
+            await asyncio.sleep(10)
+            yield [], []
+
+        self.service._session_factory = session_factory
+        self.settings.in_progress_interval = 0.01
+
+        with patch.object(
+            self.service, "_get_document", return_value=mock_document
+        ), patch.object(
+            self.service, "_download_file", side_effect=self._download(b"text")
+        ), patch.object(
+            self.service._processor, "process_stream", new=process_stream
+        ), patch.object(
+            DocumentLease, "renew", new=renewed
+        ), patch.object(
+            DocumentLease, "fail", new_callable=AsyncMock
+        ) as mock_fail:
+            result = await asyncio.wait_for(
+                self.service.process_document(
+                    document_id=1,
+                    connector_id=1,
+                    user_id=42,
+                    minio_path="doc.txt",
+                    chunking_session="session",
+                    scope="user",
+                ),
+                timeout=5,
+            )
+
+        assert result["skipped"] is True
+        renewed.assert_awaited()
+        # The takeover owns the row: nothing is written for this run
+        mock_fail.assert_not_called()
+        self.mock_qdrant.delete_by_filter.assert_not_called()
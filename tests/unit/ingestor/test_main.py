@@ -0,0 +1,191 @@
+"""Unit tests for the Ingestor pull consumer and document workers."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ingestor.main import IngestorApp
+
+
+@pytest.fixture
+def mock_settings() -> MagicMock:
+    """Create mock ingestor settings."""
+    settings = MagicMock()
+    settings.nats_stream_name = "ECHOMIND"
+    settings.nats_consumer_name = "ingestor-consumer"
+    settings.nats_ack_wait = 60.0
+    settings.nats_max_deliver = 3
+    settings.nats_fetch_timeout = 0.01
+    settings.worker_count = 3
+    settings.in_progress_interval = 0.01
+    return settings
+
+
+@pytest.fixture
+def app(mock_settings: MagicMock) -> IngestorApp:
+    """Create IngestorApp with all dependencies marked connected."""
+    with patch("ingestor.main.get_settings", return_value=mock_settings):
+        app = IngestorApp()
+    app._db_connected = True
+    app._minio_connected = True
+    app._qdrant_connected = True
+    app._nats_connected = True
+    app._subscriber = AsyncMock()
+    app._subscriber.fetch_messages.side_effect = _fetch([])
+    return app
+
+
+def _fetch(batches: list[list[AsyncMock]]) -> Any:
+    """Fake fetch_messages returning each batch once, then empty pulls."""
+    async def fetch(*args: Any, **kwargs: Any) -> list[AsyncMock]:
+        await asyncio.sleep(0.001)  # A real pull waits on the server
+        return batches.pop(0) if batches else []
+
+    return fetch
+
+
+class TestSetupSubscriptions:
+    """Tests for pull consumer setup."""
+
+    @pytest.mark.asyncio
+    async def test_pull_subscribes_with_ack_wait(self, app: IngestorApp) -> None:
+        """Test the consumer is pull-based with the configured ack deadline."""
+        await app._setup_subscriptions()
+        try:
+            call_kwargs = app._subscriber.pull_subscribe.call_args[1]
+            assert call_kwargs["consumer"] == "ingestor-consumer-document-process-pull"
+            assert call_kwargs["legacy_consumer"] == "ingestor-consumer-document-process"
+            assert call_kwargs["subject"] == "document.process"
+            assert call_kwargs["ack_wait"] == 60.0
+            assert call_kwargs["max_deliver"] == 3
+            assert len(app._worker_tasks) == 3
+        finally:
+            await app._stop_workers()
+
+        assert app._worker_tasks == []
+
+    @pytest.mark.asyncio
+    async def test_resubscribe_replaces_workers(self, app: IngestorApp) -> None:
+        """Test reconnecting does not leak the previous workers."""
+        await app._setup_subscriptions()
+        first = list(app._worker_tasks)
+        await app._setup_subscriptions()
+        try:
+            assert all(task.cancelled() or task.done() for task in first)
+            assert len(app._worker_tasks) == 3
+        finally:
+            await app._stop_workers()
+
+
+class TestWorkers:
+    """Tests for document workers."""
+
+    @pytest.mark.asyncio
+    async def test_worker_fetches_one_message_at_a_time(self, app: IngestorApp) -> None:
+        """Test workers pull single messages and process them."""
+        msg = AsyncMock()
+        app._subscriber.fetch_messages.side_effect = _fetch([[msg]])
+
+        with patch.object(app, "_handle_message", new=AsyncMock()) as handle:
+            worker = asyncio.create_task(app._worker_loop(0))
+            await asyncio.sleep(0.05)
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+
+        handle.assert_called_once_with(msg)
+        assert app._subscriber.fetch_messages.call_args[1]["batch_size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_worker_does_not_fetch_when_not_ready(self, app: IngestorApp) -> None:
+        """Test messages stay on the server while dependencies are down."""
+        app._qdrant_connected = False
+
+        worker = asyncio.create_task(app._worker_loop(0))
+        await asyncio.sleep(0.05)
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+
+        app._subscriber.fetch_messages.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_process_message_tracks_in_flight(self, app: IngestorApp) -> None:
+        """Test the in-flight count covers the handler and is reported."""
+        app._health_server = MagicMock()
+        seen: list[int] = []
+
+        async def handle(msg: AsyncMock) -> None:
+            seen.append(app.in_flight)
+
+        with patch.object(app, "_handle_message", side_effect=handle):
+            await app._process_message(AsyncMock())
+
+        assert seen == [1]
+        assert app.in_flight == 0
+        app._health_server.set_detail.assert_called_with("in_flight", 0)
+
+    @pytest.mark.asyncio
+    async def test_process_message_sends_heartbeats(self, app: IngestorApp) -> None:
+        """Test long documents send in_progress until the handler finishes."""
+        msg = AsyncMock()
+
+        async def slow_handle(msg: AsyncMock) -> None:
+            await asyncio.sleep(0.05)
+
+        with patch.object(app, "_handle_message", side_effect=slow_handle):
+            await app._process_message(msg)
+
+        assert msg.in_progress.await_count >= 2
+        calls = msg.in_progress.await_count
+        await asyncio.sleep(0.03)
+        # Heartbeats stop once the document is done
+        assert msg.in_progress.await_count == calls
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_failure_does_not_abort_processing(self, app: IngestorApp) -> None:
+        """Test a failed heartbeat leaves the document running."""
+        msg = AsyncMock()
+        msg.in_progress.side_effect = Exception("connection lost")
+        handled = False
+
+        async def slow_handle(msg: AsyncMock) -> None:
+            nonlocal handled
+            await asyncio.sleep(0.03)
+            handled = True
+
+        with patch.object(app, "_handle_message", side_effect=slow_handle):
+            await app._process_message(msg)
+
+        assert handled
+
+
+class TestLeaseDeferral:
+    """Tests for documents claimed by another worker."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_deferrals_do_not_use_delivery_attempts(self, app: IngestorApp) -> None:
+        """Test a document deferred more often than max_deliver is still processed once free."""
+        from echomind_lib.models.internal.orchestrator_pb2 import DocumentProcessRequest
+
+        from ingestor.logic.exceptions import DocumentLeasedError
+
+        msg = AsyncMock()
+        msg.data = DocumentProcessRequest(
+            document_id=7, connector_id=1, user_id=2, minio_path="docs/a.pdf", chunking_session="session",
+        ).SerializeToString()
+        deferrals = app._settings.nats_max_deliver + 2
+        attempts = [DocumentLeasedError(7, retry_after=0.02)] * deferrals + [
+            {"document_id": 7, "chunk_count": 3, "collection_name": "user_2", "skipped": False}
+        ]
+
+        with patch.object(app, "_process_request", side_effect=attempts) as process, patch(
+            "ingestor.main.create_trace"
+        ):
+            await app._process_message(msg)
+
+        assert process.await_count == deferrals + 1
+        # Deferrals hold the message in progress instead of naking it
+        msg.nak.assert_not_called()
+        msg.in_progress.assert_awaited()
+        msg.ack.assert_awaited_once()
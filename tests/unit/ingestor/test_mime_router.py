@@ -269,6 +269,24 @@ class TestMimeRouter:
         assert self.router.get_extractor_for_extension(".unknown") is None
 
 
+    def test_estimate_memory_scales_with_size_and_type(self) -> None:
+        """Test memory estimates grow with file size and extractor type."""
+        mb = 1024 * 1024
+
+        pdf = self.router.estimate_memory("application/pdf", 10 * mb)
+        text = self.router.estimate_memory("text/plain", 10 * mb)
+
+        assert pdf > text > self.router.estimate_memory("text/plain", mb)
+        assert self.router.estimate_memory("APPLICATION/PDF", 10 * mb) == pdf
+        assert self.router.estimate_memory("application/unknown", 10 * mb) == text
+        assert self.router.estimate_memory("text/plain", 0) == self.router.MEMORY_OVERHEAD
+
+    def test_every_extractor_has_memory_factor(self) -> None:
+        """Test each extractor type has a memory factor."""
+        for _, extractor in self.router.MIME_MAP.values():
+            assert extractor in self.router.MEMORY_FACTORS
+
+
 class TestMimeMapCompleteness:
     """Tests for MIME_MAP completeness."""
 
@@ -0,0 +1,144 @@
+"""Unit tests for the streaming embed → upsert pipeline."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import numpy as np
+import pytest
+
+from ingestor.logic.exceptions import EmbeddingError
+from ingestor.logic.pipeline import Chunk, EmbedPipeline
+
+
+async def _groups(*groups: list[str]) -> AsyncIterator[list[Chunk]]:
+    """Yield chunk groups with document-wide indices."""
+    index = 0
+    for group in groups:
+        chunks = []
+        for text in group:
+            chunks.append(Chunk(index=index, text=text, point_id=f"id-{index}"))
+            index += 1
+        yield chunks
+
+
+async def _embed(texts: list[str]) -> np.ndarray:
+    """Embed each text as a one-dimensional vector holding its length."""
+    return np.array([[float(len(text))] for text in texts], dtype=np.float32)
+
+
+class TestEmbedPipeline:
+    """Tests for EmbedPipeline."""
+
+    def setup_method(self) -> None:
+        """Record every store call."""
+        self.stored: list[tuple[list[Chunk], np.ndarray]] = []
+
+    async def _store(self, chunks: list[Chunk], vectors: np.ndarray) -> None:
+        self.stored.append((chunks, vectors))
+
+    @pytest.mark.asyncio
+    async def test_empty_input_stores_nothing(self) -> None:
+        """Test no store calls happen without chunks."""
+        pipeline = EmbedPipeline(embed=_embed, store=self._store)
+
+        assert await pipeline.run(_groups()) == 0
+        assert await pipeline.run(_groups([], [])) == 0
+        assert self.stored == []
+
+    @pytest.mark.asyncio
+    async def test_rebatches_groups_and_keeps_order(self) -> None:
+        """Test chunks are re-batched across groups and stored in order."""
+        embedded: list[list[str]] = []
+
+        async def embed(texts: list[str]) -> np.ndarray:
+            embedded.append(texts)
+            return await _embed(texts)
+
+        pipeline = EmbedPipeline(
+            embed=embed,
+            store=self._store,
+            embed_batch_size=2,
+            upsert_batch_size=4,
+        )
+
+        stored = await pipeline.run(_groups(["a", "bb", "ccc"], ["dddd"], ["e"]))
+
+        assert stored == 5
+        assert embedded == [["a", "bb"], ["ccc", "dddd"], ["e"]]
+        assert [[chunk.index for chunk in chunks] for chunks, _ in self.stored] == [
+            [0, 1, 2, 3],
+            [4],
+        ]
+        np.testing.assert_array_equal(self.stored[0][1][:, 0], [1, 2, 3, 4])
+
+    @pytest.mark.asyncio
+    async def test_upserts_overlap_with_embedding(self) -> None:
+        """Test the first upsert happens before the last batch is embedded."""
+        events: list[str] = []
+
+        async def embed(texts: list[str]) -> np.ndarray:
+            events.append(f"embed:{texts[0]}")
+            await asyncio.sleep(0)
+            return await _embed(texts)
+
+        async def store(chunks: list[Chunk], vectors: np.ndarray) -> None:
+            events.append(f"store:{chunks[0].text}")
+
+        pipeline = EmbedPipeline(
+            embed=embed,
+            store=store,
+            embed_batch_size=1,
+            upsert_batch_size=1,
+        )
+
+        await pipeline.run(_groups(["a", "b", "c", "d"]))
+
+        assert events.index("store:a") < events.index("embed:d")
+
+    @pytest.mark.asyncio
+    async def test_embed_error_propagates_without_store(self) -> None:
+        """Test an embed failure is re-raised and nothing is stored."""
+        async def embed(texts: list[str]) -> np.ndarray:
+            raise EmbeddingError("boom", document_id=7)
+
+        pipeline = EmbedPipeline(embed=embed, store=self._store)
+
+        with pytest.raises(EmbeddingError):
+            await pipeline.run(_groups(["a", "b"]))
+
+        assert self.stored == []
+
+    @pytest.mark.asyncio
+    async def test_store_error_stops_chunk_source(self) -> None:
+        """Test a store failure cancels the stages and closes the source."""
+        produced: list[int] = []
+        closed = False
+
+        async def endless() -> AsyncIterator[list[Chunk]]:
+            nonlocal closed
+            try:
+                index = 0
+                while True:
+                    produced.append(index)
+                    yield [Chunk(index=index, text=f"chunk-{index}", point_id=str(index))]
+                    index += 1
+            finally:
+                closed = True
+
+        async def store(chunks: list[Chunk], vectors: np.ndarray) -> None:
+            raise RuntimeError("qdrant down")
+
+        pipeline = EmbedPipeline(
+            embed=_embed,
+            store=store,
+            embed_batch_size=1,
+            upsert_batch_size=1,
+            queue_size=1,
+        )
+
+        with pytest.raises(RuntimeError, match="qdrant down"):
+            await pipeline.run(endless())
+
+        assert closed
+        # Bounded queues keep the producer only a few batches ahead
+        assert len(produced) < 10
@@ -23,6 +23,7 @@ import pytest
 from ingestor.config import IngestorSettings, reset_settings
 from ingestor.logic.document_processor import DocumentProcessor
 from ingestor.logic.mime_router import MimeRouter
+from ingestor.logic.text_chunker import TextChunk
 
 TESTDOCS_DIR = Path(__file__).parent / "testdocs"
 
@@ -166,6 +167,14 @@ class TestRealExtraction:
             )
 
         file_bytes = path.read_bytes()
+
+        # Text and HTML skip nv-ingest: decoded directly, then chunked
+        if extractor in ("text", "html"):
+            decode = self.processor._html_to_text if extractor == "html" else self.processor._decode_text
+            text = decode(file_bytes)
+            assert len(text.strip()) > 10, f"Only {len(text.strip())} chars extracted from {name} ({extractor})"
+            return
+
         df = self.processor._build_dataframe(
             file_bytes=file_bytes,
             document_id=1,
@@ -184,7 +193,6 @@ class TestRealExtraction:
 
         # Verify text exists in metadata["content"]
         # nv-ingest extractors → metadata["content"]
-        # Our text/html extractors → metadata["content"] + content_metadata["text"]
         found_text = False
         total_chars = 0
         for _, row in result.iterrows():
@@ -204,55 +212,6 @@ class TestRealExtraction:
             f"Only {total_chars} chars extracted from {name} ({extractor})"
         )
 
-    # ------------------------------------------------------------------
-    # Text extractor: verify both metadata fields are set
-    # ------------------------------------------------------------------
-
-    @pytest.mark.parametrize(
-        "name,mime,extractor,path",
-        [d for d in _ALL_DOCS if d[2] == "text"],
-        ids=[d[0] for d in _ALL_DOCS if d[2] == "text"],
-    )
-    def test_text_extractor_sets_both_fields(
-        self,
-        name: str,
-        mime: str,
-        extractor: str,
-        path: Path,
-    ) -> None:
-        """Text/markdown files must set BOTH metadata locations.
-
-        - metadata["content"]: for nv-ingest chunker
-        - content_metadata["text"]: for consistency
-        """
-        file_bytes = path.read_bytes()
-        df = self.processor._build_dataframe(
-            file_bytes=file_bytes,
-            document_id=1,
-            file_name=name,
-            mime_type=mime,
-        )
-
-        result = asyncio.get_event_loop().run_until_complete(
-            self.processor._extract(df, mime, document_id=1)
-        )
-
-        for _, row in result.iterrows():
-            meta = row.get("metadata", {})
-
-            content = meta.get("content", "")
-            cm_text = meta.get("content_metadata", {}).get("text", "")
-
-            assert content and len(content) > 0, (
-                f"metadata['content'] empty for {name}"
-            )
-            assert cm_text and len(cm_text) > 0, (
-                f"content_metadata['text'] empty for {name}"
-            )
-            assert content == cm_text, (
-                f"metadata['content'] != content_metadata['text'] for {name}"
-            )
-
     # ------------------------------------------------------------------
     # PDF: verify nv-ingest metadata structure
     # ------------------------------------------------------------------
@@ -331,15 +290,18 @@ class TestChunkFieldMapping:
             "uuid": ["a", "b", "c"],
         })
 
-        with patch(
-            "nv_ingest_api.interface.transform.transform_text_split_and_tokenize",
-            return_value=chunked_df,
-        ):
+        def split_batch(texts: list[str], rows: list[int]) -> list[list[TextChunk]]:
+            return [
+                [TextChunk(text=text, char_start=0, char_end=len(text), source_index=row)]
+                for text, row in zip(texts, rows)
+            ]
+
+        with patch.object(self.processor._chunker, "split_batch", side_effect=split_batch):
             chunks = asyncio.get_event_loop().run_until_complete(
                 self.processor._chunk_content(chunked_df, document_id=1)
             )
 
-        assert chunks == ["First chunk from PDF.", "Second chunk."]
+        assert [chunk.text for chunk in chunks] == ["First chunk from PDF.", "Second chunk."]
 
     def test_old_field_would_produce_zero_chunks(self) -> None:
         """Documents the bug: content_metadata['text'] is empty in nv-ingest output."""
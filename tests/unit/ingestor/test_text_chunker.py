@@ -0,0 +1,126 @@
+"""Unit tests for the token-window text chunker."""
+
+import re
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from ingestor.logic.text_chunker import TextChunk, TextChunker, load_tokenizer
+
+
+class WhitespaceTokenizer:
+    """Fake fast tokenizer: one token per whitespace-separated word."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, texts: list[str], **kwargs: Any) -> dict[str, Any]:
+        self.calls += 1
+        assert isinstance(texts, list)
+        assert kwargs["return_offsets_mapping"] is True
+        assert kwargs["add_special_tokens"] is False
+        return {
+            "offset_mapping": [
+                [m.span() for m in re.finditer(r"\S+", text)] for text in texts
+            ]
+        }
+
+
+@pytest.fixture
+def tokenizer() -> WhitespaceTokenizer:
+    """Patch the cached tokenizer loader with the fake tokenizer."""
+    fake = WhitespaceTokenizer()
+    with patch("ingestor.logic.text_chunker.load_tokenizer", return_value=fake):
+        yield fake
+
+
+class TestTextChunker:
+    """Tests for TextChunker."""
+
+    def test_short_text_is_one_chunk(self, tokenizer: WhitespaceTokenizer) -> None:
+        """Test text within chunk_size is returned as a single chunk."""
+        chunker = TextChunker(tokenizer="fake", chunk_size=10, chunk_overlap=2)
+
+        chunks = chunker.split("  # Title\n\nSome body text.  ")
+
+        assert chunks == [TextChunk(
+            text="# Title\n\nSome body text.",
+            char_start=2,
+            char_end=26,
+            token_count=5,
+        )]
+
+    def test_windows_overlap(self, tokenizer: WhitespaceTokenizer) -> None:
+        """Test windows advance by chunk_size - chunk_overlap tokens."""
+        chunker = TextChunker(tokenizer="fake", chunk_size=4, chunk_overlap=1)
+
+        chunks = chunker.split("a b c d e f g h i j")
+
+        assert [c.text for c in chunks] == ["a b c d", "d e f g", "g h i j"]
+        assert [c.token_count for c in chunks] == [4, 4, 4]
+
+    def test_no_trailing_window_inside_previous(self, tokenizer: WhitespaceTokenizer) -> None:
+        """Test splitting stops once a window reaches the end of the text."""
+        chunker = TextChunker(tokenizer="fake", chunk_size=4, chunk_overlap=2)
+
+        assert [c.text for c in chunker.split("a b c d e f")] == ["a b c d", "c d e f"]
+
+    def test_chunks_preserve_original_spacing(self, tokenizer: WhitespaceTokenizer) -> None:
+        """Test chunks are exact slices of the source text."""
+        chunker = TextChunker(tokenizer="fake", chunk_size=3, chunk_overlap=0)
+
+        text = "one  two\nthree four"
+        chunks = chunker.split(text)
+
+        assert [c.text for c in chunks] == ["one  two\nthree", "four"]
+        assert all(text[c.char_start:c.char_end] == c.text for c in chunks)
+
+    def test_blank_text_skips_tokenizer(self, tokenizer: WhitespaceTokenizer) -> None:
+        """Test blank input returns no chunks without tokenizing."""
+        chunker = TextChunker(tokenizer="fake", chunk_size=4, chunk_overlap=1)
+
+        assert chunker.split(" \n\t") == []
+        assert tokenizer.calls == 0
+
+    def test_split_batch_tokenizes_once(self, tokenizer: WhitespaceTokenizer) -> None:
+        """Test a batch is tokenized in one call and keeps per-text offsets."""
+        chunker = TextChunker(tokenizer="fake", chunk_size=2, chunk_overlap=0)
+
+        result = chunker.split_batch(["a b c", "  ", "d e"], source_indices=[3, 4, 5])
+
+        assert tokenizer.calls == 1
+        assert [[c.text for c in chunks] for chunks in result] == [["a b", "c"], [], ["d e"]]
+        assert [(c.char_start, c.char_end) for c in result[0]] == [(0, 3), (4, 5)]
+        assert [c.source_index for c in result[0] + result[2]] == [3, 3, 5]
+
+    def test_split_batch_defaults_source_index_to_position(self, tokenizer: WhitespaceTokenizer) -> None:
+        """Test source indices default to each text's position in the batch."""
+        chunker = TextChunker(tokenizer="fake", chunk_size=4, chunk_overlap=0)
+
+        result = chunker.split_batch(["a", "b"])
+
+        assert [chunks[0].source_index for chunks in result] == [0, 1]
+
+
+class TestLoadTokenizer:
+    """Tests for the per-process tokenizer cache."""
+
+    def setup_method(self) -> None:
+        """Clear the cache."""
+        load_tokenizer.cache_clear()
+
+    def teardown_method(self) -> None:
+        """Clear the cache."""
+        load_tokenizer.cache_clear()
+
+    def test_tokenizer_is_loaded_once(self) -> None:
+        """Test repeated lookups reuse the loaded tokenizer."""
+        transformers = pytest.importorskip("transformers")
+
+        with patch.object(transformers.AutoTokenizer, "from_pretrained", return_value=object()) as load:
+            first = load_tokenizer("gpt2")
+            second = load_tokenizer("gpt2")
+
+        assert first is second
+        load.assert_called_once_with("gpt2", token=None, use_fast=True)